@@ -1,4884 +1,33 @@
 import streamlit as st
-import random
-from typing import Dict, List, Tuple
-import time
-# ============================================================================
-# FONCTIONS DE PROGRESSION - AJOUTER APRÈS LES IMPORTS
-# ============================================================================
-
-def init_session_state():
-    """Initialise les états de session pour la progression"""
-    if 'visited_sections' not in st.session_state:
-        st.session_state.visited_sections = set()
-    
-    if 'current_progress' not in st.session_state:
-        st.session_state.current_progress = 0
-    
-    if 'last_section' not in st.session_state:
-        st.session_state.last_section = "Introduction"
-
-def update_progress():
-    """Met à jour la progression automatiquement"""
-    total_sections = len(SECTION_NAMES)
-    visited_count = len(st.session_state.visited_sections)
-    st.session_state.current_progress = int((visited_count / total_sections) * 100)
-
-def add_progress_to_header():
-    """Ajoute un indicateur de progression subtil dans l'en-tête"""
-    progress = st.session_state.current_progress
-    visited_count = len(st.session_state.visited_sections)
-    total_count = len(SECTION_NAMES)
-    
-    html = f"""
-    <div style="
-        position: absolute;
-        top: 20px;
-        right: 20px;
-        background: rgba(255, 255, 255, 0.95);
-        padding: 8px 16px;
-        border-radius: 20px;
-        font-size: 0.85rem;
-        color: #0ea5e9;
-        font-weight: 500;
-        border: 1px solid #e0f2fe;
-        box-shadow: 0 2px 8px rgba(14, 165, 233, 0.15);
-        z-index: 1000;
-        backdrop-filter: blur(5px);
-    ">
-        📊 Progression : {progress}% ({visited_count}/{total_count})
-    </div>
-    """
-    st.markdown(html, unsafe_allow_html=True)  
-
-
-# ============================================================================
-# CONFIGURATION ET STYLE - THÈME PROFESSIONNEL CLAIR
-# ============================================================================
-
-def setup_page_config():
-    """Configure les paramètres de la page Streamlit"""
-    st.set_page_config(
-        page_title="MasterTalk : L'Art de Communiquer",
-        page_icon="🎤",
-        layout="wide",
-        initial_sidebar_state="expanded"
-    )
-
-def load_custom_css():
-    """Charge le CSS personnalisé avec thème clair apaisant"""
-    st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;500;600;700&display=swap');
-        
-        /* ===== FORCER LE THÈME CLAIR ===== */
-        :root {
-            color-scheme: light !important;
-        }
-        
-        /* ===== VARIABLES DE COULEURS - REVISÉES POUR FOND BLANC ===== */
-        :root {
-            --bg-primary: #ffffff;          /* CHANGÉ : Blanc pur */
-            --bg-secondary: #f8fafc;        /* CHANGÉ : Bleu très très clair */
-            --bg-sidebar: #f0f9ff;          /* Gardé : Bleu très pâle pour sidebar */
-            --card-bg: #ffffff;             /* Blanc pur pour contraste */
-            --text-primary: #1e293b;        /* Bleu foncé/slate pour texte principal */
-            --text-secondary: #334155;      /* Bleu gris pour texte secondaire */
-            --accent-primary: #0ea5e9;      /* Bleu ciel vif pour accents */
-            --accent-secondary: #0284c7;    /* Bleu plus foncé pour hover */
-            --border-color: #e2e8f0;        /* CHANGÉ : Gris bleu plus clair */
-            --success-color: #10b981;       /* Vert émeraude */
-            --warning-color: #f59e0b;       /* Ambre */
-            --shadow-light: 0 2px 8px rgba(0, 107, 179, 0.05);
-            --shadow-medium: 0 4px 12px rgba(0, 107, 179, 0.08);
-        }
-        
-        /* ===== FORCER LE FOND BLANC SUR TOUTE L'APPLICATION ===== */
-        .stApp {
-            background-color: var(--bg-primary) !important;
-        }
-        
-        /* Conteneurs principaux Streamlit */
-        [data-testid="stAppViewContainer"],
-        [data-testid="stAppViewContainer"] > div,
-        .main > div,
-        div.block-container,
-        div[data-testid="stHorizontalBlock"] {
-            background-color: var(--bg-primary) !important;
-        }
-        
-        /* ===== SIDEBAR ===== */
-        section[data-testid="stSidebar"] {
-            background-color: var(--bg-sidebar) !important;
-            border-right: 1px solid var(--border-color);
-        }
-        
-        section[data-testid="stSidebar"] .stButton button {
-            background-color: var(--accent-primary);
-            color: white;
-            border: none;
-        }
-        
-        section[data-testid="stSidebar"] .stButton button:hover {
-            background-color: var(--accent-secondary);
-        }
-        
-        /* ===== TYPOGRAPHIE ===== */
-        * {
-            font-family: 'Montserrat', sans-serif;
-            color: var(--text-primary);
-        }
-        
-        h1, h2, h3, h4 {
-            color: var(--text-primary);
-            font-weight: 600;
-        }
-        
-        /* ===== EN-TÊTE PRINCIPAL ===== */
-        .main-header {
-            background: linear-gradient(135deg, var(--accent-primary) 0%, #38bdf8 100%);
-            color: white !important;
-            padding: 2.5rem;
-            border-radius: 16px;
-            margin-bottom: 2rem;
-            text-align: center;
-            box-shadow: var(--shadow-medium);
-            border: 1px solid rgba(255, 255, 255, 0.1);
-        }
-        
-        .main-header h1, .main-header h3 {
-            color: white !important;
-            text-shadow: 0 2px 4px rgba(0, 0, 0, 0.1);
-        }
-        
-        /* ===== CARTES DE SECTION ===== */
-        .section-card {
-            background: var(--card-bg);
-            padding: 2rem;
-            border-radius: 12px;
-            box-shadow: var(--shadow-light);
-            margin-bottom: 1.5rem;
-            border-left: 4px solid var(--accent-primary);
-            border: 1px solid var(--border-color);
-            transition: all 0.3s ease;
-        }
-        
-        .section-card:hover {
-            transform: translateY(-3px);
-            box-shadow: var(--shadow-medium);
-            border-left: 4px solid var(--accent-secondary);
-        }
-        
-        /* ===== BOÎTES DE TRANSITION ===== */
-        .transition-box {
-            background: linear-gradient(90deg, #f0f9ff 0%, #e0f2fe 100%) !important;
-            color: var(--text-primary);
-            padding: 1.2rem;
-            border-radius: 10px;
-            margin: 1.5rem 0;
-            font-style: italic;
-            text-align: center;
-            font-weight: 500;
-            border-left: 4px solid var(--accent-primary);
-            border: 1px solid var(--border-color);
-        }
-        
-        /* ===== CARTES D'ATELIER ===== */
-        .atelier-card {
-            background: #f8fafc !important;
-            padding: 1.8rem;
-            border-radius: 12px;
-            margin: 1rem 0;
-            border: 1px solid var(--border-color);
-            transition: all 0.3s ease;
-        }
-        
-        .atelier-card:hover {
-            background: #e0f2fe !important;
-            transform: translateX(5px);
-        }
-        
-        .atelier-rouge { 
-            border-left: 4px solid #ef4444;
-            background: linear-gradient(90deg, #fee2e2 0%, #f8fafc 100%) !important;
-        }
-        
-        .atelier-bleu { 
-            border-left: 4px solid #3b82f6;
-            background: linear-gradient(90deg, #dbeafe 0%, #f8fafc 100%) !important;
-        }
-        
-        .atelier-vert { 
-            border-left: 4px solid var(--success-color);
-            background: linear-gradient(90deg, #d1fae5 0%, #f8fafc 100%) !important;
-        }
-        
-        .atelier-jaune { 
-            border-left: 4px solid var(--warning-color);
-            background: linear-gradient(90deg, #fef3c7 0%, #f8fafc 100%) !important;
-        }
-        
-        /* ===== POINTS SMART ===== */
-        .smart-point {
-            background: linear-gradient(90deg, #f8fafc 0%, #f0f9ff 100%) !important;
-            padding: 1.2rem;
-            border-radius: 10px;
-            margin: 0.8rem 0;
-            border-left: 3px solid var(--accent-primary);
-            color: var(--text-primary);
-            font-weight: 500;
-        }
-        
-        .smart-point strong {
-            color: var(--accent-secondary);
-        }
-        
-        /* ===== BOÎTES DE CITATION ===== */
-        .quote-box {
-            background: linear-gradient(135deg, #f8fafc 0%, #f0f9ff 100%) !important;
-            padding: 2rem;
-            border-radius: 15px;
-            text-align: center;
-            font-size: 1.3rem;
-            font-weight: 500;
-            margin: 2rem 0;
-            border: 1px solid var(--border-color);
-            color: var(--text-primary);
-            font-style: italic;
-            box-shadow: var(--shadow-light);
-        }
-        
-        /* ===== WIDGETS STREAMLIT PERSONNALISÉS ===== */
-        .stTextInput input, .stTextArea textarea, .stSelectbox select {
-            background-color: var(--card-bg) !important;
-            border: 1px solid var(--border-color) !important;
-            color: var(--text-primary) !important;
-            border-radius: 8px !important;
-        }
-        
-        .stButton button {
-            background-color: var(--accent-primary) !important;
-            color: white !important;
-            border: none !important;
-            border-radius: 8px !important;
-            font-weight: 500 !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        .stButton button:hover {
-            background-color: var(--accent-secondary) !important;
-            transform: translateY(-2px);
-            box-shadow: var(--shadow-medium);
-        }
-        
-        /* Sliders et selectboxes */
-        .stSlider div[data-baseweb="slider"] {
-            background-color: #f8fafc;
-            border-radius: 8px;
-        }
-        
-        .stSelectbox div[data-baseweb="select"] {
-            background-color: var(--card-bg);
-            border: 1px solid var(--border-color);
-            border-radius: 8px;
-        }
-        
-        /* Alertes et messages */
-        .stAlert {
-            background-color: #f8fafc;
-            border: 1px solid var(--border-color);
-            border-radius: 10px;
-            color: var(--text-primary);
-        }
-        
-        /* Progress bar */
-        .stProgress > div > div > div {
-            background-color: var(--accent-primary) !important;
-        }
-        
-        /* ===== RESPONSIVE ===== */
-        @media (max-width: 768px) {
-            .section-card {
-                padding: 1.2rem;
-            }
-            .main-header {
-                padding: 1.5rem;
-            }
-            .quote-box {
-                font-size: 1.1rem;
-                padding: 1.5rem;
-            }
-        }
-        
-        /* ===== LIENS ET ÉLÉMENTS INTERACTIFS ===== */
-        a {
-            color: var(--accent-primary) !important;
-            text-decoration: none;
-            transition: color 0.3s ease;
-        }
-        
-        a:hover {
-            color: var(--accent-secondary) !important;
-        }
-        
-        /* Conteneurs de colonnes */
-        .stColumn {
-            background-color: transparent !important;
-        }
-        
-        /* Effet de focus */
-        :focus {
-            outline: 2px solid var(--accent-primary);
-            outline-offset: 2px;
-        }
-        
-        /* ===== SELECTBOXES STREAMLIT ===== */
-        /* Conteneur principal du select (état fermé) */
-        div[data-baseweb="select"] > div {
-            background-color: #ffffff !important;
-            border: 1px solid var(--border-color) !important;
-            border-radius: 8px !important;
-            color: var(--text-primary) !important;
-            min-height: 38px !important;
-        }
-        
-        /* Texte affiché dans le select */
-        div[data-baseweb="select"] div[data-testid="stMarkdownContainer"] p {
-            color: var(--text-primary) !important;
-            font-weight: 500 !important;
-        }
-        
-        /* Icône de flèche */
-        div[data-baseweb="select"] svg {
-            fill: #64748b !important;
-        }
-        
-        /* MENU DÉROULANT QUI APPARAÎT (dropdown ouvert) */
-        div[data-baseweb="popover"] {
-            background-color: white !important;
-            border: 1px solid var(--border-color) !important;
-            border-radius: 8px !important;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1) !important;
-            margin-top: 4px !important;
-        }
-        
-        /* Liste dans le menu déroulant */
-        div[data-baseweb="popover"] ul {
-            background-color: white !important;
-            padding: 4px 0 !important;
-            border-radius: 8px !important;
-        }
-        
-        /* Options individuelles dans le menu */
-        div[data-baseweb="popover"] li {
-            background-color: white !important;
-            color: var(--text-primary) !important;
-            padding: 8px 12px !important;
-            margin: 2px 4px !important;
-            border-radius: 6px !important;
-            font-size: 14px !important;
-            transition: all 0.2s ease !important;
-        }
-        
-        /* Option au survol */
-        div[data-baseweb="popover"] li:hover {
-            background-color: #f1f5f9 !important;
-            color: #0f172a !important;
-        }
-        
-        /* Option sélectionnée dans la liste */
-        div[data-baseweb="popover"] li[aria-selected="true"] {
-            background-color: #e0f2fe !important;
-            color: #0369a1 !important;
-            font-weight: 600 !important;
-        }
-        
-        /* Option avec focus clavier */
-        div[data-baseweb="popover"] li:focus {
-            outline: 2px solid var(--accent-primary) !important;
-            outline-offset: -2px !important;
-        }
-        
-        /* Scrollbar dans le menu déroulant */
-        div[data-baseweb="popover"]::-webkit-scrollbar {
-            width: 8px !important;
-        }
-        
-        div[data-baseweb="popover"]::-webkit-scrollbar-track {
-            background: #f1f5f9 !important;
-            border-radius: 4px !important;
-        }
-        
-        div[data-baseweb="popover"]::-webkit-scrollbar-thumb {
-            background: var(--border-color) !important;
-            border-radius: 4px !important;
-        }
-        
-        div[data-baseweb="popover"]::-webkit-scrollbar-thumb:hover {
-            background: #94a3b8 !important;
-        }
-        
-        /* État focus sur le select */
-        div[data-baseweb="select"] > div:focus-within {
-            border-color: var(--accent-primary) !important;
-            box-shadow: 0 0 0 2px rgba(14, 165, 233, 0.2) !important;
-        }
-        
-        /* Style pour le placeholder */
-        div[data-baseweb="select"] input::placeholder {
-            color: #94a3b8 !important;
-        }
-        
-        /* Pour s'assurer que le texte reste visible */
-        div[data-baseweb="select"] * {
-            color: var(--text-primary) !important;
-        }
-        
-        /* ===== CORRECTIONS SUPPLÉMENTAIRES POUR FOND BLANC ===== */
-        
-        /* Arrière-plan des métriques */
-        [data-testid="stMetricValue"], 
-        [data-testid="stMetricLabel"],
-        [data-testid="stMetricDelta"] {
-            background-color: transparent !important;
-        }
-        
-        /* Arrière-plan des onglets */
-        .stTabs [data-baseweb="tab-list"] {
-            background-color: transparent !important;
-        }
-        
-        .stTabs [data-baseweb="tab"] {
-            background-color: #f8fafc !important;
-        }
-        
-        /* Arrière-plan des expanders */
-        .streamlit-expanderHeader {
-            background-color: #f8fafc !important;
-        }
-        
-        /* Arrière-plan des colonnes */
-        [data-testid="column"] > div {
-            background-color: transparent !important;
-        }
-        
-        /* ===== CORRECTION POUR LA ZONE AUTOUR DU CONTENU ===== */
-        /* Cette règle cible la zone grise/sombre autour du contenu principal */
-        div[data-testid="stAppViewContainer"] {
-            background: linear-gradient(135deg, #ffffff 0%, #ffffff 100%) !important;
-        }
-        
-        /* Assurer que tous les enfants directs ont aussi un fond blanc */
-        div[data-testid="stAppViewContainer"] > div {
-            background-color: #ffffff !important;
-        }
-        
-        /* Fond de la page entière */
-        html, body {
-            background-color: #ffffff !important;
-        }
-                
-    </style>
-    """, unsafe_allow_html=True)
-
-# ============================================================================
-# DONNÉES ET CONSTANTES
-# ============================================================================
-
-SECTION_NAMES = [
-    "Introduction",
-    "1. Qu'est-ce qu'un TED Talk ?",
-    "2. Méthode SMART",
-    "3. Storytelling STAR",
-    "4. Écoute Active",
-    "5. Analyse SWOT",
-    "6. Matrice TOWS",
-    "7. Ateliers Interactifs",
-    "Conclusion"
-]
 
-ATELIERS = [
-    "🟥 Atelier 1 : Ton TED Talk en 7 mots",
-    "🟦 Atelier 2 : Le Mini-TED de 1 minute",
-    "🟩 Atelier 3 : Jeu de rôle Pour ou Contre ?",
-    "🟨 Atelier 4 : L'écoute active"
-]
-
-DEBATE_TOPICS = [
-    "Le télétravail est-il l'avenir ?",
-    "Les réseaux sociaux améliorent-ils la communication ?",
-    "Faut-il supprimer les examens ?"
-]
-
-# ============================================================================
-# COMPOSANTS RÉUTILISABLES
-# ============================================================================
-
-def create_card(content: str, card_class: str = "section-card") -> None:
-    """Crée une carte de contenu stylisée avec thème clair"""
-    # Nettoyer le contenu
-    content = content.strip()
-    
-    # Retirer les triples guillemets s'ils sont présents
-    if content.startswith("'''") and content.endswith("'''"):
-        content = content[3:-3].strip()
-    elif content.startswith('"""') and content.endswith('"""'):
-        content = content[3:-3].strip()
-    
-    # Échapper les apostrophes simples
-    content = content.replace("'", "&#39;")
-    
-    # Afficher la carte
-    html = f'<div class="{card_class}">{content}</div>'
-    st.markdown(html, unsafe_allow_html=True)
-
-
-def create_transition(text: str) -> None:
-    """Crée une boîte de transition avec thème bleu clair"""
-    st.markdown(f'<div class="transition-box">{text}</div>', unsafe_allow_html=True)
-
-def create_quote(text: str) -> None:
-    """Crée une boîte de citation avec dégradé bleu"""
-    st.markdown(f'<div class="quote-box">{text}</div>', unsafe_allow_html=True)
-
-# ============================================================================
-# SIDEBAR - THÈME CLAIR
-# ============================================================================
-
-def render_sidebar() -> str:
-    """Affiche la sidebar avec thème clair"""
-    with st.sidebar:
-        # Logo avec fond adapté
-        col_logo, _ = st.columns([1, 2])
-        with col_logo:
-            st.image("https://img.icons8.com/color/96/000000/conference.png", width=80)
-        
-        st.title("🎤 MasterTalk")
-        st.subheader("Par: MISSAOUI Yassine")
-        st.markdown("---")
-        
-        st.subheader("Navigation")
-        
-        # Trouver l'index de la dernière section visitée
-        if st.session_state.last_section in SECTION_NAMES:
-            default_index = SECTION_NAMES.index(st.session_state.last_section)
-        else:
-            default_index = 0
-            
-        section = st.selectbox(
-            "Choisir une section :",
-            SECTION_NAMES,
-            key="nav_select",
-            label_visibility="collapsed",
-            index=default_index
-        )
-        
-        # Marquer la section comme visitée
-        if section not in st.session_state.visited_sections:
-            st.session_state.visited_sections.add(section)
-            update_progress()
-        
-        # Mettre à jour la dernière section visitée
-        st.session_state.last_section = section
-        
-        st.markdown("---")
-        render_sidebar_sections()
-        
-        st.markdown("---")
-        render_progress_tracker()
-        
-        return section
-
-def render_sidebar_sections() -> None:
-    """Affiche les sections de la sidebar avec style clair"""
-    st.subheader("🎯 Objectifs du jour")
-    
-    st.markdown("""
-    <div style='
-        background: #e0f2fe;
-        padding: 1rem;
-        border-radius: 10px;
-        border: 1px solid #cbd5e1;
-        color: #1e293b;
-        margin-bottom: 1rem;
-    '>
-    • Définir une idée claire<br>
-    • Structurer un message<br>
-    • Raconter une histoire captivante<br>
-    • Pratiquer l'écoute active
-    </div>
-    """, unsafe_allow_html=True)
-    
+from mastertalk.facilitator import facilitator_view_requested, publish_visit, render_facilitator_dashboard
+from mastertalk.layout import init_session_state, render_footer, render_header, render_sidebar
+from mastertalk.profiling import profile_render, render_profiler_panel
+from mastertalk.sections import SECTION_HANDLERS, load_handler
+from mastertalk.store import persist_session
+from mastertalk.theme import load_custom_css, setup_page_config
 
-def render_progress_tracker() -> None:
-    """Affiche le suivi de progression"""
-    st.subheader("📊 Progression")
-    
-    # Afficher le nombre de sections visitées
-    visited_count = len(st.session_state.visited_sections)
-    total_count = len(SECTION_NAMES)
-    st.caption(f"📖 Sections visitées : {visited_count}/{total_count}")
-    
-    # Afficher la barre de progression (supprimer le slider)
-    progress = st.session_state.current_progress
-    st.progress(progress)
-    
-    # Affichage de l'encouragement dynamique
-    if progress >= 90:
-        st.success(f"🎉 Félicitations ! {progress}% complété - Presque terminé !")
-        st.balloons()
-    elif progress >= 75:
-        st.success(f"🌟 Excellent travail ! {progress}% complété")
-    elif progress >= 50:
-        st.info(f"📈 Bonne progression ! {progress}% complété")
-    elif progress >= 25:
-        st.info(f"🚀 Vous progressez ! {progress}% complété")
-    else:
-        st.info(f"✨ Continuez ! {progress}% complété")
-    
-    # Afficher les sections visitées
-    with st.expander("📋 Voir les sections complétées"):
-        for i, section_name in enumerate(SECTION_NAMES):
-            if section_name in st.session_state.visited_sections:
-                st.markdown(f"✅ **{section_name}**")
-            else:
-                st.markdown(f"⬜ {section_name}")
-
-# ============================================================================
-# SECTIONS DU CONTENU PRINCIPAL
-# ============================================================================
-
-def render_header() -> None:
-    """Affiche l'en-tête principal avec nouveau design"""
-    # Ajouter l'indicateur de progression
-    add_progress_to_header()
-    
-    st.markdown(
-        '''
-        <div class="main-header">
-            <h1 style="font-size: 3rem; margin-bottom: 1rem;">🌟 MasterTalk</h1>
-            <h3 style="font-weight: 400; opacity: 0.95;">L\'Art de Communiquer, Inspirer et Influencer</h3>
-            <p style="margin-top: 1rem; opacity: 0.9; font-size: 1.1rem;">
-                Développez vos compétences en communication avec des méthodes éprouvées
-            </p>
-        </div>
-        ''',
-        unsafe_allow_html=True
-    )
-
-def intro_section() -> None:
-    """Section Introduction"""
-    # Titre principal avec le même style que TED Talk
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">🎬</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">Introduction</h2>'
-        '<p style="color: #64748b; margin: 0;">Le pouvoir de la communication</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte principale d'introduction
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1.5rem;">✨ Pourquoi la communication est-elle essentielle ?</h4>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #cbd5e1;'
-            'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.08);'
-            '">'
-            '"Les mots ont le pouvoir de détruire et de guérir. Quand les mots sont justes et vrais, ils peuvent changer le monde."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #f59e0b;">💼</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #92400e;">Dans le travail :</strong> 85% de votre succès dépend de vos compétences en communication'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #3b82f6;">👥</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #1d4ed8;">Dans les relations :</strong> Crée des connexions authentiques et durables'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0 1.5rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">🚀</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">Dans le leadership :</strong> Inspire, motive et dirige efficacement'
-            '</div>'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">🎯 L\'exemple parfait : Les TED Talks</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'Les TED Talks montrent comment <strong style="color: #0284c7;">une idée, bien présentée, peut changer des vies</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte statistiques et objectifs
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #10b981;">📊</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">Les chiffres qui parlent</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<div style="display: flex; align-items: center; justify-content: space-between;">'
-            '<div>'
-            '<h2 style="color: #92400e; margin: 0; font-size: 2rem;">85%</h2>'
-            '<p style="color: #78350f; margin: 0; font-size: 0.9rem;">Du succès professionnel</p>'
-            '</div>'
-            '<div style="font-size: 2rem; color: #f59e0b;">📈</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<div style="display: flex; align-items: center; justify-content: space-between;">'
-            '<div>'
-            '<h2 style="color: #1e40af; margin: 0; font-size: 2rem;">70%</h2>'
-            '<p style="color: #1e40af; margin: 0; font-size: 0.9rem;">Des conflits évités</p>'
-            '</div>'
-            '<div style="font-size: 2rem; color: #3b82f6;">🤝</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<div style="display: flex; align-items: center; justify-content: space-between;">'
-            '<div>'
-            '<h2 style="color: #065f46; margin: 0; font-size: 2rem;">4×</h2>'
-            '<p style="color: #065f46; margin: 0; font-size: 0.9rem;">Plus de leadership perçu</p>'
-            '</div>'
-            '<div style="font-size: 2rem; color: #10b981;">👑</div>'
-            '</div>'
-            '</div>'
-            
-            '<h5 style="color: #0ea5e9; margin-bottom: 0.8rem;">🎯 Objectif de ce guide :</h5>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            'margin-bottom: 0.5rem;'
-            '">'
-            '<div style="color: #f59e0b;">🎤</div>'
-            '<span style="color: #334155;">Parler avec clarté et impact</span>'
-            '</div>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            'margin-bottom: 0.5rem;'
-            '">'
-            '<div style="color: #3b82f6;">📖</div>'
-            '<span style="color: #334155;">Raconter des histoires captivantes</span>'
-            '</div>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            '">'
-            '<div style="color: #10b981;">👂</div>'
-            '<span style="color: #334155;">Écouter activement et avec empathie</span>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Section interactive d'introduction
-    st.markdown("### 🎬 Commencez votre parcours")
-    
-    # Conteneur pour l'exercice d'introduction
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    st.markdown(
-        '<div style="'
-        'background: #f0f9ff;'
-        'padding: 1.5rem;'
-        'border-radius: 10px;'
-        'margin-bottom: 1.5rem;'
-        'border-left: 4px solid #0ea5e9;'
-        '">'
-        '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">🌟 Préparez-vous à transformer votre communication</h5>'
-        '<p style="color: #334155; margin: 0;">Répondez à cette question pour personnaliser votre expérience :</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_input1, col_input2 = st.columns(2)
-    
-    with col_input1:
-        nom = st.text_input(
-            "**Votre prénom :**",
-            placeholder="Ex: Marie",
-            key="user_name",
-            help="Pour personnaliser votre expérience"
-        )
-        
-        niveau = st.selectbox(
-            "**Votre niveau actuel :**",
-            ["Débutant", "Intermédiaire", "Avancé"],
-            key="user_level",
-            help="Pour adapter les exercices à votre niveau"
-        )
-    
-    with col_input2:
-        objectif_perso = st.selectbox(
-            "**Votre objectif principal :**",
-            [
-                "Parler en public sans stress",
-                "Convaincre en réunion",
-                "Présenter des idées clairement", 
-                "Améliorer mon leadership",
-                "Raconter de meilleures histoires"
-            ],
-            key="user_goal"
-        )
-    
-    if st.button("🚀 Démarrer mon parcours", type="primary", use_container_width=True, key="start_journey_btn"):
-        if nom:
-            st.session_state.user_profile = {
-                "name": nom,
-                "level": niveau,
-                "goal": objectif_perso
-            }
-            st.success(f"✅ Parfait {nom} ! Votre parcours personnalisé est prêt.")
-        else:
-            st.warning("⚠️ Veuillez entrer votre prénom pour personnaliser l'expérience")
-    
-    # Affichage du profil utilisateur
-    if 'user_profile' in st.session_state:
-        st.markdown(
-            f'<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 2rem;'
-            'border-radius: 12px;'
-            'border-left: 4px solid #0ea5e9;'
-            'margin-top: 1.5rem;'
-            'border: 1px solid #cbd5e1;'
-            'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.1);'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 2rem; color: #0ea5e9;">👤</div>'
-            '<div>'
-            f'<h4 style="color: #1e293b; margin: 0;">Bienvenue, {st.session_state.user_profile["name"]} !</h4>'
-            '<p style="color: #64748b; margin: 0;">Votre parcours est personnalisé pour vous</p>'
-            '</div>'
-            '</div>'
-            '<div style="background: white; padding: 1.5rem; border-radius: 8px;">'
-            '<div style="display: flex; justify-content: space-between; margin-bottom: 1rem;">'
-            '<div>'
-            '<strong style="color: #0369a1;">🎯 Objectif :</strong><br>'
-            f'<span style="color: #334155;">{st.session_state.user_profile["goal"]}</span>'
-            '</div>'
-            '<div>'
-            '<strong style="color: #0369a1;">📊 Niveau :</strong><br>'
-            f'<span style="color: #334155;">{st.session_state.user_profile["level"]}</span>'
-            '</div>'
-            '</div>'
-            '<div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; text-align: center;">'
-            '<p style="color: #334155; margin: 0; font-style: italic;">"Votre voyage vers une communication exceptionnelle commence maintenant !"</p>'
-            '</div>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    create_transition(
-        "Avant de comprendre comment parler comme un leader, commençons par découvrir ce qui rend un TED Talk tellement captivant."
-    )
-
-def ted_talk_section() -> None:
-    """Section TED Talk"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">🎤</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">1. Qu&#39;est-ce qu&#39;un TED Talk ?</h2>'
-        '<p style="color: #64748b; margin: 0;">La puissance des idées partagées</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte de définition TED Talk
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1rem;">📋 Un TED Talk, c&#39;est :</h4>'
-            '<div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; margin-bottom: 0.5rem; border-left: 4px solid #0ea5e9;">'
-            '✅ <strong>Une idée forte</strong>, facile à retenir'
-            '</div>'
-            '<div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; margin-bottom: 0.5rem; border-left: 4px solid #0ea5e9;">'
-            '✅ <strong>Un discours court</strong> (≤ 18 minutes)'
-            '</div>'
-            '<div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; margin-bottom: 0.5rem; border-left: 4px solid #0ea5e9;">'
-            '✅ <strong>Une histoire personnelle</strong> qui devient une leçon universelle'
-            '</div>'
-            '<div style="background: #f0f9ff; padding: 1rem; border-radius: 8px; margin-bottom: 1.5rem; border-left: 4px solid #0ea5e9;">'
-            '✅ <strong>Une connexion émotionnelle</strong> avec le public'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">🎯 Pourquoi ça marche ?</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'Parce que c&#39;est <strong style="color: #0284c7;">simple, humain et authentique</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte The One Idea Rule
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #f59e0b;">⭐</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">The One Idea Rule</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #cbd5e1;'
-            'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.08);'
-            '">'
-            '"Un discours = Une seule idée principale."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">✔</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">Clarté :</strong> C&#39;est ce qui rend le message clair'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #3b82f6;">✔</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #1d4ed8;">Simplicité :</strong> C&#39;est ce qui évite la confusion'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #8b5cf6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #8b5cf6;">✔</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #6d28d9;">Mémorabilité :</strong> C&#39;est ce qui rend la présentation mémorable'
-            '</div>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Exercice pratique
-    st.markdown("### 💡 Exercice pratique : The One Idea Rule")
-    
-    # Conteneur pour l'exercice
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    idea = st.text_area(
-        "**Transformez cette idée complexe en une seule idée principale :**",
-        "Je veux parler de motivation, discipline, stress et leadership",
-        key="idea_simplify",
-        height=100
-    )
-    
-    col_btn, col_result = st.columns([1, 3])
-    with col_btn:
-        if st.button("✨ Simplifier", type="primary", use_container_width=True, key="simplify_btn"):
-            simplified = "La discipline est plus importante que la motivation."
-            st.session_state.simplified_idea = simplified
-    
-    with col_result:
-        if 'simplified_idea' in st.session_state:
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-                'padding: 1.5rem;'
-                'border-radius: 10px;'
-                'border-left: 4px solid #10b981;'
-                'margin-top: 1rem;'
-                'border: 1px solid #a7f3d0;'
-                '">'
-                '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 0.5rem;">'
-                '<div style="font-size: 1.5rem; color: #065f46;">✓</div>'
-                '<strong style="color: #065f46; font-size: 1.1rem;">Idée simplifiée :</strong>'
-                '</div>'
-                f'<div style="color: #1e293b; font-size: 1.1rem; line-height: 1.6; padding-left: 2rem;">'
-                f'{st.session_state.simplified_idea}'
-                '</div>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    create_transition(
-        "Une fois l'idée principale définie, il faut lui donner une direction. Et pour cela, on utilise SMART."
-    )
-
-def smart_section() -> None:
-    """Section Méthode SMART"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">🎯</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">2. Méthode SMART</h2>'
-        '<p style="color: #64748b; margin: 0;">Clarifier son message avec précision</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte de présentation SMART détaillée
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1rem;">🎯 Les 5 critères SMART</h4>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 2rem; color: #f59e0b;">S</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Spécifique</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Clair, précis, sans ambiguïté</span>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 2rem; color: #3b82f6;">M</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Mesurable</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Avec des indicateurs concrets</span>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<div style="font-size: 2rem; color: #10b981;">A</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Atteignable</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Ambitieux mais réaliste</span>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #ede9fe 0%, #ddd6fe 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #8b5cf6;'
-            '">'
-            '<div style="font-size: 2rem; color: #8b5cf6;">R</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Relevant</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">En lien avec vos objectifs globaux</span>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #ec4899;'
-            '">'
-            '<div style="font-size: 2rem; color: #ec4899;">T</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Temporel</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Avec une date limite précise</span>'
-            '</div>'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">🎯 Pourquoi SMART fonctionne ?</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'Parce que ça transforme <strong style="color: #0284c7;">des vœux pieux en plans d\'action concrets</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte d'exemples et avantages
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #3b82f6;">✨</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">De la théorie à la pratique</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #cbd5e1;'
-            'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.08);'
-            '">'
-            '"Un objectif bien défini est à moitié atteint."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #f59e0b;">🚫</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #92400e;">Avant :</strong> "Je veux être plus confiant"'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0 1.5rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">✅</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">Après SMART :</strong> "Dans 2 semaines, je présenterai 5 minutes sans regarder mes notes"'
-            '</div>'
-            '</div>'
-            
-            '<h5 style="color: #0ea5e9; margin-bottom: 0.8rem;">📈 Les bénéfices :</h5>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            'margin-bottom: 0.5rem;'
-            '">'
-            '<div style="color: #10b981;">•</div>'
-            '<span style="color: #334155;">Clarté dans la planification</span>'
-            '</div>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            'margin-bottom: 0.5rem;'
-            '">'
-            '<div style="color: #3b82f6;">•</div>'
-            '<span style="color: #334155;">Motivation renforcée</span>'
-            '</div>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            '">'
-            '<div style="color: #f59e0b;">•</div>'
-            '<span style="color: #334155;">Suivi des progrès facilité</span>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Interface interactive SMART améliorée
-    st.markdown("### 🎯 Créer votre objectif SMART")
-    
-    # Conteneur pour l'exercice
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    st.markdown(
-        '<div style="'
-        'background: #f0f9ff;'
-        'padding: 1.5rem;'
-        'border-radius: 10px;'
-        'margin-bottom: 1.5rem;'
-        'border-left: 4px solid #0ea5e9;'
-        '">'
-        '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">🎯 Votre mission :</h5>'
-        '<p style="color: #334155; margin: 0;">Transformez votre objectif vague en un objectif SMART précis et actionnable.</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_input1, col_input2 = st.columns(2)
-    
-    with col_input1:
-        objectif = st.text_input(
-            "**Votre objectif actuel :**",
-            "Je veux parler mieux en public",
-            key="smart_goal",
-            help="Exprimez votre objectif actuel, même s'il est vague"
-        )
-        
-        mesurable = st.text_input(
-            "**Comment le mesurer ?**",
-            "Présenter 3 minutes sans notes",
-            key="smart_measurable",
-            help="Comment saurez-vous que vous avez réussi ?"
-        )
-        
-        atteignable = st.text_input(
-            "**Pourquoi est-ce atteignable ?**",
-            "J'ai déjà réussi à parler 1 minute sans notes",
-            key="smart_achievable",
-            help="Quelles ressources/skills avez-vous déjà ?"
-        )
-    
-    with col_input2:
-        temps = st.selectbox(
-            "**Délai :**",
-            ["3 jours", "1 semaine", "10 jours", "1 mois", "3 mois"],
-            key="smart_time",
-            help="Quelle est votre échéance ?"
-        )
-        
-        relevant = st.text_input(
-            "**Pourquoi est-ce important ?**",
-            "Pour progresser dans ma carrière",
-            key="smart_relevant",
-            help="En quoi cela sert vos objectifs plus larges ?"
-        )
-    
-    col_btn, col_result = st.columns([1, 3])
-    with col_btn:
-        if st.button("🚀 Transformer en SMART", type="primary", use_container_width=True, key="smart_transform_btn"):
-            smart_objectif = f"Dans {temps}, je serai capable de {mesurable.lower()}."
-            st.session_state.smart_objectif = smart_objectif
-            st.session_state.smart_details = {
-                "S": objectif,
-                "M": mesurable,
-                "A": atteignable,
-                "R": relevant,
-                "T": temps
-            }
-    
-    with col_result:
-        if 'smart_objectif' in st.session_state:
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-                'padding: 2rem;'
-                'border-radius: 12px;'
-                'border-left: 4px solid #0ea5e9;'
-                'margin-top: 1rem;'
-                'border: 1px solid #cbd5e1;'
-                'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.1);'
-                '">'
-                '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-                '<div style="font-size: 2rem; color: #0ea5e9;">🎯</div>'
-                '<h4 style="color: #1e293b; margin: 0;">Objectif SMART généré !</h4>'
-                '</div>'
-                f'<div style="color: #1e293b; font-size: 1.2rem; line-height: 1.8; margin-bottom: 1.5rem;">'
-                f'{st.session_state.smart_objectif}'
-                '</div>'
-                '<div style="background: white; padding: 1rem; border-radius: 8px;">'
-                '<h5 style="color: #0369a1; margin-top: 0; margin-bottom: 0.5rem;">📋 Détails :</h5>'
-                f'<p style="color: #334155; margin: 0.3rem 0;"><strong>S</strong>pécifique : {st.session_state.smart_details["S"]}</p>'
-                f'<p style="color: #334155; margin: 0.3rem 0;"><strong>M</strong>esurable : {st.session_state.smart_details["M"]}</p>'
-                f'<p style="color: #334155; margin: 0.3rem 0;"><strong>A</strong>tteignable : {st.session_state.smart_details["A"]}</p>'
-                f'<p style="color: #334155; margin: 0.3rem 0;"><strong>R</strong>elevant : {st.session_state.smart_details["R"]}</p>'
-                f'<p style="color: #334155; margin: 0.3rem 0;"><strong>T</strong>emporel : {st.session_state.smart_details["T"]}</p>'
-                '</div>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    create_transition(
-        "Maintenant que ton idée est définie et ton objectif clarifié… Il faut raconter une histoire."
-    )
-
-def star_section() -> None:
-    """Section Storytelling STAR"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">📖</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">3. Storytelling STAR</h2>'
-        '<p style="color: #64748b; margin: 0;">Comment toucher les gens avec une histoire</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte de présentation STAR
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1rem;">⭐ La méthode STAR en détail</h4>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 2rem; color: #f59e0b;">S</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Situation</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Le contexte, le décor, le point de départ</span>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 2rem; color: #3b82f6;">T</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Tâche</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Le défi, l\'objectif, la mission</span>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<div style="font-size: 2rem; color: #10b981;">A</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Action</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Les étapes, les choix, les efforts</span>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);'
-            'padding: 1.2rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #8b5cf6;'
-            '">'
-            '<div style="font-size: 2rem; color: #8b5cf6;">R</div>'
-            '<div>'
-            '<strong style="color: #1e293b;">Résultat</strong><br>'
-            '<span style="color: #64748b; font-size: 0.9rem;">Le dénouement, les apprentissages</span>'
-            '</div>'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">🎯 Pourquoi STAR fonctionne ?</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'Parce que ça crée <strong style="color: #0284c7;">une structure claire, émotionnelle et mémorable</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte de conseils storytelling
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #8b5cf6;">✨</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">Les secrets du bon storytelling</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #f5f3ff 0%, #ede9fe 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #ddd6fe;'
-            'box-shadow: 0 4px 12px rgba(139, 92, 246, 0.08);'
-            '">'
-            '"Les gens oublient les faits, mais ils se souviennent des histoires."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #f59e0b;">🎭</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #92400e;">Personnalisez :</strong> Parlez de vous ou d\'une expérience réelle'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">🎯</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">Structurez :</strong> Commencez fort et terminez avec une morale'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #3b82f6;">💬</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #1d4ed8;">Émotionnez :</strong> Montrez les émotions, ne les décrivez pas'
-            '</div>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Exercice pratique STAR
-    st.markdown("### 📝 Construire votre histoire avec STAR")
-    
-    # Conteneur pour l'exercice
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    cols = st.columns(2)
-    
-    with cols[0]:
-        # Utiliser des clés uniques pour les widgets
-        s_input = st.text_area(
-            "**Situation :**",
-            "Je tremblais à l'idée de présenter en classe.",
-            key="star_s_input",  # Clé unique pour le widget
-            height=100,
-            help="Décrivez le contexte initial"
-        )
-        
-        t_input = st.text_area(
-            "**Tâche :**",
-            "Je devais parler 5 minutes devant 40 étudiants.",
-            key="star_t_input",  # Clé unique pour le widget
-            height=100,
-            help="Quel était l'objectif ou le défi ?"
-        )
-    
-    with cols[1]:
-        a_input = st.text_area(
-            "**Action :**",
-            "J'ai préparé un plan simple et répété 3 fois.",
-            key="star_a_input",  # Clé unique pour le widget
-            height=100,
-            help="Qu'avez-vous fait concrètement ?"
-        )
-        
-        r_input = st.text_area(
-            "**Résultat :**",
-            "J'ai réussi et j'ai gagné confiance.",
-            key="star_r_input",  # Clé unique pour le widget
-            height=100,
-            help="Quel a été le résultat et l'apprentissage ?"
-        )
-    
-    col_btn, col_result = st.columns([1, 3])
-    with col_btn:
-        if st.button("📖 Générer mon histoire STAR", type="primary", use_container_width=True, key="star_generate_btn"):
-            # Stocker les valeurs dans session state avec des noms différents
-            st.session_state.star_s_value = s_input
-            st.session_state.star_t_value = t_input
-            st.session_state.star_a_value = a_input
-            st.session_state.star_r_value = r_input
-            st.session_state.star_generated = True
-    
-    with col_result:
-        if st.session_state.get('star_generated', False):
-            # Récupérer les valeurs du session state
-            s_val = st.session_state.get('star_s_value', '')
-            t_val = st.session_state.get('star_t_value', '')
-            a_val = st.session_state.get('star_a_value', '')
-            r_val = st.session_state.get('star_r_value', '')
-            
-            # Afficher l'histoire avec HTML complet
-            st.markdown(
-                f'''
-                <div style="
-                    background: linear-gradient(135deg, #f0f9ff 0%, #dbeafe 100%);
-                    padding: 2rem;
-                    border-radius: 12px;
-                    border-left: 4px solid #3b82f6;
-                    margin-top: 1rem;
-                    border: 1px solid #cbd5e1;
-                    box-shadow: 0 4px 12px rgba(59, 130, 246, 0.1);
-                ">
-                    <div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">
-                        <div style="font-size: 2rem; color: #3b82f6;">📖</div>
-                        <h4 style="color: #1e293b; margin: 0;">Votre histoire est prête !</h4>
-                    </div>
-                    <div style="color: #1e293b; font-size: 1.1rem; line-height: 1.8;">
-                        <h3 style="color: #3b82f6; margin-top: 0;">🌟 Votre histoire STAR complète</h3>
-                        <p style="margin: 1rem 0;"><strong style="color: #1d4ed8;">Situation :</strong> {s_val}</p>
-                        <p style="margin: 1rem 0;"><strong style="color: #1d4ed8;">Tâche :</strong> {t_val}</p>
-                        <p style="margin: 1rem 0;"><strong style="color: #1d4ed8;">Action :</strong> {a_val}</p>
-                        <p style="margin: 1rem 0;"><strong style="color: #1d4ed8;">Résultat :</strong> {r_val}</p>
-                    </div>
-                </div>
-                ''',
-                unsafe_allow_html=True
-            )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    create_transition(
-        "Mais raconter une histoire ne suffit pas. Un bon communicateur doit aussi savoir écouter."
-    )
-
-def ecoute_section() -> None:
-    """Section Écoute Active"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">🧠</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">4. Leadership & Écoute Active</h2>'
-        '<p style="color: #64748b; margin: 0;">L\'art de comprendre avant d\'être compris</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte des niveaux d'écoute
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1.5rem;">🎧 Les 3 niveaux d\'écoute</h4>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="background: #f59e0b; color: white; width: 28px; height: 28px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: bold;">1</div>'
-            '<h5 style="color: #92400e; margin: 0;">Écoute passive</h5>'
-            '</div>'
-            '<p style="color: #78350f; margin: 0; font-size: 0.95rem;">Entendre sans vraiment écouter, en pensant à autre chose</p>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="background: #3b82f6; color: white; width: 28px; height: 28px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: bold;">2</div>'
-            '<h5 style="color: #1e40af; margin: 0;">Écoute attentive</h5>'
-            '</div>'
-            '<p style="color: #1e40af; margin: 0; font-size: 0.95rem;">Comprendre le contenu du message, les faits et informations</p>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="background: #10b981; color: white; width: 28px; height: 28px; border-radius: 50%; display: flex; align-items: center; justify-content: center; font-weight: bold;">3</div>'
-            '<h5 style="color: #065f46; margin: 0;">Écoute active</h5>'
-            '</div>'
-            '<p style="color: #065f46; margin: 0; font-size: 0.95rem;">Reformuler, questionner, valider les émotions derrière les mots</p>'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">🎯 Pourquoi écouter activement ?</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'Parce que ça crée <strong style="color: #0284c7;">confiance, connexion et compréhension mutuelle</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte des techniques d'écoute active
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #10b981;">✨</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">Les techniques de l\'écoute active</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #f5f3ff 0%, #ede9fe 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #ddd6fe;'
-            'box-shadow: 0 4px 12px rgba(139, 92, 246, 0.08);'
-            '">'
-            '"Écouter, c\'est comprendre avec le cœur ce que l\'autre dit avec les mots."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #f59e0b;">🔄</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #92400e;">Reformuler :</strong> "Si je comprends bien, tu dis que..."'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #3b82f6;">❓</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #1d4ed8;">Questionner :</strong> "Peux-tu me dire plus sur..."'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">💬</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">Valider :</strong> "Je comprends que cela doit être difficile..."'
-            '</div>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Jeu interactif d'écoute active
-    st.markdown("### 🎮 Exercice d'écoute active")
-    
-    # Conteneur pour l'exercice
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    phrases = [
-        "J'ai peur de parler en public.",
-        "Je ne sais pas comment commencer mon discours.",
-        "Je crains d'être jugé par les autres."
-    ]
-    
-    st.markdown(
-        '<div style="'
-        'background: #f0f9ff;'
-        'padding: 1.5rem;'
-        'border-radius: 10px;'
-        'margin-bottom: 1.5rem;'
-        'border-left: 4px solid #0ea5e9;'
-        '">'
-        '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">🎯 Votre mission :</h5>'
-        '<p style="color: #334155; margin: 0;">Choisissez une phrase et pratiquez la reformulation en écoute active.</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    selected = st.selectbox(
-        "**Choisissez une phrase à reformuler :**",
-        phrases,
-        key="ecoute_phrase"
-    )
-    
-    reformulation = st.text_area(
-        "**Votre reformulation (écoute active) :**",
-        placeholder="Ex: Si je comprends bien, le problème n'est pas parler... c'est le regard des autres ?",
-        key="ecoute_reformulation",
-        height=100
-    )
-    
-    col_btn1, col_btn2, col_btn3 = st.columns(3)
-    with col_btn1:
-        if st.button("✓ Vérifier", type="primary", use_container_width=True, key="ecoute_check_btn"):
-            if reformulation and "?" in reformulation and ("comprend" in reformulation.lower() or "si " in reformulation.lower()):
-                st.session_state.ecoute_success = True
-                st.session_state.ecoute_message = "✅ Excellente reformulation ! Vous pratiquez l'écoute active."
-            else:
-                st.session_state.ecoute_success = False
-                st.session_state.ecoute_message = "💡 Essayez de commencer par 'Si je comprends bien...' et terminez par une question"
-    
-    with col_btn2:
-        if st.button("🔄 Exemple", use_container_width=True, key="ecoute_example_btn"):
-            examples = {
-                phrases[0]: "Si je comprends bien, parler devant un public vous génère de l'anxiété ?",
-                phrases[1]: "Vous cherchez un point d'entrée pour captiver votre auditoire dès le début ?",
-                phrases[2]: "La peur du jugement est-elle ce qui vous bloque le plus ?"
-            }
-            st.session_state.ecoute_example = examples[selected]
-    
-    with col_btn3:
-        if st.button("📝 Conseils", use_container_width=True, key="ecoute_tips_btn"):
-            st.session_state.ecoute_tips = "💡 **Conseil :** Commencez toujours par 'Si je comprends bien...' ou 'Tu veux dire que...' et terminez par une question ouverte."
-    
-    # Affichage des résultats
-    if 'ecoute_success' in st.session_state:
-        if st.session_state.ecoute_success:
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-                'padding: 1.5rem;'
-                'border-radius: 10px;'
-                'border-left: 4px solid #10b981;'
-                'margin-top: 1.5rem;'
-                '">'
-                '<div style="display: flex; align-items: center; gap: 0.8rem;">'
-                '<div style="font-size: 1.5rem; color: #065f46;">✅</div>'
-                '<div>'
-                '<h5 style="color: #065f46; margin: 0;">Parfait !</h5>'
-                f'<p style="color: #065f46; margin: 0;">{st.session_state.ecoute_message}</p>'
-                '</div>'
-                '</div>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-        else:
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-                'padding: 1.5rem;'
-                'border-radius: 10px;'
-                'border-left: 4px solid #f59e0b;'
-                'margin-top: 1.5rem;'
-                '">'
-                '<div style="display: flex; align-items: center; gap: 0.8rem;">'
-                '<div style="font-size: 1.5rem; color: #92400e;">💡</div>'
-                '<div>'
-                '<h5 style="color: #92400e; margin: 0;">À améliorer</h5>'
-                f'<p style="color: #92400e; margin: 0;">{st.session_state.ecoute_message}</p>'
-                '</div>'
-                '</div>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-    
-    if 'ecoute_example' in st.session_state:
-        st.info(f"**Exemple de reformulation :** {st.session_state.ecoute_example}")
-    
-    if 'ecoute_tips' in st.session_state:
-        st.warning(st.session_state.ecoute_tips)
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    create_transition(
-        "Pour améliorer sa communication, il faut comprendre ses forces et ses faiblesses."
-    )
-
-def swot_section() -> None:
-    """Section Analyse SWOT"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">📊</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">5. Analyse SWOT</h2>'
-        '<p style="color: #64748b; margin: 0;">Se connaître pour mieux communiquer</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte explicative SWOT
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1.5rem;">📊 Qu\'est-ce que l\'analyse SWOT ?</h4>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #cbd5e1;'
-            'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.08);'
-            '">'
-            '"Connais-toi toi-même et tu connaîtras l\'univers et les dieux."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">✅</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">S - Forces :</strong> Vos atouts, compétences, ressources'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #ef4444;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #ef4444;">⚠️</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #dc2626;">W - Faiblesses :</strong> Vos lacunes, limites, axes d\'amélioration'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #3b82f6;">🌟</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #1d4ed8;">O - Opportunités :</strong> Tendances, occasions, atouts externes'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0 1.5rem 0;'
-            'border-left: 3px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #f59e0b;">🔥</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #92400e;">T - Menaces :</strong> Risques, obstacles, compétition'
-            '</div>'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">🎯 Pourquoi faire un SWOT ?</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'Parce que la <strong style="color: #0284c7;">connaissance de soi est la base de toute communication authentique</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte d'exemples SWOT
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #8b5cf6;">💡</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">Exemples concrets</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<h5 style="color: #065f46; margin: 0 0 0.5rem 0;">✅ Forces (exemple) :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Voix claire et posée</li>'
-            '<li>Bonne préparation</li>'
-            '<li>Empathie naturelle</li>'
-            '</ul>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #ef4444;'
-            '">'
-            '<h5 style="color: #dc2626; margin: 0 0 0.5rem 0;">⚠️ Faiblesses (exemple) :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Trac avant les présentations</li>'
-            '<li>Difficulté à improviser</li>'
-            '<li>Timidité en grands groupes</li>'
-            '</ul>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<h5 style="color: #1d4ed8; margin: 0 0 0.5rem 0;">🌟 Opportunités (exemple) :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Clubs de prise de parole</li>'
-            '<li>Formations en ligne gratuites</li>'
-            '<li>Projets collaboratifs au travail</li>'
-            '</ul>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<h5 style="color: #92400e; margin: 0 0 0.5rem 0;">🔥 Menaces (exemple) :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Critiques non constructives</li>'
-            '<li>Comparaison avec d\'autres</li>'
-            '<li>Manque de temps pour pratiquer</li>'
-            '</ul>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Interface interactive SWOT améliorée
-    st.markdown("### 📝 Votre analyse SWOT personnelle")
-    
-    # Conteneur pour l'exercice
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    st.markdown(
-        '<div style="'
-        'background: #f0f9ff;'
-        'padding: 1.5rem;'
-        'border-radius: 10px;'
-        'margin-bottom: 1.5rem;'
-        'border-left: 4px solid #0ea5e9;'
-        '">'
-        '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">🎯 Votre mission :</h5>'
-        '<p style="color: #334155; margin: 0;">Identifiez vos forces, faiblesses, opportunités et menaces pour mieux vous connaître.</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<h4 style="color: #065f46;">✅ Vos Forces</h4>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        forces = st.text_area(
-            "Listez vos atouts en communication :",
-            "voix claire, idées structurées, bonne préparation, empathie naturelle",
-            key="swot_forces",
-            height=120,
-            label_visibility="collapsed"
-        )
-        
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #ef4444;'
-            '">'
-            '<h4 style="color: #dc2626;">⚠️ Vos Faiblesses</h4>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        faiblesses = st.text_area(
-            "Listez vos axes d'amélioration :",
-            "stress, timidité, difficulté à improviser, peur du jugement",
-            key="swot_faiblesses",
-            height=120,
-            label_visibility="collapsed"
-        )
-    
-    with col2:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<h4 style="color: #1d4ed8;">🌟 Vos Opportunités</h4>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        opportunites = st.text_area(
-            "Listez les occasions autour de vous :",
-            "présentations au travail, clubs de prise de parole, concours d'éloquence, formations en ligne",
-            key="swot_opportunites",
-            height=120,
-            label_visibility="collapsed"
-        )
-        
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<h4 style="color: #92400e;">🔥 Vos Menaces</h4>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        menaces = st.text_area(
-            "Listez les obstacles potentiels :",
-            "jugements des collègues, comparaison avec d'autres, trac paralysant, manque de temps",
-            key="swot_menaces",
-            height=120,
-            label_visibility="collapsed"
-        )
-    
-    col_btn, col_result = st.columns([1, 3])
-    with col_btn:
-        if st.button("📊 Générer mon SWOT", type="primary", use_container_width=True, key="swot_generate_btn"):
-            swot_analysis = {
-                "forces": forces,
-                "faiblesses": faiblesses,
-                "opportunites": opportunites,
-                "menaces": menaces
-            }
-            st.session_state.swot_result = swot_analysis
-    
-    with col_result:
-        if 'swot_result' in st.session_state:
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-                'padding: 2rem;'
-                'border-radius: 12px;'
-                'border-left: 4px solid #0ea5e9;'
-                'margin-top: 1rem;'
-                'border: 1px solid #cbd5e1;'
-                'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.1);'
-                '">'
-                '<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">'
-                '<div style="font-size: 2rem; color: #0ea5e9;">📊</div>'
-                '<h4 style="color: #1e293b; margin: 0;">Votre analyse SWOT est prête !</h4>'
-                '</div>'
-                '<div style="background: white; padding: 1.5rem; border-radius: 8px;">'
-                '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">'
-                '<div style="background: #d1fae5; padding: 1rem; border-radius: 8px; border-left: 4px solid #10b981;">'
-                '<h5 style="color: #065f46; margin-top: 0;">✅ Forces</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.swot_result["forces"]}</p>'
-                '</div>'
-                '<div style="background: #fee2e2; padding: 1rem; border-radius: 8px; border-left: 4px solid #ef4444;">'
-                '<h5 style="color: #dc2626; margin-top: 0;">⚠️ Faiblesses</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.swot_result["faiblesses"]}</p>'
-                '</div>'
-                '<div style="background: #dbeafe; padding: 1rem; border-radius: 8px; border-left: 4px solid #3b82f6;">'
-                '<h5 style="color: #1d4ed8; margin-top: 0;">🌟 Opportunités</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.swot_result["opportunites"]}</p>'
-                '</div>'
-                '<div style="background: #fef3c7; padding: 1rem; border-radius: 8px; border-left: 4px solid #f59e0b;">'
-                '<h5 style="color: #92400e; margin-top: 0;">🔥 Menaces</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.swot_result["menaces"]}</p>'
-                '</div>'
-                '</div>'
-                '</div>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    create_transition(
-        "La matrice TOWS organise STRATÉGIQUEMENT les éléments de SWOT pour passer à l'action."
-    )
-
-def tows_section() -> None:
-    """Section Matrice TOWS"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">🔄</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">6. Matrice TOWS</h2>'
-        '<p style="color: #64748b; margin: 0;">Transformer la théorie en actions concrètes</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte explicative TOWS
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1.5rem;">🔄 Qu\'est-ce que la matrice TOWS ?</h4>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #cbd5e1;'
-            'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.08);'
-            '">'
-            '"La connaissance n\'a de valeur que si elle est transformée en action."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">💪</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">SO - Stratégies offensives :</strong> Utiliser les forces pour saisir les opportunités'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #f59e0b;">🛡️</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #92400e;">ST - Stratégies défensives :</strong> Utiliser les forces pour contrer les menaces'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #3b82f6;">🚀</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #1d4ed8;">WO - Stratégies d\'adaptation :</strong> Transformer les faiblesses en forces grâce aux opportunités'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0 1.5rem 0;'
-            'border-left: 3px solid #ef4444;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #ef4444;">⚠️</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #dc2626;">WT - Stratégies de survie :</strong> Minimiser les faiblesses pour éviter les menaces'
-            '</div>'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">🎯 L\'avantage TOWS :</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'Transforme <strong style="color: #0284c7;">l\'analyse en stratégie, la théorie en action concrète</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte d'exemples TOWS
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #10b981;">📋</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">Exemples de stratégies TOWS</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<h5 style="color: #065f46; margin: 0 0 0.5rem 0;">💪 SO - Stratégies offensives</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.95rem;">Utiliser ma voix claire pour participer à un concours d\'éloquence</p>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<h5 style="color: #92400e; margin: 0 0 0.5rem 0;">🛡️ ST - Stratégies défensives</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.95rem;">M\'appuyer sur ma bonne préparation pour diminuer le stress du jugement</p>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<h5 style="color: #1d4ed8; margin: 0 0 0.5rem 0;">🚀 WO - Stratégies d\'adaptation</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.95rem;">Participer à un club de prise de parole pour travailler ma timidité</p>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #ef4444;'
-            '">'
-            '<h5 style="color: #dc2626; margin: 0 0 0.5rem 0;">⚠️ WT - Stratégies de survie</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.95rem;">Pratiquer la respiration avant chaque présentation pour gérer le trac</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Matrice TOWS interactive améliorée
-    st.markdown("### 🎯 Votre stratégie TOWS")
-    
-    # Conteneur pour l'exercice
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    st.markdown(
-        '<div style="'
-        'background: #f0f9ff;'
-        'padding: 1.5rem;'
-        'border-radius: 10px;'
-        'margin-bottom: 1.5rem;'
-        'border-left: 4px solid #0ea5e9;'
-        '">'
-        '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">🎯 Votre mission :</h5>'
-        '<p style="color: #334155; margin: 0;">Transformez votre analyse SWOT en stratégies d\'action concrètes avec la matrice TOWS.</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    cols = st.columns(4)
-    
-    with cols[0]:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<h4 style="color: #065f46;">💪 SO</h4>'
-            '<p style="color: #334155; font-size: 0.9rem;">Forces + Opportunités</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        so_ex = st.text_area(
-            "Exemple :",
-            "Utiliser ma voix claire pour participer à un concours d'éloquence",
-            key="tows_so",
-            height=120,
-            label_visibility="collapsed",
-            help="Comment utiliser vos forces pour saisir les opportunités ?"
-        )
-    
-    with cols[1]:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<h4 style="color: #92400e;">🛡️ ST</h4>'
-            '<p style="color: #334155; font-size: 0.9rem;">Forces + Menaces</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        st_ex = st.text_area(
-            "Exemple :",
-            "M'appuyer sur ma bonne préparation pour diminuer le stress du jugement",
-            key="tows_st",
-            height=120,
-            label_visibility="collapsed",
-            help="Comment utiliser vos forces pour contrer les menaces ?"
-        )
-    
-    with cols[2]:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<h4 style="color: #1d4ed8;">🚀 WO</h4>'
-            '<p style="color: #334155; font-size: 0.9rem;">Faiblesses + Opportunités</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        wo_ex = st.text_area(
-            "Exemple :",
-            "Participer à un club de prise de parole pour travailler ma timidité",
-            key="tows_wo",
-            height=120,
-            label_visibility="collapsed",
-            help="Comment transformer vos faiblesses en forces grâce aux opportunités ?"
-        )
-    
-    with cols[3]:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #ef4444;'
-            '">'
-            '<h4 style="color: #dc2626;">⚠️ WT</h4>'
-            '<p style="color: #334155; font-size: 0.9rem;">Faiblesses + Menaces</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        wt_ex = st.text_area(
-            "Exemple :",
-            "Pratiquer la respiration avant chaque présentation pour gérer le trac",
-            key="tows_wt",
-            height=120,
-            label_visibility="collapsed",
-            help="Comment minimiser vos faiblesses pour éviter les menaces ?"
-        )
-    
-    col_btn, col_result = st.columns([1, 3])
-    with col_btn:
-        if st.button("📈 Générer ma matrice TOWS", type="primary", use_container_width=True, key="tows_generate_btn"):
-            st.session_state.tows_matrix = {
-                "SO": so_ex,
-                "ST": st_ex,
-                "WO": wo_ex,
-                "WT": wt_ex
-            }
-    
-    with col_result:
-        if 'tows_matrix' in st.session_state:
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-                'padding: 2rem;'
-                'border-radius: 12px;'
-                'border-left: 4px solid #0ea5e9;'
-                'margin-top: 1rem;'
-                'border: 1px solid #cbd5e1;'
-                'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.1);'
-                '">'
-                '<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1.5rem;">'
-                '<div style="font-size: 2rem; color: #0ea5e9;">🔄</div>'
-                '<h4 style="color: #1e293b; margin: 0;">Votre matrice TOWS est prête !</h4>'
-                '</div>'
-                '<div style="background: white; padding: 1.5rem; border-radius: 8px;">'
-                '<div style="display: grid; grid-template-columns: 1fr 1fr; gap: 1rem;">'
-                '<div style="background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #10b981;">'
-                '<h5 style="color: #065f46; margin-top: 0;">💪 Forces + Opportunités (SO)</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.tows_matrix["SO"]}</p>'
-                '</div>'
-                '<div style="background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #f59e0b;">'
-                '<h5 style="color: #92400e; margin-top: 0;">🛡️ Forces + Menaces (ST)</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.tows_matrix["ST"]}</p>'
-                '</div>'
-                '<div style="background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #3b82f6;">'
-                '<h5 style="color: #1d4ed8; margin-top: 0;">🚀 Faiblesses + Opportunités (WO)</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.tows_matrix["WO"]}</p>'
-                '</div>'
-                '<div style="background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%); padding: 1.5rem; border-radius: 8px; border-left: 4px solid #ef4444;">'
-                '<h5 style="color: #dc2626; margin-top: 0;">⚠️ Faiblesses + Menaces (WT)</h5>'
-                f'<p style="color: #334155; margin: 0;">{st.session_state.tows_matrix["WT"]}</p>'
-                '</div>'
-                '</div>'
-                '</div>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    create_transition(
-        "Maintenant, place à l'action : mettons en pratique tout ce que nous avons appris !"
-    )
-
-def ateliers_section() -> None:
-    """Section Ateliers Interactifs"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">🎭</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">7. Ateliers Interactifs</h2>'
-        '<p style="color: #64748b; margin: 0;">Jeux de rôle et exercices pratiques</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte explicative des ateliers
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1.5rem;">🎭 Pourquoi pratiquer ?</h4>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 1.8rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-style: italic;'
-            'font-size: 1.2rem;'
-            'color: #1e293b;'
-            'margin: 1rem 0 1.5rem 0;'
-            'border: 1px solid #cbd5e1;'
-            'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.08);'
-            '">'
-            '"Ce n\'est pas en regardant la lumière qu\'on devient lumineux, mais en plongeant dans l\'obscurité."'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #ef4444;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #ef4444;">🎯</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #dc2626;">Atelier 1 - Concision :</strong> Exprimer l\'essentiel en 7 mots'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #3b82f6;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #3b82f6;">⏱️</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #1d4ed8;">Atelier 2 - Mini-TED :</strong> Structurer un discours en 1 minute'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0;'
-            'border-left: 3px solid #10b981;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #10b981;">🗣️</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #065f46;">Atelier 3 - Débat :</strong> Argumenter et convaincre'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'display: flex;'
-            'align-items: flex-start;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin: 0.8rem 0 1.5rem 0;'
-            'border-left: 3px solid #f59e0b;'
-            '">'
-            '<div style="font-size: 1.2rem; color: #f59e0b;">👂</div>'
-            '<div style="flex: 1;">'
-            '<strong style="color: #92400e;">Atelier 4 - Écoute :</strong> Pratiquer l\'écoute active'
-            '</div>'
-            '</div>'
-            
-            '<h4 style="color: #0ea5e9; margin-top: 1.5rem;">💪 L\'importance de la pratique :</h4>'
-            '<div style="background: #e0f2fe; padding: 1.2rem; border-radius: 10px; margin-top: 0.5rem;">'
-            '<p style="color: #334155; font-size: 1.1rem; margin: 0;">'
-            'C\'est en pratiquant que vous transformez <strong style="color: #0284c7;">la théorie en compétence naturelle</strong>.'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte des statistiques d'apprentissage
-        st.markdown(
-            '<div class="section-card">'
-            '<div style="display: flex; align-items: center; gap: 0.5rem; margin-bottom: 1.5rem;">'
-            '<div style="font-size: 1.5rem; color: #8b5cf6;">📈</div>'
-            '<h4 style="color: #0ea5e9; margin: 0;">Impact de la pratique</h4>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<div style="display: flex; align-items: center; justify-content: space-between;">'
-            '<div>'
-            '<h2 style="color: #065f46; margin: 0; font-size: 2rem;">70%</h2>'
-            '<p style="color: #065f46; margin: 0; font-size: 0.9rem;">De rétention après pratique</p>'
-            '</div>'
-            '<div style="font-size: 2rem; color: #10b981;">🧠</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<div style="display: flex; align-items: center; justify-content: space-between;">'
-            '<div>'
-            '<h2 style="color: #1e40af; margin: 0; font-size: 2rem;">4×</h2>'
-            '<p style="color: #1e40af; margin: 0; font-size: 0.9rem;">Plus de confiance acquise</p>'
-            '</div>'
-            '<div style="font-size: 2rem; color: #3b82f6;">💪</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1.5rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<div style="display: flex; align-items: center; justify-content: space-between;">'
-            '<div>'
-            '<h2 style="color: #92400e; margin: 0; font-size: 2rem;">90%</h2>'
-            '<p style="color: #92400e; margin: 0; font-size: 0.9rem;">Réduction du stress</p>'
-            '</div>'
-            '<div style="font-size: 2rem; color: #f59e0b;">😌</div>'
-            '</div>'
-            '</div>'
-            
-            '<h5 style="color: #0ea5e9; margin-bottom: 0.8rem;">🎯 Conseils de pratique :</h5>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            'margin-bottom: 0.5rem;'
-            '">'
-            '<div style="color: #f59e0b;">🔄</div>'
-            '<span style="color: #334155;">Pratiquez régulièrement (même 10 min/jour)</span>'
-            '</div>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            'margin-bottom: 0.5rem;'
-            '">'
-            '<div style="color: #3b82f6;">🎯</div>'
-            '<span style="color: #334155;">Concentrez-vous sur un aspect à la fois</span>'
-            '</div>'
-            '<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 0.8rem;'
-            'background: #f0f9ff;'
-            'padding: 0.8rem;'
-            'border-radius: 8px;'
-            '">'
-            '<div style="color: #10b981;">👥</div>'
-            '<span style="color: #334155;">Trouvez un partenaire d\'entraînement</span>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Sélecteur d'atelier amélioré
-    st.markdown("### 🎯 Choisissez un atelier à pratiquer :")
-    
-    # Conteneur pour le sélecteur
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 1.5rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin: 1rem 0 2rem 0;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    st.markdown(
-        '<div style="'
-        'background: #f0f9ff;'
-        'padding: 1rem;'
-        'border-radius: 10px;'
-        'margin-bottom: 1rem;'
-        'border-left: 4px solid #0ea5e9;'
-        '">'
-        '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">🎯 Votre mission :</h5>'
-        '<p style="color: #334155; margin: 0;">Sélectionnez un atelier et mettez en pratique vos compétences en communication.</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_selector1, col_selector2 = st.columns([3, 1])
-    
-    with col_selector1:
-        atelier = st.selectbox(
-            "Sélectionnez un atelier :",
-            ATELIERS,
-            key="atelier_select",
-            label_visibility="collapsed"
-        )
-    
-    with col_selector2:
-        if st.button("🚀 Démarrer l'atelier", type="primary", use_container_width=True, key="start_atelier_btn"):
-            st.session_state.selected_atelier = atelier
-    
-    # Indicateur visuel de l'atelier sélectionné
-    atelier_colors = {
-        "🟥 Atelier 1 : Concision (7 mots)": "#ef4444",
-        "🟦 Atelier 2 : Mini-TED (1 minute)": "#3b82f6", 
-        "🟩 Atelier 3 : Débat (Pour/Contre)": "#10b981",
-        "🟨 Atelier 4 : Écoute active (30s/15s)": "#f59e0b"
-    }
-    
-    if atelier in atelier_colors:
-        st.markdown(
-            f'<div style="'
-            'display: flex;'
-            'align-items: center;'
-            'gap: 1rem;'
-            'background: #f0f9ff;'
-            'padding: 1rem;'
-            'border-radius: 10px;'
-            'margin-top: 1rem;'
-            f'border-left: 4px solid {atelier_colors[atelier]};'
-            '">'
-            f'<div style="font-size: 1.5rem;">{atelier.split()[0]}</div>'
-            f'<div><strong style="color: #1e293b;">{atelier}</strong> sélectionné</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Conteneur pour l'atelier
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin: 1rem 0 2rem 0;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    if "🟥 Atelier 1" in atelier:
-        render_atelier_1()
-    elif "🟦 Atelier 2" in atelier:
-        render_atelier_2()
-    elif "🟩 Atelier 3" in atelier:
-        render_atelier_3()
-    elif "🟨 Atelier 4" in atelier:
-        render_atelier_4()
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-
-def render_atelier_1() -> None:
-    """Atelier 1 : TED Talk en 7 mots - Version enrichie"""
-    # En-tête de l'atelier
-    st.markdown(
-        f'<div style="'
-        'background: linear-gradient(135deg, #fee2e2 0%, #fecaca 100%);'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border-left: 4px solid #ef4444;'
-        'margin-bottom: 2rem;'
-        '">'
-        '<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;">'
-        '<div style="font-size: 2rem; color: #ef4444;">🟥</div>'
-        '<div>'
-        '<h3 style="color: #1e293b; margin: 0;">Atelier 1 : "Ton TED Talk en 7 mots"</h3>'
-        '<p style="color: #64748b; margin: 0;">La puissance de la concision</p>'
-        '</div>'
-        '</div>'
-        '<div style="background: white; padding: 1rem; border-radius: 8px; margin-top: 1rem;">'
-        '<strong style="color: #dc2626;">🎯 Objectif :</strong> Exprimer une idée claire et mémorable en très peu de mots.'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_inst1, col_inst2 = st.columns(2)
-    
-    with col_inst1:
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #0ea5e9;'
-            '">'
-            '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">📝 Instructions :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Pensez à l\'idée principale de votre prochain discours</li>'
-            '<li>Exprimez-la en <strong>7 mots maximum</strong></li>'
-            '<li>Soyez concis, percutant et mémorable</li>'
-            '</ul>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_inst2:
-        st.markdown(
-            '<div style="'
-            'background: #d1fae5;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<h5 style="color: #065f46; margin: 0 0 0.5rem 0;">💡 Pourquoi 7 mots ?</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.9rem;">'
-            'La mémoire à court terme retient 7±2 éléments. C\'est le nombre idéal pour une idée mémorable.'
-            '</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Zone de saisie améliorée
-    st.markdown("### ✍️ Votre idée en 7 mots")
-    
-    col_input1, col_input2, col_input3 = st.columns([3, 1, 1])
-    
-    with col_input1:
-        idee_7_mots = st.text_input(
-            "**Votre idée :**",
-            max_chars=50,
-            key="atelier1_idea",
-            placeholder="Ex: La discipline surpasse toujours la motivation"
-        )
-    
-    with col_input2:
-        mots = len(idee_7_mots.split()) if idee_7_mots else 0
-        st.metric("Mots", mots)
-    
-    with col_input3:
-        caracteres = len(idee_7_mots) if idee_7_mots else 0
-        st.metric("Caractères", caracteres)
-    
-    # Feedback visuel enrichi
-    if idee_7_mots:
-        col_result, col_visual = st.columns([3, 1])
-        
-        with col_result:
-            if mots <= 7:
-                st.markdown(
-                    f'<div style="'
-                    'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-                    'padding: 1.5rem;'
-                    'border-radius: 10px;'
-                    'border-left: 4px solid #10b981;'
-                    '">'
-                    '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-                    '<div style="font-size: 1.5rem; color: #065f46;">✅</div>'
-                    '<h5 style="color: #065f46; margin: 0;">Parfait !</h5>'
-                    '</div>'
-                    f'<p style="color: #334155; margin: 0; font-size: 1.1rem;">{mots}/7 mots - Votre idée est concise et puissante !</p>'
-                    '</div>',
-                    unsafe_allow_html=True
-                )
-                st.balloons()
-            else:
-                st.markdown(
-                    f'<div style="'
-                    'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-                    'padding: 1.5rem;'
-                    'border-radius: 10px;'
-                    'border-left: 4px solid #f59e0b;'
-                    '">'
-                    '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-                    '<div style="font-size: 1.5rem; color: #92400e;">💡</div>'
-                    '<h5 style="color: #92400e; margin: 0;">À améliorer</h5>'
-                    '</div>'
-                    f'<p style="color: #334155; margin: 0;">{mots}/7 mots - Essayez d\'être plus concis</p>'
-                    '</div>',
-                    unsafe_allow_html=True
-                )
-                
-                # Suggestions contextuelles
-                if mots > 10:
-                    st.info("""
-                    💡 **Astuces de concision :**
-                    • Supprimez les adjectifs superflus
-                    • Concentrez-vous sur le verbe principal
-                    • Utilisez des mots plus forts et précis
-                    """)
-        
-        with col_visual:
-            if mots <= 3:
-                st.markdown(
-                    '<div style="'
-                    'background: linear-gradient(135deg, #818cf8 0%, #c7d2fe 100%);'
-                    'padding: 1.5rem;'
-                    'border-radius: 10px;'
-                    'text-align: center;'
-                    '">'
-                    '<div style="font-size: 3rem; color: white;">🚀</div>'
-                    '<div style="color: white; font-weight: bold;">Ultra-concis !</div>'
-                    '</div>',
-                    unsafe_allow_html=True
-                )
-            elif mots <= 7:
-                st.markdown(
-                    '<div style="'
-                    'background: linear-gradient(135deg, #34d399 0%, #a7f3d0 100%);'
-                    'padding: 1.5rem;'
-                    'border-radius: 10px;'
-                    'text-align: center;'
-                    '">'
-                    '<div style="font-size: 3rem; color: white;">🎯</div>'
-                    '<div style="color: white; font-weight: bold;">Parfait !</div>'
-                    '</div>',
-                    unsafe_allow_html=True
-                )
-    
-    st.markdown("---")
-    
-    # Exemples réussis
-    st.markdown("### 📚 Exemples réussis")
-    
-    col_ex1, col_ex2, col_ex3 = st.columns(3)
-    
-    with col_ex1:
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            'border: 1px solid #cbd5e1;'
-            '">'
-            '<div style="font-size: 1.5rem; color: #0ea5e9;">💬</div>'
-            '<p style="color: #334155; margin: 0.5rem 0; font-style: italic;">"La peur disparaît quand on avance."</p>'
-            '<div style="color: #64748b; font-size: 0.9rem;">4 mots</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_ex2:
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            'border: 1px solid #cbd5e1;'
-            '">'
-            '<div style="font-size: 1.5rem; color: #10b981;">💬</div>'
-            '<p style="color: #334155; margin: 0.5rem 0; font-style: italic;">"La discipline construit les rêves."</p>'
-            '<div style="color: #64748b; font-size: 0.9rem;">3 mots</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_ex3:
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            'border: 1px solid #cbd5e1;'
-            '">'
-            '<div style="font-size: 1.5rem; color: #8b5cf6;">💬</div>'
-            '<p style="color: #334155; margin: 0.5rem 0; font-style: italic;">"L\'écoute est la clé de la connexion."</p>'
-            '<div style="color: #64748b; font-size: 0.9rem;">5 mots</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-
-def render_atelier_2() -> None:
-    """Atelier 2 : Mini-TED de 1 minute - Version avec timer fonctionnel"""
-    # En-tête de l'atelier
-    st.markdown(
-        f'<div style="'
-        'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border-left: 4px solid #3b82f6;'
-        'margin-bottom: 2rem;'
-        '">'
-        '<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;">'
-        '<div style="font-size: 2rem; color: #3b82f6;">🟦</div>'
-        '<div>'
-        '<h3 style="color: #1e293b; margin: 0;">Atelier 2 : "Le Mini-TED de 1 minute"</h3>'
-        '<p style="color: #64748b; margin: 0;">Structurez un discours court et impactant</p>'
-        '</div>'
-        '</div>'
-        '<div style="background: white; padding: 1rem; border-radius: 8px; margin-top: 1rem;">'
-        '<strong style="color: #1d4ed8;">🎯 Objectif :</strong> Apprendre à structurer un discours efficace en temps limité.'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_inst1, col_inst2 = st.columns(2)
-    
-    with col_inst1:
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #0ea5e9;'
-            '">'
-            '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">📝 Instructions :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Choisissez un sujet qui vous passionne</li>'
-            '<li>Structurez votre discours en 3 parties</li>'
-            '<li>Préparez-vous à parler pendant 1 minute</li>'
-            '</ul>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_inst2:
-        st.markdown(
-            '<div style="'
-            'background: #d1fae5;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<h5 style="color: #065f46; margin: 0 0 0.5rem 0;">⏱️ Structure en 1 minute :</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.9rem;">'
-            '• 20s : Introduction et accroche<br>'
-            '• 30s : Corps du message<br>'
-            '• 10s : Conclusion et appel à l\'action'
-            '</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Sélection du sujet
-    st.markdown("### 🎯 Choisissez votre sujet")
-    
-    sujet_options = [
-        "Pourquoi apprendre une nouvelle compétence à tout âge",
-        "L'importance de sortir de sa zone de confort",
-        "Comment gérer son temps efficacement",
-        "Le pouvoir des petites habitudes quotidiennes",
-        "Votre sujet personnalisé"
-    ]
-    
-    sujet = st.selectbox(
-        "**Sélectionnez un sujet :**",
-        sujet_options,
-        key="atelier2_sujet"
-    )
-    
-    if sujet == "Votre sujet personnalisé":
-        sujet_perso = st.text_input(
-            "**Proposez votre sujet :**",
-            key="atelier2_sujet_perso",
-            placeholder="Ex: L'importance de la gratitude au quotidien"
-        )
-        if sujet_perso:
-            sujet = sujet_perso
-    
-    # Structure du discours
-    st.markdown("### 📝 Structurez votre discours")
-    
-    col_struct1, col_struct2, col_struct3 = st.columns(3)
-    
-    with col_struct1:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            '">'
-            '<div style="font-size: 2rem; color: #10b981;">🎯</div>'
-            '<h5 style="color: #065f46;">Introduction (20s)</h5>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        intro = st.text_area(
-            "**Accroche + idée principale :**",
-            key="atelier2_intro",
-            height=100,
-            placeholder="Ex: Saviez-vous que...\nAujourd'hui, je veux partager avec vous..."
-        )
-    
-    with col_struct2:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            '">'
-            '<div style="font-size: 2rem; color: #3b82f6;">💡</div>'
-            '<h5 style="color: #1d4ed8;">Corps (30s)</h5>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        corps = st.text_area(
-            "**Développement + arguments :**",
-            key="atelier2_corps",
-            height=100,
-            placeholder="Ex: Premièrement...\nDeuxièmement...\nEnfin..."
-        )
-    
-    with col_struct3:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            '">'
-            '<div style="font-size: 2rem; color: #f59e0b;">🎬</div>'
-            '<h5 style="color: #92400e;">Conclusion (10s)</h5>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        conclusion = st.text_area(
-            "**Résumé + appel à l'action :**",
-            key="atelier2_conclusion",
-            height=100,
-            placeholder="Ex: En résumé...\nJe vous invite à..."
-        )
-    
-    # Timer et pratique - SECTION SIMPLIFIÉE SANS TIMER AUTOMATIQUE
-    st.markdown("### ⏱️ Entraînez-vous au chrono")
-    
-    # Placeholders pour l'affichage dynamique
-    timer_display = st.empty()
-    progress_display = st.empty()
-    message_display = st.empty()
-    
-    # Initialiser l'état du timer
-    if 'atelier2_timer_active' not in st.session_state:
-        st.session_state.atelier2_timer_active = False
-    if 'atelier2_time_left' not in st.session_state:
-        st.session_state.atelier2_time_left = 60
-    
-    col_timer1, col_timer2, col_timer3 = st.columns(3)
-    
-    with col_timer1:
-        start_clicked = st.button("▶️ Démarrer le timer 1min", type="primary", use_container_width=True, key="start_timer_btn2")
-        if start_clicked:
-            st.session_state.atelier2_timer_active = True
-            st.session_state.atelier2_time_left = 60
-            st.rerun()
-    
-    with col_timer2:
-        stop_clicked = st.button("⏹️ Arrêter", use_container_width=True, key="stop_timer_btn2")
-        if stop_clicked:
-            st.session_state.atelier2_timer_active = False
-            st.rerun()
-    
-    with col_timer3:
-        reset_clicked = st.button("🔄 Recommencer", use_container_width=True, key="reset_timer_btn2")
-        if reset_clicked:
-            st.session_state.atelier2_timer_active = False
-            st.session_state.atelier2_time_left = 60
-            st.rerun()
-    
-    # Afficher le timer
-    if st.session_state.atelier2_timer_active:
-        # Calculer les minutes et secondes
-        minutes = st.session_state.atelier2_time_left // 60
-        seconds = st.session_state.atelier2_time_left % 60
-        
-        # Déterminer la couleur
-        if st.session_state.atelier2_time_left <= 10:
-            timer_color = "#ef4444"
-            timer_message = "⏰ **10 secondes restantes !** Préparez votre conclusion."
-        elif st.session_state.atelier2_time_left <= 30:
-            timer_color = "#f59e0b"
-            timer_message = "⏳ **30 secondes restantes !** Vous êtes dans le corps du discours."
-        else:
-            timer_color = "#10b981"
-            timer_message = "✅ **Bon rythme !** Continuez comme ça."
-        
-        # Calculer la progression
-        progress = 1 - (st.session_state.atelier2_time_left / 60)
-        
-        # Afficher le timer
-        with timer_display.container():
-            st.markdown(
-                f'<div style="text-align: center; padding: 1.5rem; background: #f8fafc; border-radius: 12px; border: 3px solid {timer_color};">'
-                f'<div style="font-size: 3.5rem; color: {timer_color}; font-weight: bold; margin-bottom: 0.5rem;">'
-                f'{minutes:02d}:{seconds:02d}'
-                f'</div>'
-                f'<div style="color: #64748b; font-size: 1rem;">Temps restant</div>'
-                f'</div>',
-                unsafe_allow_html=True
-            )
-        
-        # Afficher la barre de progression
-        progress_display.progress(progress)
-        
-        # Afficher le message
-        message_display.info(timer_message)
-        
-        # Si le timer est actif, le décrémenter
-        if st.session_state.atelier2_time_left > 0:
-            # Ajouter un délai pour la prochaine exécution
-            time.sleep(1)
-            st.session_state.atelier2_time_left -= 1
-            st.rerun()
-        else:
-            # Timer terminé
-            st.session_state.atelier2_timer_active = False
-            st.success("🎉 **Temps écoulé !** Excellent travail !")
-            st.balloons()
-            timer_display.empty()
-            progress_display.empty()
-            message_display.empty()
-    else:
-        # Afficher l'état initial
-        with timer_display.container():
-            if st.session_state.atelier2_time_left < 60:
-                minutes = st.session_state.atelier2_time_left // 60
-                seconds = st.session_state.atelier2_time_left % 60
-                st.markdown(
-                    f'<div style="text-align: center; padding: 1.5rem; background: #f8fafc; border-radius: 12px; border: 2px solid #94a3b8;">'
-                    f'<div style="font-size: 3rem; color: #64748b; font-weight: bold; margin-bottom: 0.5rem;">'
-                    f'{minutes:02d}:{seconds:02d}'
-                    f'</div>'
-                    f'<div style="color: #94a3b8; font-size: 0.9rem;">Timer en pause</div>'
-                    f'</div>',
-                    unsafe_allow_html=True
-                )
-    
-    # Guide de structure
-    if st.button("📋 Afficher le guide de structure", key="show_guide_btn2"):
-        st.session_state.show_guide_atelier2 = not st.session_state.get('show_guide_atelier2', False)
-    
-    if st.session_state.get('show_guide_atelier2', False):
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-top: 1rem;'
-            'border-left: 4px solid #0ea5e9;'
-            '">'
-            '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">📋 Guide de structure (1 minute) :</h5>'
-            '<div style="display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 1rem;">'
-            '<div>'
-            '<strong>🎯 Introduction (20s)</strong><br>'
-            '• Accroche percutante<br>'
-            '• Présentation du sujet<br>'
-            '• Annonce du plan'
-            '</div>'
-            '<div>'
-            '<strong>💡 Corps (30s)</strong><br>'
-            '• 1er point principal<br>'
-            '• 2ème point principal<br>'
-            '• Exemple concret'
-            '</div>'
-            '<div>'
-            '<strong>🎬 Conclusion (10s)</strong><br>'
-            '• Résumé des points<br>'
-            '• Message clé<br>'
-            '• Appel à l\'action'
-            '</div>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Feedback automatique
-    if intro and corps and conclusion:
-        st.markdown("### 📊 Votre feedback")
-        
-        # Analyse de la structure
-        mots_intro = len(intro.split())
-        mots_corps = len(corps.split())
-        mots_conclu = len(conclusion.split())
-        total_mots = mots_intro + mots_corps + mots_conclu
-        
-        col_fb1, col_fb2, col_fb3 = st.columns(3)
-        
-        with col_fb1:
-            st.metric("Introduction", f"{mots_intro} mots")
-            if mots_intro < 40:
-                st.success("✅ Parfait pour 20s")
-            elif mots_intro < 60:
-                st.warning("⚠️ Un peu long pour 20s")
-            else:
-                st.error("❌ Trop long pour 20s")
-        
-        with col_fb2:
-            st.metric("Corps", f"{mots_corps} mots")
-            if 50 < mots_corps < 80:
-                st.success("✅ Idéal pour 30s")
-            elif mots_corps < 50:
-                st.warning("⚠️ Pourrait être plus développé")
-            else:
-                st.error("❌ Trop dense pour 30s")
-        
-        with col_fb3:
-            st.metric("Conclusion", f"{mots_conclu} mots")
-            if mots_conclu < 25:
-                st.success("✅ Parfait pour 10s")
-            elif mots_conclu < 35:
-                st.warning("⚠️ Un peu long pour 10s")
-            else:
-                st.error("❌ Trop long pour 10s")
-        
-        # Conseils personnalisés
-        if total_mots < 120:
-            st.info("💡 **Conseil :** Votre discours est un peu court. Ajoutez des exemples ou des détails pour enrichir votre message.")
-        elif total_mots > 200:
-            st.info("💡 **Conseil :** Votre discours est trop long pour 1 minute. Simplifiez et concentrez-vous sur l'essentiel.")
-        else:
-            st.success("🎯 **Excellent !** Votre structure est bien équilibrée pour 1 minute.")
-    
-    st.markdown("---")
-    
-    # Exemples de discours réussis
-    st.markdown("### 📚 Exemples de discours 1 minute")
-    
-    with st.expander("📖 Voir des exemples réussis"):
-        col_ex1, col_ex2 = st.columns(2)
-        
-        with col_ex1:
-            st.markdown(
-                '<div style="'
-                'background: #f0f9ff;'
-                'padding: 1.5rem;'
-                'border-radius: 10px;'
-                '">'
-                '<h5 style="color: #0369a1;">💡 Exemple 1 : "Le pouvoir des petites habitudes"</h5>'
-                '<p style="color: #334155; font-size: 0.9rem;">'
-                '<strong>Introduction (20s):</strong> Imaginez améliorer votre vie 1% chaque jour...<br><br>'
-                '<strong>Corps (30s):</strong> Une petite habitude quotidienne, comme lire 10 pages, peut transformer votre année...<br><br>'
-                '<strong>Conclusion (10s):</strong> Commencez aujourd\'hui avec une micro-habitude !'
-                '</p>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-        
-        with col_ex2:
-            st.markdown(
-                '<div style="'
-                'background: #f0f9ff;'
-                'padding: 1.5rem;'
-                'border-radius: 10px;'
-                '">'
-                '<h5 style="color: #0369a1;">🎯 Exemple 2 : "Sortir de sa zone de confort"</h5>'
-                '<p style="color: #334155; font-size: 0.9rem;">'
-                '<strong>Introduction (20s):</strong> La zone de confort est douce mais elle ne fait pas grandir...<br><br>'
-                '<strong>Corps (30s):</strong> Chaque défi relevé renforce la confiance et ouvre de nouvelles portes...<br><br>'
-                '<strong>Conclusion (10s):</strong> Osez un petit pas hors de votre routine aujourd\'hui !'
-                '</p>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-
-def render_atelier_3() -> None:
-    """Atelier 3 : Jeu de rôle Pour ou Contre - Version avec timer fonctionnel"""
-    # En-tête de l'atelier
-    st.markdown(
-        f'<div style="'
-        'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border-left: 4px solid #10b981;'
-        'margin-bottom: 2rem;'
-        '">'
-        '<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;">'
-        '<div style="font-size: 2rem; color: #10b981;">🟩</div>'
-        '<div>'
-        '<h3 style="color: #1e293b; margin: 0;">Atelier 3 : "Jeu de rôle Pour ou Contre ?"</h3>'
-        '<p style="color: #64748b; margin: 0;">Développez vos compétences d\'argumentation</p>'
-        '</div>'
-        '</div>'
-        '<div style="background: white; padding: 1rem; border-radius: 8px; margin-top: 1rem;">'
-        '<strong style="color: #065f46;">🎯 Objectif :</strong> Apprendre à argumenter efficacement, même sur des positions qui ne sont pas les vôtres.'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_inst1, col_inst2 = st.columns(2)
-    
-    with col_inst1:
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #0ea5e9;'
-            '">'
-            '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">📝 Instructions :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Un sujet controversé vous est attribué</li>'
-            '<li>Une position (Pour/Contre) vous est assignée</li>'
-            '<li>Préparez 3 arguments solides en 2 minutes</li>'
-            '</ul>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_inst2:
-        st.markdown(
-            '<div style="'
-            'background: #fee2e2;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #ef4444;'
-            '">'
-            '<h5 style="color: #dc2626; margin: 0 0 0.5rem 0;">💪 Défi :</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.9rem;">'
-            'Vous devez défendre une position même si elle ne correspond pas à votre opinion personnelle.'
-            '</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Sélection aléatoire du sujet et position
-    st.markdown("### 🎲 Lancez le défi !")
-    
-    col_challenge1, col_challenge2, col_challenge3 = st.columns([1, 2, 1])
-    
-    with col_challenge2:
-        if st.button("🎯 Générer un défi", type="primary", use_container_width=True, key="generate_challenge_btn"):
-            # Sélection aléatoire
-            sujet_debat = random.choice(DEBATE_TOPICS)
-            position = random.choice(["POUR", "CONTRE"])
-            
-            st.session_state.debat_sujet = sujet_debat
-            st.session_state.debat_position = position
-            # Réinitialiser le timer
-            st.session_state.atelier3_timer_active = False
-            st.session_state.atelier3_time_left = 120
-            st.rerun()
-    
-    # Affichage du défi
-    if st.session_state.get('debat_sujet', False):
-        col_display1, col_display2, col_display3 = st.columns([1, 2, 1])
-        
-        with col_display2:
-            position_color = "#10b981" if st.session_state.debat_position == "POUR" else "#ef4444"
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);'
-                'padding: 2rem;'
-                'border-radius: 12px;'
-                'text-align: center;'
-                'border: 1px solid #cbd5e1;'
-                'margin: 1rem 0;'
-                '">'
-                f'<div style="font-size: 2rem; color: {position_color}; margin-bottom: 1rem;">{"✅" if st.session_state.debat_position == "POUR" else "❌"}</div>'
-                f'<h4 style="color: #1e293b; margin: 0 0 0.5rem 0;">{st.session_state.debat_sujet}</h4>'
-                f'<div style="background: {"#d1fae5" if st.session_state.debat_position == "POUR" else "#fee2e2"}; '
-                f'padding: 0.5rem 1rem; border-radius: 20px; display: inline-block; margin-top: 0.5rem;">'
-                f'<strong style="color: {"#065f46" if st.session_state.debat_position == "POUR" else "#dc2626"};">'
-                f'Position : {st.session_state.debat_position}'
-                f'</strong></div>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-        
-        # Timer de préparation - SECTION SIMPLIFIÉE
-        st.markdown("### ⏱️ Temps de préparation : 2 minutes")
-        
-        # Initialiser l'état du timer
-        if 'atelier3_timer_active' not in st.session_state:
-            st.session_state.atelier3_timer_active = False
-        if 'atelier3_time_left' not in st.session_state:
-            st.session_state.atelier3_time_left = 120
-        
-        # Placeholders pour l'affichage
-        timer_display3 = st.empty()
-        progress_display3 = st.empty()
-        message_display3 = st.empty()
-        
-        col_timer1, col_timer2, col_timer3 = st.columns(3)
-        
-        with col_timer1:
-            start_timer3 = st.button("▶️ Démarrer timer 2min", type="primary", use_container_width=True, key="start_timer3")
-            if start_timer3:
-                st.session_state.atelier3_timer_active = True
-                st.session_state.atelier3_time_left = 120
-                st.rerun()
-        
-        with col_timer2:
-            stop_timer3 = st.button("⏹️ Arrêter", use_container_width=True, key="stop_timer3")
-            if stop_timer3:
-                st.session_state.atelier3_timer_active = False
-                st.rerun()
-        
-        with col_timer3:
-            reset_timer3 = st.button("🔄 Redémarrer", use_container_width=True, key="reset_timer3")
-            if reset_timer3:
-                st.session_state.atelier3_timer_active = False
-                st.session_state.atelier3_time_left = 120
-                st.rerun()
-        
-        # Afficher et gérer le timer
-        if st.session_state.atelier3_timer_active:
-            # Calculer les minutes et secondes
-            minutes = st.session_state.atelier3_time_left // 60
-            seconds = st.session_state.atelier3_time_left % 60
-            
-            # Déterminer la couleur et le message
-            if st.session_state.atelier3_time_left <= 30:
-                timer_color = "#ef4444"
-                timer_message = "⏰ **30 secondes restantes !** Finalisez vos arguments."
-            elif st.session_state.atelier3_time_left <= 60:
-                timer_color = "#f59e0b"
-                timer_message = "⏳ **1 minute restante !** Structurez vos arguments principaux."
-            else:
-                timer_color = "#10b981"
-                timer_message = "✅ **Bon début !** Prenez le temps de bien préparer vos arguments."
-            
-            # Calculer la progression
-            progress = 1 - (st.session_state.atelier3_time_left / 120)
-            
-            # Afficher le timer
-            with timer_display3.container():
-                st.markdown(
-                    f'<div style="text-align: center; padding: 1.5rem; background: #f8fafc; border-radius: 12px; border: 3px solid {timer_color};">'
-                    f'<div style="font-size: 3.5rem; color: {timer_color}; font-weight: bold; margin-bottom: 0.5rem;">'
-                    f'{minutes:02d}:{seconds:02d}'
-                    f'</div>'
-                    f'<div style="color: #64748b; font-size: 1rem;">Temps de préparation restant</div>'
-                    f'</div>',
-                    unsafe_allow_html=True
-                )
-            
-            # Afficher la barre de progression
-            progress_display3.progress(progress)
-            
-            # Afficher le message
-            message_display3.info(timer_message)
-            
-            # Décrémenter le timer
-            if st.session_state.atelier3_time_left > 0:
-                time.sleep(1)
-                st.session_state.atelier3_time_left -= 1
-                st.rerun()
-            else:
-                # Timer terminé
-                st.session_state.atelier3_timer_active = False
-                st.success("✅ **Temps écoulé !** Préparez-vous à présenter vos arguments.")
-                timer_display3.empty()
-                progress_display3.empty()
-                message_display3.empty()
-        else:
-            # Afficher l'état initial ou en pause
-            if st.session_state.atelier3_time_left < 120:
-                minutes = st.session_state.atelier3_time_left // 60
-                seconds = st.session_state.atelier3_time_left % 60
-                with timer_display3.container():
-                    st.markdown(
-                        f'<div style="text-align: center; padding: 1.5rem; background: #f8fafc; border-radius: 12px; border: 2px solid #94a3b8;">'
-                        f'<div style="font-size: 3rem; color: #64748b; font-weight: bold; margin-bottom: 0.5rem;">'
-                        f'{minutes:02d}:{seconds:02d}'
-                        f'</div>'
-                        f'<div style="color: #94a3b8; font-size: 0.9rem;">Timer en pause</div>'
-                        f'</div>',
-                        unsafe_allow_html=True
-                    )
-    
-    # Zone de préparation des arguments
-    st.markdown("### 💡 Préparez vos arguments")
-    
-    col_arg1, col_arg2, col_arg3 = st.columns(3)
-    
-    with col_arg1:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            'margin-bottom: 1rem;'
-            '">'
-            '<div style="font-size: 2rem; color: #10b981;">1️⃣</div>'
-            '<h5 style="color: #065f46;">Argument principal</h5>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        arg1 = st.text_area(
-            "**Votre argument le plus fort :**",
-            key="arg1",
-            height=100,
-            placeholder="Ex: Cet avantage majeur change complètement la situation..."
-        )
-    
-    with col_arg2:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            'margin-bottom: 1rem;'
-            '">'
-            '<div style="font-size: 2rem; color: #3b82f6;">2️⃣</div>'
-            '<h5 style="color: #1d4ed8;">Second argument</h5>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        arg2 = st.text_area(
-            "**Un argument complémentaire :**",
-            key="arg2",
-            height=100,
-            placeholder="Ex: Les études montrent que..."
-        )
-    
-    with col_arg3:
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            'margin-bottom: 1rem;'
-            '">'
-            '<div style="font-size: 2rem; color: #f59e0b;">3️⃣</div>'
-            '<h5 style="color: #92400e;">Troisième argument</h5>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        arg3 = st.text_area(
-            "**Un dernier point important :**",
-            key="arg3",
-            height=100,
-            placeholder="Ex: Sans oublier que cela permet aussi..."
-        )
-    
-    # Zone de contre-arguments
-    st.markdown("### 🛡️ Anticipez les objections")
-    
-    contre_arg = st.text_area(
-        "**Quelles objections votre adversaire pourrait-il soulever ?**",
-        key="contre_arg",
-        height=100,
-        placeholder="Ex: On pourrait me dire que...\nJe répondrai que..."
-    )
-    
-    # Validation et feedback
-    if arg1 and arg2 and arg3:
-        st.markdown("### 📊 Analyse de vos arguments")
-        
-        col_ana1, col_ana2, col_ana3 = st.columns(3)
-        
-        with col_ana1:
-            mots_arg1 = len(arg1.split())
-            st.metric("Argument 1", f"{mots_arg1} mots")
-            if mots_arg1 > 30:
-                st.success("✅ Détail suffisant")
-            else:
-                st.warning("⚠️ Pourrait être plus développé")
-        
-        with col_ana2:
-            mots_arg2 = len(arg2.split())
-            st.metric("Argument 2", f"{mots_arg2} mots")
-            if mots_arg2 > 20:
-                st.success("✅ Bon équilibre")
-            else:
-                st.warning("⚠️ Un peu court")
-        
-        with col_ana3:
-            mots_arg3 = len(arg3.split())
-            st.metric("Argument 3", f"{mots_arg3} mots")
-            if mots_arg3 > 15:
-                st.success("✅ Suffisamment élaboré")
-            else:
-                st.info("💡 Pourrait être renforcé")
-        
-        # Types d'arguments détectés
-        types_args = []
-        if "étude" in arg1.lower() or "statistique" in arg1.lower() or "recherche" in arg1.lower():
-            types_args.append("📊 Argument scientifique")
-        if "exemple" in arg1.lower() or "cas" in arg1.lower() or "histoire" in arg1.lower():
-            types_args.append("📖 Argument par l'exemple")
-        if "logique" in arg1.lower() or "donc" in arg1.lower() or "parce que" in arg1.lower():
-            types_args.append("🧠 Argument logique")
-        
-        if types_args:
-            st.info(f"💡 **Types d'arguments utilisés :** {', '.join(types_args)}")
-        
-        # Force de persuasion
-        force_score = 0
-        if len(arg1.split()) > 25: force_score += 1
-        if len(arg2.split()) > 20: force_score += 1
-        if len(arg3.split()) > 15: force_score += 1
-        if contre_arg: force_score += 2
-        
-        col_force1, col_force2 = st.columns([2, 1])
-        with col_force1:
-            if force_score >= 4:
-                st.success("🎯 **Excellent !** Vos arguments sont solides et bien préparés.")
-            elif force_score >= 2:
-                st.info("📈 **Bon travail !** Vos arguments sont bien structurés.")
-            else:
-                st.warning("💪 **Continuez !** Développez davantage vos arguments.")
-        
-        with col_force2:
-            st.metric("Score de persuasion", f"{force_score}/5")
-    
-    # Section d'entraînement
-    st.markdown("### 🎭 Entraînement au contre-argument")
-    
-    if st.button("🔄 S'entraîner avec un contre-argument", key="counter_training_btn"):
-        contre_exemples = [
-            "Mais cette solution est trop coûteuse à mettre en œuvre.",
-            "Et si cette approche créait plus de problèmes qu'elle n'en résout ?",
-            "Vous oubliez de considérer l'impact sur les plus vulnérables.",
-            "Cela a déjà été tenté et cela n'a pas fonctionné."
-        ]
-        st.session_state.contre_exemple = random.choice(contre_exemples)
-    
-    if st.session_state.get('contre_exemple', False):
-        col_ce1, col_ce2 = st.columns([2, 1])
-        with col_ce1:
-            st.markdown(
-                f'<div style="'
-                'background: #fee2e2;'
-                'padding: 1.5rem;'
-                'border-radius: 10px;'
-                'border-left: 4px solid #ef4444;'
-                '">'
-                f'<h5 style="color: #dc2626; margin: 0 0 0.5rem 0;">Contre-argument à réfuter :</h5>'
-                f'<p style="color: #334155; margin: 0;">"{st.session_state.contre_exemple}"</p>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-        
-        with col_ce2:
-            reponse = st.text_area(
-                "**Votre réfutation :**",
-                key="reponse_contre",
-                height=100,
-                placeholder="Ex: Je comprends cette objection, mais..."
-            )
-            
-            if reponse:
-                st.success("✅ Bonne réfutation !")
-    
-    st.markdown("---")
-    
-    # Conseils pour bien argumenter
-    with st.expander("💡 Conseils pour un débat efficace"):
-        col_tips1, col_tips2 = st.columns(2)
-        
-        with col_tips1:
-            st.markdown(
-                '''
-                **🎯 Structurez vos arguments :**
-                • Commencez par votre point le plus fort
-                • Utilisez des faits et des exemples
-                • Liez chaque argument à votre thèse principale
-                
-                **🗣️ Technique de parole :**
-                • Parlez lentement et clairement
-                • Maintenez un contact visuel (même virtuel)
-                • Utilisez des pauses pour marquer vos points
-                '''
-            )
-        
-        with col_tips2:
-            st.markdown(
-                '''
-                **🛡️ Gestion des objections :**
-                • Écoutez attentivement le contre-argument
-                • Reconnaissez le point de vue adverse
-                • Réfutez avec des faits, pas des émotions
-                
-                **🧠 État d'esprit :**
-                • Restez calme et respectueux
-                • Concentrez-vous sur les idées, pas les personnes
-                • Apprenez de chaque échange
-                '''
-            )
-
-def render_atelier_4() -> None:
-    """Atelier 4 : L'écoute active - Version avec timer fonctionnel"""
-    # En-tête de l'atelier
-    st.markdown(
-        f'<div style="'
-        'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border-left: 4px solid #f59e0b;'
-        'margin-bottom: 2rem;'
-        '">'
-        '<div style="display: flex; align-items: center; gap: 1rem; margin-bottom: 1rem;">'
-        '<div style="font-size: 2rem; color: #f59e0b;">🟨</div>'
-        '<div>'
-        '<h3 style="color: #1e293b; margin: 0;">Atelier 4 : "L\'écoute active"</h3>'
-        '<p style="color: #64748b; margin: 0;">Pratiquez l\'écoute empathique et constructive</p>'
-        '</div>'
-        '</div>'
-        '<div style="background: white; padding: 1rem; border-radius: 8px; margin-top: 1rem;">'
-        '<strong style="color: #92400e;">🎯 Objectif :</strong> Développer l\'écoute active pour mieux comprendre et répondre avec empathie.'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_inst1, col_inst2 = st.columns(2)
-    
-    with col_inst1:
-        st.markdown(
-            '<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #0ea5e9;'
-            '">'
-            '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">📝 Instructions :</h5>'
-            '<ul style="color: #334155; margin: 0; padding-left: 1.2rem;">'
-            '<li>Écoutez attentivement le message</li>'
-            '<li>Reformulez avec vos propres mots</li>'
-            '<li>Validez les émotions exprimées</li>'
-            '</ul>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_inst2:
-        st.markdown(
-            '<div style="'
-            'background: #d1fae5;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<h5 style="color: #065f46; margin: 0 0 0.5rem 0;">👂 La règle 30s/15s :</h5>'
-            '<p style="color: #334155; margin: 0; font-size: 0.9rem;">'
-            '• 30 secondes : Écouter sans interrompre<br>'
-            '• 15 secondes : Reformuler et valider'
-            '</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Scénarios d'écoute active
-    st.markdown("### 🎭 Choisissez un scénario")
-    
-    scenarios = [
-        "Un collègue stressé par une deadline",
-        "Un ami qui doute de ses capacités",
-        "Un client mécontent d'un service",
-        "Un membre de l'équipe qui se sent sous-estimé",
-        "Une personne qui a peur de prendre la parole"
-    ]
-    
-    scenario = st.selectbox(
-        "**Sélectionnez un scénario :**",
-        scenarios,
-        key="atelier4_scenario"
-    )
-    
-    # Messages selon le scénario
-    messages_scenarios = {
-        "Un collègue stressé par une deadline": "Je ne vais jamais y arriver à temps. Ce projet est trop important et je crains de le rater complètement. Tout le monde compte sur moi et la pression est insupportable.",
-        "Un ami qui doute de ses capacités": "Je me demande si je suis vraiment à la hauteur. Tout le monde semble mieux réussir que moi. Peut-être que je devrais abandonner, je n'ai pas les compétences nécessaires.",
-        "Un client mécontent d'un service": "Je suis vraiment déçu par votre service. J'attends depuis une semaine et personne ne m'a tenu au courant. C'est inacceptable pour ce prix !",
-        "Un membre de l'équipe qui se sent sous-estimé": "J'ai l'impression que mes idées ne sont jamais écoutées. Je travaille dur mais on ne me donne jamais de responsabilités importantes. À quoi bon continuer ?",
-        "Une personne qui a peur de prendre la parole": "Dès que je dois parler en public, je panique. Mon cœur s'emballe, je tremble et j'oublie tout. Je me sens ridicule devant les autres."
-    }
-    
-    if scenario in messages_scenarios:
-        st.markdown("### 💬 Message à écouter")
-        
-        col_msg1, col_msg2 = st.columns([3, 1])
-        
-        with col_msg1:
-            st.markdown(
-                f'<div style="'
-                'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-                'padding: 1.5rem;'
-                'border-radius: 10px;'
-                'border-left: 4px solid #0ea5e9;'
-                '">'
-                f'<p style="color: #334155; margin: 0; font-style: italic;">"{messages_scenarios[scenario]}"</p>'
-                '</div>',
-                unsafe_allow_html=True
-            )
-        
-        with col_msg2:
-            # Initialiser l'état du timer
-            if 'atelier4_timer_active' not in st.session_state:
-                st.session_state.atelier4_timer_active = False
-            if 'atelier4_time_left' not in st.session_state:
-                st.session_state.atelier4_time_left = 30
-            
-            start_listening = st.button("▶️ Lancer l'écoute (30s)", type="primary", use_container_width=True, key="start_listening_btn")
-            if start_listening:
-                st.session_state.atelier4_timer_active = True
-                st.session_state.atelier4_time_left = 30
-                st.rerun()
-    
-    # Timer d'écoute - SECTION SIMPLIFIÉE
-    if 'atelier4_timer_active' in st.session_state and st.session_state.atelier4_timer_active:
-        st.markdown("### ⏱️ Écoute en cours...")
-        
-        # Placeholders pour l'affichage
-        timer_display4 = st.empty()
-        progress_display4 = st.empty()
-        message_display4 = st.empty()
-        
-        # Contrôles du timer
-        col_control1, col_control2 = st.columns(2)
-        with col_control1:
-            stop_listening = st.button("⏹️ Arrêter l'écoute", use_container_width=True, key="stop_listening_btn")
-            if stop_listening:
-                st.session_state.atelier4_timer_active = False
-                st.rerun()
-        
-        with col_control2:
-            restart_listening = st.button("🔄 Recommencer", use_container_width=True, key="restart_listening_btn")
-            if restart_listening:
-                st.session_state.atelier4_timer_active = True
-                st.session_state.atelier4_time_left = 30
-                st.rerun()
-        
-        # Afficher et gérer le timer
-        if st.session_state.atelier4_timer_active:
-            # Calculer l'affichage
-            seconds = st.session_state.atelier4_time_left
-            
-            # Déterminer la couleur et le message
-            if seconds <= 5:
-                timer_color = "#ef4444"
-                timer_message = "👂 **5 secondes restantes !** Préparez votre reformulation."
-            elif seconds <= 15:
-                timer_color = "#f59e0b"
-                timer_message = "🧠 **15 secondes restantes !** Identifiez les émotions clés."
-            else:
-                timer_color = "#10b981"
-                timer_message = "✅ **Écoute active en cours...** Concentrez-vous sur le message."
-            
-            # Calculer la progression
-            progress = 1 - (seconds / 30)
-            
-            # Afficher le timer
-            with timer_display4.container():
-                st.markdown(
-                    f'<div style="text-align: center; padding: 1.5rem; background: #f8fafc; border-radius: 12px; border: 3px solid {timer_color};">'
-                    f'<div style="font-size: 3.5rem; color: {timer_color}; font-weight: bold; margin-bottom: 0.5rem;">'
-                    f'00:{seconds:02d}'
-                    f'</div>'
-                    f'<div style="color: #64748b; font-size: 1rem;">Temps d\'écoute restant</div>'
-                    f'</div>',
-                    unsafe_allow_html=True
-                )
-            
-            # Afficher la barre de progression
-            progress_display4.progress(progress)
-            
-            # Afficher le message
-            message_display4.info(timer_message)
-            
-            # Décrémenter le timer
-            if st.session_state.atelier4_time_left > 0:
-                time.sleep(1)
-                st.session_state.atelier4_time_left -= 1
-                st.rerun()
-            else:
-                # Timer terminé
-                st.session_state.atelier4_timer_active = False
-                st.success("✅ **Temps d'écoute terminé !** Maintenant, reformulez ce que vous avez entendu.")
-                timer_display4.empty()
-                progress_display4.empty()
-                message_display4.empty()
-    
-    # Zone de reformulation
-    st.markdown("### 🔄 Votre reformulation")
-    
-    col_reform1, col_reform2, col_reform3 = st.columns([1, 2, 1])
-    
-    with col_reform2:
-        reformulation = st.text_area(
-            "**Reformulez le message avec vos mots :**",
-            key="reformulation",
-            height=120,
-            placeholder="Ex: Si je comprends bien, tu ressens...\nCe qui te préoccupe particulièrement, c'est..."
-        )
-    
-    # Validation de la reformulation
-    if reformulation:
-        st.markdown("### 📊 Analyse de votre écoute active")
-        
-        # Vérification des éléments clés
-        elements_presents = {
-            "Reformulation": any(mot in reformulation.lower() for mot in ["si je comprends", "tu veux dire", "donc tu", "ce que tu"]),
-            "Validation émotionnelle": any(mot in reformulation.lower() for mot in ["tu te sens", "tu ressens", "c'est difficile", "ça doit être"]),
-            "Question ouverte": "?" in reformulation,
-            "Empathie": any(mot in reformulation.lower() for mot in ["je comprends", "je vois", "c'est normal", "c'est compréhensible"])
-        }
-        
-        col_check1, col_check2 = st.columns(2)
-        
-        with col_check1:
-            st.markdown("**✅ Éléments présents :**")
-            for element, present in elements_presents.items():
-                if present:
-                    st.markdown(f"✓ {element}")
-        
-        with col_check2:
-            score = sum(elements_presents.values())
-            st.metric("Score d'écoute active", f"{score}/4")
-            
-            if score == 4:
-                st.success("🎯 **Excellent !** Votre écoute active est complète.")
-                st.balloons()
-            elif score >= 2:
-                st.info("📈 **Bon travail !** Vous avez capté l'essentiel.")
-            else:
-                st.warning("💪 **À améliorer** : Essayez d'inclure plus d'éléments d'écoute active.")
-        
-        # Feedback spécifique
-        if not elements_presents["Reformulation"]:
-            st.info("💡 **Astuce :** Commencez par 'Si je comprends bien...' ou 'Tu veux dire que...'")
-        if not elements_presents["Validation émotionnelle"]:
-            st.info("💡 **Astuce :** Ajoutez 'Tu dois te sentir...' ou 'C'est difficile quand...'")
-        if not elements_presents["Question ouverte"]:
-            st.info("💡 **Astuce :** Terminez par une question comme 'C'est bien ça ?'")
-    
-    # Exercice de miroir émotionnel
-    st.markdown("### 🎭 Exercice : Le miroir émotionnel")
-    
-    emotions_scenarios = [
-        ("Frustration", "Tout ce que j'essaie de faire échoue. Rien ne fonctionne comme je le veux."),
-        ("Anxiété", "Je ne cesse de penser à tout ce qui pourrait mal tourner demain."),
-        ("Découragement", "J'ai l'impression de courir après rien. Mes efforts ne donnent aucun résultat."),
-        ("Colère", "On ne m'écoute jamais ! Mes opinions ne comptent pour personne ici."),
-        ("Tristesse", "Je me sens tellement seul dans tout ça. Personne ne semble comprendre.")
-    ]
-    
-    selected_emotion = st.selectbox(
-        "**Identifiez l'émotion dominante :**",
-        [e[0] for e in emotions_scenarios],
-        key="emotion_select"
-    )
-    
-    # Trouver le message correspondant
-    message_emotion = next((msg for emo, msg in emotions_scenarios if emo == selected_emotion), "")
-    
-    if message_emotion:
-        st.markdown(
-            f'<div style="'
-            'background: #f0f9ff;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-top: 1rem;'
-            '">'
-            f'<p style="color: #334155; margin: 0; font-style: italic;">"{message_emotion}"</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-        
-        validation_emotion = st.text_area(
-            "**Validez cette émotion :**",
-            key="validation_emotion",
-            height=100,
-            placeholder=f"Ex: Je comprends que tu te sentes {selected_emotion.lower()} parce que..."
-        )
-        
-        if validation_emotion and selected_emotion.lower() in validation_emotion.lower():
-            st.success(f"✅ Parfait ! Vous avez bien identifié et validé l'émotion de {selected_emotion.lower()}.")
-    
-    # Techniques d'écoute active
-    st.markdown("### 💡 Techniques d'écoute active")
-    
-    col_tech1, col_tech2, col_tech3 = st.columns(3)
-    
-    with col_tech1:
-        st.markdown(
-            '<div style="'
-            'background: #d1fae5;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            '">'
-            '<div style="font-size: 2rem; color: #10b981;">🔄</div>'
-            '<h5 style="color: #065f46;">Reformulation</h5>'
-            '<p style="color: #334155; font-size: 0.9rem;">'
-            '"Si je comprends bien..."<br>'
-            '"Donc ce que tu dis c\'est..."'
-            '</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_tech2:
-        st.markdown(
-            '<div style="'
-            'background: #dbeafe;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            '">'
-            '<div style="font-size: 2rem; color: #3b82f6;">❓</div>'
-            '<h5 style="color: #1d4ed8;">Questionnement</h5>'
-            '<p style="color: #334155; font-size: 0.9rem;">'
-            '"Peux-tu me dire plus sur..."<br>'
-            '"Comment as-tu ressenti cela ?"'
-            '</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col_tech3:
-        st.markdown(
-            '<div style="'
-            'background: #fef3c7;'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'text-align: center;'
-            '">'
-            '<div style="font-size: 2rem; color: #f59e0b;">💬</div>'
-            '<h5 style="color: #92400e;">Validation</h5>'
-            '<p style="color: #334155; font-size: 0.9rem;">'
-            '"Je comprends que c\'est difficile..."<br>'
-            '"C\'est normal de se sentir ainsi..."'
-            '</p>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Quiz d'écoute active
-    st.markdown("### 🧠 Quiz : Vrai ou Faux ?")
-    
-    quiz_questions = [
-        ("L'écoute active signifie simplement ne pas parler pendant que l'autre parle.", "Faux", "L'écoute active implique une attention complète, la reformulation et la validation émotionnelle."),
-        ("Reformuler avec ses propres mots montre qu'on a bien compris.", "Vrai", "La reformulation démontre une compréhension profonde du message."),
-        ("Il faut toujours donner des conseils immédiatement quand quelqu'un partage un problème.", "Faux", "Parfois, la meilleure aide est d'écouter sans donner de conseils."),
-        ("Le langage corporel fait partie de l'écoute active.", "Vrai", "Le contact visuel, les hochements de tête montrent l'attention."),
-        ("Interrompre pour montrer qu'on comprend est une bonne technique.", "Faux", "Il vaut mieux attendre que l'autre ait fini de parler.")
-    ]
-    
-    score_quiz = 0
-    
-    for i, (question, reponse, explication) in enumerate(quiz_questions):
-        col_q1, col_q2 = st.columns([3, 1])
-        
-        with col_q1:
-            st.markdown(f"**{i+1}. {question}**")
-        
-        with col_q2:
-            user_answer = st.selectbox(
-                f"Réponse {i+1}",
-                ["", "Vrai", "Faux"],
-                key=f"quiz_{i}",
-                label_visibility="collapsed"
-            )
-            
-            if user_answer == reponse:
-                score_quiz += 1
-                if user_answer:  # Si une réponse a été donnée
-                    st.success("✓")
-            elif user_answer and user_answer != reponse:
-                st.error("✗")
-    
-    if score_quiz > 0:
-        st.markdown(f"**Score : {score_quiz}/{len(quiz_questions)}**")
-        if score_quiz == len(quiz_questions):
-            st.success("🎉 Excellent ! Vous maîtrisez les concepts de l'écoute active.")
-        elif score_quiz >= len(quiz_questions) // 2:
-            st.info("📚 Bonnes connaissances ! Continuez à pratiquer.")
-        else:
-            st.warning("📖 Revoyez les techniques d'écoute active.")
-    
-    st.markdown("---")
-    
-    # Bénéfices de l'écoute active
-    with st.expander("🌟 Les bénéfices de l'écoute active"):
-        col_benefits1, col_benefits2 = st.columns(2)
-        
-        with col_benefits1:
-            st.markdown(
-                '''
-                **🤝 Relations améliorées :**
-                • Crée la confiance et le respect
-                • Renforce les liens personnels et professionnels
-                • Réduit les malentendus et conflits
-                
-                **🧠 Compréhension approfondie :**
-                • Capture les besoins réels
-                • Identifie les émotions sous-jacentes
-                • Permet des réponses plus adaptées
-                '''
-            )
-        
-        with col_benefits2:
-            st.markdown(
-                '''
-                **💼 Avantages professionnels :**
-                • Meilleure collaboration en équipe
-                • Résolution efficace des problèmes
-                • Leadership plus empathique
-                
-                **😌 Bien-être personnel :**
-                • Réduction du stress relationnel
-                • Sentiment de connexion authentique
-                • Développement de l'intelligence émotionnelle
-                '''
-            )
-
-def conclusion_section() -> None:
-    """Section Conclusion - Version enrichie"""
-    # Titre principal
-    st.markdown(
-        '<div class="section-card">'
-        '<div style="display: flex; align-items: center; gap: 1rem;">'
-        '<div style="font-size: 2rem;">🏁</div>'
-        '<div>'
-        '<h2 style="color: #1e293b; margin: 0;">Conclusion</h2>'
-        '<p style="color: #64748b; margin: 0;">La communication n\'est pas un talent, c\'est une compétence</p>'
-        '</div>'
-        '</div>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    # Carte de citation inspirante
-    st.markdown(
-        '<div style="'
-        'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-        'padding: 2.5rem;'
-        'border-radius: 12px;'
-        'text-align: center;'
-        'font-style: italic;'
-        'font-size: 1.3rem;'
-        'color: #1e293b;'
-        'margin: 1rem 0 2rem 0;'
-        'border: 1px solid #cbd5e1;'
-        'box-shadow: 0 4px 12px rgba(14, 165, 233, 0.08);'
-        '">'
-        'On ne naît pas bon communicant.<br>'
-        'On le devient avec clarité, storytelling, écoute, et surtout… pratique.'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Carte récapitulative enrichie
-        st.markdown(
-            '<div class="section-card">'
-            '<h4 style="color: #0ea5e9; margin-bottom: 1.5rem;">📋 Votre parcours MasterTalk</h4>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #10b981;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="font-size: 1.5rem; color: #10b981;">🎤</div>'
-            '<div>'
-            '<strong style="color: #065f46;">1. TED Talk & The One Idea Rule</strong><br>'
-            '<span style="color: #334155; font-size: 0.9rem;">Un discours = une idée forte</span>'
-            '</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #dbeafe 0%, #bfdbfe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #3b82f6;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="font-size: 1.5rem; color: #3b82f6;">🎯</div>'
-            '<div>'
-            '<strong style="color: #1d4ed8;">2. Méthode SMART</strong><br>'
-            '<span style="color: #334155; font-size: 0.9rem;">Objectifs clairs et mesurables</span>'
-            '</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fef3c7 0%, #fde68a 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #f59e0b;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="font-size: 1.5rem; color: #f59e0b;">📖</div>'
-            '<div>'
-            '<strong style="color: #92400e;">3. Storytelling STAR</strong><br>'
-            '<span style="color: #334155; font-size: 0.9rem;">Histoires structurées et captivantes</span>'
-            '</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #ede9fe 0%, #ddd6fe 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #8b5cf6;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="font-size: 1.5rem; color: #8b5cf6;">👂</div>'
-            '<div>'
-            '<strong style="color: #6d28d9;">4. Écoute active</strong><br>'
-            '<span style="color: #334155; font-size: 0.9rem;">Reformuler et valider les émotions</span>'
-            '</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #fce7f3 0%, #fbcfe8 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #ec4899;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="font-size: 1.5rem; color: #ec4899;">📊</div>'
-            '<div>'
-            '<strong style="color: #be185d;">5. Analyse SWOT + TOWS</strong><br>'
-            '<span style="color: #334155; font-size: 0.9rem;">Connaissance de soi et stratégies</span>'
-            '</div>'
-            '</div>'
-            '</div>'
-            
-            '<div style="'
-            'background: linear-gradient(135deg, #e0f2fe 0%, #bae6fd 100%);'
-            'padding: 1.5rem;'
-            'border-radius: 10px;'
-            'margin-bottom: 1rem;'
-            'border-left: 4px solid #0ea5e9;'
-            '">'
-            '<div style="display: flex; align-items: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-            '<div style="font-size: 1.5rem; color: #0ea5e9;">🎭</div>'
-            '<div>'
-            '<strong style="color: #0369a1;">6. Ateliers interactifs</strong><br>'
-            '<span style="color: #334155; font-size: 0.9rem;">Exercices pratiques pour progresser</span>'
-            '</div>'
-            '</div>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    with col2:
-        # Carte de synthèse inspirante
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);'
-            'padding: 2rem;'
-            'border-radius: 12px;'
-            'border: 1px solid #cbd5e1;'
-            'height: 100%;'
-            'display: flex;'
-            'flex-direction: column;'
-            'justify-content: center;'
-            'align-items: center;'
-            'text-align: center;'
-            '">'
-            '<div style="font-size: 4rem; color: #0ea5e9; margin-bottom: 1rem;">✨</div>'
-            '<h3 style="color: #0369a1; margin: 0 0 1rem 0;">Votre voix compte</h3>'
-            '<p style="color: #334155; margin-bottom: 1.5rem; font-style: italic;">'
-            'Chaque présentation est une opportunité d\'inspirer, de convaincre et de transformer.'
-            '</p>'
-            
-            '<div style="'
-            'background: white;'
-            'padding: 1rem;'
-            'border-radius: 8px;'
-            'margin-top: 1rem;'
-            'width: 100%;'
-            '">'
-            '<p style="color: #334155; margin: 0; font-size: 0.95rem;">'
-            '<strong>🎯 Votre prochaine étape :</strong><br>'
-            'Appliquez ces techniques dans votre prochaine présentation'
-            '</p>'
-            '</div>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Message final interactif
-    st.markdown("### ✨ Votre message à retenir")
-    
-    col_msg1, col_msg2, col_msg3 = st.columns([1, 2, 1])
-    
-    with col_msg2:
-        if st.button("🎯 Révéler votre message final", type="primary", use_container_width=True, key="final_message_btn"):
-            st.session_state.show_final_message = True
-    
-    if st.session_state.get('show_final_message', False):
-        st.balloons()
-        st.markdown(
-            '<div style="'
-            'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-            'padding: 2.5rem;'
-            'border-radius: 12px;'
-            'text-align: center;'
-            'font-size: 1.3rem;'
-            'color: #065f46;'
-            'margin: 1.5rem 0;'
-            'border: 1px solid #10b981;'
-            'box-shadow: 0 4px 12px rgba(16, 185, 129, 0.1);'
-            '">'
-            '<div style="font-size: 2rem; margin-bottom: 1rem;">💫</div>'
-            'Votre histoire a du pouvoir.<br>'
-            'Votre voix compte.<br>'
-            '<strong>Apprenez à la partager.</strong>'
-            '</div>',
-            unsafe_allow_html=True
-        )
-    
-    # Section feedback enrichie
-    st.markdown("---")
-    st.markdown("### 📝 Partagez votre expérience")
-    
-    # Conteneur pour le feedback
-    st.markdown(
-        '<div style="'
-        'background: white;'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'border: 1px solid #cbd5e1;'
-        'margin-bottom: 2rem;'
-        'box-shadow: 0 4px 12px rgba(0, 107, 179, 0.05);'
-        '">',
-        unsafe_allow_html=True
-    )
-    
-    st.markdown(
-        '<div style="'
-        'background: #f0f9ff;'
-        'padding: 1.5rem;'
-        'border-radius: 10px;'
-        'margin-bottom: 1.5rem;'
-        'border-left: 4px solid #0ea5e9;'
-        '">'
-        '<h5 style="color: #0369a1; margin: 0 0 0.5rem 0;">🎯 Votre feedback nous aide à améliorer</h5>'
-        '<p style="color: #334155; margin: 0;">Partagez vos impressions pour nous aider à rendre MasterTalk encore meilleur.</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
-    
-    col_rating1, col_rating2 = st.columns([2, 1])
-    
-    with col_rating1:
-        st.markdown("**Comment avez-vous trouvé cette formation ?**")
-        rating = st.slider(
-            "Notez cette formation :",
-            1, 5, 5,
-            key="feedback_rating",
-            label_visibility="collapsed"
-        )
-    
-    with col_rating2:
-        # Affichage visuel des étoiles amélioré
-        stars_html = ""
-        for i in range(5):
-            if i < rating:
-                stars_html += '<span style="font-size: 2rem; color: #fbbf24;">⭐</span>'
-            else:
-                stars_html += '<span style="font-size: 2rem; color: #cbd5e1;">☆</span>'
-        
-        st.markdown(
-            f'<div style="text-align: center;">'
-            f'<div style="font-size: 1.2rem; color: #64748b; margin-bottom: 0.5rem;">Votre note</div>'
-            f'<div>{stars_html}</div>'
-            f'<div style="font-size: 1.5rem; font-weight: bold; color: #f59e0b; margin-top: 0.5rem;">{rating}/5</div>'
-            f'</div>',
-            unsafe_allow_html=True
-        )
-    
-    feedback = st.text_area(
-        "**Vos commentaires et suggestions :**",
-        key="feedback_text",
-        height=120,
-        placeholder="Partagez vos impressions, ce que vous avez préféré, ce qui pourrait être amélioré..."
-    )
-    
-    col_fb1, col_fb2, col_fb3 = st.columns([1, 2, 1])
-    
-    with col_fb2:
-        if st.button("📤 Envoyer mon feedback", type="primary", use_container_width=True, key="feedback_submit_btn"):
-            if feedback:
-                st.markdown(
-                    '<div style="'
-                    'background: linear-gradient(135deg, #d1fae5 0%, #a7f3d0 100%);'
-                    'padding: 1.5rem;'
-                    'border-radius: 10px;'
-                    'border-left: 4px solid #10b981;'
-                    'text-align: center;'
-                    'margin-top: 1rem;'
-                    '">'
-                    '<div style="display: flex; align-items: center; justify-content: center; gap: 0.8rem; margin-bottom: 0.5rem;">'
-                    '<div style="font-size: 1.5rem; color: #065f46;">✅</div>'
-                    '<h5 style="color: #065f46; margin: 0;">Merci pour votre feedback !</h5>'
-                    '</div>'
-                    '<p style="color: #334155; margin: 0;">Votre avis précieux nous aide à améliorer MasterTalk.</p>'
-                    '</div>',
-                    unsafe_allow_html=True
-                )
-            else:
-                st.warning("Veuillez ajouter un commentaire avant d'envoyer votre feedback.")
-    
-    if feedback:
-        st.info(f"📝 **Votre commentaire :** {len(feedback)} caractères")
-    
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Message de remerciement final
-    st.markdown(
-        '<div style="'
-        'background: linear-gradient(135deg, #f0f9ff 0%, #e0f2fe 100%);'
-        'padding: 2rem;'
-        'border-radius: 12px;'
-        'text-align: center;'
-        'margin-top: 2rem;'
-        'border: 1px solid #cbd5e1;'
-        '">'
-        '<h4 style="color: #0369a1; margin: 0 0 1rem 0;">🌟 Merci d\'avoir suivi MasterTalk !</h4>'
-        '<p style="color: #334155; margin: 0;">Continuez à pratiquer et à développer vos compétences en communication.</p>'
-        '</div>',
-        unsafe_allow_html=True
-    )
+# Ce script est réexécuté par Streamlit à chaque interaction : il reste
+# volontairement minimal. Le contenu de chaque section vit dans son propre
+# module sous mastertalk/sections/ et n'est importé qu'à la première
+# visite (voir mastertalk.sections.load_handler).
 
 # ============================================================================
 # ROUTEUR DE SECTIONS
 # ============================================================================
 
-SECTION_HANDLERS = {
-    "Introduction": intro_section,
-    "1. Qu'est-ce qu'un TED Talk ?": ted_talk_section,
-    "2. Méthode SMART": smart_section,
-    "3. Storytelling STAR": star_section,
-    "4. Écoute Active": ecoute_section,
-    "5. Analyse SWOT": swot_section,
-    "6. Matrice TOWS": tows_section,
-    "7. Ateliers Interactifs": ateliers_section,
-    "Conclusion": conclusion_section
-}
+# Section -> fonction d'affichage : voir mastertalk.sections.SECTION_HANDLERS
 
 def render_main_content(section: str) -> None:
     """Affiche le contenu principal en fonction de la section sélectionnée"""
     render_header()
     
     if section in SECTION_HANDLERS:
-        SECTION_HANDLERS[section]()
+        with profile_render(section):
+            load_handler(SECTION_HANDLERS[section])()
     else:
         st.error("Section non trouvée")
 
-def render_footer() -> None:
-    """Affiche le pied de page avec thème clair"""
-    st.markdown("---")
-    
-    footer_content = """
-    <div style="
-        text-align: center;
-        padding: 2rem;
-        color: #64748b;
-        font-size: 0.9rem;
-        background: linear-gradient(90deg, #f0f9ff 0%, #e0f2fe 100%);
-        border-radius: 12px;
-        border: 1px solid #cbd5e1;
-        margin-top: 3rem;
-    ">
-        <div style="font-size: 1.2rem; color: #0ea5e9; margin-bottom: 0.5rem;">
-            🎤 MasterTalk - L'Art de Communiquer
-        </div>
-        <div style="margin-bottom: 0.5rem;">
-            Développez vos compétences en communication | Méthodes éprouvées | Résultats tangibles
-        </div>
-        <div style="color: #94a3b8;">
-            © 2025 MasterTalk | Tous droits réservés
-        </div>
-    </div>
-    """
-    
-    st.markdown(footer_content, unsafe_allow_html=True)
-
 # ============================================================================
 # POINT D'ENTRÉE PRINCIPAL
 # ============================================================================
@@ -4889,19 +38,21 @@ def main():
     setup_page_config()
     load_custom_css()
     
-    # Initialisation de l'état de session
-    init_session_state()  # <-- AJOUTER CETTE LIGNE
-    
-    if 'pause' not in st.session_state:
-        st.session_state.pause = False
+    # Vue animateur : pas de parcours, seulement le suivi de la salle
+    if facilitator_view_requested():
+        render_facilitator_dashboard()
+        return
     
-    if 'show_final_message' not in st.session_state:
-        st.session_state.show_final_message = False
+    # Initialisation de l'état de session
+    init_session_state()
     
     # Rendu de l'interface
     selected_section = render_sidebar()
+    publish_visit(selected_section)
     render_main_content(selected_section)
     render_footer()
+    render_profiler_panel()
+    persist_session()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
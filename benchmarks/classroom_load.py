@@ -0,0 +1,389 @@
+"""Test de charge : une salle entière connectée au même processus
+
+Démarre app.py avec `streamlit run` sur un port local, puis ouvre N
+sessions simulées qui parlent le protocole du navigateur : websocket
+/_stcore/stream, messages protobuf BackMsg (réexécutions avec l'état des
+widgets) et ForwardMsg (éléments, fin de script). Chaque session suit un
+parcours scripté (JOURNEY) : elle saisit son prénom, parcourt les
+sections, rédige une histoire STAR et démarre les minuteurs des ateliers.
+Les minuteurs en cours sont rafraîchis comme dans le navigateur : une
+réexécution du fragment à chaque intervalle annoncé par le serveur.
+
+Pour chaque valeur de N, un serveur neuf est démarré. Le rapport donne
+p50/p99 de la latence des réexécutions complètes et des fragments, le
+nombre de threads, le CPU et la mémoire (RSS) du processus serveur, lus
+dans /proc (Linux). La capacité estimée est le plus grand N dont le p99
+reste sous --max-p99.
+
+Usage :
+    python benchmarks/classroom_load.py
+    python benchmarks/classroom_load.py --participants 1 10 25 50 100 --think 1.0
+    python benchmarks/classroom_load.py --participants 20 --rounds 2 --json load.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import websockets
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from mastertalk.catalog import get_catalog  # noqa: E402
+
+APP_PATH = ROOT_DIR / "app.py"
+STARTUP_TIMEOUT = 60
+RERUN_TIMEOUT = 60
+SAMPLE_INTERVAL = 0.5
+
+SECTION_NAMES = get_catalog().sections
+ATELIERS = get_catalog().ateliers
+ATELIERS_SECTION = "7. Ateliers Interactifs"
+
+# Étapes d'un parcours : ("select" | "type", clé, valeur), ("click", clé) ou
+# ("wait", secondes) pour laisser tourner les minuteurs
+Step = Tuple
+
+JOURNEY: List[Step] = [
+    ("type", "user_name", "Participant"),
+    ("click", "start_journey_btn"),
+    *[("select", "nav_select", section) for section in SECTION_NAMES[1:3]],
+    ("select", "nav_select", "3. Storytelling STAR"),
+    ("type", "star_s_input", "Je devais présenter notre projet devant 40 personnes."),
+    ("type", "star_t_input", "Convaincre le comité en 5 minutes."),
+    ("type", "star_a_input", "J'ai préparé un plan simple et répété trois fois."),
+    ("type", "star_r_input", "Le projet a été validé et j'ai gagné en confiance."),
+    ("click", "star_generate_btn"),
+    *[("select", "nav_select", section) for section in SECTION_NAMES[4:7]],
+    ("select", "nav_select", ATELIERS_SECTION),
+    ("select", "atelier_select", ATELIERS[1]),
+    ("click", "start_timer_btn2"),
+    ("wait", 3),
+    ("select", "atelier_select", ATELIERS[2]),
+    ("click", "generate_challenge_btn"),
+    ("click", "start_timer3"),
+    ("wait", 3),
+    ("select", "atelier_select", ATELIERS[3]),
+    ("click", "start_listening_btn"),
+    ("wait", 3),
+    ("select", "nav_select", "Conclusion"),
+]
+
+
+# ============================================================================
+# SESSION SIMULÉE
+# ============================================================================
+
+@dataclass
+class SessionStats:
+    """Mesures d'une session simulée"""
+    reruns: List[float] = field(default_factory=list)
+    fragments: List[float] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+
+class SimulatedSession:
+    """Un onglet de navigateur : widgets connus, état envoyé à chaque réexécution"""
+
+    def __init__(self, url: str, number: int, think: float, stats: SessionStats) -> None:
+        self.url = url
+        self.number = number
+        self.think = think
+        self.stats = stats
+        self.query_string = ""
+        self.widget_ids: Dict[str, str] = {}
+        self.widget_states: Dict[str, WidgetState] = {}
+        # Fragments à réexécuter périodiquement (minuteurs) : id -> intervalle
+        self.auto_reruns: Dict[str, float] = {}
+        self.ws = None
+
+    async def run(self, rounds: int) -> None:
+        async with websockets.connect(self.url, subprotocols=["streamlit"], max_size=None) as ws:
+            self.ws = ws
+            await self.rerun()
+            for _ in range(rounds):
+                for step in JOURNEY:
+                    await self.play(step)
+                    await self.pause(self.think * random.uniform(0.5, 1.5))
+
+    async def play(self, step: Step) -> None:
+        action, *args = step
+        if action == "wait":
+            await self.pause(args[0])
+            return
+        widget_id = self.widget_ids.get(args[0])
+        if widget_id is None:
+            self.stats.errors.append(f"widget absent : {args[0]}")
+            return
+        if action == "click":
+            trigger = WidgetState(id=widget_id, trigger_value=True)
+            await self.rerun(extra=[trigger])
+            return
+        value = args[1] if args[0] != "user_name" else f"{args[1]} {self.number}"
+        self.widget_states[widget_id] = WidgetState(id=widget_id, string_value=value)
+        await self.rerun()
+
+    async def pause(self, seconds: float) -> None:
+        """Attend comme un participant, en rafraîchissant les minuteurs en cours"""
+        deadline = time.perf_counter() + seconds
+        while True:
+            remaining = deadline - time.perf_counter()
+            if not self.auto_reruns or remaining <= 0:
+                await asyncio.sleep(max(remaining, 0))
+                return
+            fragment_id, interval = next(iter(self.auto_reruns.items()))
+            await asyncio.sleep(min(interval, remaining))
+            if time.perf_counter() < deadline and fragment_id in self.auto_reruns:
+                await self.rerun(fragment_id=fragment_id)
+
+    async def rerun(self, extra: Optional[List[WidgetState]] = None, fragment_id: str = "") -> None:
+        """Envoie une réexécution et attend la fin du script ; mesure la latence"""
+        msg = BackMsg()
+        state = msg.rerun_script
+        state.query_string = self.query_string
+        state.widget_states.widgets.extend(self.widget_states.values())
+        state.widget_states.widgets.extend(extra or [])
+        if fragment_id:
+            state.fragment_id = fragment_id
+            state.is_auto_rerun = True
+        else:
+            # Une réexécution complète repart sans minuteur : le script les réannonce
+            self.auto_reruns.clear()
+
+        start = time.perf_counter()
+        await self.ws.send(msg.SerializeToString())
+        await asyncio.wait_for(self._receive_until_finished(), RERUN_TIMEOUT)
+        elapsed = time.perf_counter() - start
+        (self.stats.fragments if fragment_id else self.stats.reruns).append(elapsed)
+
+    async def _receive_until_finished(self) -> None:
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await self.ws.recv())
+            kind = msg.WhichOneof("type")
+            if kind == "delta" and msg.delta.WhichOneof("type") == "new_element":
+                self._register(msg.delta.new_element)
+            elif kind == "page_info_changed":
+                self.query_string = msg.page_info_changed.query_string
+            elif kind == "auto_rerun":
+                self.auto_reruns[msg.auto_rerun.fragment_id] = msg.auto_rerun.interval
+            elif kind == "stop_auto_rerun":
+                for fragment_id in msg.stop_auto_rerun.fragment_ids:
+                    self.auto_reruns.pop(fragment_id, None)
+            elif kind == "script_finished":
+                # st.rerun() enchaîne une nouvelle exécution : on attend la suivante
+                if msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                    return
+
+    def _register(self, element) -> None:
+        kind = element.WhichOneof("type")
+        if kind == "exception":
+            self.stats.errors.append(element.exception.message)
+            return
+        widget_id = getattr(getattr(element, kind), "id", "")
+        if widget_id.startswith("$$ID-"):
+            # Identifiant d'un widget à clé : "$$ID-<empreinte>-<clé>"
+            self.widget_ids[widget_id.split("-", 2)[2]] = widget_id
+
+
+# ============================================================================
+# SERVEUR ET MESURES DU PROCESSUS
+# ============================================================================
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    """Démarre app.py sans navigateur et attend que le serveur réponde"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", str(APP_PATH),
+         "--server.headless", "true", "--server.port", str(port),
+         "--browser.gatherUsageStats", "false"],
+        cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"le serveur n'a pas démarré en {STARTUP_TIMEOUT} s")
+
+
+class ProcessSampler:
+    """Threads, CPU et RSS d'un processus, lus périodiquement dans /proc"""
+
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self.ticks = os.sysconf("SC_CLK_TCK")
+        self.threads: List[int] = []
+        self.rss_mb: List[float] = []
+        self.cpu_percent: List[float] = []
+
+    def _read(self) -> Tuple[float, int, float]:
+        with open(f"/proc/{self.pid}/stat") as stat:
+            fields = stat.read().rsplit(")", 1)[1].split()
+        # utime et stime : champs 14 et 15 de /proc/<pid>/stat
+        cpu = (int(fields[11]) + int(fields[12])) / self.ticks
+        status = {}
+        with open(f"/proc/{self.pid}/status") as source:
+            for line in source:
+                key, _, value = line.partition(":")
+                status[key] = value.split()
+        return cpu, int(status["Threads"][0]), int(status["VmRSS"][0]) / 1024
+
+    async def run(self) -> None:
+        previous_cpu, _, _ = self._read()
+        previous_time = time.perf_counter()
+        while True:
+            await asyncio.sleep(SAMPLE_INTERVAL)
+            cpu, threads, rss = self._read()
+            now = time.perf_counter()
+            self.cpu_percent.append(100 * (cpu - previous_cpu) / (now - previous_time))
+            self.threads.append(threads)
+            self.rss_mb.append(rss)
+            previous_cpu, previous_time = cpu, now
+
+
+# ============================================================================
+# NIVEAUX DE CHARGE ET RAPPORT
+# ============================================================================
+
+def percentile(values: List[float], p: float) -> float:
+    """Percentile par rang le plus proche, en millisecondes"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return round(ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] * 1000, 1)
+
+
+@dataclass
+class LevelResult:
+    """Mesures d'un niveau de charge"""
+    participants: int
+    reruns: int
+    rerun_p50_ms: float
+    rerun_p99_ms: float
+    fragment_runs: int
+    fragment_p50_ms: float
+    fragment_p99_ms: float
+    errors: int
+    threads_max: int
+    cpu_mean_percent: float
+    rss_max_mb: float
+    seconds: float
+
+
+async def run_level(participants: int, rounds: int, think: float, ramp: float) -> Tuple[LevelResult, List[str]]:
+    """Un serveur neuf, N sessions simultanées, les mesures du processus"""
+    port = free_port()
+    server = start_server(port)
+    sampler = ProcessSampler(server.pid)
+    sampling = asyncio.create_task(sampler.run())
+    stats = [SessionStats() for _ in range(participants)]
+    url = f"ws://127.0.0.1:{port}/_stcore/stream"
+
+    async def participant(number: int) -> None:
+        # Arrivées étalées sur la durée de montée en charge
+        await asyncio.sleep(ramp * number / participants)
+        try:
+            await SimulatedSession(url, number + 1, think, stats[number]).run(rounds)
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as exc:
+            stats[number].errors.append(f"{type(exc).__name__}: {exc}")
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(participant(number) for number in range(participants)))
+    finally:
+        elapsed = time.perf_counter() - start
+        sampling.cancel()
+        server.terminate()
+        server.wait(timeout=10)
+
+    reruns = [t for s in stats for t in s.reruns]
+    fragments = [t for s in stats for t in s.fragments]
+    errors = [error for s in stats for error in s.errors]
+    result = LevelResult(
+        participants=participants,
+        reruns=len(reruns),
+        rerun_p50_ms=percentile(reruns, 50),
+        rerun_p99_ms=percentile(reruns, 99),
+        fragment_runs=len(fragments),
+        fragment_p50_ms=percentile(fragments, 50),
+        fragment_p99_ms=percentile(fragments, 99),
+        errors=len(errors),
+        threads_max=max(sampler.threads, default=0),
+        cpu_mean_percent=round(sum(sampler.cpu_percent) / len(sampler.cpu_percent), 1) if sampler.cpu_percent else 0.0,
+        rss_max_mb=round(max(sampler.rss_mb, default=0.0), 1),
+        seconds=round(elapsed, 1),
+    )
+    return result, errors
+
+
+def print_report(results: List[LevelResult], max_p99: float) -> None:
+    print(f"\n{'N':>5} {'réexéc.':>8} {'p50 ms':>8} {'p99 ms':>8} {'fragm.':>7} {'p50 ms':>8} {'p99 ms':>8}"
+          f" {'erreurs':>8} {'threads':>8} {'CPU %':>6} {'RSS Mo':>7} {'durée s':>8}")
+    for r in results:
+        flag = "  ⚠" if r.rerun_p99_ms > max_p99 else ""
+        print(f"{r.participants:>5} {r.reruns:>8} {r.rerun_p50_ms:>8} {r.rerun_p99_ms:>8} {r.fragment_runs:>7}"
+              f" {r.fragment_p50_ms:>8} {r.fragment_p99_ms:>8} {r.errors:>8} {r.threads_max:>8}"
+              f" {r.cpu_mean_percent:>6} {r.rss_max_mb:>7} {r.seconds:>8}{flag}")
+
+    within = [r.participants for r in results if r.rerun_p99_ms <= max_p99 and not r.errors]
+    if within:
+        print(f"\nCapacité estimée : {max(within)} participants (p99 des réexécutions ≤ {max_p99:.0f} ms)")
+    else:
+        print(f"\nAucun niveau ne tient un p99 ≤ {max_p99:.0f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Test de charge multi-sessions de MasterTalk")
+    parser.add_argument("--participants", type=int, nargs="+", default=[1, 5, 10, 25],
+                        help="nombres de sessions simultanées à essayer")
+    parser.add_argument("--rounds", type=int, default=1, help="parcours joués par session")
+    parser.add_argument("--think", type=float, default=0.5, help="temps de réflexion moyen entre deux actions (s)")
+    parser.add_argument("--ramp", type=float, default=2.0, help="durée d'arrivée des participants (s)")
+    parser.add_argument("--max-p99", type=float, default=500.0, help="p99 acceptable d'une réexécution (ms)")
+    parser.add_argument("--json", type=Path, help="enregistre les résultats au format JSON")
+    args = parser.parse_args()
+
+    if not Path("/proc/self/stat").exists():
+        print("Les mesures du processus serveur lisent /proc : Linux requis", file=sys.stderr)
+        return 2
+
+    results = []
+    for participants in args.participants:
+        print(f"{participants} participant(s)…", flush=True)
+        result, errors = asyncio.run(run_level(participants, args.rounds, args.think, args.ramp))
+        results.append(result)
+        for error in sorted(set(errors))[:5]:
+            print(f"  erreur : {error}")
+
+    print_report(results, args.max_p99)
+    if args.json:
+        args.json.write_text(json.dumps([asdict(r) for r in results], ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if any(r.errors for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
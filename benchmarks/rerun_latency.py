@@ -0,0 +1,208 @@
+"""Benchmark de latence des réexécutions, piloté par AppTest
+
+Rejoue app.py sans navigateur avec streamlit.testing : chaque section et
+chaque atelier du catalogue (mastertalk.catalog), puis un clic sur les vrais
+boutons de l'application. Pour chaque scénario sont mesurés le temps de
+réexécution (médiane) et le nombre d'éléments affichés ; le démarrage à
+froid est mesuré dans un processus neuf.
+
+Les résultats sont comparés à une référence enregistrée : un temps au-delà
+de la tolérance ou un nombre d'éléments en hausse fait échouer le run
+(code de sortie 1). La référence dépend de la machine, elle se régénère
+avec --update-baseline.
+
+Usage :
+    python benchmarks/rerun_latency.py
+    python benchmarks/rerun_latency.py --update-baseline
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from mastertalk.catalog import get_catalog  # noqa: E402
+
+APP_PATH = ROOT_DIR / "app.py"
+BASELINE_PATH = Path(__file__).resolve().parent / "rerun_baseline.json"
+
+SECTION_NAMES = get_catalog().sections
+ATELIERS = get_catalog().ateliers
+ATELIERS_SECTION = "7. Ateliers Interactifs"
+TIMEOUT = 30
+
+# (widget, clé, valeur) à renseigner avant le clic
+Inputs = Tuple[Tuple[str, str, str], ...]
+
+
+class Scenario(NamedTuple):
+    name: str
+    section: str
+    atelier: Optional[str] = None
+    button: Optional[str] = None
+    inputs: Inputs = ()
+
+
+CLICK_SCENARIOS = [
+    Scenario("clic:start_journey_btn", "Introduction", button="start_journey_btn",
+             inputs=(("text_input", "user_name", "Marie"),)),
+    Scenario("clic:smart_transform_btn", "2. Méthode SMART", button="smart_transform_btn"),
+    Scenario("clic:star_generate_btn", "3. Storytelling STAR", button="star_generate_btn"),
+    Scenario("clic:swot_generate_btn", "5. Analyse SWOT", button="swot_generate_btn"),
+    Scenario("clic:tows_generate_btn", "6. Matrice TOWS", button="tows_generate_btn"),
+    Scenario("clic:start_timer_btn2", ATELIERS_SECTION, ATELIERS[1], "start_timer_btn2"),
+    Scenario("clic:generate_challenge_btn", ATELIERS_SECTION, ATELIERS[2], "generate_challenge_btn"),
+    Scenario("clic:start_listening_btn", ATELIERS_SECTION, ATELIERS[3], "start_listening_btn"),
+]
+
+# Exécuté dans un processus neuf : streamlit est importé avant la mesure
+COLD_START_PROBE = """
+import json, time
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({path!r}, default_timeout={timeout})
+start = time.perf_counter()
+at.run()
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def all_scenarios() -> List[Scenario]:
+    """Toutes les sections, tous les ateliers, puis les clics"""
+    scenarios = [Scenario(f"section:{name}", name) for name in SECTION_NAMES]
+    scenarios += [Scenario(f"atelier:{name.split(' :')[0]}", ATELIERS_SECTION, name) for name in ATELIERS]
+    return scenarios + CLICK_SCENARIOS
+
+
+def count_elements(node) -> int:
+    """Nombre de nœuds de l'arbre d'éléments AppTest"""
+    children = getattr(node, "children", None) or {}
+    return 1 + sum(count_elements(child) for child in children.values())
+
+
+def _timed(action: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    action()
+    return time.perf_counter() - start
+
+
+def _check(at: AppTest, scenario: Scenario) -> None:
+    if at.exception:
+        raise RuntimeError(f"{scenario.name} : {[e.value for e in at.exception]}")
+
+
+def run_scenario(scenario: Scenario, repeat: int) -> Dict[str, float]:
+    """Mesure un scénario : navigation, réexécution à vide et clic éventuel"""
+    navigation, rerun, click = [], [], []
+    elements = 0
+    for _ in range(repeat):
+        at = AppTest.from_file(str(APP_PATH), default_timeout=TIMEOUT)
+        at.run()
+        navigation.append(_timed(lambda: at.selectbox(key="nav_select").set_value(scenario.section).run()))
+        if scenario.atelier:
+            navigation[-1] += _timed(lambda: at.selectbox(key="atelier_select").set_value(scenario.atelier).run())
+        _check(at, scenario)
+
+        rerun.append(_timed(at.run))
+
+        if scenario.button:
+            for widget, key, value in scenario.inputs:
+                getattr(at, widget)(key=key).input(value)
+            click.append(_timed(lambda: at.button(key=scenario.button).click().run()))
+        _check(at, scenario)
+        elements = count_elements(at.main) + count_elements(at.sidebar)
+
+    result = {
+        "navigation_ms": round(statistics.median(navigation) * 1000, 2),
+        "rerun_ms": round(statistics.median(rerun) * 1000, 2),
+        "elements": elements,
+    }
+    if click:
+        result["click_ms"] = round(statistics.median(click) * 1000, 2)
+    return result
+
+
+def cold_start(repeat: int) -> float:
+    """Premier run de app.py dans un processus neuf, en ms (médiane)"""
+    code = COLD_START_PROBE.format(path=str(APP_PATH), timeout=TIMEOUT)
+    timings = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                check=True, cwd=ROOT_DIR)
+        timings.append(json.loads(result.stdout.strip().splitlines()[-1]))
+    return round(statistics.median(timings) * 1000, 2)
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """Liste des régressions par rapport à la référence"""
+    regressions = []
+    limit = 1 + tolerance
+    if results["cold_start_ms"] > baseline["cold_start_ms"] * limit:
+        regressions.append(
+            f"démarrage à froid : {results['cold_start_ms']:.1f} ms > {baseline['cold_start_ms']:.1f} ms"
+        )
+    for name, metrics in results["scenarios"].items():
+        reference = baseline["scenarios"].get(name)
+        if reference is None:
+            continue
+        for metric, value in metrics.items():
+            if metric not in reference:
+                continue
+            if metric == "elements":
+                if value > reference[metric]:
+                    regressions.append(f"{name} : {value} éléments > {reference[metric]}")
+            elif value > reference[metric] * limit:
+                regressions.append(f"{name} : {metric} {value:.1f} > {reference[metric]:.1f}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="mesures par scénario")
+    parser.add_argument("--cold-repeat", type=int, default=3, help="processus neufs pour le démarrage à froid")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="hausse de temps tolérée par rapport à la référence (0.5 = +50%%)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="fichier de référence")
+    parser.add_argument("--update-baseline", action="store_true", help="enregistre les résultats comme référence")
+    args = parser.parse_args()
+
+    results = {"cold_start_ms": cold_start(args.cold_repeat), "scenarios": {}}
+    print(f"Démarrage à froid : {results['cold_start_ms']:.1f} ms\n")
+    print(f"{'scénario':<40}{'nav (ms)':>10}{'rerun (ms)':>12}{'clic (ms)':>11}{'éléments':>10}")
+    for scenario in all_scenarios():
+        metrics = run_scenario(scenario, args.repeat)
+        results["scenarios"][scenario.name] = metrics
+        click = f"{metrics['click_ms']:.1f}" if "click_ms" in metrics else "-"
+        print(f"{scenario.name:<40}{metrics['navigation_ms']:>10.1f}{metrics['rerun_ms']:>12.1f}"
+              f"{click:>11}{metrics['elements']:>10}")
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(results, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"\nRéférence enregistrée : {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print(f"\nPas de référence ({args.baseline}) : relancer avec --update-baseline")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print("\nRégressions :")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+    print("\nAucune régression par rapport à la référence.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Mesure du coût de démarrage et de réexécution du script principal
+
+Streamlit réexécute app.py à chaque interaction. Ce script mesure :
+
+* le démarrage à froid : temps pour exécuter le corps de app.py dans un
+  processus neuf (imports compris, hors import de streamlit lui-même) ;
+* le coût par réexécution : compilation + exécution du corps de app.py une
+  fois les modules déjà importés ;
+* le premier chargement de chaque module de section.
+
+Usage :
+    python benchmarks/section_imports.py
+    git show <commit>:app.py > /tmp/app_monolithe.py
+    python benchmarks/section_imports.py --baseline /tmp/app_monolithe.py
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+APP_PATH = ROOT_DIR / "app.py"
+
+SECTION_MODULES = [
+    "mastertalk.sections.intro",
+    "mastertalk.sections.ted_talk",
+    "mastertalk.sections.smart",
+    "mastertalk.sections.star",
+    "mastertalk.sections.ecoute",
+    "mastertalk.sections.swot",
+    "mastertalk.sections.tows",
+    "mastertalk.sections.ateliers",
+    "mastertalk.sections.atelier_1",
+    "mastertalk.sections.atelier_2",
+    "mastertalk.sections.atelier_3",
+    "mastertalk.sections.atelier_4",
+    "mastertalk.sections.conclusion",
+]
+
+# Exécuté dans un processus neuf : streamlit est importé avant la mesure
+# pour ne compter que le coût propre à l'application.
+COLD_START_PROBE = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import streamlit
+path = {path!r}
+start = time.perf_counter()
+source = open(path, encoding="utf-8").read()
+exec(compile(source, path, "exec"), {{"__name__": "bench", "__file__": path}})
+print(json.dumps(time.perf_counter() - start))
+"""
+
+MODULE_PROBE = """
+import importlib, json, sys, time
+sys.path.insert(0, {root!r})
+import streamlit, mastertalk.components, mastertalk.constants, mastertalk.timers
+start = time.perf_counter()
+importlib.import_module({module!r})
+print(json.dumps(time.perf_counter() - start))
+"""
+
+
+def _run_probe(code: str) -> float:
+    """Exécute une sonde dans un processus neuf et retourne sa mesure (s)"""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT_DIR,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def cold_start(path: Path, repeat: int) -> float:
+    """Temps médian d'exécution du corps du script dans un processus neuf"""
+    code = COLD_START_PROBE.format(root=str(ROOT_DIR), path=str(path))
+    return statistics.median(_run_probe(code) for _ in range(repeat))
+
+
+def rerun_cost(path: Path, repeat: int) -> float:
+    """Temps médian de compilation + exécution du script, modules déjà chargés"""
+    sys.path.insert(0, str(ROOT_DIR))
+    source = path.read_text(encoding="utf-8")
+    namespace = {"__name__": "bench", "__file__": str(path)}
+    exec(compile(source, str(path), "exec"), dict(namespace))  # préchauffage
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        exec(compile(source, str(path), "exec"), dict(namespace))
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def section_import_costs(repeat: int) -> dict:
+    """Temps médian du premier import de chaque module de section"""
+    return {
+        module: statistics.median(
+            _run_probe(MODULE_PROBE.format(root=str(ROOT_DIR), module=module))
+            for _ in range(repeat)
+        )
+        for module in SECTION_MODULES
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--baseline", type=Path, help="ancienne version de app.py à comparer")
+    parser.add_argument("--repeat", type=int, default=5, help="processus neufs par mesure à froid")
+    parser.add_argument("--reruns", type=int, default=200, help="réexécutions mesurées")
+    args = parser.parse_args()
+
+    scripts = {"actuel": APP_PATH}
+    if args.baseline:
+        scripts["référence"] = args.baseline
+
+    print(f"{'script':<12}{'froid (ms)':>14}{'réexécution (ms)':>20}{'taille (Ko)':>14}")
+    for label, path in scripts.items():
+        cold = cold_start(path, args.repeat) * 1000
+        rerun = rerun_cost(path, args.reruns) * 1000
+        size = path.stat().st_size / 1024
+        print(f"{label:<12}{cold:>14.2f}{rerun:>20.3f}{size:>14.1f}")
+
+    print("\nPremier chargement des sections :")
+    for module, seconds in section_import_costs(args.repeat).items():
+        print(f"  {module:<40}{seconds * 1000:>8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""MasterTalk : L'Art de Communiquer"""
@@ -0,0 +1,241 @@
+"""Ressources servies localement : polices, logo et images
+
+Les salles de formation n'ont pas toujours Internet : aucune ressource
+n'est chargée depuis un service externe dès que les polices sont
+vendorisées (voir plus bas). Les sources sont versionnées sous
+assets/ (polices Montserrat, logo) et publiées au démarrage dans static/
+sous un nom dérivé de leur contenu, comme la feuille de style. Les
+déclinaisons redimensionnées de public.png y sont générées au passage.
+
+Un fichier dont le nom change avec le contenu peut être mis en cache sans
+limite. Streamlit n'envoie pas d'en-tête Cache-Control sur app/static :
+il se pose devant, au niveau du proxy, par exemple avec nginx :
+
+    location ~ "^/app/static/.+\\.[0-9a-f]{12}\\.\\w+$" {
+        add_header Cache-Control "public, max-age=31536000, immutable";
+        proxy_pass http://streamlit;
+    }
+
+Les polices se récupèrent une seule fois, depuis un poste connecté, puis
+se versionnent :
+
+    python -m mastertalk.assets vendor
+
+Tant que assets/fonts/ ne contient aucune police, la feuille de style
+garde l'import de Google Fonts : Montserrat reste affichée sur un poste
+connecté, et seuls les postes hors ligne retombent sur sans-serif.
+"""
+
+import hashlib
+import io
+import re
+import sys
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import streamlit as st
+
+from mastertalk.constants import BASE_DIR, STATIC_DIR
+
+ASSETS_DIR = BASE_DIR / "assets"
+FONTS_DIR = ASSETS_DIR / "fonts"
+LOGO_SOURCE = ASSETS_DIR / "logo.svg"
+PUBLIC_IMAGE = BASE_DIR / "public.png"
+
+FONT_FAMILY = "Montserrat"
+FONT_WEIGHTS = (300, 400, 500, 600, 700)
+FONT_FILE = "montserrat-latin-{weight}.woff2"
+
+# Largeurs générées pour public.png (1024 px = taille d'origine)
+PUBLIC_WIDTHS = (320, 640, 1024)
+# Largeur d'affichage par défaut de l'illustration (attribut sizes de public_picture)
+PUBLIC_SIZES = "(max-width: 640px) 90vw, 300px"
+# Format -> (format Pillow, extension, options d'encodage)
+PUBLIC_FORMATS = {
+    "webp": ("WEBP", ".webp", {"quality": 80, "method": 6}),
+    "jpeg": ("JPEG", ".jpg", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+GOOGLE_FONTS_CSS = (
+    "https://fonts.googleapis.com/css2?family=Montserrat:wght@300;400;500;600;700&display=swap"
+)
+# Google Fonts ne sert du woff2 qu'aux navigateurs qui l'annoncent
+WOFF2_USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/120.0 Safari/537.36"
+)
+_SUBSET_BLOCK = re.compile(r"/\*\s*([\w-]+)\s*\*/\s*@font-face\s*\{(.*?)\}", re.S)
+
+
+@dataclass(frozen=True)
+class AssetManifest:
+    """Chemins servis (relatifs à l'application) des ressources publiées"""
+    logo: str
+    fonts: Dict[int, str]
+    public: Dict[int, Dict[str, str]]
+    public_size: Tuple[int, int] = (0, 0)
+
+    def srcset(self, fmt: str = "webp") -> str:
+        """Attribut srcset des déclinaisons de public.png dans un format"""
+        return ", ".join(f"{variants[fmt]} {width}w" for width, variants in sorted(self.public.items()))
+
+    def public_picture(self, alt: str) -> str:
+        """Balise <picture> de public.png : WebP, JPEG en repli, le navigateur choisit la largeur"""
+        if not self.public:
+            return ""
+        width, height = self.public_size
+        smallest = self.public[min(self.public)]["jpeg"]
+        return (
+            f'<picture><source type="image/webp" srcset="{self.srcset("webp")}" sizes="{PUBLIC_SIZES}">'
+            f'<img src="{smallest}" srcset="{self.srcset("jpeg")}" sizes="{PUBLIC_SIZES}" '
+            f'width="{width}" height="{height}" alt="{alt}" loading="lazy" decoding="async" '
+            f'style="width: 100%; height: auto; border-radius: 10px;"></picture>'
+        )
+
+
+# ============================================================================
+# PUBLICATION DANS static/
+# ============================================================================
+
+def publish_static(data: bytes, stem: str, suffix: str, subdir: str = "",
+                   digest: str = "") -> Tuple[str, str]:
+    """Écrit un fichier statique nommé d'après son contenu
+
+    Le fichier devient <stem>.<empreinte><suffix> ; les versions
+    précédentes du même fichier sont supprimées. Retourne le chemin servi
+    (relatif à l'application) et l'empreinte.
+    """
+    digest = digest or hashlib.sha256(data).hexdigest()[:12]
+    filename = f"{stem}.{digest}{suffix}"
+    directory = STATIC_DIR / subdir if subdir else STATIC_DIR
+
+    directory.mkdir(parents=True, exist_ok=True)
+    target = directory / filename
+    if not target.exists():
+        tmp = target.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(target)
+    _remove_stale(directory, stem, suffix, keep=filename)
+
+    href = f"{subdir}/{filename}" if subdir else filename
+    return f"app/static/{href}", digest
+
+
+def _remove_stale(directory: Path, stem: str, suffix: str, keep: str) -> None:
+    pattern = re.compile(rf"{re.escape(stem)}\.[0-9a-f]{{12}}{re.escape(suffix)}")
+    for old in directory.iterdir():
+        if old.name != keep and pattern.fullmatch(old.name):
+            old.unlink(missing_ok=True)
+
+
+def _publish_fonts() -> Dict[int, str]:
+    """Publie les polices présentes sous assets/fonts/"""
+    fonts = {}
+    for weight in FONT_WEIGHTS:
+        source = FONTS_DIR / FONT_FILE.format(weight=weight)
+        if source.exists():
+            fonts[weight], _ = publish_static(source.read_bytes(), source.stem, ".woff2", "fonts")
+    return fonts
+
+
+def _publish_public_variants() -> Dict[int, Dict[str, str]]:
+    """Génère les déclinaisons redimensionnées et compressées de public.png"""
+    if not PUBLIC_IMAGE.exists():
+        return {}
+
+    source = PUBLIC_IMAGE.read_bytes()
+    source_digest = hashlib.sha256(source).hexdigest()
+    image = None
+    variants: Dict[int, Dict[str, str]] = {}
+    for width in PUBLIC_WIDTHS:
+        for fmt, (pil_format, suffix, options) in PUBLIC_FORMATS.items():
+            # L'empreinte dépend de la source et des réglages : on évite de
+            # réencoder à chaque démarrage quand le fichier existe déjà
+            digest = hashlib.sha256(f"{source_digest}:{width}:{options}".encode()).hexdigest()[:12]
+            stem = f"public-{width}"
+            filename = f"{stem}.{digest}{suffix}"
+            if not (STATIC_DIR / "img" / filename).exists():
+                if image is None:
+                    from PIL import Image
+                    image = Image.open(io.BytesIO(source)).convert("RGB")
+                publish_static(_encode(image, width, pil_format, options), stem, suffix, "img", digest)
+            variants.setdefault(width, {})[fmt] = f"app/static/img/{filename}"
+    return variants
+
+
+def _image_size(path: Path) -> Tuple[int, int]:
+    from PIL import Image
+
+    # Image.open ne lit que l'en-tête du fichier
+    with Image.open(path) as image:
+        return image.size
+
+
+def _encode(image, width: int, pil_format: str, options: Dict) -> bytes:
+    from PIL import Image
+
+    height = round(image.height * width / image.width)
+    resized = image if width >= image.width else image.resize((width, height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    resized.save(buffer, pil_format, **options)
+    return buffer.getvalue()
+
+
+@st.cache_resource
+def get_assets() -> AssetManifest:
+    """Publie les ressources locales dans static/ (une fois par processus)"""
+    logo, _ = publish_static(LOGO_SOURCE.read_bytes(), "logo", ".svg", "img")
+    public = _publish_public_variants()
+    return AssetManifest(
+        logo=logo,
+        fonts=_publish_fonts(),
+        public=public,
+        public_size=_image_size(PUBLIC_IMAGE) if public else (0, 0),
+    )
+
+
+def font_face_css(fonts: Dict[int, str]) -> str:
+    """Règles @font-face des polices publiées, ou import de Google Fonts si aucune n'est vendorisée"""
+    if not fonts:
+        return f"@import url('{GOOGLE_FONTS_CSS}');"
+    return "".join(
+        f"@font-face{{font-family:'{FONT_FAMILY}';font-style:normal;font-weight:{weight};"
+        f"font-display:swap;src:url('{href}') format('woff2')}}"
+        for weight, href in sorted(fonts.items())
+    )
+
+
+# ============================================================================
+# VENDORISATION DES POLICES (poste connecté, une seule fois)
+# ============================================================================
+
+def _download(url: str) -> bytes:
+    request = urllib.request.Request(url, headers={"User-Agent": WOFF2_USER_AGENT})
+    with urllib.request.urlopen(request, timeout=30) as response:
+        return response.read()
+
+
+def vendor_fonts() -> List[Path]:
+    """Télécharge le sous-ensemble latin de Montserrat dans assets/fonts/"""
+    css = _download(GOOGLE_FONTS_CSS).decode("utf-8")
+    FONTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    written = []
+    for subset, block in _SUBSET_BLOCK.findall(css):
+        if subset != "latin":
+            continue
+        weight = re.search(r"font-weight:\s*(\d+)", block).group(1)
+        url = re.search(r"url\((\S+?\.woff2)\)", block).group(1)
+        target = FONTS_DIR / FONT_FILE.format(weight=weight)
+        target.write_bytes(_download(url))
+        written.append(target)
+    return written
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["vendor"]:
+        sys.exit("Usage : python -m mastertalk.assets vendor")
+    for path in vendor_fonts():
+        print(f"{path.relative_to(BASE_DIR)} ({path.stat().st_size // 1024} Ko)")
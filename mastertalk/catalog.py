@@ -0,0 +1,260 @@
+"""Catalogue du contenu pédagogique (content/catalogue.json)
+
+Les listes affichées par l'application (sections, ateliers, phrases et
+scénarios d'écoute, émotions, quiz, sujets du Mini-TED) vivent dans un
+fichier de données versionné plutôt que dans le code. Le fichier est lu
+une fois et converti en structures figées (tuples de dataclasses frozen),
+partagées par toutes les sessions du processus.
+
+Le fichier est relu sans redémarrer le serveur quand sa date de
+modification change (vérifiée au plus une fois par CHECK_INTERVAL
+secondes, voir WatchedFile). Au rechargement, chaque partie identique à
+la version précédente garde le même objet : les caches calculés à partir
+d'une partie (tables de correspondance, index de similarité de
+mastertalk.similarity) ne sont recalculés que si cette partie a changé.
+Un fichier invalide est ignoré et la version précédente reste en service.
+
+Les noms de sections et d'ateliers servent aussi de clés aux routeurs
+(SECTION_HANDLERS et ATELIER_HANDLERS dans mastertalk.sections) et au
+pré-rendu (STATIC_SECTIONS dans mastertalk.prerender) : un catalogue dont
+les noms ne leur correspondent pas est refusé. Les renommer impose de
+mettre ces tables à jour dans le même déploiement. Les sujets et
+contre-arguments de l'atelier 3 ont leurs propres fichiers, rechargés de
+la même façon (voir mastertalk.challenges).
+
+Vérifier le fichier avant de le déployer :
+
+    python -m mastertalk.catalog check [--path content/catalogue.json]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from mastertalk.constants import CONTENT_DIR
+from mastertalk.prerender import STATIC_SECTIONS
+from mastertalk.sections import ATELIER_HANDLERS, SECTION_HANDLERS
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = CONTENT_DIR / "catalogue.json"
+
+# Version du format de catalogue.json
+CATALOG_VERSION = 1
+
+# Intervalle minimal entre deux vérifications de la date de modification (secondes)
+CHECK_INTERVAL = 1.0
+
+# Réponses possibles du quiz de l'atelier 4
+QUIZ_ANSWERS = ("Vrai", "Faux")
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Entry:
+    """Libellé proposé au participant et texte associé"""
+    label: str
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class QuizQuestion:
+    """Affirmation du quiz Vrai ou Faux"""
+    statement: str
+    answer: str
+    explanation: str
+
+
+Entries = Tuple[Entry, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class Catalog:
+    """Contenu du catalogue, une partie par clé du fichier"""
+    sections: Tuple[str, ...]
+    ateliers: Tuple[str, ...]
+    ecoute_phrases: Entries  # phrase à reformuler -> exemple de reformulation
+    listening_scenarios: Entries  # scénario de l'atelier 4 -> message à écouter
+    emotions: Entries  # émotion -> message qui l'exprime
+    quiz: Tuple[QuizQuestion, ...]
+    mini_ted_topics: Tuple[str, ...]
+
+
+# ============================================================================
+# LECTURE DU FICHIER
+# ============================================================================
+
+def _texts(key: str, value: Any) -> Tuple[str, ...]:
+    if not isinstance(value, list) or not value or not all(isinstance(v, str) and v for v in value):
+        raise ValueError(f"{key} : liste de textes non vide attendue")
+    return tuple(value)
+
+
+def _entries(key: str, value: Any) -> Entries:
+    if not isinstance(value, dict) or not value or not all(isinstance(v, str) and v for v in value.values()):
+        raise ValueError(f"{key} : objet {{libellé: texte}} non vide attendu")
+    return tuple(Entry(label, text) for label, text in value.items())
+
+
+def _quiz(key: str, value: Any) -> Tuple[QuizQuestion, ...]:
+    try:
+        questions = tuple(
+            QuizQuestion(item["affirmation"], item["reponse"], item["explication"]) for item in value
+        )
+    except (TypeError, KeyError) as exc:
+        raise ValueError(f"{key} : question invalide ({exc})") from exc
+    if not questions or any(question.answer not in QUIZ_ANSWERS for question in questions):
+        raise ValueError(f"{key} : réponses attendues parmi {', '.join(QUIZ_ANSWERS)}")
+    return questions
+
+
+# Clé du fichier -> (champ de Catalog, conversion)
+_PARTS: Dict[str, Tuple[str, Callable[[str, Any], Any]]] = {
+    "sections": ("sections", _texts),
+    "ateliers": ("ateliers", _texts),
+    "ecoute_phrases": ("ecoute_phrases", _entries),
+    "scenarios_ecoute": ("listening_scenarios", _entries),
+    "emotions": ("emotions", _entries),
+    "quiz": ("quiz", _quiz),
+    "sujets_mini_ted": ("mini_ted_topics", _texts),
+}
+
+
+def _check_routes(sections: Tuple[str, ...], ateliers: Tuple[str, ...]) -> None:
+    """Vérifie que les sections et ateliers correspondent aux routeurs et au pré-rendu"""
+    unknown = [section for section in sections if section not in SECTION_HANDLERS]
+    if unknown:
+        raise ValueError(f"sections sans page : {', '.join(unknown)}")
+    missing = [section for section in SECTION_HANDLERS if section not in sections]
+    missing += [section for section in STATIC_SECTIONS if section not in sections and section not in missing]
+    if missing:
+        raise ValueError(f"sections absentes du catalogue : {', '.join(missing)}")
+    # Un atelier est routé par le premier préfixe contenu dans son nom (voir ateliers.py)
+    routed = set()
+    for atelier in ateliers:
+        prefix = next((prefix for prefix in ATELIER_HANDLERS if prefix in atelier), None)
+        if prefix is None:
+            raise ValueError(f"atelier sans page : {atelier}")
+        routed.add(prefix)
+    missing = [prefix for prefix in ATELIER_HANDLERS if prefix not in routed]
+    if missing:
+        raise ValueError(f"ateliers absents du catalogue : {', '.join(missing)}")
+
+
+def load_catalog(path: Path, previous: Optional[Catalog] = None) -> Catalog:
+    """Lit et valide le catalogue, en réutilisant les parties inchangées de previous
+
+    Lève ValueError si le fichier est invalide.
+    """
+    data = json.loads(path.read_bytes())
+    version = data.get("version") if isinstance(data, dict) else None
+    if version != CATALOG_VERSION:
+        raise ValueError(f"version de catalogue inconnue : {version!r}")
+    values = {}
+    for key, (name, convert) in _PARTS.items():
+        if key not in data:
+            raise ValueError(f"partie manquante : {key}")
+        value = convert(key, data[key])
+        if previous is not None and getattr(previous, name) == value:
+            value = getattr(previous, name)
+        values[name] = value
+    _check_routes(values["sections"], values["ateliers"])
+    return Catalog(**values)
+
+
+# ============================================================================
+# RECHARGEMENT À CHAUD
+# ============================================================================
+
+class WatchedFile(Generic[T]):
+    """Fichier de content/ chargé une fois, relu quand sa date de modification change"""
+
+    def __init__(self, path: Path, load: Callable[[Path, Optional[T]], T]) -> None:
+        self.path = path
+        self._load = load
+        self._lock = threading.Lock()
+        self._value: Optional[T] = None
+        self._mtime: Optional[int] = None
+        self._checked = 0.0
+
+    def get(self) -> T:
+        """Version courante, relue si le fichier a changé depuis le dernier chargement"""
+        if self._value is None or time.monotonic() - self._checked >= CHECK_INTERVAL:
+            with self._lock:
+                if self._value is None or time.monotonic() - self._checked >= CHECK_INTERVAL:
+                    self._refresh()
+                    self._checked = time.monotonic()
+        return self._value
+
+    def _refresh(self) -> None:
+        try:
+            mtime = self.path.stat().st_mtime_ns
+        except OSError:
+            # Fichier momentanément absent (remplacement en cours)
+            if self._value is None:
+                raise
+            return
+        if mtime == self._mtime:
+            return
+        try:
+            value = self._load(self.path, self._value)
+        except (OSError, ValueError) as exc:
+            if self._value is None:
+                raise
+            logger.error("%s ignoré, la version précédente reste en service : %s", self.path.name, exc)
+        else:
+            self._value = value
+        # Un fichier invalide n'est relu qu'après une nouvelle modification
+        self._mtime = mtime
+
+
+_CATALOG = WatchedFile(CATALOG_PATH, load_catalog)
+
+
+def get_catalog() -> Catalog:
+    """Catalogue courant, partagé par toutes les sessions du processus"""
+    return _CATALOG.get()
+
+
+@lru_cache(maxsize=32)
+def labels(entries: Entries) -> Tuple[str, ...]:
+    """Libellés d'une partie, dans l'ordre du fichier"""
+    return tuple(entry.label for entry in entries)
+
+
+@lru_cache(maxsize=32)
+def lookup(entries: Entries) -> Dict[str, str]:
+    """Table libellé -> texte d'une partie (ne pas modifier)"""
+    return {entry.label: entry.text for entry in entries}
+
+
+# ============================================================================
+# POINT D'ENTRÉE
+# ============================================================================
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Catalogue du contenu pédagogique de MasterTalk")
+    parser.add_argument("command", choices=["check"])
+    parser.add_argument("--path", type=Path, default=CATALOG_PATH, help="fichier à vérifier")
+    args = parser.parse_args()
+
+    try:
+        catalog = load_catalog(args.path)
+    except (OSError, ValueError) as exc:
+        print(f"{args.path} : {exc}", file=sys.stderr)
+        return 1
+    for f in fields(Catalog):
+        print(f"{f.name:<20} {len(getattr(catalog, f.name)):>4}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
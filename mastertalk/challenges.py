@@ -0,0 +1,177 @@
+"""Banques de défis de l'atelier 3 : sujets de débat et contre-arguments
+
+Chaque banque est un fichier texte de content/ (une ligne par entrée :
+thème, niveau, texte séparés par des tabulations). Le fichier est lu d'un
+bloc et indexé en un seul passage : pour chaque entrée on ne garde que ses
+bornes dans le fichier, et pour chaque couple (thème, niveau) la liste des
+numéros d'entrées, dans des array('I'). Le texte n'est décodé qu'au
+tirage. La banque est chargée au premier affichage de l'atelier 3 puis
+partagée par toutes les sessions ; elle est relue si le fichier change
+(voir mastertalk.catalog.WatchedFile).
+
+Le tirage se fait sans remise pour chaque session : un participant voit
+toutes les entrées d'un filtre avant d'en revoir une. L'ordre de passage
+est une permutation du filtre : une permutation de base mélangée une
+fois par filtre et gardée en cache (_base_order), composée avec une
+permutation affine rang -> (a * rang + b) mod taille tirée de la graine
+de la session (DebatState.seed) et du cycle. Le cache ne dépend donc pas
+du nombre de participants, et un tirage coûte O(1) sans construire de
+tableau par session. La session ne conserve qu'un compteur par filtre
+(DebatState.draws), sauvegardé avec elle. Si la banque change en cours
+de session, les compteurs continuent sur les nouvelles permutations.
+"""
+
+import random
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
+from pathlib import Path
+from typing import Dict, List, MutableMapping, Optional, Tuple
+
+from mastertalk.catalog import WatchedFile
+from mastertalk.constants import CONTENT_DIR
+
+# Fichiers des banques (voir l'en-tête de chaque fichier pour le format)
+TOPICS_PATH = CONTENT_DIR / "sujets.tsv"
+COUNTERS_PATH = CONTENT_DIR / "contre_arguments.tsv"
+
+# Niveaux de difficulté des entrées
+LEVELS = {
+    1: "Facile",
+    2: "Intermédiaire",
+    3: "Difficile",
+}
+
+# Clé d'un filtre : (thème, niveau), None pour « tous »
+PoolKey = Tuple[Optional[str], Optional[int]]
+
+
+@dataclass(frozen=True, slots=True)
+class Challenge:
+    """Entrée d'une banque"""
+    text: str
+    category: str
+    level: int
+
+    @property
+    def level_label(self) -> str:
+        """Libellé du niveau de difficulté"""
+        return LEVELS[self.level]
+
+
+class ChallengeBank:
+    """Banque indexée d'un fichier de content/, en lecture seule"""
+
+    def __init__(self, path: Path) -> None:
+        self.name = path.stem
+        self._data = path.read_bytes()
+        self._starts = array("I")
+        self._ends = array("I")
+        self._levels = array("B")
+        self._category_of = array("H")
+        self.categories: List[str] = []
+        self._pools: Dict[PoolKey, array] = {}
+        self._index()
+
+    def _index(self) -> None:
+        """Repère les bornes de chaque entrée et remplit les filtres"""
+        data = self._data
+        category_ids: Dict[bytes, int] = {}
+        position, size = 0, len(data)
+        while position < size:
+            end = data.find(b"\n", position)
+            if end < 0:
+                end = size
+            if end > position and data[position] != ord("#"):
+                first = data.find(b"\t", position, end)
+                second = data.find(b"\t", first + 1, end)
+                if first < 0 or second < 0:
+                    raise ValueError(f"{self.name} : ligne mal formée à l'octet {position}")
+                category = data[position:first]
+                if category not in category_ids:
+                    category_ids[category] = len(self.categories)
+                    self.categories.append(category.decode("utf-8"))
+                level = int(data[first + 1:second])
+                if level not in LEVELS:
+                    raise ValueError(f"{self.name} : niveau inconnu {level} à l'octet {position}")
+                number = len(self._starts)
+                self._starts.append(second + 1)
+                self._ends.append(end)
+                self._levels.append(level)
+                self._category_of.append(category_ids[category])
+                name = self.categories[category_ids[category]]
+                for key in ((None, None), (name, None), (None, level), (name, level)):
+                    self._pools.setdefault(key, array("I")).append(number)
+            position = end + 1
+        if not self._starts:
+            raise ValueError(f"{self.name} : aucune entrée")
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def entry(self, number: int) -> Challenge:
+        """Décode l'entrée numéro number"""
+        text = self._data[self._starts[number]:self._ends[number]].decode("utf-8")
+        return Challenge(
+            text.rstrip("\r"),
+            self.categories[self._category_of[number]],
+            self._levels[number],
+        )
+
+    def pool(self, category: Optional[str] = None, level: Optional[int] = None) -> array:
+        """Numéros des entrées d'un filtre (vide si le filtre n'existe pas)"""
+        return self._pools.get((category, level), array("I"))
+
+
+_TOPICS = WatchedFile(TOPICS_PATH, lambda path, previous: ChallengeBank(path))
+_COUNTERS = WatchedFile(COUNTERS_PATH, lambda path, previous: ChallengeBank(path))
+
+
+def get_topic_bank() -> ChallengeBank:
+    """Banque des sujets de débat, partagée par toutes les sessions"""
+    return _TOPICS.get()
+
+
+def get_counter_bank() -> ChallengeBank:
+    """Banque des contre-arguments, partagée par toutes les sessions"""
+    return _COUNTERS.get()
+
+
+@lru_cache(maxsize=256)
+def _base_order(key: str, size: int) -> array:
+    """Permutation de base des rangs d'un filtre, commune à toutes les sessions"""
+    order = list(range(size))
+    random.Random(key).shuffle(order)
+    return array("I", order)
+
+
+def _affine(seed: int, key: str, cycle: int, size: int) -> Tuple[int, int]:
+    """Coefficients (a, b) de la permutation d'une session et d'un cycle, a premier avec size"""
+    rng = random.Random(f"{seed}:{key}:{cycle}")
+    step = rng.randrange(1, size) if size > 1 else 1
+    while gcd(step, size) != 1:
+        step = rng.randrange(1, size)
+    return step, rng.randrange(size)
+
+
+def draw(
+    bank: ChallengeBank,
+    seed: int,
+    cursors: MutableMapping[str, int],
+    category: Optional[str] = None,
+    level: Optional[int] = None,
+) -> Optional[Challenge]:
+    """Tire sans remise l'entrée suivante d'un filtre pour une session
+
+    cursors est le compteur de tirages de la session (DebatState.draws),
+    mis à jour sur place. Renvoie None si le filtre est vide.
+    """
+    pool = bank.pool(category, level)
+    if not pool:
+        return None
+    key = f"{bank.name}:{category or '*'}:{level or '*'}"
+    cycle, rank = divmod(cursors.get(key, 0), len(pool))
+    cursors[key] = cursors.get(key, 0) + 1
+    step, offset = _affine(seed, key, cycle, len(pool))
+    return bank.entry(pool[_base_order(key, len(pool))[(step * rank + offset) % len(pool)]])
@@ -0,0 +1,63 @@
+"""Composants d'affichage réutilisables"""
+
+from typing import Sequence, Tuple
+
+import streamlit as st
+
+from mastertalk.readability import combine, readability
+from mastertalk.similarity import fidelity
+
+# ============================================================================
+# COMPOSANTS RÉUTILISABLES
+# ============================================================================
+
+def create_card(content: str, card_class: str = "section-card") -> None:
+    """Crée une carte de contenu stylisée avec thème clair"""
+    # Nettoyer le contenu
+    content = content.strip()
+    
+    # Retirer les triples guillemets s'ils sont présents
+    if content.startswith("'''") and content.endswith("'''"):
+        content = content[3:-3].strip()
+    elif content.startswith('"""') and content.endswith('"""'):
+        content = content[3:-3].strip()
+    
+    # Échapper les apostrophes simples
+    content = content.replace("'", "&#39;")
+    
+    # Afficher la carte
+    html = f'<div class="{card_class}">{content}</div>'
+    st.markdown(html, unsafe_allow_html=True)
+
+def create_transition(text: str) -> None:
+    """Crée une boîte de transition avec thème bleu clair"""
+    st.markdown(f'<div class="transition-box">{text}</div>', unsafe_allow_html=True)
+
+def create_quote(text: str) -> None:
+    """Crée une boîte de citation avec dégradé bleu"""
+    st.markdown(f'<div class="quote-box">{text}</div>', unsafe_allow_html=True)
+
+def create_readability_table(parts: Sequence[Tuple[str, str]], total_label: str = "Ensemble") -> None:
+    """Affiche la lisibilité de chaque partie (libellé, texte) et de l'ensemble"""
+    rows = [(label, readability(text)) for label, text in parts]
+    rows.append((f"**{total_label}**", combine(r for _, r in rows)))
+    lines = [
+        "| Partie | Flesch (FR) | Niveau | Mots / phrase | Densité lexicale |",
+        "|---|---:|---|---:|---:|",
+    ]
+    for label, r in rows:
+        flesch = "—" if r.flesch is None else f"{r.flesch:.0f}"
+        lines.append(f"| {label} | {flesch} | {r.level} | {r.avg_sentence_length:.1f} | {r.lexical_density:.0%} |")
+    st.markdown("\n".join(lines))
+
+def create_fidelity_feedback(reference: str, reformulation: str) -> None:
+    """Affiche la proximité d'une reformulation avec le message d'origine"""
+    result = fidelity(reference, reformulation)
+    col_sim, col_cov = st.columns(2)
+    with col_sim:
+        st.metric("Proximité avec le message", f"{result.similarity:.0%}")
+    with col_cov:
+        st.metric("Idées clés reprises", f"{result.coverage:.0%}")
+    if not result.faithful:
+        st.info("💡 **Fidélité :** Votre reformulation s'éloigne du message d'origine. "
+                f"Reprenez ses idées clés : {', '.join(result.missing[:5])}.")
@@ -0,0 +1,59 @@
+"""Données partagées par l'application MasterTalk"""
+
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+# Données produites pendant les formations (sessions, feedbacks)
+DATA_DIR = BASE_DIR / "data"
+
+# Contenu pédagogique éditable sans toucher au code (voir mastertalk.catalog)
+CONTENT_DIR = BASE_DIR / "content"
+
+# Fichiers servis par Streamlit sous app/static/ (server.enableStaticServing)
+STATIC_DIR = BASE_DIR / "static"
+
+# ============================================================================
+# DONNÉES ET CONSTANTES
+# ============================================================================
+
+# Marqueurs repérés dans les saisies (voir mastertalk.keywords) : mots
+# entiers, sans tenir compte des accents ni de la casse ; « * » accepte
+# toute fin de mot
+ACTIVE_LISTENING_MARKERS = {
+    "Reformulation": ["si je comprends", "tu veux dire", "donc tu", "ce que tu"],
+    "Validation émotionnelle": ["tu te sens", "tu ressens", "c'est difficile", "ça doit être"],
+    "Question ouverte": ["?"],
+    "Empathie": ["je comprends", "je vois", "c'est normal", "c'est compréhensible"],
+}
+
+ECOUTE_MARKERS = {
+    "Reformulation": ["comprend*", "si"],
+    "Question": ["?"],
+}
+
+# Types d'arguments de l'atelier 3 : connecteurs et mots typiques, réduits
+# à leur radical (« prouv* » couvre prouve, prouvé, prouvent...)
+ARGUMENT_MARKERS = {
+    "📖 Exemple": [
+        "exemple*", "cas", "histoire*", "anecdote*", "prenons", "témoign*", "illustr*",
+        "comme quand", "vécu", "notamment",
+    ],
+    "🧠 Logique": [
+        "logique*", "donc", "parce que", "parce qu'", "puisque", "puisqu'", "car", "ainsi",
+        "par conséquent", "c'est pourquoi", "en effet", "dès lors", "de ce fait", "conséquen*",
+        "entraîn*", "implique*",
+    ],
+    "🎓 Autorité": [
+        "selon", "d'après", "expert*", "spécialiste*", "scientifique*", "chercheur*", "professeur*",
+        "médecin*", "étude*", "recherche*", "prouv*", "démontr*", "prix nobel",
+    ],
+    "❤️ Émotion": [
+        "imagin*", "ressen*", "sentiment*", "peur*", "espoir*", "fier*", "injust*", "souffr*",
+        "bonheur", "heureu*", "tristesse", "colère", "cœur", "rêve", "rêves", "honte*", "dignité",
+    ],
+    "📊 Statistique": [
+        "statistique*", "chiffre*", "pourcentage*", "%", "pour cent", "sondage*", "moyenne",
+        "majorité", "millions", "milliard*", "taux", "sur dix", "fois plus", "fois moins", "insee",
+    ],
+}
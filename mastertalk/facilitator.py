@@ -0,0 +1,401 @@
+"""Tableau de bord de l'animateur
+
+Toutes les sessions du processus publient leurs changements dans un même
+registre (st.cache_resource) : section affichée, atelier ouvert, scores
+des exercices. Chaque publication est un delta appliqué en O(1) aux
+agrégats (nombre de participants par section, moyenne de chaque score) :
+un score modifié retire l'ancienne valeur de la somme avant d'ajouter la
+nouvelle, et une publication sans changement ne touche à rien.
+
+La vue animateur (?view=animateur dans l'URL) lit un instantané des
+agrégats. L'instantané n'est reconstruit que si un delta est arrivé, et
+au plus une fois par DASHBOARD_REFRESH secondes quel que soit le nombre
+de vues ouvertes : 200 participants ne coûtent pas 200 fois le travail.
+À chaque reconstruction, les participants inactifs depuis ACTIVE_WINDOW
+secondes sont retirés des sections « en ce moment ».
+
+Le registre reste borné dans un processus qui tourne longtemps : un
+participant inactif depuis PARTICIPANT_RETENTION secondes est oublié,
+avec ses sections, ses ateliers et ses scores retirés des agrégats, et
+au-delà de MAX_PARTICIPANTS le moins récemment actif fait place au
+nouveau.
+
+La vue est protégée par une clé, lue dans la variable d'environnement
+MASTERTALK_FACILITATOR_KEY ou dans st.secrets (facilitator_key) ; sans
+clé configurée, elle reste fermée :
+
+    MASTERTALK_FACILITATOR_KEY=... streamlit run app.py
+"""
+
+import hmac
+import os
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+import streamlit as st
+
+from mastertalk.catalog import get_catalog
+from mastertalk.scoring import MAX_FORCE_SCORE
+from mastertalk.session import get_session
+from mastertalk.store import session_token
+
+# Valeur du paramètre d'URL ?view= qui affiche le tableau de bord
+FACILITATOR_QUERY_VALUE = "animateur"
+
+# Clé d'accès à la vue animateur : variable d'environnement, ou entrée de st.secrets
+FACILITATOR_KEY_ENV = "MASTERTALK_FACILITATOR_KEY"
+FACILITATOR_KEY_SECRET = "facilitator_key"
+FACILITATOR_AUTH_KEY = "mastertalk_facilitator_auth"
+
+# Intervalle minimal entre deux redessins du tableau de bord (secondes)
+DASHBOARD_REFRESH = 2
+
+# Un participant sans activité depuis plus longtemps n'est plus compté comme
+# connecté ni présent dans sa section
+ACTIVE_WINDOW = 5 * 60
+# Sans nouveau delta, l'instantané est tout de même refait à cet intervalle
+# pour que le nombre de connectés suive les départs
+IDLE_REFRESH = 30
+
+# Un participant inactif depuis plus longtemps est oublié (une journée de formation)
+PARTICIPANT_RETENTION = 8 * 60 * 60
+# Nombre maximal de participants suivis par processus
+MAX_PARTICIPANTS = 1000
+
+# Scores publiés par les sections (mêmes clés que mastertalk.scoring) :
+# libellé, et échelle d'affichage (None pour un taux de réussite)
+SCORE_LABELS = {
+    "atelier1_passed": ("Atelier 1 : idée en 7 mots", None),
+    "atelier2_seconds": ("Atelier 2 : durée du Mini-TED", "s"),
+    "atelier3_force": ("Atelier 3 : persuasion", f"/{MAX_FORCE_SCORE}"),
+    "atelier4_score": ("Atelier 4 : écoute active", "/4"),
+    "ecoute_passed": ("Écoute active : reformulation", None),
+    "emotion_passed": ("Atelier 4 : miroir émotionnel", None),
+    "smart_score": ("Objectif SMART", "/5"),
+}
+
+
+@dataclass(slots=True)
+class Participant:
+    """Dernier état publié par une session"""
+    number: int
+    name: str = ""
+    section: Optional[str] = None
+    atelier: Optional[str] = None
+    ateliers: Set[str] = field(default_factory=set)
+    visited: Set[str] = field(default_factory=set)
+    scores: Dict[str, float] = field(default_factory=dict)
+    last_seen: float = 0.0
+
+    @property
+    def label(self) -> str:
+        """Nom saisi dans l'introduction, ou numéro d'arrivée"""
+        return self.name or f"Participant {self.number}"
+
+
+@dataclass(frozen=True, slots=True)
+class ClassroomSnapshot:
+    """Agrégats de la salle à un instant donné"""
+    participants: int
+    active: int
+    visited: Dict[str, int]
+    current: Dict[str, int]
+    ateliers: Dict[str, int]
+    scores: Dict[str, Tuple[float, int]]
+    roster: List[Dict[str, object]]
+    taken_at: float
+
+
+class ClassroomRegistry:
+    """Registre des participants et agrégats tenus à jour à chaque delta"""
+
+    def __init__(self, refresh: float = DASHBOARD_REFRESH, capacity: int = MAX_PARTICIPANTS) -> None:
+        self.refresh = refresh
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._snapshot: Optional[ClassroomSnapshot] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._participants: Dict[str, Participant] = {}
+        self._visited: Counter = Counter()
+        self._current: Counter = Counter()
+        self._ateliers: Counter = Counter()
+        # Clé de score -> [somme, nombre de participants notés]
+        self._scores: Dict[str, List[float]] = {}
+        self._arrivals = 0
+        self._version = 0
+        self._snapshot_version = -1
+
+    def _participant(self, participant_id: str) -> Participant:
+        participant = self._participants.get(participant_id)
+        if participant is None:
+            if len(self._participants) >= self.capacity:
+                oldest = min(self._participants, key=lambda pid: self._participants[pid].last_seen)
+                self._forget(oldest)
+            self._arrivals += 1
+            participant = Participant(number=self._arrivals)
+            self._participants[participant_id] = participant
+        participant.last_seen = time.time()
+        return participant
+
+    def _forget(self, participant_id: str) -> None:
+        """Retire un participant et sa contribution à chaque agrégat"""
+        participant = self._participants.pop(participant_id)
+        if participant.section is not None:
+            self._current[participant.section] -= 1
+        self._visited.subtract(participant.visited)
+        self._ateliers.subtract(participant.ateliers)
+        for key, value in participant.scores.items():
+            total = self._scores[key]
+            total[0] -= value
+            total[1] -= 1
+            if not total[1]:
+                del self._scores[key]
+        self._version += 1
+
+    def visit(self, participant_id: str, section: str, name: str = "") -> None:
+        """Section affichée par un participant"""
+        with self._lock:
+            participant = self._participant(participant_id)
+            if participant.section == section and participant.name == name:
+                return
+            if participant.section is not None:
+                self._current[participant.section] -= 1
+            self._current[section] += 1
+            if section not in participant.visited:
+                participant.visited.add(section)
+                self._visited[section] += 1
+            participant.section = section
+            participant.name = name
+            self._version += 1
+
+    def open_atelier(self, participant_id: str, atelier: str) -> None:
+        """Atelier ouvert par un participant"""
+        with self._lock:
+            participant = self._participant(participant_id)
+            if participant.atelier == atelier:
+                return
+            if atelier not in participant.ateliers:
+                participant.ateliers.add(atelier)
+                self._ateliers[atelier] += 1
+            participant.atelier = atelier
+            self._version += 1
+
+    def score(self, participant_id: str, key: str, value: float) -> None:
+        """Dernier score d'un participant pour un exercice"""
+        value = float(value)
+        with self._lock:
+            participant = self._participant(participant_id)
+            previous = participant.scores.get(key)
+            if previous == value:
+                return
+            total = self._scores.setdefault(key, [0.0, 0])
+            if previous is None:
+                total[1] += 1
+            else:
+                total[0] -= previous
+            total[0] += value
+            participant.scores[key] = value
+            self._version += 1
+
+    def clear(self) -> None:
+        """Oublie tous les participants (nouvelle séance)"""
+        with self._lock:
+            self._reset()
+            self._snapshot = None
+
+    def snapshot(self) -> ClassroomSnapshot:
+        """Instantané des agrégats, reconstruit au plus une fois par intervalle"""
+        now = time.time()
+        with self._lock:
+            cached = self._snapshot
+            if cached is not None:
+                age = now - cached.taken_at
+                if age < self.refresh or (self._snapshot_version == self._version and age < IDLE_REFRESH):
+                    return cached
+            expired = now - PARTICIPANT_RETENTION
+            for participant_id in [pid for pid, p in self._participants.items() if p.last_seen < expired]:
+                self._forget(participant_id)
+            threshold = now - ACTIVE_WINDOW
+            for p in self._participants.values():
+                if p.section is not None and p.last_seen < threshold:
+                    # Parti ou inactif : il réapparaît dans sa section à sa prochaine visite
+                    self._current[p.section] -= 1
+                    p.section = None
+                    self._version += 1
+            roster = [
+                {
+                    "participant": p.label,
+                    "section": p.section or "—",
+                    "atelier": p.atelier or "—",
+                    "sections vues": len(p.visited),
+                    "scores": len(p.scores),
+                    "actif": p.last_seen >= threshold,
+                }
+                for p in self._participants.values()
+            ]
+            snapshot = ClassroomSnapshot(
+                participants=len(self._participants),
+                active=sum(row["actif"] for row in roster),
+                visited={section: n for section, n in self._visited.items() if n},
+                current={section: n for section, n in self._current.items() if n},
+                ateliers={atelier: n for atelier, n in self._ateliers.items() if n},
+                scores={key: (total / count, count) for key, (total, count) in self._scores.items() if count},
+                roster=roster,
+                taken_at=now,
+            )
+            self._snapshot, self._snapshot_version = snapshot, self._version
+            return snapshot
+
+
+@st.cache_resource
+def get_registry() -> ClassroomRegistry:
+    """Registre partagé par toutes les sessions du processus"""
+    return ClassroomRegistry()
+
+
+# ============================================================================
+# PUBLICATION DEPUIS LES SESSIONS
+# ============================================================================
+
+def publish_visit(section: str) -> None:
+    """Publie la section affichée par la session courante"""
+    profile = get_session().profile
+    get_registry().visit(session_token(), section, profile.name if profile else "")
+
+
+def publish_atelier(atelier: str) -> None:
+    """Publie l'atelier ouvert par la session courante"""
+    get_registry().open_atelier(session_token(), atelier)
+
+
+def publish_score(key: str, value: float) -> None:
+    """Publie le dernier score de la session courante pour un exercice"""
+    get_registry().score(session_token(), key, value)
+
+
+# ============================================================================
+# VUE ANIMATEUR
+# ============================================================================
+
+def facilitator_view_requested() -> bool:
+    """La vue animateur n'est affichée qu'avec ?view=animateur dans l'URL"""
+    return st.query_params.get("view") == FACILITATOR_QUERY_VALUE
+
+
+def _facilitator_key() -> str:
+    """Clé d'accès configurée, ou chaîne vide"""
+    key = os.environ.get(FACILITATOR_KEY_ENV, "")
+    if not key:
+        try:
+            key = st.secrets.get(FACILITATOR_KEY_SECRET, "")
+        except FileNotFoundError:
+            # Pas de secrets.toml
+            key = ""
+    return str(key)
+
+
+def _facilitator_authorized() -> bool:
+    """Demande la clé d'accès une fois par session ; True si elle a été donnée"""
+    if st.session_state.get(FACILITATOR_AUTH_KEY):
+        return True
+    expected = _facilitator_key()
+    if not expected:
+        st.error(
+            f"Vue animateur désactivée : définissez la variable d'environnement {FACILITATOR_KEY_ENV} "
+            f"ou l'entrée {FACILITATOR_KEY_SECRET} de .streamlit/secrets.toml."
+        )
+        return False
+    with st.form("facilitator_login"):
+        given = st.text_input("Clé d'accès animateur", type="password", key="facilitator_key_input")
+        submitted = st.form_submit_button("Accéder au tableau de bord")
+    if submitted:
+        if hmac.compare_digest(given.encode("utf-8"), expected.encode("utf-8")):
+            st.session_state[FACILITATOR_AUTH_KEY] = True
+            st.rerun()
+        st.error("Clé incorrecte.")
+    return False
+
+
+def _format_score(key: str, mean: float) -> str:
+    unit = SCORE_LABELS[key][1]
+    if unit is None:
+        return f"{mean:.0%} de réussite"
+    if unit == "s":
+        return f"{mean:.0f} s en moyenne"
+    return f"{mean:.1f}{unit} en moyenne"
+
+
+def _render_dashboard() -> None:
+    """Agrégats de la salle ; exécuté dans un fragment rafraîchi périodiquement"""
+    snapshot = get_registry().snapshot()
+
+    col_total, col_active, col_ateliers = st.columns(3)
+    with col_total:
+        st.metric("Participants", snapshot.participants)
+    with col_active:
+        st.metric("Connectés", snapshot.active, help=f"Actifs depuis moins de {ACTIVE_WINDOW // 60} minutes")
+    with col_ateliers:
+        st.metric("Ateliers ouverts", sum(snapshot.ateliers.values()))
+
+    if not snapshot.participants:
+        st.info("En attente des participants…")
+        return
+
+    catalog = get_catalog()
+    col_sections, col_scores = st.columns(2)
+    with col_sections:
+        st.markdown("#### 📍 Parcours")
+        st.dataframe(
+            [
+                {
+                    "section": section,
+                    "en ce moment": snapshot.current.get(section, 0),
+                    "déjà vue": snapshot.visited.get(section, 0),
+                }
+                for section in catalog.sections
+            ],
+            hide_index=True,
+            use_container_width=True
+        )
+        st.markdown("#### 🎭 Ateliers")
+        for atelier in catalog.ateliers:
+            prefix = " ".join(atelier.split()[:3])
+            st.caption(f"{atelier} : {snapshot.ateliers.get(prefix, 0)} participant(s)")
+
+    with col_scores:
+        st.markdown("#### 📊 Résultats")
+        if not snapshot.scores:
+            st.caption("Aucun exercice noté pour l'instant.")
+        for key, (label, _) in SCORE_LABELS.items():
+            if key in snapshot.scores:
+                mean, count = snapshot.scores[key]
+                st.markdown(f"**{label}** : {_format_score(key, mean)} ({count} participant(s))")
+
+    with st.expander(f"👥 Participants ({snapshot.participants})"):
+        st.dataframe(snapshot.roster, hide_index=True, use_container_width=True)
+    st.caption(f"Mis à jour à {time.strftime('%H:%M:%S', time.localtime(snapshot.taken_at))}")
+
+
+def _new_session() -> None:
+    """Efface la séance ; la confirmation est à redonner pour la suivante"""
+    get_registry().clear()
+    st.session_state["facilitator_reset_confirm"] = False
+
+
+def render_facilitator_dashboard() -> None:
+    """Vue animateur : suivi en direct de tous les participants connectés"""
+    st.markdown("## 🧑‍🏫 Tableau de bord de l'animateur")
+    if not _facilitator_authorized():
+        return
+    st.caption("Les résultats de la salle se mettent à jour automatiquement.")
+    st.fragment(_render_dashboard, run_every=DASHBOARD_REFRESH)()
+
+    st.markdown("---")
+    confirmed = st.checkbox("Je confirme vouloir effacer la séance en cours", key="facilitator_reset_confirm")
+    st.button("🗑️ Nouvelle séance", key="facilitator_reset_btn", on_click=_new_session,
+              disabled=not confirmed, help="Oublie tous les participants et leurs résultats")
@@ -0,0 +1,241 @@
+"""Collecte et agrégation des feedbacks de fin de formation
+
+Chaque envoi du formulaire de la conclusion devient une ligne JSON ajoutée
+à data/feedback.jsonl. L'écriture est faite par un thread dédié : l'envoi
+ne fait que déposer l'avis dans une file, et le thread écrit les avis par
+lots, dès que BATCH_SIZE avis attendent ou au plus tard après
+FLUSH_INTERVAL secondes. Chaque lot se termine par un fsync : un avis
+écrit survit à une coupure de courant, sans payer un fsync par avis.
+
+Un lot dont l'écriture échoue (disque plein, dossier supprimé) est
+journalisé et réessayé après FLUSH_INTERVAL secondes, au plus
+WRITE_ATTEMPTS fois avant d'être abandonné ; le thread continue avec les
+lots suivants. La file est bornée (QUEUE_SIZE avis) : si elle est pleine
+ou si le thread s'est arrêté, l'envoi est refusé et le participant en est
+averti.
+
+Les statistiques se calculent hors ligne :
+
+    python -m mastertalk.feedback stats
+    python -m mastertalk.feedback stats --json autre/feedback.jsonl
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import logging
+import os
+import queue
+import statistics
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import streamlit as st
+
+from mastertalk.constants import DATA_DIR
+from mastertalk.text_analysis import compute_stats
+
+FEEDBACK_PATH = DATA_DIR / "feedback.jsonl"
+
+# Un lot est écrit dès qu'il atteint BATCH_SIZE avis ou FLUSH_INTERVAL secondes
+BATCH_SIZE = 50
+FLUSH_INTERVAL = 5.0
+
+# Avis en attente au maximum, et essais d'écriture d'un lot avant abandon
+QUEUE_SIZE = 10_000
+WRITE_ATTEMPTS = 3
+
+# Longueur maximale conservée d'un commentaire
+MAX_COMMENT_CHARS = 5000
+
+RATINGS = (1, 2, 3, 4, 5)
+TOP_WORDS = 15
+
+logger = logging.getLogger(__name__)
+
+
+class FeedbackWriter:
+    """Ajoute les avis au fichier JSONL depuis un thread d'écriture"""
+
+    def __init__(self, path: Path = FEEDBACK_PATH, batch_size: int = BATCH_SIZE,
+                 flush_interval: float = FLUSH_INTERVAL) -> None:
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=QUEUE_SIZE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="mastertalk-feedback", daemon=True)
+        self._thread.start()
+
+    def submit(self, record: Dict) -> bool:
+        """Met un avis en file d'écriture ; False si le thread est arrêté ou la file pleine"""
+        if not self._thread.is_alive():
+            return False
+        try:
+            self._queue.put_nowait(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+        except queue.Full:
+            return False
+        return True
+
+    def _run(self) -> None:
+        batch: List[str] = []
+        deadline = None
+        failures = 0
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                line = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                line = ""
+            if line is None:
+                # Signal d'arrêt : dernier lot puis fin du thread
+                try:
+                    self._write(batch)
+                except (OSError, ValueError) as exc:
+                    logger.error("%d avis non écrits à l'arrêt : %s", len(batch), exc)
+                return
+            if line:
+                batch.append(line)
+                if deadline is None:
+                    deadline = time.monotonic() + self.flush_interval
+            # Après un échec, le lot attend l'échéance suivante même s'il est plein
+            if batch and (time.monotonic() >= deadline or (not failures and len(batch) >= self.batch_size)):
+                try:
+                    self._write(batch)
+                except (OSError, ValueError) as exc:
+                    failures += 1
+                    if failures < WRITE_ATTEMPTS:
+                        logger.error("écriture de %d avis impossible (essai %d/%d), nouvel essai dans %g s : %s",
+                                     len(batch), failures, WRITE_ATTEMPTS, self.flush_interval, exc)
+                        deadline = time.monotonic() + self.flush_interval
+                        continue
+                    logger.error("%d avis abandonnés après %d essais : %s", len(batch), failures, exc)
+                batch, deadline, failures = [], None, 0
+
+    def _write(self, batch: List[str]) -> None:
+        if not batch:
+            return
+        # Fichier rouvert à chaque lot : un dossier recréé ou un fichier déplacé est pris en compte
+        with open(self.path, "a", encoding="utf-8") as out:
+            out.write("\n".join(batch) + "\n")
+            out.flush()
+            os.fsync(out.fileno())
+
+    def close(self) -> None:
+        """Écrit les avis en attente et arrête le thread"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+
+
+@st.cache_resource
+def get_feedback_writer() -> FeedbackWriter:
+    """Écrivain partagé par toutes les sessions du processus"""
+    writer = FeedbackWriter()
+    atexit.register(writer.close)
+    return writer
+
+
+def submit_feedback(rating: int, comment: str, session_token: str = "") -> bool:
+    """Enregistre un avis (note de 1 à 5 et commentaire) ; False s'il n'a pas pu être pris en charge"""
+    record = {
+        "ts": round(time.time(), 3),
+        "rating": int(rating),
+        "comment": comment.strip()[:MAX_COMMENT_CHARS],
+    }
+    if session_token:
+        # Empreinte seulement : le jeton permet de rouvrir la session
+        record["session"] = hashlib.sha256(session_token.encode("utf-8")).hexdigest()[:16]
+    return get_feedback_writer().submit(record)
+
+
+# ============================================================================
+# AGRÉGATION HORS LIGNE
+# ============================================================================
+
+def aggregate(path: Path) -> Dict:
+    """Distribution des notes et statistiques des commentaires d'un fichier"""
+    ratings: Counter = Counter()
+    lengths: List[int] = []
+    word_counts: List[int] = []
+    words: Counter = Counter()
+    rows = invalid = 0
+
+    with open(path, encoding="utf-8") as source:
+        for line in source:
+            try:
+                record = json.loads(line)
+                rating = int(record["rating"])
+            except (ValueError, KeyError, TypeError):
+                # Ligne tronquée (arrêt brutal pendant un lot) ou corrompue
+                invalid += 1
+                continue
+            rows += 1
+            ratings[rating] += 1
+            comment = record.get("comment") or ""
+            if comment:
+                text_stats = compute_stats(comment)
+                lengths.append(len(comment))
+                word_counts.append(text_stats.words)
+                words.update(text_stats.content_words)
+
+    total = sum(ratings.values())
+    return {
+        "rows": rows,
+        "invalid_rows": invalid,
+        "ratings": {
+            "distribution": {str(r): ratings.get(r, 0) for r in RATINGS},
+            "share": {str(r): round(ratings.get(r, 0) / total, 4) if total else 0.0 for r in RATINGS},
+            "mean": round(sum(r * n for r, n in ratings.items()) / total, 3) if total else None,
+            "median": statistics.median(sorted(ratings.elements())) if total else None,
+        },
+        "comments": {
+            "count": len(lengths),
+            "mean_chars": round(statistics.fmean(lengths), 1) if lengths else 0.0,
+            "median_chars": statistics.median(lengths) if lengths else 0,
+            "max_chars": max(lengths, default=0),
+            "mean_words": round(statistics.fmean(word_counts), 1) if word_counts else 0.0,
+            "top_words": words.most_common(TOP_WORDS),
+        },
+    }
+
+
+def _print_report(stats: Dict) -> None:
+    ratings, comments = stats["ratings"], stats["comments"]
+    print(f"Avis : {stats['rows']} (lignes ignorées : {stats['invalid_rows']})")
+    print(f"Note moyenne : {ratings['mean']}  médiane : {ratings['median']}\n")
+    for rating in RATINGS:
+        key = str(rating)
+        share = ratings["share"][key]
+        print(f"  {'⭐' * rating:<6} {ratings['distribution'][key]:>7}  {share:>6.1%}  {'█' * round(share * 40)}")
+    print(f"\nCommentaires : {comments['count']}")
+    print(f"  longueur moyenne : {comments['mean_chars']} caractères, {comments['mean_words']} mots")
+    print(f"  longueur médiane : {comments['median_chars']} caractères (max {comments['max_chars']})")
+    print("  mots fréquents : " + ", ".join(f"{word} ({n})" for word, n in comments["top_words"]))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Statistiques des feedbacks MasterTalk")
+    parser.add_argument("command", choices=["stats"])
+    parser.add_argument("path", type=Path, nargs="?", default=FEEDBACK_PATH, help="fichier JSONL des avis")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"Aucun feedback : {args.path}", file=sys.stderr)
+        return 1
+    stats = aggregate(args.path)
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+    else:
+        _print_report(stats)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,167 @@
+"""Détection d'expressions-clés en un seul passage (Aho-Corasick)
+
+Un lexique associe des catégories à des expressions. Toutes les
+expressions sont compilées dans un même automate : un texte est parcouru
+une seule fois quel que soit le nombre de catégories ou d'expressions, ce
+qui tient pour des lexiques de plusieurs milliers d'entrées.
+
+La recherche ignore la casse et les accents (« etude » trouve « étude »)
+et porte sur des mots entiers ; une expression terminée par « * » accepte
+toute fin de mot (« étude* » trouve « études »). Les positions renvoyées
+sont celles du texte d'origine, pour le surlignage.
+"""
+
+import html
+import unicodedata
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+_APOSTROPHES = {"’": "'", "ʼ": "'", "‘": "'"}
+
+
+@dataclass(frozen=True, slots=True)
+class Match:
+    """Occurrence d'une expression, positions dans le texte d'origine"""
+    category: str
+    phrase: str
+    start: int
+    end: int
+
+
+@lru_cache(maxsize=4096)
+def _fold_char(char: str) -> str:
+    """Minuscule sans accent d'un caractère (peut renvoyer 0, 1 ou 2 caractères)"""
+    char = _APOSTROPHES.get(char, char)
+    decomposed = unicodedata.normalize("NFD", char.casefold())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=1024)
+def fold_text(text: str) -> Tuple[str, Optional[Tuple[int, ...]]]:
+    """Texte normalisé et, si les longueurs diffèrent, position d'origine de chaque caractère"""
+    if text.isascii():
+        return text.lower(), None
+    parts = list(map(_fold_char, text))
+    folded = "".join(parts)
+    if len(folded) == len(text) and "" not in parts:
+        # Un caractère pour un caractère : les positions sont inchangées
+        return folded, None
+    offsets = tuple(index for index, part in enumerate(parts) for _ in part)
+    return folded, offsets
+
+
+class KeywordMatcher:
+    """Automate d'Aho-Corasick sur un lexique {catégorie: expressions}"""
+
+    def __init__(self, lexicon: Mapping[str, Iterable[str]]) -> None:
+        self.categories = tuple(lexicon)
+        # Nœud 0 = racine ; transitions, lien d'échec et sorties par nœud
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Sortie : (longueur, catégorie, expression, préfixe accepté)
+        self._out: List[List[Tuple[int, str, str, bool]]] = [[]]
+
+        for category, phrases in lexicon.items():
+            for phrase in phrases:
+                self._add(category, phrase)
+        self._link()
+        self.find_all = lru_cache(maxsize=1024)(self._find_all)
+
+    def _add(self, category: str, phrase: str) -> None:
+        prefix = phrase.endswith("*")
+        pattern, _ = fold_text(phrase.rstrip("*").strip())
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = next_node
+        self._out[node].append((len(pattern), category, phrase, prefix))
+
+    def _link(self) -> None:
+        """Calcule les liens d'échec en largeur et hérite des sorties"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def _find_all(self, text: str) -> Tuple[Match, ...]:
+        """Toutes les occurrences, dans l'ordre du texte (mémoïsé par texte)"""
+        folded, offsets = fold_text(text)
+        goto, fail, out = self._goto, self._fail, self._out
+        matches = []
+        node = 0
+        for index, char in enumerate(folded):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            if not out[node]:
+                continue
+            end = index + 1
+            for length, category, phrase, prefix in out[node]:
+                start = end - length
+                if _is_word_match(folded, start, end, prefix):
+                    stop = _word_end(folded, end) if prefix else end
+                    matches.append(self._match(category, phrase, start, stop, offsets))
+        matches.sort(key=lambda match: (match.start, -match.end))
+        return tuple(matches)
+
+    @staticmethod
+    def _match(category: str, phrase: str, start: int, end: int,
+               offsets: Optional[Tuple[int, ...]]) -> Match:
+        if offsets is not None:
+            start, end = offsets[start], offsets[end - 1] + 1
+        return Match(category, phrase, start, end)
+
+    def present(self, text: str) -> Dict[str, bool]:
+        """Présence de chaque catégorie du lexique dans le texte"""
+        found = {match.category for match in self.find_all(text)}
+        return {category: category in found for category in self.categories}
+
+
+def _is_word_match(folded: str, start: int, end: int, prefix: bool) -> bool:
+    """L'occurrence commence et (sauf « * ») finit en limite de mot"""
+    if folded[start].isalnum() and start > 0 and folded[start - 1].isalnum():
+        return False
+    if prefix or not folded[end - 1].isalnum():
+        return True
+    return end == len(folded) or not folded[end].isalnum()
+
+
+def _word_end(folded: str, end: int) -> int:
+    """Fin du mot commencé avant end (pour surligner « études » entier)"""
+    while end < len(folded) and folded[end].isalnum():
+        end += 1
+    return end
+
+
+def highlight_html(text: str, matches: Iterable[Match]) -> str:
+    """Texte échappé avec les occurrences entourées de <mark>"""
+    spans: List[List] = []
+    for match in sorted(matches, key=lambda m: m.start):
+        if spans and match.start < spans[-1][1]:
+            # Occurrences qui se chevauchent : un seul surlignage
+            spans[-1][1] = max(spans[-1][1], match.end)
+        else:
+            spans.append([match.start, match.end, match.category])
+
+    parts, cursor = [], 0
+    for start, end, category in spans:
+        parts.append(html.escape(text[cursor:start]))
+        parts.append(f'<mark class="mt-mark" title="{html.escape(category)}">{html.escape(text[start:end])}</mark>')
+        cursor = end
+    parts.append(html.escape(text[cursor:]))
+    return "".join(parts).replace("\n", "<br>")
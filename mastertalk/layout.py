@@ -0,0 +1,170 @@
+"""Progression, sidebar, en-tête et pied de page"""
+
+import streamlit as st
+
+from mastertalk.assets import LOGO_SOURCE, get_assets
+from mastertalk.catalog import get_catalog
+from mastertalk.session import get_session
+from mastertalk.store import restore_session
+from mastertalk.templates import footer, main_header, objectives, progress_badge
+
+# ============================================================================
+# FONCTIONS DE PROGRESSION
+# ============================================================================
+
+def init_session_state():
+    """Initialise l'état de session, restauré depuis le jeton de l'URL"""
+    restore_session()
+
+def update_progress():
+    """Met à jour la progression automatiquement"""
+    progress = get_session().progress
+    total_sections = len(get_catalog().sections)
+    visited_count = len(progress.visited_sections)
+    progress.current_progress = int((visited_count / total_sections) * 100)
+
+def add_progress_to_header():
+    """Ajoute un indicateur de progression subtil dans l'en-tête"""
+    state = get_session().progress
+    progress = state.current_progress
+    visited_count = len(state.visited_sections)
+    total_count = len(get_catalog().sections)
+    
+    st.markdown(progress_badge(progress, visited_count, total_count), unsafe_allow_html=True)
+
+# ============================================================================
+# SIDEBAR - THÈME CLAIR
+# ============================================================================
+
+def render_sidebar() -> str:
+    """Affiche la sidebar avec thème clair"""
+    with st.sidebar:
+        # Logo avec fond adapté
+        col_logo, _ = st.columns([1, 2])
+        with col_logo:
+            if st.get_option("server.enableStaticServing"):
+                st.markdown(
+                    f'<img src="{get_assets().logo}" width="80" height="80" alt="MasterTalk">',
+                    unsafe_allow_html=True
+                )
+            else:
+                st.image(str(LOGO_SOURCE), width=80)
+        
+        st.title("🎤 MasterTalk")
+        st.subheader("Par: MISSAOUI Yassine")
+        st.markdown("---")
+        
+        st.subheader("Navigation")
+        
+        # Trouver l'index de la dernière section visitée
+        sections = get_catalog().sections
+        progress = get_session().progress
+        if progress.last_section in sections:
+            default_index = sections.index(progress.last_section)
+        else:
+            default_index = 0
+            
+        section = st.selectbox(
+            "Choisir une section :",
+            sections,
+            key="nav_select",
+            label_visibility="collapsed",
+            index=default_index
+        )
+        
+        # Marquer la section comme visitée
+        if section not in progress.visited_sections:
+            progress.visited_sections.add(section)
+            update_progress()
+        
+        # Mettre à jour la dernière section visitée
+        progress.last_section = section
+        
+        st.markdown("---")
+        render_sidebar_sections()
+        
+        st.markdown("---")
+        render_progress_tracker()
+        
+        return section
+
+def render_sidebar_sections() -> None:
+    """Affiche les sections de la sidebar avec style clair"""
+    st.subheader("🎯 Objectifs du jour")
+    
+    st.markdown(
+        objectives((
+            "Définir une idée claire",
+            "Structurer un message",
+            "Raconter une histoire captivante",
+            "Pratiquer l'écoute active",
+        )),
+        unsafe_allow_html=True
+    )
+
+def render_progress_tracker() -> None:
+    """Affiche le suivi de progression"""
+    st.subheader("📊 Progression")
+    
+    # Afficher le nombre de sections visitées
+    sections = get_catalog().sections
+    state = get_session().progress
+    visited_count = len(state.visited_sections)
+    total_count = len(sections)
+    st.caption(f"📖 Sections visitées : {visited_count}/{total_count}")
+    
+    # Afficher la barre de progression (supprimer le slider)
+    progress = state.current_progress
+    st.progress(progress)
+    
+    # Affichage de l'encouragement dynamique
+    if progress >= 90:
+        st.success(f"🎉 Félicitations ! {progress}% complété - Presque terminé !")
+        st.balloons()
+    elif progress >= 75:
+        st.success(f"🌟 Excellent travail ! {progress}% complété")
+    elif progress >= 50:
+        st.info(f"📈 Bonne progression ! {progress}% complété")
+    elif progress >= 25:
+        st.info(f"🚀 Vous progressez ! {progress}% complété")
+    else:
+        st.info(f"✨ Continuez ! {progress}% complété")
+    
+    # Afficher les sections visitées
+    with st.expander("📋 Voir les sections complétées"):
+        for i, section_name in enumerate(sections):
+            if section_name in state.visited_sections:
+                st.markdown(f"✅ **{section_name}**")
+            else:
+                st.markdown(f"⬜ {section_name}")
+
+# ============================================================================
+# EN-TÊTE ET PIED DE PAGE
+# ============================================================================
+
+def render_header() -> None:
+    """Affiche l'en-tête principal avec nouveau design"""
+    # Ajouter l'indicateur de progression
+    add_progress_to_header()
+    
+    st.markdown(
+        main_header(
+            "🌟 MasterTalk",
+            "L'Art de Communiquer, Inspirer et Influencer",
+            "Développez vos compétences en communication avec des méthodes éprouvées"
+        ),
+        unsafe_allow_html=True
+    )
+
+def render_footer() -> None:
+    """Affiche le pied de page avec thème clair"""
+    st.markdown("---")
+    
+    st.markdown(
+        footer(
+            "🎤 MasterTalk - L'Art de Communiquer",
+            "Développez vos compétences en communication | Méthodes éprouvées | Résultats tangibles",
+            "© 2025 MasterTalk | Tous droits réservés"
+        ),
+        unsafe_allow_html=True
+    )
@@ -0,0 +1,135 @@
+"""Pré-rendu du contenu statique des sections
+
+Les cartes explicatives des sections (définitions, exemples, consignes)
+ne dépendent d'aucune saisie. Chacune est déclarée comme bloc statique
+avec @static_block : son HTML est assemblé au premier affichage, puis les
+réexécutions ne font plus qu'une recherche dans le cache ; seuls les
+widgets des exercices sont réellement exécutés.
+
+Les mêmes blocs forment un site statique pour les postes en lecture
+seule (écran de projection, participants sans connexion au serveur) :
+
+    python -m mastertalk.prerender build
+
+Le site est écrit dans static/cours/ (servi par Streamlit sous
+app/static/cours/index.html, ou par n'importe quel serveur web).
+"""
+
+import argparse
+import html
+import importlib
+import re
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+from typing import Callable, Dict, List
+
+from mastertalk.constants import STATIC_DIR
+
+# Section -> module qui déclare ses blocs statiques (même ordre que les sections du catalogue)
+STATIC_SECTIONS = {
+    "Introduction": "mastertalk.sections.intro",
+    "1. Qu'est-ce qu'un TED Talk ?": "mastertalk.sections.ted_talk",
+    "2. Méthode SMART": "mastertalk.sections.smart",
+    "3. Storytelling STAR": "mastertalk.sections.star",
+    "5. Analyse SWOT": "mastertalk.sections.swot",
+    "6. Matrice TOWS": "mastertalk.sections.tows",
+    "Conclusion": "mastertalk.sections.conclusion",
+}
+
+SITE_DIR = STATIC_DIR / "cours"
+
+PAGE = Template("""<!DOCTYPE html>
+<html lang="fr">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>$title · MasterTalk</title>
+<style>$css</style>
+<style>body{max-width:1100px;margin:0 auto;padding:1.5rem}nav{margin-bottom:1.5rem}nav a{margin-right:1rem}</style>
+</head>
+<body>
+<nav>$nav</nav>
+<main>$content</main>
+</body>
+</html>
+""")
+
+
+def static_block(build: Callable[[], str]) -> Callable[[], str]:
+    """Déclare un bloc HTML statique : il n'est construit qu'une fois par processus"""
+    cached = lru_cache(maxsize=None)(build)
+    cached.static_block = True
+    return cached
+
+
+def section_blocks(section: str) -> List[str]:
+    """HTML des blocs statiques d'une section, dans l'ordre de déclaration du module"""
+    module = importlib.import_module(STATIC_SECTIONS[section])
+    return [block() for block in vars(module).values() if getattr(block, "static_block", False)]
+
+
+def prerender_all() -> Dict[str, List[str]]:
+    """Blocs statiques de toutes les sections"""
+    return {section: section_blocks(section) for section in STATIC_SECTIONS}
+
+
+# ============================================================================
+# SITE STATIQUE (LECTURE SEULE)
+# ============================================================================
+
+def page_slug(section: str) -> str:
+    """Nom de fichier d'une section : « 2. Méthode SMART » -> methode-smart"""
+    ascii_name = unicodedata.normalize("NFKD", section).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_name.lower()).strip("-").lstrip("0123456789-")
+
+
+def _site_css() -> str:
+    """Thème compilé, polices référencées depuis static/cours/"""
+    from mastertalk.assets import font_face_css, get_assets
+    from mastertalk.theme import compile_theme
+
+    fonts = {weight: "../" + href.removeprefix("app/static/") for weight, href in get_assets().fonts.items()}
+    return compile_theme(font_face_css(fonts))
+
+
+def build_site(target: Path = SITE_DIR) -> List[Path]:
+    """Écrit une page HTML par section, plus un sommaire ; retourne les fichiers écrits"""
+    blocks = prerender_all()
+    css = _site_css()
+    pages = {section: f"{page_slug(section)}.html" for section in blocks}
+    nav = "".join(f'<a href="{href}">{html.escape(section)}</a>' for section, href in pages.items())
+
+    target.mkdir(parents=True, exist_ok=True)
+    written = []
+    for section, content in blocks.items():
+        path = target / pages[section]
+        path.write_text(
+            PAGE.substitute(title=html.escape(section), css=css, nav=nav, content="".join(content)),
+            encoding="utf-8"
+        )
+        written.append(path)
+
+    summary = "".join(f'<li><a href="{href}">{html.escape(section)}</a></li>' for section, href in pages.items())
+    index = target / "index.html"
+    index.write_text(
+        PAGE.substitute(title="Sommaire", css=css, nav="", content=f"<h1>MasterTalk</h1><ul>{summary}</ul>"),
+        encoding="utf-8"
+    )
+    written.append(index)
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pré-rendu du contenu statique de MasterTalk")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--output", type=Path, default=SITE_DIR, help="dossier du site (défaut : static/cours)")
+    args = parser.parse_args()
+    for path in build_site(args.output):
+        print(f"{path} ({path.stat().st_size // 1024} Ko)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
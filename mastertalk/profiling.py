@@ -0,0 +1,213 @@
+"""Profilage du rendu des sections
+
+Chaque rendu de section (et de chaque atelier) est mesuré : durée, nombre
+d'éléments Streamlit émis et octets de markdown envoyés au navigateur.
+Les mesures alimentent un historique glissant par section, partagé par
+toutes les sessions du processus. Un panneau caché (?debug=perf dans
+l'URL) affiche p50/p95/p99 et permet l'export JSON pour comparer deux
+versions hors ligne.
+
+Les éléments sont comptés en interceptant ScriptRunContext._enqueue, un
+attribut interne de Streamlit. S'il disparaît ou si le format des messages
+change, seule la durée est mesurée (éléments et octets restent à 0) : le
+rendu des pages n'en dépend jamais.
+"""
+
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from typing import Callable, Deque, Dict, Iterator, List
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from mastertalk.session import get_session
+
+# Nombre de rendus conservés par section
+PROFILE_WINDOW = 500
+
+# Valeur du paramètre d'URL ?debug= qui affiche le panneau
+DEBUG_QUERY_VALUE = "perf"
+
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class RenderSample:
+    """Mesure d'un rendu de section"""
+    seconds: float
+    elements: int
+    markdown_bytes: int
+
+
+class RenderProfiler:
+    """Historique glissant des rendus, par section"""
+
+    def __init__(self, window: int = PROFILE_WINDOW) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[RenderSample]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, name: str, sample: RenderSample) -> None:
+        """Ajoute une mesure à l'historique de la section"""
+        with self._lock:
+            history = self._samples.setdefault(name, deque(maxlen=self.window))
+            history.append(sample)
+
+    def snapshot(self) -> Dict[str, List[RenderSample]]:
+        """Copie de l'historique, sûre à parcourir hors verrou"""
+        with self._lock:
+            return {name: list(history) for name, history in self._samples.items()}
+
+    def clear(self) -> None:
+        """Vide l'historique"""
+        with self._lock:
+            self._samples.clear()
+
+    def summary(self) -> Dict[str, Dict[str, object]]:
+        """Percentiles de chaque métrique, par section"""
+        result = {}
+        for name, samples in self.snapshot().items():
+            result[name] = {
+                "count": len(samples),
+                "ms": _percentiles([s.seconds * 1000 for s in samples]),
+                "elements": _percentiles([s.elements for s in samples]),
+                "markdown_bytes": _percentiles([s.markdown_bytes for s in samples]),
+            }
+        return result
+
+    def to_json(self) -> str:
+        """Export JSON : résumé et mesures brutes"""
+        return json.dumps(
+            {
+                "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+                "window": self.window,
+                "summary": self.summary(),
+                "samples": {
+                    name: [asdict(sample) for sample in samples]
+                    for name, samples in self.snapshot().items()
+                },
+            },
+            ensure_ascii=False,
+            indent=2,
+        )
+
+
+def _percentiles(values: List[float]) -> Dict[str, float]:
+    """p50/p95/p99 par rang le plus proche"""
+    ordered = sorted(values)
+    if not ordered:
+        return {f"p{p}": 0.0 for p in PERCENTILES}
+    return {f"p{p}": round(ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)], 3) for p in PERCENTILES}
+
+
+@st.cache_resource
+def get_profiler() -> RenderProfiler:
+    """Profileur partagé par toutes les sessions du processus"""
+    return RenderProfiler()
+
+
+class _DeltaCounter:
+    """Compte les éléments et le markdown émis pendant un rendu"""
+
+    def __init__(self) -> None:
+        self.elements = 0
+        self.markdown_bytes = 0
+
+    def wrap(self, enqueue: Callable) -> Callable:
+        def counting_enqueue(msg) -> None:
+            try:
+                self._count(msg)
+            except (AttributeError, ValueError):
+                # Message d'un format inconnu (autre version de Streamlit) : non compté
+                pass
+            enqueue(msg)
+        return counting_enqueue
+
+    def _count(self, msg) -> None:
+        if msg.HasField("delta") and msg.delta.HasField("new_element"):
+            self.elements += 1
+            element = msg.delta.new_element
+            if element.WhichOneof("type") == "markdown":
+                self.markdown_bytes += len(element.markdown.body.encode("utf-8"))
+
+
+@contextmanager
+def profile_render(name: str) -> Iterator[None]:
+    """Mesure le rendu du bloc et l'enregistre sous le nom de section donné
+
+    Les rendus imbriqués (un atelier dans la section Ateliers) sont comptés
+    dans chaque niveau. Un rendu interrompu (st.rerun, exception) n'est pas
+    enregistré.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    counter = _DeltaCounter()
+    # Les messages passent tous par _enqueue (interne à Streamlit) : on
+    # l'enveloppe le temps du rendu, s'il existe encore sous ce nom
+    original_enqueue = getattr(ctx, "_enqueue", None)
+    if callable(original_enqueue):
+        ctx._enqueue = counter.wrap(original_enqueue)
+    else:
+        original_enqueue = None
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        if original_enqueue is not None:
+            ctx._enqueue = original_enqueue
+    get_profiler().record(name, RenderSample(elapsed, counter.elements, counter.markdown_bytes))
+
+
+# ============================================================================
+# PANNEAU DE DÉBOGAGE
+# ============================================================================
+
+def debug_panel_requested() -> bool:
+    """Le panneau n'est affiché qu'avec ?debug=perf dans l'URL"""
+    return st.query_params.get("debug") == DEBUG_QUERY_VALUE
+
+
+def render_profiler_panel() -> None:
+    """Affiche les percentiles de rendu par section dans la sidebar"""
+    if not debug_panel_requested():
+        return
+
+    profiler = get_profiler()
+    summary = profiler.summary()
+
+    with st.sidebar:
+        st.markdown("---")
+        with st.expander("⏱️ Performances de rendu", expanded=True):
+            st.caption(f"Mémoire de la session : {get_session().nbytes():,} octets".replace(",", " "))
+            if not summary:
+                st.caption("Aucune mesure pour l'instant.")
+                return
+
+            rows = []
+            for name, stats in sorted(summary.items()):
+                row = {"section": name, "rendus": stats["count"]}
+                for metric, label in (("ms", "ms"), ("elements", "éléments"), ("markdown_bytes", "octets md")):
+                    for key, value in stats[metric].items():
+                        row[f"{label} {key}"] = value
+                rows.append(row)
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+
+            col_export, col_reset = st.columns(2)
+            with col_export:
+                st.download_button(
+                    "📥 Export JSON",
+                    data=profiler.to_json(),
+                    file_name="mastertalk-profil.json",
+                    mime="application/json",
+                    key="profiler_export_btn",
+                    use_container_width=True
+                )
+            with col_reset:
+                st.button("🗑️ Réinitialiser", key="profiler_reset_btn", use_container_width=True,
+                          on_click=profiler.clear)
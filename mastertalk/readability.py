@@ -0,0 +1,93 @@
+"""Indicateurs de lisibilité des textes rédigés par les participants
+
+Pour chaque champ :
+
+* indice de Flesch adapté au français (Kandel et Moles) :
+  207 - 1,015 x (mots / phrases) - 73,6 x (syllabes / mots),
+  de 0 (très difficile) à 100 et plus (très facile) ;
+* longueur moyenne des phrases, en mots ;
+* densité lexicale : part des mots porteurs de sens (hors mots outils).
+
+Les mesures sont mémoïsées par champ : modifier une partie d'une histoire
+ne réanalyse que cette partie. Les indicateurs d'un texte en plusieurs
+parties se déduisent des comptes de chaque partie (combine), sans relire
+le texte.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from mastertalk.speech import word_syllables
+from mastertalk.text_analysis import analyze_text
+
+# Seuils de l'indice de Flesch et appréciation correspondante
+FLESCH_LEVELS = (
+    (90, "Très facile"),
+    (70, "Facile"),
+    (60, "Standard"),
+    (50, "Plutôt difficile"),
+    (30, "Difficile"),
+)
+FLESCH_HARDEST = "Très difficile"
+
+
+@dataclass(frozen=True, slots=True)
+class Readability:
+    """Comptes d'un texte et indicateurs qui en découlent"""
+    words: int
+    sentences: int
+    syllables: int
+    content_words: int
+
+    @property
+    def flesch(self) -> Optional[float]:
+        """Indice de Flesch (Kandel et Moles), None pour un texte vide"""
+        if not self.words:
+            return None
+        return round(207 - 1.015 * self.words / self.sentences - 73.6 * self.syllables / self.words, 1)
+
+    @property
+    def avg_sentence_length(self) -> float:
+        """Nombre moyen de mots par phrase"""
+        return round(self.words / self.sentences, 1) if self.sentences else 0.0
+
+    @property
+    def lexical_density(self) -> float:
+        """Part des mots porteurs de sens (0 à 1)"""
+        return round(self.content_words / self.words, 2) if self.words else 0.0
+
+    @property
+    def level(self) -> str:
+        """Appréciation de l'indice de Flesch"""
+        return flesch_level(self.flesch)
+
+
+def flesch_level(score: Optional[float]) -> str:
+    """Appréciation d'un indice de Flesch"""
+    if score is None:
+        return "—"
+    for threshold, label in FLESCH_LEVELS:
+        if score >= threshold:
+            return label
+    return FLESCH_HARDEST
+
+
+@lru_cache(maxsize=4096)
+def readability(text: str) -> Readability:
+    """Comptes de lisibilité d'un champ (mémoïsé par contenu)"""
+    stats = analyze_text(text)
+    # Les élisions (« l' », « qu' ») sont rattachées au mot suivant
+    syllables = sum(word_syllables(token) for token in stats.tokens if not token.endswith("'"))
+    return Readability(stats.words, stats.sentences, syllables, len(stats.content_words))
+
+
+def combine(parts: Iterable[Readability]) -> Readability:
+    """Indicateurs d'un texte formé de plusieurs parties déjà mesurées"""
+    words = sentences = syllables = content_words = 0
+    for part in parts:
+        words += part.words
+        sentences += part.sentences
+        syllables += part.syllables
+        content_words += part.content_words
+    return Readability(words, sentences, syllables, content_words)
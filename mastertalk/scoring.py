@@ -0,0 +1,420 @@
+"""Notation des exercices, sans Streamlit
+
+Les règles de notation des ateliers et de la section Écoute active sont
+des fonctions pures : l'interface les appelle pour afficher ses retours,
+et la ligne de commande les applique à un fichier de rendus d'une classe
+(CSV ou JSONL, une ligne par participant) :
+
+    python -m mastertalk.scoring grade rendus.csv
+    python -m mastertalk.scoring grade rendus.jsonl -o notes.csv --workers 8
+
+Les colonnes reprennent les clés des widgets de l'application
+(atelier1_idea, atelier2_intro, arg1, reformulation, emotion_select...).
+Avec la phrase ou le scénario choisi (ecoute_phrase, atelier4_scenario),
+la fidélité de la reformulation au message est aussi notée. Les objectifs
+SMART (smart_goal, smart_measurable...) reçoivent le nombre de critères
+respectés et la liste des critères à revoir (mastertalk.smart_check).
+Un exercice dont les champs sont absents ou vides n'est pas noté. Les
+lignes sont notées en parallèle par un pool de processus.
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import sys
+import time
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from mastertalk.catalog import get_catalog, lookup
+from mastertalk.constants import (
+    ACTIVE_LISTENING_MARKERS,
+    ARGUMENT_MARKERS,
+    ECOUTE_MARKERS,
+)
+from mastertalk.keywords import KeywordMatcher, fold_text
+from mastertalk.similarity import fidelity
+from mastertalk.smart_check import validate as validate_smart
+from mastertalk.speech import DEFAULT_RATE, SPEAKING_RATES, estimate
+from mastertalk.text_analysis import word_count
+
+ACTIVE_LISTENING = KeywordMatcher(ACTIVE_LISTENING_MARKERS)
+ARGUMENT_TYPES = KeywordMatcher(ARGUMENT_MARKERS)
+REFORMULATION_CHECK = KeywordMatcher(ECOUTE_MARKERS)
+
+# Atelier 1 : nombre de mots maximal, et seuil « ultra-concis »
+MAX_IDEA_WORDS = 7
+ULTRA_CONCISE_WORDS = 3
+
+# Atelier 2 : durée visée de chaque partie et du discours (secondes)
+TARGET_INTRO = 20
+TARGET_CORPS = 30
+TARGET_CONCLUSION = 10
+TARGET_TOTAL = 60
+
+# Atelier 3 : mots au-delà desquels un argument compte pour la persuasion ;
+# un point par type d'argument au-delà du premier (plafonné) ; un point pour
+# des objections anticipées, un de plus si la réponse est argumentée
+PERSUASION_WORDS = (25, 20, 15)
+VARIETY_POINTS = 2
+COUNTER_ARGUMENT_POINTS = 2
+PERSUASION_CRITERIA = {
+    "Développement": len(PERSUASION_WORDS),
+    "Variété des arguments": VARIETY_POINTS,
+    "Objections anticipées": COUNTER_ARGUMENT_POINTS,
+}
+MAX_FORCE_SCORE = sum(PERSUASION_CRITERIA.values())
+
+# Au-dessous de ce nombre de lignes, le pool coûte plus qu'il ne rapporte
+MIN_PARALLEL_ROWS = 500
+
+
+# ============================================================================
+# RÈGLES DE NOTATION
+# ============================================================================
+
+@dataclass(frozen=True, slots=True)
+class IdeaScore:
+    """Atelier 1 : idée en 7 mots"""
+    words: int
+    passed: bool
+    ultra_concise: bool
+
+
+@dataclass(frozen=True, slots=True)
+class MiniTedScore:
+    """Atelier 2 : durée estimée et verdict de chaque partie"""
+    seconds: Tuple[float, float, float]
+    verdicts: Tuple[str, str, str]
+    total_seconds: float
+    total_verdict: str
+
+
+@dataclass(frozen=True, slots=True)
+class ArgumentScore:
+    """Atelier 3 : longueur et types de chaque argument, détail de la persuasion"""
+    words: Tuple[int, int, int]
+    by_argument: Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]
+    counter_types: Tuple[str, ...]
+    breakdown: Dict[str, int]
+
+    @property
+    def types(self) -> Tuple[str, ...]:
+        """Types d'arguments distincts des trois arguments, dans l'ordre du lexique"""
+        used = set().union(*self.by_argument)
+        return tuple(category for category in ARGUMENT_TYPES.categories if category in used)
+
+    @property
+    def force(self) -> int:
+        """Score de persuasion, sur MAX_FORCE_SCORE"""
+        return sum(self.breakdown.values())
+
+
+@dataclass(frozen=True, slots=True)
+class ListeningScore:
+    """Atelier 4 : éléments d'écoute active présents dans la reformulation"""
+    elements: Dict[str, bool]
+    score: int
+
+
+def score_idea(idea: str) -> IdeaScore:
+    """Idée exprimée en MAX_IDEA_WORDS mots au plus"""
+    words = word_count(idea)
+    return IdeaScore(words, words <= MAX_IDEA_WORDS, words <= ULTRA_CONCISE_WORDS)
+
+
+def duration_verdict(seconds: float, target: float, short_below: Optional[float] = None,
+                     tolerance: float = 1.5) -> str:
+    """« court », « ok », « long » ou « trop_long » par rapport à la durée visée"""
+    if short_below is not None and seconds < target * short_below:
+        return "court"
+    if seconds <= target * 1.1:
+        return "ok"
+    if seconds <= target * tolerance:
+        return "long"
+    return "trop_long"
+
+
+def score_mini_ted(intro: str, corps: str, conclusion: str,
+                   rate: float = SPEAKING_RATES[DEFAULT_RATE]) -> MiniTedScore:
+    """Durées estimées du Mini-TED comparées aux cibles 20s / 30s / 10s"""
+    seconds = (estimate(intro, rate).seconds, estimate(corps, rate).seconds,
+               estimate(conclusion, rate).seconds)
+    verdicts = (
+        duration_verdict(seconds[0], TARGET_INTRO),
+        duration_verdict(seconds[1], TARGET_CORPS, short_below=0.6, tolerance=1.1),
+        duration_verdict(seconds[2], TARGET_CONCLUSION),
+    )
+    total = round(sum(seconds), 1)
+    if total < TARGET_TOTAL * 0.75:
+        total_verdict = "court"
+    elif total > TARGET_TOTAL * 1.15:
+        total_verdict = "long"
+    else:
+        total_verdict = "ok"
+    return MiniTedScore(seconds, verdicts, total, total_verdict)
+
+
+def classify_arguments(*texts: str) -> Tuple[Tuple[str, ...], ...]:
+    """Types d'arguments de chaque texte, en un seul passage de l'automate"""
+    # Les textes sont mis bout à bout ; la position d'une occurrence dit à
+    # quel texte elle appartient
+    ends, end = [], 0
+    for text in texts:
+        end += len(text) + 1
+        ends.append(end)
+    found: List[set] = [set() for _ in texts]
+    for match in ARGUMENT_TYPES.find_all("\n".join(texts)):
+        found[bisect_right(ends, match.start)].add(match.category)
+    return tuple(
+        tuple(category for category in ARGUMENT_TYPES.categories if category in categories)
+        for categories in found
+    )
+
+
+def score_arguments(arg1: str, arg2: str, arg3: str, contre_arg: str = "") -> ArgumentScore:
+    """Types de chaque argument et des objections, persuasion sur MAX_FORCE_SCORE"""
+    words = (word_count(arg1), word_count(arg2), word_count(arg3))
+    *by_argument, counter_types = classify_arguments(arg1, arg2, arg3, contre_arg)
+    distinct = len(set().union(*by_argument))
+    breakdown = {
+        "Développement": sum(count > threshold for count, threshold in zip(words, PERSUASION_WORDS)),
+        "Variété des arguments": min(max(distinct - 1, 0), VARIETY_POINTS),
+        "Objections anticipées": (bool(contre_arg) + bool(counter_types)) if contre_arg else 0,
+    }
+    return ArgumentScore(words, tuple(by_argument), counter_types, breakdown)
+
+
+def score_active_listening(reformulation: str) -> ListeningScore:
+    """Score d'écoute active sur 4 (un point par catégorie de marqueurs)"""
+    elements = ACTIVE_LISTENING.present(reformulation)
+    return ListeningScore(elements, sum(elements.values()))
+
+
+def check_reformulation(reformulation: str) -> bool:
+    """Section Écoute active : reformulation terminée par une question"""
+    return bool(reformulation) and all(REFORMULATION_CHECK.present(reformulation).values())
+
+
+def check_emotion_mirror(emotion: str, validation: str) -> bool:
+    """Miroir émotionnel : l'émotion est nommée dans la réponse (sans casse ni accents)"""
+    if not emotion or not validation:
+        return False
+    return fold_text(emotion)[0] in fold_text(validation)[0]
+
+
+# ============================================================================
+# NOTATION D'UN FICHIER DE RENDUS
+# ============================================================================
+
+# Colonnes recopiées telles quelles pour identifier la ligne
+ID_COLUMNS = ("id", "participant", "user_name")
+
+
+def grade_submission(row: Mapping[str, str], rate: float = SPEAKING_RATES[DEFAULT_RATE]) -> Dict:
+    """Notes d'un rendu ; None pour les exercices sans réponse"""
+    def field(key: str) -> str:
+        return (row.get(key) or "").strip()
+
+    result: Dict = {key: row[key] for key in ID_COLUMNS if key in row}
+    result.update(dict.fromkeys((
+        "atelier1_words", "atelier1_passed",
+        "atelier2_seconds", "atelier2_verdict",
+        "atelier3_force", "atelier3_types",
+        "atelier4_score", "atelier4_similarity", "atelier4_coverage",
+        "ecoute_passed", "ecoute_similarity", "ecoute_coverage", "emotion_passed",
+        "smart_score", "smart_flagged",
+    )))
+
+    if field("atelier1_idea"):
+        idea = score_idea(field("atelier1_idea"))
+        result["atelier1_words"], result["atelier1_passed"] = idea.words, idea.passed
+
+    parts = field("atelier2_intro"), field("atelier2_corps"), field("atelier2_conclusion")
+    if all(parts):
+        mini_ted = score_mini_ted(*parts, rate=rate)
+        result["atelier2_seconds"] = mini_ted.total_seconds
+        result["atelier2_verdict"] = mini_ted.total_verdict
+
+    args = field("arg1"), field("arg2"), field("arg3")
+    if all(args):
+        arguments = score_arguments(*args, field("contre_arg"))
+        result["atelier3_force"] = arguments.force
+        result["atelier3_types"] = len(arguments.types)
+
+    if field("reformulation"):
+        result["atelier4_score"] = score_active_listening(field("reformulation")).score
+        message = lookup(get_catalog().listening_scenarios).get(field("atelier4_scenario"))
+        if message:
+            fid = fidelity(message, field("reformulation"))
+            result["atelier4_similarity"], result["atelier4_coverage"] = fid.similarity, fid.coverage
+    if field("ecoute_reformulation"):
+        result["ecoute_passed"] = check_reformulation(field("ecoute_reformulation"))
+        if field("ecoute_phrase"):
+            fid = fidelity(field("ecoute_phrase"), field("ecoute_reformulation"))
+            result["ecoute_similarity"], result["ecoute_coverage"] = fid.similarity, fid.coverage
+    if field("emotion_select") and field("validation_emotion"):
+        result["emotion_passed"] = check_emotion_mirror(field("emotion_select"), field("validation_emotion"))
+    if field("smart_goal"):
+        smart = validate_smart(field("smart_goal"), field("smart_measurable"), field("smart_achievable"),
+                               field("smart_relevant"), field("smart_time"))
+        result["smart_score"], result["smart_flagged"] = smart.score, "".join(smart.flagged)
+    return result
+
+
+def read_submissions(path: Path) -> Tuple[List[Dict[str, str]], int]:
+    """Lignes d'un fichier CSV ou JSONL, et nombre de lignes JSON illisibles"""
+    with open(path, encoding="utf-8-sig", newline="") as source:
+        if path.suffix.lower() == ".csv":
+            return list(csv.DictReader(source)), 0
+        rows, invalid = [], 0
+        for line in source:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                invalid += 1
+                continue
+            if isinstance(record, dict):
+                rows.append({key: "" if value is None else str(value) for key, value in record.items()})
+            else:
+                invalid += 1
+        return rows, invalid
+
+
+def grade_all(rows: List[Mapping[str, str]], rate: float = SPEAKING_RATES[DEFAULT_RATE],
+              workers: Optional[int] = None) -> List[Dict]:
+    """Note toutes les lignes, en parallèle au-delà de MIN_PARALLEL_ROWS"""
+    workers = workers or os.cpu_count() or 1
+    grade = partial(grade_submission, rate=rate)
+    if workers == 1 or len(rows) < MIN_PARALLEL_ROWS:
+        return list(map(grade, rows))
+    # Gros morceaux : peu d'allers-retours entre processus
+    chunksize = max(1, len(rows) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(grade, rows, chunksize=chunksize))
+
+
+def summarize(results: Iterable[Dict]) -> Dict:
+    """Moyennes, taux de réussite et répartition des verdicts"""
+    results = list(results)
+
+    def values(key: str) -> List:
+        return [r[key] for r in results if r.get(key) is not None]
+
+    def mean(key: str) -> Optional[float]:
+        found = values(key)
+        return round(statistics.fmean(found), 2) if found else None
+
+    def pass_rate(key: str) -> Optional[float]:
+        found = values(key)
+        return round(sum(found) / len(found), 4) if found else None
+
+    return {
+        "rows": len(results),
+        "graded": {key: len(values(key)) for key in (
+            "atelier1_passed", "atelier2_verdict", "atelier3_force",
+            "atelier4_score", "ecoute_passed", "emotion_passed", "smart_score",
+        )},
+        "atelier1": {"pass_rate": pass_rate("atelier1_passed"), "mean_words": mean("atelier1_words")},
+        "atelier2": {
+            "mean_seconds": mean("atelier2_seconds"),
+            "verdicts": dict(Counter(values("atelier2_verdict"))),
+        },
+        "atelier3": {
+            "mean_force": mean("atelier3_force"),
+            "force_distribution": {str(n): c for n, c in sorted(Counter(values("atelier3_force")).items())},
+        },
+        "atelier4": {
+            "mean_score": mean("atelier4_score"),
+            "score_distribution": {str(n): c for n, c in sorted(Counter(values("atelier4_score")).items())},
+            "mean_similarity": mean("atelier4_similarity"),
+            "mean_coverage": mean("atelier4_coverage"),
+        },
+        "ecoute": {
+            "pass_rate": pass_rate("ecoute_passed"),
+            "mean_similarity": mean("ecoute_similarity"),
+            "mean_coverage": mean("ecoute_coverage"),
+        },
+        "emotion": {"pass_rate": pass_rate("emotion_passed")},
+        "smart": {
+            "mean_score": mean("smart_score"),
+            "flagged": dict(Counter(letter for flagged in values("smart_flagged") for letter in flagged)),
+        },
+    }
+
+
+def write_results(results: List[Dict], path: Path) -> None:
+    """Écrit les notes par ligne en CSV ou JSONL selon l'extension"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as out:
+        if path.suffix.lower() == ".csv":
+            columns = list(dict.fromkeys(key for result in results for key in result))
+            writer = csv.DictWriter(out, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(results)
+        else:
+            for result in results:
+                out.write(json.dumps(result, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def _print_report(summary: Dict, invalid: int, elapsed: float) -> None:
+    print(f"Rendus notés : {summary['rows']} en {elapsed:.2f} s (lignes ignorées : {invalid})\n")
+    graded = summary["graded"]
+
+    def rate(value: Optional[float]) -> str:
+        return "—" if value is None else f"{value:.1%}"
+
+    print(f"  Atelier 1 (7 mots)       {graded['atelier1_passed']:>6} rendus  réussite {rate(summary['atelier1']['pass_rate'])}"
+          f"  mots moyens {summary['atelier1']['mean_words']}")
+    print(f"  Atelier 2 (Mini-TED)     {graded['atelier2_verdict']:>6} rendus  durée moyenne {summary['atelier2']['mean_seconds']} s"
+          f"  verdicts {summary['atelier2']['verdicts']}")
+    print(f"  Atelier 3 (persuasion)   {graded['atelier3_force']:>6} rendus  moyenne {summary['atelier3']['mean_force']}/{MAX_FORCE_SCORE}"
+          f"  répartition {summary['atelier3']['force_distribution']}")
+    print(f"  Atelier 4 (écoute)       {graded['atelier4_score']:>6} rendus  moyenne {summary['atelier4']['mean_score']}/4"
+          f"  répartition {summary['atelier4']['score_distribution']}"
+          f"  proximité {summary['atelier4']['mean_similarity']}  couverture {summary['atelier4']['mean_coverage']}")
+    print(f"  Écoute active            {graded['ecoute_passed']:>6} rendus  réussite {rate(summary['ecoute']['pass_rate'])}"
+          f"  proximité {summary['ecoute']['mean_similarity']}  couverture {summary['ecoute']['mean_coverage']}")
+    print(f"  Miroir émotionnel        {graded['emotion_passed']:>6} rendus  réussite {rate(summary['emotion']['pass_rate'])}")
+    print(f"  Objectif SMART           {graded['smart_score']:>6} rendus  moyenne {summary['smart']['mean_score']}/5"
+          f"  critères à revoir {summary['smart']['flagged']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Notation des rendus MasterTalk")
+    parser.add_argument("command", choices=["grade"])
+    parser.add_argument("path", type=Path, help="rendus au format CSV ou JSONL")
+    parser.add_argument("-o", "--output", type=Path, help="notes par ligne (.csv ou .jsonl)")
+    parser.add_argument("--workers", type=int, default=None, help="processus de notation (défaut : nombre de cœurs)")
+    parser.add_argument("--rate", choices=list(SPEAKING_RATES), default=DEFAULT_RATE, help="débit de parole de l'atelier 2")
+    parser.add_argument("--json", action="store_true", help="synthèse au format JSON")
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"Fichier introuvable : {args.path}", file=sys.stderr)
+        return 1
+    start = time.perf_counter()
+    rows, invalid = read_submissions(args.path)
+    results = grade_all(rows, SPEAKING_RATES[args.rate], args.workers)
+    if args.output:
+        write_results(results, args.output)
+    summary = summarize(results)
+    if args.json:
+        summary["invalid_rows"] = invalid
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+    else:
+        _print_report(summary, invalid, time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""Sections du contenu principal, chargées à la demande
+
+Chaque section vit dans son propre module. Les routeurs (SECTION_HANDLERS
+pour app.py, ATELIER_HANDLERS pour ateliers.py) référencent les fonctions
+par chaîne "module:fonction" : un module n'est importé que la première
+fois qu'on l'affiche, puis il reste en cache dans sys.modules. Ils sont
+déclarés ici, sans dépendance, pour que mastertalk.catalog puisse vérifier
+que les noms du catalogue leur correspondent.
+"""
+
+import importlib
+from typing import Callable
+
+# Section du catalogue -> fonction d'affichage
+SECTION_HANDLERS = {
+    "Introduction": "mastertalk.sections.intro:intro_section",
+    "1. Qu'est-ce qu'un TED Talk ?": "mastertalk.sections.ted_talk:ted_talk_section",
+    "2. Méthode SMART": "mastertalk.sections.smart:smart_section",
+    "3. Storytelling STAR": "mastertalk.sections.star:star_section",
+    "4. Écoute Active": "mastertalk.sections.ecoute:ecoute_section",
+    "5. Analyse SWOT": "mastertalk.sections.swot:swot_section",
+    "6. Matrice TOWS": "mastertalk.sections.tows:tows_section",
+    "7. Ateliers Interactifs": "mastertalk.sections.ateliers:ateliers_section",
+    "Conclusion": "mastertalk.sections.conclusion:conclusion_section"
+}
+
+# Préfixe du nom d'atelier du catalogue -> fonction d'affichage
+ATELIER_HANDLERS = {
+    "🟥 Atelier 1": "mastertalk.sections.atelier_1:render_atelier_1",
+    "🟦 Atelier 2": "mastertalk.sections.atelier_2:render_atelier_2",
+    "🟩 Atelier 3": "mastertalk.sections.atelier_3:render_atelier_3",
+    "🟨 Atelier 4": "mastertalk.sections.atelier_4:render_atelier_4"
+}
+
+
+def load_handler(spec: str) -> Callable[[], None]:
+    """Importe (si nécessaire) et retourne la fonction d'affichage désignée par spec"""
+    module_name, _, func_name = spec.partition(":")
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
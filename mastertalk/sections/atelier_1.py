@@ -0,0 +1,126 @@
+"""Atelier 1 : Ton TED Talk en 7 mots"""
+
+import streamlit as st
+
+from mastertalk.facilitator import publish_score
+from mastertalk.scoring import MAX_IDEA_WORDS, score_idea
+from mastertalk.simplifier import suggestions
+from mastertalk.templates import atelier_header, info_box, success_card, tile, warning_card
+
+
+def render_atelier_1() -> None:
+    """Atelier 1 : TED Talk en 7 mots - Version enrichie"""
+    # En-tête de l'atelier
+    st.markdown(
+        atelier_header(
+            "🟥",
+            'Atelier 1 : "Ton TED Talk en 7 mots"',
+            "La puissance de la concision",
+            "Exprimer une idée claire et mémorable en très peu de mots.",
+            "red"
+        ),
+        unsafe_allow_html=True
+    )
+    
+    col_inst1, col_inst2 = st.columns(2)
+    
+    with col_inst1:
+        st.markdown(
+            info_box(
+                "📝 Instructions :",
+                '<ul>'
+                '<li>Pensez à l\'idée principale de votre prochain discours</li>'
+                '<li>Exprimez-la en <strong>7 mots maximum</strong></li>'
+                '<li>Soyez concis, percutant et mémorable</li>'
+                '</ul>'
+            ),
+            unsafe_allow_html=True
+        )
+    
+    with col_inst2:
+        st.markdown(
+            info_box(
+                "💡 Pourquoi 7 mots ?",
+                '<p>La mémoire à court terme retient 7±2 éléments. C\'est le nombre idéal pour une idée mémorable.</p>',
+                "green"
+            ),
+            unsafe_allow_html=True
+        )
+    
+    # Zone de saisie améliorée
+    st.markdown("### ✍️ Votre idée en 7 mots")
+    
+    col_input1, col_input2, col_input3 = st.columns([3, 1, 1])
+    
+    with col_input1:
+        idee_7_mots = st.text_input(
+            "**Votre idée :**",
+            max_chars=50,
+            key="atelier1_idea",
+            placeholder="Ex: La discipline surpasse toujours la motivation"
+        )
+    
+    with col_input2:
+        idea_score = score_idea(idee_7_mots)
+        mots = idea_score.words
+        st.metric("Mots", mots)
+    
+    with col_input3:
+        caracteres = len(idee_7_mots) if idee_7_mots else 0
+        st.metric("Caractères", caracteres)
+    
+    # Feedback visuel enrichi
+    if idee_7_mots:
+        publish_score("atelier1_passed", idea_score.passed)
+        col_result, col_visual = st.columns([3, 1])
+        
+        with col_result:
+            if idea_score.passed:
+                st.markdown(
+                    success_card("Parfait !", f"{mots}/{MAX_IDEA_WORDS} mots - Votre idée est concise et puissante !"),
+                    unsafe_allow_html=True
+                )
+                st.balloons()
+            else:
+                st.markdown(
+                    warning_card("À améliorer", f"{mots}/{MAX_IDEA_WORDS} mots - Essayez d'être plus concis"),
+                    unsafe_allow_html=True
+                )
+                
+                # Versions courtes extraites de la saisie
+                propositions = suggestions(idee_7_mots)
+                if propositions:
+                    st.markdown("**✂️ Pistes plus courtes, tirées de votre phrase :**")
+                    for proposition in propositions:
+                        st.markdown(f"• {proposition}")
+                
+                # Suggestions contextuelles
+                if mots > 10:
+                    st.info("""
+                    💡 **Astuces de concision :**
+                    • Supprimez les adjectifs superflus
+                    • Concentrez-vous sur le verbe principal
+                    • Utilisez des mots plus forts et précis
+                    """)
+        
+        with col_visual:
+            if idea_score.ultra_concise:
+                st.markdown(tile("🚀", "Ultra-concis !", "", "violet"), unsafe_allow_html=True)
+            elif idea_score.passed:
+                st.markdown(tile("🎯", "Parfait !", "", "green"), unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Exemples réussis
+    st.markdown("### 📚 Exemples réussis")
+    
+    col_ex1, col_ex2, col_ex3 = st.columns(3)
+    
+    with col_ex1:
+        st.markdown(tile("💬", '"La peur disparaît quand on avance."', "4 mots", "sky"), unsafe_allow_html=True)
+    
+    with col_ex2:
+        st.markdown(tile("💬", '"La discipline construit les rêves."', "3 mots", "green"), unsafe_allow_html=True)
+    
+    with col_ex3:
+        st.markdown(tile("💬", '"L\'écoute est la clé de la connexion."', "5 mots", "violet"), unsafe_allow_html=True)
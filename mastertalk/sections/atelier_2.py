@@ -0,0 +1,265 @@
+"""Atelier 2 : Le Mini-TED de 1 minute"""
+
+import streamlit as st
+
+from mastertalk.catalog import get_catalog
+from mastertalk.components import create_readability_table
+from mastertalk.facilitator import publish_score
+from mastertalk.scoring import TARGET_TOTAL, score_mini_ted
+from mastertalk.session import get_session
+from mastertalk.speech import DEFAULT_RATE, SPEAKING_RATES, estimate
+from mastertalk.templates import atelier_header, info_box, tile
+from mastertalk.text_analysis import word_count
+from mastertalk.timers import render_timer, reset_timer, start_timer, stop_timer
+
+# Dernière option de la liste des sujets : le participant saisit le sien
+CUSTOM_TOPIC = "Votre sujet personnalisé"
+
+# Message affiché selon le verdict de durée d'une partie (voir mastertalk.scoring)
+VERDICT_MESSAGES = {
+    "ok": (st.success, "✅ Parfait pour {target}"),
+    "court": (st.warning, "⚠️ Pourrait être plus développé"),
+    "long": (st.warning, "⚠️ Un peu long pour {target}"),
+    "trop_long": (st.error, "❌ Trop long pour {target}"),
+}
+BODY_MESSAGES = {
+    **VERDICT_MESSAGES,
+    "ok": (st.success, "✅ Idéal pour {target}"),
+    "trop_long": (st.error, "❌ Trop dense pour {target}"),
+}
+
+
+def render_atelier_2() -> None:
+    """Atelier 2 : Mini-TED de 1 minute - Version avec timer fonctionnel"""
+    # En-tête de l'atelier
+    st.markdown(
+        atelier_header(
+            "🟦",
+            'Atelier 2 : "Le Mini-TED de 1 minute"',
+            "Structurez un discours court et impactant",
+            "Apprendre à structurer un discours efficace en temps limité.",
+            "blue"
+        ),
+        unsafe_allow_html=True
+    )
+    
+    col_inst1, col_inst2 = st.columns(2)
+    
+    with col_inst1:
+        st.markdown(
+            info_box(
+                "📝 Instructions :",
+                '<ul>'
+                '<li>Choisissez un sujet qui vous passionne</li>'
+                '<li>Structurez votre discours en 3 parties</li>'
+                '<li>Préparez-vous à parler pendant 1 minute</li>'
+                '</ul>'
+            ),
+            unsafe_allow_html=True
+        )
+    
+    with col_inst2:
+        st.markdown(
+            info_box(
+                "⏱️ Structure en 1 minute :",
+                '<p>'
+                '• 20s : Introduction et accroche<br>'
+                '• 30s : Corps du message<br>'
+                '• 10s : Conclusion et appel à l\'action'
+                '</p>',
+                "green"
+            ),
+            unsafe_allow_html=True
+        )
+    
+    # Sélection du sujet
+    st.markdown("### 🎯 Choisissez votre sujet")
+    
+    sujet_options = get_catalog().mini_ted_topics + (CUSTOM_TOPIC,)
+    
+    sujet = st.selectbox(
+        "**Sélectionnez un sujet :**",
+        sujet_options,
+        key="atelier2_sujet"
+    )
+    
+    if sujet == CUSTOM_TOPIC:
+        sujet_perso = st.text_input(
+            "**Proposez votre sujet :**",
+            key="atelier2_sujet_perso",
+            placeholder="Ex: L'importance de la gratitude au quotidien"
+        )
+        if sujet_perso:
+            sujet = sujet_perso
+    
+    # Structure du discours
+    st.markdown("### 📝 Structurez votre discours")
+    
+    col_struct1, col_struct2, col_struct3 = st.columns(3)
+    
+    with col_struct1:
+        st.markdown(tile("🎯", "Introduction (20s)", "", "green"), unsafe_allow_html=True)
+        intro = st.text_area(
+            "**Accroche + idée principale :**",
+            key="atelier2_intro",
+            height=100,
+            placeholder="Ex: Saviez-vous que...\nAujourd'hui, je veux partager avec vous..."
+        )
+    
+    with col_struct2:
+        st.markdown(tile("💡", "Corps (30s)", "", "blue"), unsafe_allow_html=True)
+        corps = st.text_area(
+            "**Développement + arguments :**",
+            key="atelier2_corps",
+            height=100,
+            placeholder="Ex: Premièrement...\nDeuxièmement...\nEnfin..."
+        )
+    
+    with col_struct3:
+        st.markdown(tile("🎬", "Conclusion (10s)", "", "amber"), unsafe_allow_html=True)
+        conclusion = st.text_area(
+            "**Résumé + appel à l'action :**",
+            key="atelier2_conclusion",
+            height=100,
+            placeholder="Ex: En résumé...\nJe vous invite à..."
+        )
+    
+    # Timer et pratique
+    st.markdown("### ⏱️ Entraînez-vous au chrono")
+    
+    render_timer(
+        "atelier2",
+        label="Temps restant",
+        phases=[
+            (10, "#ef4444", "⏰ **10 secondes restantes !** Préparez votre conclusion."),
+            (30, "#f59e0b", "⏳ **30 secondes restantes !** Vous êtes dans le corps du discours.")
+        ],
+        default_phase=("#10b981", "✅ **Bon rythme !** Continuez comme ça."),
+        done_message="🎉 **Temps écoulé !** Excellent travail !",
+        celebrate=True
+    )
+    
+    col_timer1, col_timer2, col_timer3 = st.columns(3)
+    
+    with col_timer1:
+        st.button("▶️ Démarrer le timer 1min", type="primary", use_container_width=True, key="start_timer_btn2",
+                  on_click=start_timer, args=("atelier2",))
+    
+    with col_timer2:
+        st.button("⏹️ Arrêter", use_container_width=True, key="stop_timer_btn2",
+                  on_click=stop_timer, args=("atelier2",))
+    
+    with col_timer3:
+        st.button("🔄 Recommencer", use_container_width=True, key="reset_timer_btn2",
+                  on_click=reset_timer, args=("atelier2",))
+    
+    # Guide de structure
+    if st.button("📋 Afficher le guide de structure", key="show_guide_btn2"):
+        session = get_session()
+        session.show_guide_atelier2 = not session.show_guide_atelier2
+    
+    if get_session().show_guide_atelier2:
+        st.markdown(
+            info_box(
+                "📋 Guide de structure (1 minute) :",
+                '<div class="mt-grid-3">'
+                '<div>'
+                '<strong>🎯 Introduction (20s)</strong><br>'
+                '• Accroche percutante<br>'
+                '• Présentation du sujet<br>'
+                '• Annonce du plan'
+                '</div>'
+                '<div>'
+                '<strong>💡 Corps (30s)</strong><br>'
+                '• 1er point principal<br>'
+                '• 2ème point principal<br>'
+                '• Exemple concret'
+                '</div>'
+                '<div>'
+                '<strong>🎬 Conclusion (10s)</strong><br>'
+                '• Résumé des points<br>'
+                '• Message clé<br>'
+                '• Appel à l\'action'
+                '</div>'
+                '</div>'
+            ),
+            unsafe_allow_html=True
+        )
+    
+    # Feedback automatique
+    if intro and corps and conclusion:
+        st.markdown("### 📊 Votre feedback")
+        
+        # Durée de parole estimée (syllabes et pauses) au débit choisi
+        debit = st.select_slider(
+            "**Votre débit de parole :**",
+            options=list(SPEAKING_RATES),
+            value=DEFAULT_RATE,
+            key="atelier2_debit"
+        )
+        rate = SPEAKING_RATES[debit]
+        mini_ted = score_mini_ted(intro, corps, conclusion, rate)
+        publish_score("atelier2_seconds", mini_ted.total_seconds)
+        
+        parts = (
+            ("Introduction", intro, "20s", VERDICT_MESSAGES),
+            ("Corps", corps, "30s", BODY_MESSAGES),
+            ("Conclusion", conclusion, "10s", VERDICT_MESSAGES),
+        )
+        for column, (label, text, target, messages), seconds, verdict in zip(
+            st.columns(3), parts, mini_ted.seconds, mini_ted.verdicts
+        ):
+            with column:
+                st.metric(label, f"≈ {seconds:.0f} s")
+                st.caption(f"{word_count(text)} mots · {estimate(text, rate).syllables} syllabes")
+                show, message = messages[verdict]
+                show(message.format(target=target))
+        
+        # Conseils personnalisés
+        st.markdown(f"**⏱️ Durée totale estimée :** ≈ {mini_ted.total_seconds:.0f} s pour {TARGET_TOTAL} s visées")
+        if mini_ted.total_verdict == "court":
+            st.info("💡 **Conseil :** Votre discours est un peu court. Ajoutez des exemples ou des détails pour enrichir votre message.")
+        elif mini_ted.total_verdict == "long":
+            st.info("💡 **Conseil :** Votre discours est trop long pour 1 minute. Simplifiez et concentrez-vous sur l'essentiel.")
+        else:
+            st.success("🎯 **Excellent !** Votre structure est bien équilibrée pour 1 minute.")
+        
+        st.markdown("**📏 Lisibilité de votre discours**")
+        create_readability_table(
+            [("Introduction", intro), ("Corps", corps), ("Conclusion", conclusion)],
+            total_label="Discours"
+        )
+    
+    st.markdown("---")
+    
+    # Exemples de discours réussis
+    st.markdown("### 📚 Exemples de discours 1 minute")
+    
+    with st.expander("📖 Voir des exemples réussis"):
+        col_ex1, col_ex2 = st.columns(2)
+        
+        with col_ex1:
+            st.markdown(
+                info_box(
+                    '💡 Exemple 1 : "Le pouvoir des petites habitudes"',
+                    '<p>'
+                    '<strong>Introduction (20s):</strong> Imaginez améliorer votre vie 1% chaque jour...<br><br>'
+                    '<strong>Corps (30s):</strong> Une petite habitude quotidienne, comme lire 10 pages, peut transformer votre année...<br><br>'
+                    '<strong>Conclusion (10s):</strong> Commencez aujourd\'hui avec une micro-habitude !'
+                    '</p>'
+                ),
+                unsafe_allow_html=True
+            )
+        
+        with col_ex2:
+            st.markdown(
+                info_box(
+                    '🎯 Exemple 2 : "Sortir de sa zone de confort"',
+                    '<p>'
+                    '<strong>Introduction (20s):</strong> La zone de confort est douce mais elle ne fait pas grandir...<br><br>'
+                    '<strong>Corps (30s):</strong> Chaque défi relevé renforce la confiance et ouvre de nouvelles portes...<br><br>'
+                    '<strong>Conclusion (10s):</strong> Osez un petit pas hors de votre routine aujourd\'hui !'
+                    '</p>'
+                ),
+                unsafe_allow_html=True
+            )
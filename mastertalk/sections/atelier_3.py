@@ -0,0 +1,318 @@
+"""Atelier 3 : Jeu de rôle Pour ou Contre ?"""
+
+import random
+
+import streamlit as st
+
+from mastertalk.challenges import LEVELS, draw, get_counter_bank, get_topic_bank
+from mastertalk.facilitator import publish_score
+from mastertalk.scoring import MAX_FORCE_SCORE, PERSUASION_CRITERIA, score_arguments
+from mastertalk.session import DebatState, get_session
+from mastertalk.templates import atelier_header, info_box, tile
+from mastertalk.timers import render_timer, reset_timer, start_timer, stop_timer
+
+
+def render_atelier_3() -> None:
+    """Atelier 3 : Jeu de rôle Pour ou Contre - Version avec timer fonctionnel"""
+    # En-tête de l'atelier
+    st.markdown(
+        atelier_header(
+            "🟩",
+            'Atelier 3 : "Jeu de rôle Pour ou Contre ?"',
+            "Développez vos compétences d\'argumentation",
+            "Apprendre à argumenter efficacement, même sur des positions qui ne sont pas les vôtres.",
+            "green"
+        ),
+        unsafe_allow_html=True
+    )
+    
+    col_inst1, col_inst2 = st.columns(2)
+    
+    with col_inst1:
+        st.markdown(
+            info_box(
+                "📝 Instructions :",
+                '<ul>'
+                '<li>Un sujet controversé vous est attribué</li>'
+                '<li>Une position (Pour/Contre) vous est assignée</li>'
+                '<li>Préparez 3 arguments solides en 2 minutes</li>'
+                '</ul>'
+            ),
+            unsafe_allow_html=True
+        )
+    
+    with col_inst2:
+        st.markdown(
+            info_box(
+                "💪 Défi :",
+                '<p>Vous devez défendre une position même si elle ne correspond pas à votre opinion personnelle.</p>',
+                "red"
+            ),
+            unsafe_allow_html=True
+        )
+    
+    # Sélection aléatoire du sujet et position
+    st.markdown("### 🎲 Lancez le défi !")
+    
+    topics = get_topic_bank()
+    col_filtre1, col_filtre2 = st.columns(2)
+    
+    with col_filtre1:
+        categorie = st.selectbox(
+            "**Thème :**",
+            ["Tous les thèmes"] + topics.categories,
+            key="atelier3_categorie"
+        )
+    
+    with col_filtre2:
+        niveau = st.selectbox(
+            "**Niveau :**",
+            ["Tous niveaux"] + list(LEVELS),
+            format_func=lambda choix: LEVELS.get(choix, choix),
+            key="atelier3_niveau"
+        )
+    
+    categorie = None if categorie == "Tous les thèmes" else categorie
+    niveau = None if niveau == "Tous niveaux" else niveau
+    
+    col_challenge1, col_challenge2, col_challenge3 = st.columns([1, 2, 1])
+    
+    with col_challenge2:
+        if st.button("🎯 Générer un défi", type="primary", use_container_width=True, key="generate_challenge_btn"):
+            # Tirage sans remise dans la banque, position aléatoire
+            debat = get_session().ensure("debat")
+            sujet_debat = draw(topics, debat.seed, debat.draws, categorie, niveau)
+            if sujet_debat is None:
+                st.warning("Aucun sujet pour ce thème à ce niveau.")
+            else:
+                debat.sujet = sujet_debat.text
+                debat.categorie = sujet_debat.category
+                debat.niveau = sujet_debat.level
+                debat.position = random.choice(["POUR", "CONTRE"])
+                # Réinitialiser le timer
+                reset_timer("atelier3")
+                st.rerun()
+    
+    # Affichage du défi
+    debat = get_session().debat or DebatState()
+    if debat.sujet:
+        col_display1, col_display2, col_display3 = st.columns([1, 2, 1])
+        
+        with col_display2:
+            pour = debat.position == "POUR"
+            st.markdown(
+                tile(
+                    "✅" if pour else "❌",
+                    debat.sujet,
+                    f'<strong>Position : {debat.position}</strong>'
+                    + (f'<br>{debat.categorie} · {LEVELS[debat.niveau]}' if debat.niveau else ''),
+                    "green" if pour else "red"
+                ),
+                unsafe_allow_html=True
+            )
+        
+        # Timer de préparation
+        st.markdown("### ⏱️ Temps de préparation : 2 minutes")
+        
+        render_timer(
+            "atelier3",
+            label="Temps de préparation restant",
+            phases=[
+                (30, "#ef4444", "⏰ **30 secondes restantes !** Finalisez vos arguments."),
+                (60, "#f59e0b", "⏳ **1 minute restante !** Structurez vos arguments principaux.")
+            ],
+            default_phase=("#10b981", "✅ **Bon début !** Prenez le temps de bien préparer vos arguments."),
+            done_message="✅ **Temps écoulé !** Préparez-vous à présenter vos arguments."
+        )
+        
+        col_timer1, col_timer2, col_timer3 = st.columns(3)
+        
+        with col_timer1:
+            st.button("▶️ Démarrer timer 2min", type="primary", use_container_width=True, key="start_timer3",
+                      on_click=start_timer, args=("atelier3",))
+        
+        with col_timer2:
+            st.button("⏹️ Arrêter", use_container_width=True, key="stop_timer3",
+                      on_click=stop_timer, args=("atelier3",))
+        
+        with col_timer3:
+            st.button("🔄 Redémarrer", use_container_width=True, key="reset_timer3",
+                      on_click=reset_timer, args=("atelier3",))
+    
+    # Zone de préparation des arguments
+    st.markdown("### 💡 Préparez vos arguments")
+    
+    col_arg1, col_arg2, col_arg3 = st.columns(3)
+    
+    with col_arg1:
+        st.markdown(tile("1️⃣", "Argument principal", "", "green"), unsafe_allow_html=True)
+        arg1 = st.text_area(
+            "**Votre argument le plus fort :**",
+            key="arg1",
+            height=100,
+            placeholder="Ex: Cet avantage majeur change complètement la situation..."
+        )
+    
+    with col_arg2:
+        st.markdown(tile("2️⃣", "Second argument", "", "blue"), unsafe_allow_html=True)
+        arg2 = st.text_area(
+            "**Un argument complémentaire :**",
+            key="arg2",
+            height=100,
+            placeholder="Ex: Les études montrent que..."
+        )
+    
+    with col_arg3:
+        st.markdown(tile("3️⃣", "Troisième argument", "", "amber"), unsafe_allow_html=True)
+        arg3 = st.text_area(
+            "**Un dernier point important :**",
+            key="arg3",
+            height=100,
+            placeholder="Ex: Sans oublier que cela permet aussi..."
+        )
+    
+    # Zone de contre-arguments
+    st.markdown("### 🛡️ Anticipez les objections")
+    
+    contre_arg = st.text_area(
+        "**Quelles objections votre adversaire pourrait-il soulever ?**",
+        key="contre_arg",
+        height=100,
+        placeholder="Ex: On pourrait me dire que...\nJe répondrai que..."
+    )
+    
+    # Validation et feedback
+    if arg1 and arg2 and arg3:
+        st.markdown("### 📊 Analyse de vos arguments")
+        
+        arguments = score_arguments(arg1, arg2, arg3, contre_arg)
+        publish_score("atelier3_force", arguments.force)
+        mots_arg1, mots_arg2, mots_arg3 = arguments.words
+        types_arg1, types_arg2, types_arg3 = (
+            ", ".join(types) or "Aucun type repéré" for types in arguments.by_argument
+        )
+        
+        col_ana1, col_ana2, col_ana3 = st.columns(3)
+        
+        with col_ana1:
+            st.metric("Argument 1", f"{mots_arg1} mots")
+            if mots_arg1 > 30:
+                st.success("✅ Détail suffisant")
+            else:
+                st.warning("⚠️ Pourrait être plus développé")
+            st.caption(types_arg1)
+        
+        with col_ana2:
+            st.metric("Argument 2", f"{mots_arg2} mots")
+            if mots_arg2 > 20:
+                st.success("✅ Bon équilibre")
+            else:
+                st.warning("⚠️ Un peu court")
+            st.caption(types_arg2)
+        
+        with col_ana3:
+            st.metric("Argument 3", f"{mots_arg3} mots")
+            if mots_arg3 > 15:
+                st.success("✅ Suffisamment élaboré")
+            else:
+                st.info("💡 Pourrait être renforcé")
+            st.caption(types_arg3)
+        
+        # Types d'arguments détectés
+        if arguments.types:
+            st.info(f"💡 **Types d'arguments utilisés :** {', '.join(arguments.types)}")
+        if arguments.counter_types:
+            st.info(f"🛡️ **Votre réponse aux objections s'appuie sur :** {', '.join(arguments.counter_types)}")
+        
+        # Force de persuasion
+        force_score = arguments.force
+        
+        col_force1, col_force2 = st.columns([2, 1])
+        with col_force1:
+            if force_score >= 5:
+                st.success("🎯 **Excellent !** Vos arguments sont solides et bien préparés.")
+            elif force_score >= 3:
+                st.info("📈 **Bon travail !** Vos arguments sont bien structurés.")
+            else:
+                st.warning("💪 **Continuez !** Développez davantage vos arguments.")
+        
+        with col_force2:
+            st.metric("Score de persuasion", f"{force_score}/{MAX_FORCE_SCORE}")
+            for critere, points in arguments.breakdown.items():
+                st.caption(f"{critere} : {points}/{PERSUASION_CRITERIA[critere]}")
+    
+    # Section d'entraînement
+    st.markdown("### 🎭 Entraînement au contre-argument")
+    
+    if st.button("🔄 S'entraîner avec un contre-argument", key="counter_training_btn"):
+        # Même niveau que le défi choisi (tous niveaux s'il n'y en a pas), tous types confondus
+        counters = get_counter_bank()
+        debat = get_session().ensure("debat")
+        contre = (
+            draw(counters, debat.seed, debat.draws, level=debat.niveau or None)
+            or draw(counters, debat.seed, debat.draws)
+        )
+        if contre is None:
+            st.warning("Aucun contre-argument disponible pour le moment.")
+        else:
+            debat.contre_exemple = contre.text
+    
+    contre_exemple = (get_session().debat or DebatState()).contre_exemple
+    if contre_exemple:
+        col_ce1, col_ce2 = st.columns([2, 1])
+        with col_ce1:
+            st.markdown(
+                info_box(
+                    "Contre-argument à réfuter :",
+                    f'<p>"{contre_exemple}"</p>',
+                    "red"
+                ),
+                unsafe_allow_html=True
+            )
+        
+        with col_ce2:
+            reponse = st.text_area(
+                "**Votre réfutation :**",
+                key="reponse_contre",
+                height=100,
+                placeholder="Ex: Je comprends cette objection, mais..."
+            )
+            
+            if reponse:
+                st.success("✅ Bonne réfutation !")
+    
+    st.markdown("---")
+    
+    # Conseils pour bien argumenter
+    with st.expander("💡 Conseils pour un débat efficace"):
+        col_tips1, col_tips2 = st.columns(2)
+        
+        with col_tips1:
+            st.markdown(
+                '''
+                **🎯 Structurez vos arguments :**
+                • Commencez par votre point le plus fort
+                • Utilisez des faits et des exemples
+                • Liez chaque argument à votre thèse principale
+                
+                **🗣️ Technique de parole :**
+                • Parlez lentement et clairement
+                • Maintenez un contact visuel (même virtuel)
+                • Utilisez des pauses pour marquer vos points
+                '''
+            )
+        
+        with col_tips2:
+            st.markdown(
+                '''
+                **🛡️ Gestion des objections :**
+                • Écoutez attentivement le contre-argument
+                • Reconnaissez le point de vue adverse
+                • Réfutez avec des faits, pas des émotions
+                
+                **🧠 État d'esprit :**
+                • Restez calme et respectueux
+                • Concentrez-vous sur les idées, pas les personnes
+                • Apprenez de chaque échange
+                '''
+            )
@@ -0,0 +1,298 @@
+"""Atelier 4 : L'écoute active"""
+
+import streamlit as st
+
+from mastertalk.catalog import QUIZ_ANSWERS, get_catalog, labels, lookup
+from mastertalk.components import create_fidelity_feedback
+from mastertalk.facilitator import publish_score
+from mastertalk.keywords import highlight_html
+from mastertalk.scoring import ACTIVE_LISTENING, check_emotion_mirror, score_active_listening
+from mastertalk.templates import atelier_header, highlighted_text, info_box, quote_block, tile
+from mastertalk.timers import render_timer, reset_timer, start_timer, timer_is_running
+
+
+def render_atelier_4() -> None:
+    """Atelier 4 : L'écoute active - Version avec timer fonctionnel"""
+    # En-tête de l'atelier
+    st.markdown(
+        atelier_header(
+            "🟨",
+            'Atelier 4 : "L\'écoute active"',
+            "Pratiquez l\'écoute empathique et constructive",
+            "Développer l\'écoute active pour mieux comprendre et répondre avec empathie.",
+            "amber"
+        ),
+        unsafe_allow_html=True
+    )
+    
+    col_inst1, col_inst2 = st.columns(2)
+    
+    with col_inst1:
+        st.markdown(
+            info_box(
+                "📝 Instructions :",
+                '<ul>'
+                '<li>Écoutez attentivement le message</li>'
+                '<li>Reformulez avec vos propres mots</li>'
+                '<li>Validez les émotions exprimées</li>'
+                '</ul>'
+            ),
+            unsafe_allow_html=True
+        )
+    
+    with col_inst2:
+        st.markdown(
+            info_box(
+                "👂 La règle 30s/15s :",
+                '<p>'
+                '• 30 secondes : Écouter sans interrompre<br>'
+                '• 15 secondes : Reformuler et valider'
+                '</p>',
+                "green"
+            ),
+            unsafe_allow_html=True
+        )
+    
+    # Scénarios d'écoute active
+    st.markdown("### 🎭 Choisissez un scénario")
+    
+    catalog = get_catalog()
+    scenarios = labels(catalog.listening_scenarios)
+    
+    scenario = st.selectbox(
+        "**Sélectionnez un scénario :**",
+        scenarios,
+        key="atelier4_scenario"
+    )
+    
+    # Messages selon le scénario
+    messages_scenarios = lookup(catalog.listening_scenarios)
+    
+    if scenario in messages_scenarios:
+        st.markdown("### 💬 Message à écouter")
+        
+        col_msg1, col_msg2 = st.columns([3, 1])
+        
+        with col_msg1:
+            st.markdown(quote_block(f'"{messages_scenarios[scenario]}"'), unsafe_allow_html=True)
+        
+        with col_msg2:
+            st.button("▶️ Lancer l'écoute (30s)", type="primary", use_container_width=True, key="start_listening_btn",
+                      on_click=start_timer, args=("atelier4",))
+    
+    # Timer d'écoute
+    if timer_is_running("atelier4"):
+        st.markdown("### ⏱️ Écoute en cours...")
+    
+    render_timer(
+        "atelier4",
+        label="Temps d'écoute restant",
+        phases=[
+            (5, "#ef4444", "👂 **5 secondes restantes !** Préparez votre reformulation."),
+            (15, "#f59e0b", "🧠 **15 secondes restantes !** Identifiez les émotions clés.")
+        ],
+        default_phase=("#10b981", "✅ **Écoute active en cours...** Concentrez-vous sur le message."),
+        done_message="✅ **Temps d'écoute terminé !** Maintenant, reformulez ce que vous avez entendu.",
+        show_paused=False
+    )
+    
+    if timer_is_running("atelier4"):
+        # Contrôles du timer
+        col_control1, col_control2 = st.columns(2)
+        with col_control1:
+            st.button("⏹️ Arrêter l'écoute", use_container_width=True, key="stop_listening_btn",
+                      on_click=reset_timer, args=("atelier4",))
+        
+        with col_control2:
+            st.button("🔄 Recommencer", use_container_width=True, key="restart_listening_btn",
+                      on_click=start_timer, args=("atelier4",))
+    
+    # Zone de reformulation
+    st.markdown("### 🔄 Votre reformulation")
+    
+    col_reform1, col_reform2, col_reform3 = st.columns([1, 2, 1])
+    
+    with col_reform2:
+        reformulation = st.text_area(
+            "**Reformulez le message avec vos mots :**",
+            key="reformulation",
+            height=120,
+            placeholder="Ex: Si je comprends bien, tu ressens...\nCe qui te préoccupe particulièrement, c'est..."
+        )
+    
+    # Validation de la reformulation
+    if reformulation:
+        st.markdown("### 📊 Analyse de votre écoute active")
+        
+        # Vérification des éléments clés, en un passage sur le texte
+        listening = score_active_listening(reformulation)
+        publish_score("atelier4_score", listening.score)
+        elements_presents = listening.elements
+        st.markdown(
+            highlighted_text(highlight_html(reformulation, ACTIVE_LISTENING.find_all(reformulation))),
+            unsafe_allow_html=True
+        )
+        
+        col_check1, col_check2 = st.columns(2)
+        
+        with col_check1:
+            st.markdown("**✅ Éléments présents :**")
+            for element, present in elements_presents.items():
+                if present:
+                    st.markdown(f"✓ {element}")
+        
+        with col_check2:
+            score = listening.score
+            st.metric("Score d'écoute active", f"{score}/4")
+            
+            if score == 4:
+                st.success("🎯 **Excellent !** Votre écoute active est complète.")
+                st.balloons()
+            elif score >= 2:
+                st.info("📈 **Bon travail !** Vous avez capté l'essentiel.")
+            else:
+                st.warning("💪 **À améliorer** : Essayez d'inclure plus d'éléments d'écoute active.")
+        
+        # Fidélité au message du scénario
+        if scenario in messages_scenarios:
+            create_fidelity_feedback(messages_scenarios[scenario], reformulation)
+        
+        # Feedback spécifique
+        if not elements_presents["Reformulation"]:
+            st.info("💡 **Astuce :** Commencez par 'Si je comprends bien...' ou 'Tu veux dire que...'")
+        if not elements_presents["Validation émotionnelle"]:
+            st.info("💡 **Astuce :** Ajoutez 'Tu dois te sentir...' ou 'C'est difficile quand...'")
+        if not elements_presents["Question ouverte"]:
+            st.info("💡 **Astuce :** Terminez par une question comme 'C'est bien ça ?'")
+    
+    # Exercice de miroir émotionnel
+    st.markdown("### 🎭 Exercice : Le miroir émotionnel")
+    
+    emotions_scenarios = catalog.emotions
+    
+    selected_emotion = st.selectbox(
+        "**Identifiez l'émotion dominante :**",
+        labels(emotions_scenarios),
+        key="emotion_select"
+    )
+    
+    # Trouver le message correspondant
+    message_emotion = lookup(emotions_scenarios).get(selected_emotion, "")
+    
+    if message_emotion:
+        st.markdown(quote_block(f'"{message_emotion}"'), unsafe_allow_html=True)
+        
+        validation_emotion = st.text_area(
+            "**Validez cette émotion :**",
+            key="validation_emotion",
+            height=100,
+            placeholder=f"Ex: Je comprends que tu te sentes {selected_emotion.lower()} parce que..."
+        )
+        
+        mirrored = check_emotion_mirror(selected_emotion, validation_emotion)
+        if validation_emotion:
+            publish_score("emotion_passed", mirrored)
+        if mirrored:
+            st.success(f"✅ Parfait ! Vous avez bien identifié et validé l'émotion de {selected_emotion.lower()}.")
+    
+    # Techniques d'écoute active
+    st.markdown("### 💡 Techniques d'écoute active")
+    
+    col_tech1, col_tech2, col_tech3 = st.columns(3)
+    
+    with col_tech1:
+        st.markdown(
+            tile("🔄", "Reformulation", '"Si je comprends bien..."<br>"Donc ce que tu dis c\'est..."', "green"),
+            unsafe_allow_html=True
+        )
+    
+    with col_tech2:
+        st.markdown(
+            tile("❓", "Questionnement", '"Peux-tu me dire plus sur..."<br>"Comment as-tu ressenti cela ?"', "blue"),
+            unsafe_allow_html=True
+        )
+    
+    with col_tech3:
+        st.markdown(
+            tile(
+                "💬",
+                "Validation",
+                '"Je comprends que c\'est difficile..."<br>"C\'est normal de se sentir ainsi..."',
+                "amber"
+            ),
+            unsafe_allow_html=True
+        )
+    
+    # Quiz d'écoute active
+    st.markdown("### 🧠 Quiz : Vrai ou Faux ?")
+    
+    quiz_questions = catalog.quiz
+    
+    score_quiz = 0
+    
+    for i, question in enumerate(quiz_questions):
+        reponse = question.answer
+        col_q1, col_q2 = st.columns([3, 1])
+        
+        with col_q1:
+            st.markdown(f"**{i+1}. {question.statement}**")
+        
+        with col_q2:
+            user_answer = st.selectbox(
+                f"Réponse {i+1}",
+                ["", *QUIZ_ANSWERS],
+                key=f"quiz_{i}",
+                label_visibility="collapsed"
+            )
+            
+            if user_answer == reponse:
+                score_quiz += 1
+                if user_answer:  # Si une réponse a été donnée
+                    st.success("✓")
+            elif user_answer and user_answer != reponse:
+                st.error("✗")
+    
+    if score_quiz > 0:
+        st.markdown(f"**Score : {score_quiz}/{len(quiz_questions)}**")
+        if score_quiz == len(quiz_questions):
+            st.success("🎉 Excellent ! Vous maîtrisez les concepts de l'écoute active.")
+        elif score_quiz >= len(quiz_questions) // 2:
+            st.info("📚 Bonnes connaissances ! Continuez à pratiquer.")
+        else:
+            st.warning("📖 Revoyez les techniques d'écoute active.")
+    
+    st.markdown("---")
+    
+    # Bénéfices de l'écoute active
+    with st.expander("🌟 Les bénéfices de l'écoute active"):
+        col_benefits1, col_benefits2 = st.columns(2)
+        
+        with col_benefits1:
+            st.markdown(
+                '''
+                **🤝 Relations améliorées :**
+                • Crée la confiance et le respect
+                • Renforce les liens personnels et professionnels
+                • Réduit les malentendus et conflits
+                
+                **🧠 Compréhension approfondie :**
+                • Capture les besoins réels
+                • Identifie les émotions sous-jacentes
+                • Permet des réponses plus adaptées
+                '''
+            )
+        
+        with col_benefits2:
+            st.markdown(
+                '''
+                **💼 Avantages professionnels :**
+                • Meilleure collaboration en équipe
+                • Résolution efficace des problèmes
+                • Leadership plus empathique
+                
+                **😌 Bien-être personnel :**
+                • Réduction du stress relationnel
+                • Sentiment de connexion authentique
+                • Développement de l'intelligence émotionnelle
+                '''
+            )
@@ -0,0 +1,123 @@
+"""Section 7 : Ateliers Interactifs"""
+
+import streamlit as st
+
+from mastertalk.catalog import get_catalog
+from mastertalk.facilitator import publish_atelier
+from mastertalk.profiling import profile_render
+from mastertalk.sections import ATELIER_HANDLERS, load_handler
+from mastertalk.session import get_session
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    bullet_row,
+    card_title,
+    feature_row,
+    info_box,
+    metric_tile,
+    quote_block,
+    section_header,
+    subtitle,
+    takeaway,
+)
+
+
+def ateliers_section() -> None:
+    """Section Ateliers Interactifs"""
+    # Titre principal
+    st.markdown(
+        section_header("🎭", "7. Ateliers Interactifs", "Jeux de rôle et exercices pratiques"),
+        unsafe_allow_html=True
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Carte explicative des ateliers
+        st.markdown(
+            '<div class="section-card">'
+            + card_title("🎭 Pourquoi pratiquer ?")
+            + quote_block('"Ce n\'est pas en regardant la lumière qu\'on devient lumineux, mais en plongeant dans l\'obscurité."')
+            + feature_row("🎯", "Atelier 1 - Concision :", "Exprimer l\'essentiel en 7 mots", "red")
+            + feature_row("⏱️", "Atelier 2 - Mini-TED :", "Structurer un discours en 1 minute", "blue")
+            + feature_row("🗣️", "Atelier 3 - Débat :", "Argumenter et convaincre", "green")
+            + feature_row("👂", "Atelier 4 - Écoute :", "Pratiquer l\'écoute active", "amber")
+            + takeaway(
+                "💪 L\'importance de la pratique :",
+                'C\'est en pratiquant que vous transformez <strong>la théorie en compétence naturelle</strong>.'
+            )
+            + '</div>',
+            unsafe_allow_html=True
+        )
+    
+    with col2:
+        # Carte des statistiques d'apprentissage
+        st.markdown(
+            '<div class="section-card">'
+            + card_title("📈 Impact de la pratique")
+            + metric_tile("70%", "De rétention après pratique", "🧠", "green")
+            + metric_tile("4×", "Plus de confiance acquise", "💪", "blue")
+            + metric_tile("90%", "Réduction du stress", "😌", "amber")
+            + subtitle("🎯 Conseils de pratique :")
+            + bullet_row("🔄", "Pratiquez régulièrement (même 10 min/jour)", "amber")
+            + bullet_row("🎯", "Concentrez-vous sur un aspect à la fois", "blue")
+            + bullet_row("👥", "Trouvez un partenaire d\'entraînement", "green")
+            + '</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Sélecteur d'atelier amélioré
+    st.markdown("### 🎯 Choisissez un atelier à pratiquer :")
+    
+    # Conteneur pour le sélecteur
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    st.markdown(
+        info_box(
+            "🎯 Votre mission :",
+            "<p>Sélectionnez un atelier et mettez en pratique vos compétences en communication.</p>"
+        ),
+        unsafe_allow_html=True
+    )
+    
+    col_selector1, col_selector2 = st.columns([3, 1])
+    
+    with col_selector1:
+        atelier = st.selectbox(
+            "Sélectionnez un atelier :",
+            get_catalog().ateliers,
+            key="atelier_select",
+            label_visibility="collapsed"
+        )
+    
+    with col_selector2:
+        if st.button("🚀 Démarrer l'atelier", type="primary", use_container_width=True, key="start_atelier_btn"):
+            get_session().selected_atelier = atelier
+    
+    # Indicateur visuel de l'atelier sélectionné
+    atelier_tones = {
+        "🟥 Atelier 1 : Concision (7 mots)": "red",
+        "🟦 Atelier 2 : Mini-TED (1 minute)": "blue", 
+        "🟩 Atelier 3 : Débat (Pour/Contre)": "green",
+        "🟨 Atelier 4 : Écoute active (30s/15s)": "amber"
+    }
+    
+    if atelier in atelier_tones:
+        st.markdown(
+            feature_row(atelier.split()[0], atelier, "sélectionné", atelier_tones[atelier]),
+            unsafe_allow_html=True
+        )
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    # Conteneur pour l'atelier
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    for prefix, spec in ATELIER_HANDLERS.items():
+        if prefix in atelier:
+            publish_atelier(prefix)
+            with profile_render(prefix):
+                load_handler(spec)()
+            break
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
@@ -0,0 +1,172 @@
+"""Section Conclusion"""
+
+import streamlit as st
+
+from mastertalk.feedback import submit_feedback
+from mastertalk.prerender import static_block
+from mastertalk.session import get_session
+from mastertalk.store import session_token
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    card_title,
+    info_box,
+    letter_row,
+    quote_block,
+    rating_stars,
+    section_header,
+    success_card,
+    tile,
+)
+
+
+@static_block
+def _header() -> str:
+    """Titre principal"""
+    return section_header("🏁", "Conclusion", "La communication n\'est pas un talent, c\'est une compétence")
+
+
+@static_block
+def _quote() -> str:
+    """Carte de citation inspirante"""
+    return quote_block(
+        'On ne naît pas bon communicant.<br>'
+        'On le devient avec clarité, storytelling, écoute, et surtout… pratique.'
+    )
+
+
+@static_block
+def _recap_card() -> str:
+    """Carte récapitulative enrichie"""
+    return (
+        '<div class="section-card">'
+        + card_title("📋 Votre parcours MasterTalk")
+        + letter_row("🎤", "1. TED Talk & The One Idea Rule", "Un discours = une idée forte", "green")
+        + letter_row("🎯", "2. Méthode SMART", "Objectifs clairs et mesurables", "blue")
+        + letter_row("📖", "3. Storytelling STAR", "Histoires structurées et captivantes", "amber")
+        + letter_row("👂", "4. Écoute active", "Reformuler et valider les émotions", "violet")
+        + letter_row("📊", "5. Analyse SWOT + TOWS", "Connaissance de soi et stratégies", "pink")
+        + letter_row("🎭", "6. Ateliers interactifs", "Exercices pratiques pour progresser", "sky")
+        + '</div>'
+    )
+
+
+@static_block
+def _voice_tile() -> str:
+    """Carte de synthèse inspirante"""
+    return tile(
+        "✨",
+        "Votre voix compte",
+        '<em>Chaque présentation est une opportunité d\'inspirer, de convaincre et de transformer.</em>'
+        '<br><br><strong>🎯 Votre prochaine étape :</strong><br>'
+        'Appliquez ces techniques dans votre prochaine présentation',
+        "sky"
+    )
+
+
+@static_block
+def _thanks_tile() -> str:
+    """Message de remerciement final"""
+    return tile(
+        "🌟",
+        "Merci d\'avoir suivi MasterTalk !",
+        "Continuez à pratiquer et à développer vos compétences en communication.",
+        "plain"
+    )
+
+
+def conclusion_section() -> None:
+    """Section Conclusion - Version enrichie"""
+    st.markdown(_header(), unsafe_allow_html=True)
+    st.markdown(_quote(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_recap_card(), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_voice_tile(), unsafe_allow_html=True)
+    
+    # Message final interactif
+    st.markdown("### ✨ Votre message à retenir")
+    
+    col_msg1, col_msg2, col_msg3 = st.columns([1, 2, 1])
+    
+    with col_msg2:
+        if st.button("🎯 Révéler votre message final", type="primary", use_container_width=True, key="final_message_btn"):
+            get_session().show_final_message = True
+    
+    if get_session().show_final_message:
+        st.balloons()
+        st.markdown(
+            quote_block(
+                '💫<br>'
+                'Votre histoire a du pouvoir.<br>'
+                'Votre voix compte.<br>'
+                '<strong>Apprenez à la partager.</strong>',
+                "green"
+            ),
+            unsafe_allow_html=True
+        )
+    
+    # Section feedback enrichie
+    st.markdown("---")
+    st.markdown("### 📝 Partagez votre expérience")
+    
+    # Conteneur pour le feedback
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    st.markdown(
+        info_box(
+            "🎯 Votre feedback nous aide à améliorer",
+            "<p>Partagez vos impressions pour nous aider à rendre MasterTalk encore meilleur.</p>"
+        ),
+        unsafe_allow_html=True
+    )
+    
+    col_rating1, col_rating2 = st.columns([2, 1])
+    
+    with col_rating1:
+        st.markdown("**Comment avez-vous trouvé cette formation ?**")
+        rating = st.slider(
+            "Notez cette formation :",
+            1, 5, 5,
+            key="feedback_rating",
+            label_visibility="collapsed"
+        )
+    
+    with col_rating2:
+        # Affichage visuel des étoiles
+        st.markdown(rating_stars(rating), unsafe_allow_html=True)
+    
+    feedback = st.text_area(
+        "**Vos commentaires et suggestions :**",
+        key="feedback_text",
+        height=120,
+        placeholder="Partagez vos impressions, ce que vous avez préféré, ce qui pourrait être amélioré..."
+    )
+    
+    col_fb1, col_fb2, col_fb3 = st.columns([1, 2, 1])
+    
+    with col_fb2:
+        if st.button("📤 Envoyer mon feedback", type="primary", use_container_width=True, key="feedback_submit_btn"):
+            if not feedback:
+                st.warning("Veuillez ajouter un commentaire avant d'envoyer votre feedback.")
+            elif not submit_feedback(rating, feedback, session_token()):
+                st.error("Votre feedback n'a pas pu être enregistré pour le moment. Merci de réessayer plus tard.")
+            else:
+                st.markdown(
+                    success_card(
+                        "Merci pour votre feedback !",
+                        "Votre avis précieux nous aide à améliorer MasterTalk."
+                    ),
+                    unsafe_allow_html=True
+                )
+    
+    if feedback:
+        st.info(f"📝 **Votre commentaire :** {len(feedback)} caractères")
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    st.markdown(_thanks_tile(), unsafe_allow_html=True)
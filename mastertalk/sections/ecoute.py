@@ -0,0 +1,141 @@
+"""Section 4 : Écoute Active"""
+
+import streamlit as st
+
+from mastertalk.catalog import get_catalog, labels, lookup
+from mastertalk.components import create_fidelity_feedback, create_transition
+from mastertalk.facilitator import publish_score
+from mastertalk.scoring import check_reformulation
+from mastertalk.session import EcouteState, get_session
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    card_title,
+    feature_row,
+    info_box,
+    panel,
+    quote_block,
+    section_header,
+    success_card,
+    takeaway,
+    warning_card,
+)
+
+
+def ecoute_section() -> None:
+    """Section Écoute Active"""
+    # Titre principal
+    st.markdown(
+        section_header("🧠", "4. Leadership & Écoute Active", "L\'art de comprendre avant d\'être compris"),
+        unsafe_allow_html=True
+    )
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Carte des niveaux d'écoute
+        st.markdown(
+            '<div class="section-card">'
+            + card_title("🎧 Les 3 niveaux d\'écoute")
+            + panel("1. Écoute passive", "<p>Entendre sans vraiment écouter, en pensant à autre chose</p>", "amber")
+            + panel("2. Écoute attentive", "<p>Comprendre le contenu du message, les faits et informations</p>", "blue")
+            + panel("3. Écoute active", "<p>Reformuler, questionner, valider les émotions derrière les mots</p>", "green")
+            + takeaway(
+                "🎯 Pourquoi écouter activement ?",
+                'Parce que ça crée <strong>confiance, connexion et compréhension mutuelle</strong>.'
+            )
+            + '</div>',
+            unsafe_allow_html=True
+        )
+    
+    with col2:
+        # Carte des techniques d'écoute active
+        st.markdown(
+            '<div class="section-card">'
+            + card_title("✨ Les techniques de l\'écoute active")
+            + quote_block('"Écouter, c\'est comprendre avec le cœur ce que l\'autre dit avec les mots."', "violet")
+            + feature_row("🔄", "Reformuler :", '"Si je comprends bien, tu dis que..."', "amber")
+            + feature_row("❓", "Questionner :", '"Peux-tu me dire plus sur..."', "blue")
+            + feature_row("💬", "Valider :", '"Je comprends que cela doit être difficile..."', "green")
+            + '</div>',
+            unsafe_allow_html=True
+        )
+    
+    # Jeu interactif d'écoute active
+    st.markdown("### 🎮 Exercice d'écoute active")
+    
+    # Conteneur pour l'exercice
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    phrases = get_catalog().ecoute_phrases
+    
+    st.markdown(
+        info_box(
+            "🎯 Votre mission :",
+            "<p>Choisissez une phrase et pratiquez la reformulation en écoute active.</p>"
+        ),
+        unsafe_allow_html=True
+    )
+    
+    selected = st.selectbox(
+        "**Choisissez une phrase à reformuler :**",
+        labels(phrases),
+        key="ecoute_phrase"
+    )
+    
+    reformulation = st.text_area(
+        "**Votre reformulation (écoute active) :**",
+        placeholder="Ex: Si je comprends bien, le problème n'est pas parler... c'est le regard des autres ?",
+        key="ecoute_reformulation",
+        height=100
+    )
+    
+    col_btn1, col_btn2, col_btn3 = st.columns(3)
+    with col_btn1:
+        if st.button("✓ Vérifier", type="primary", use_container_width=True, key="ecoute_check_btn"):
+            passed = check_reformulation(reformulation)
+            publish_score("ecoute_passed", passed)
+            if passed:
+                ecoute = get_session().ensure("ecoute")
+                ecoute.success = True
+                ecoute.message = "✅ Excellente reformulation ! Vous pratiquez l'écoute active."
+            else:
+                ecoute = get_session().ensure("ecoute")
+                ecoute.success = False
+                ecoute.message = "💡 Essayez de commencer par 'Si je comprends bien...' et terminez par une question"
+    
+    with col_btn2:
+        if st.button("🔄 Exemple", use_container_width=True, key="ecoute_example_btn"):
+            get_session().ensure("ecoute").example = lookup(phrases)[selected]
+    
+    with col_btn3:
+        if st.button("📝 Conseils", use_container_width=True, key="ecoute_tips_btn"):
+            get_session().ensure("ecoute").tips = "💡 **Conseil :** Commencez toujours par 'Si je comprends bien...' ou 'Tu veux dire que...' et terminez par une question ouverte."
+    
+    # Affichage des résultats
+    ecoute = get_session().ecoute or EcouteState()
+    if ecoute.success is not None:
+        if ecoute.success:
+            st.markdown(
+                success_card("Parfait !", ecoute.message),
+                unsafe_allow_html=True
+            )
+        else:
+            st.markdown(
+                warning_card("À améliorer", ecoute.message),
+                unsafe_allow_html=True
+            )
+        if reformulation:
+            create_fidelity_feedback(selected, reformulation)
+    
+    if ecoute.example is not None:
+        st.info(f"**Exemple de reformulation :** {ecoute.example}")
+    
+    if ecoute.tips is not None:
+        st.warning(ecoute.tips)
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    create_transition(
+        "Pour améliorer sa communication, il faut comprendre ses forces et ses faiblesses."
+    )
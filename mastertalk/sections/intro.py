@@ -0,0 +1,149 @@
+"""Section Introduction"""
+
+import streamlit as st
+
+from mastertalk.components import create_transition
+from mastertalk.prerender import static_block
+from mastertalk.session import UserProfile, get_session
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    bullet_row,
+    card_title,
+    feature_row,
+    info_box,
+    metric_tile,
+    quote_block,
+    result_card,
+    section_header,
+    subtitle,
+    takeaway,
+)
+
+
+@static_block
+def _header() -> str:
+    """Titre principal avec le même style que TED Talk"""
+    return section_header("🎬", "Introduction", "Le pouvoir de la communication")
+
+
+@static_block
+def _why_card() -> str:
+    """Carte principale d'introduction"""
+    return (
+        '<div class="section-card">'
+        + card_title("✨ Pourquoi la communication est-elle essentielle ?")
+        + quote_block('"Les mots ont le pouvoir de détruire et de guérir. Quand les mots sont justes et vrais, ils peuvent changer le monde."')
+        + feature_row("💼", "Dans le travail :", "85% de votre succès dépend de vos compétences en communication", "amber")
+        + feature_row("👥", "Dans les relations :", "Crée des connexions authentiques et durables", "blue")
+        + feature_row("🚀", "Dans le leadership :", "Inspire, motive et dirige efficacement", "green")
+        + takeaway(
+            "🎯 L'exemple parfait : Les TED Talks",
+            'Les TED Talks montrent comment <strong>une idée, bien présentée, peut changer des vies</strong>.'
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _figures_card() -> str:
+    """Carte statistiques et objectifs"""
+    return (
+        '<div class="section-card">'
+        + card_title("📊 Les chiffres qui parlent")
+        + metric_tile("85%", "Du succès professionnel", "📈", "amber")
+        + metric_tile("70%", "Des conflits évités", "🤝", "blue")
+        + metric_tile("4×", "Plus de leadership perçu", "👑", "green")
+        + subtitle("🎯 Objectif de ce guide :")
+        + bullet_row("🎤", "Parler avec clarté et impact", "amber")
+        + bullet_row("📖", "Raconter des histoires captivantes", "blue")
+        + bullet_row("👂", "Écouter activement et avec empathie", "green")
+        + '</div>'
+    )
+
+
+@static_block
+def _mission() -> str:
+    """Consigne de l'exercice d'introduction"""
+    return info_box(
+        "🌟 Préparez-vous à transformer votre communication",
+        "<p>Répondez à cette question pour personnaliser votre expérience :</p>"
+    )
+
+
+def intro_section() -> None:
+    """Section Introduction"""
+    st.markdown(_header(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_why_card(), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_figures_card(), unsafe_allow_html=True)
+    
+    # Section interactive d'introduction
+    st.markdown("### 🎬 Commencez votre parcours")
+    
+    # Conteneur pour l'exercice d'introduction
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    st.markdown(_mission(), unsafe_allow_html=True)
+    
+    col_input1, col_input2 = st.columns(2)
+    
+    with col_input1:
+        nom = st.text_input(
+            "**Votre prénom :**",
+            placeholder="Ex: Marie",
+            key="user_name",
+            help="Pour personnaliser votre expérience"
+        )
+        
+        niveau = st.selectbox(
+            "**Votre niveau actuel :**",
+            ["Débutant", "Intermédiaire", "Avancé"],
+            key="user_level",
+            help="Pour adapter les exercices à votre niveau"
+        )
+    
+    with col_input2:
+        objectif_perso = st.selectbox(
+            "**Votre objectif principal :**",
+            [
+                "Parler en public sans stress",
+                "Convaincre en réunion",
+                "Présenter des idées clairement", 
+                "Améliorer mon leadership",
+                "Raconter de meilleures histoires"
+            ],
+            key="user_goal"
+        )
+    
+    if st.button("🚀 Démarrer mon parcours", type="primary", use_container_width=True, key="start_journey_btn"):
+        if nom:
+            get_session().profile = UserProfile(name=nom, level=niveau, goal=objectif_perso)
+            st.success(f"✅ Parfait {nom} ! Votre parcours personnalisé est prêt.")
+        else:
+            st.warning("⚠️ Veuillez entrer votre prénom pour personnaliser l'expérience")
+    
+    # Affichage du profil utilisateur
+    profile = get_session().profile
+    if profile is not None:
+        st.markdown(
+            result_card(
+                "👤",
+                f'Bienvenue, {profile.name} !',
+                f'<p><strong>🎯 Objectif :</strong> {profile.goal}</p>'
+                f'<p><strong>📊 Niveau :</strong> {profile.level}</p>'
+                '<p><em>"Votre voyage vers une communication exceptionnelle commence maintenant !"</em></p>'
+            ),
+            unsafe_allow_html=True
+        )
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    create_transition(
+        "Avant de comprendre comment parler comme un leader, commençons par découvrir ce qui rend un TED Talk tellement captivant."
+    )
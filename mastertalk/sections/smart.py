@@ -0,0 +1,190 @@
+"""Section 2 : Méthode SMART"""
+
+import streamlit as st
+
+from mastertalk.components import create_transition
+from mastertalk.facilitator import publish_score
+from mastertalk.prerender import static_block
+from mastertalk.session import SmartDraft, get_session
+from mastertalk.smart_check import CRITERIA, validate
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    bullet_row,
+    card_title,
+    feature_row,
+    info_box,
+    letter_row,
+    quote_block,
+    result_card,
+    section_header,
+    subtitle,
+    takeaway,
+)
+
+CRITERIA_LABELS = {
+    "S": "Spécifique",
+    "M": "Mesurable",
+    "A": "Atteignable",
+    "R": "Relevant",
+    "T": "Temporel",
+}
+
+
+@static_block
+def _header() -> str:
+    """Titre principal"""
+    return section_header("🎯", "2. Méthode SMART", "Clarifier son message avec précision")
+
+
+@static_block
+def _criteria_card() -> str:
+    """Carte de présentation SMART détaillée"""
+    return (
+        '<div class="section-card">'
+        + card_title("🎯 Les 5 critères SMART")
+        + letter_row("S", "Spécifique", "Clair, précis, sans ambiguïté", "amber")
+        + letter_row("M", "Mesurable", "Avec des indicateurs concrets", "blue")
+        + letter_row("A", "Atteignable", "Ambitieux mais réaliste", "green")
+        + letter_row("R", "Relevant", "En lien avec vos objectifs globaux", "violet")
+        + letter_row("T", "Temporel", "Avec une date limite précise", "pink")
+        + takeaway(
+            "🎯 Pourquoi SMART fonctionne ?",
+            'Parce que ça transforme <strong>des vœux pieux en plans d\'action concrets</strong>.'
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _practice_card() -> str:
+    """Carte d'exemples et avantages"""
+    return (
+        '<div class="section-card">'
+        + card_title("✨ De la théorie à la pratique")
+        + quote_block('"Un objectif bien défini est à moitié atteint."')
+        + feature_row("🚫", "Avant :", '"Je veux être plus confiant"', "amber")
+        + feature_row("✅", "Après SMART :", '"Dans 2 semaines, je présenterai 5 minutes sans regarder mes notes"', "green")
+        + subtitle("📈 Les bénéfices :")
+        + bullet_row("•", "Clarté dans la planification", "green")
+        + bullet_row("•", "Motivation renforcée", "blue")
+        + bullet_row("•", "Suivi des progrès facilité", "amber")
+        + '</div>'
+    )
+
+
+@static_block
+def _mission() -> str:
+    """Consigne de l'exercice"""
+    return info_box(
+        "🎯 Votre mission :",
+        "<p>Transformez votre objectif vague en un objectif SMART précis et actionnable.</p>"
+    )
+
+
+def smart_section() -> None:
+    """Section Méthode SMART"""
+    st.markdown(_header(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_criteria_card(), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_practice_card(), unsafe_allow_html=True)
+    
+    # Interface interactive SMART améliorée
+    st.markdown("### 🎯 Créer votre objectif SMART")
+    
+    # Conteneur pour l'exercice
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    st.markdown(_mission(), unsafe_allow_html=True)
+    
+    col_input1, col_input2 = st.columns(2)
+    
+    with col_input1:
+        objectif = st.text_input(
+            "**Votre objectif actuel :**",
+            "Je veux parler mieux en public",
+            key="smart_goal",
+            help="Exprimez votre objectif actuel, même s'il est vague"
+        )
+        
+        mesurable = st.text_input(
+            "**Comment le mesurer ?**",
+            "Présenter 3 minutes sans notes",
+            key="smart_measurable",
+            help="Comment saurez-vous que vous avez réussi ?"
+        )
+        
+        atteignable = st.text_input(
+            "**Pourquoi est-ce atteignable ?**",
+            "J'ai déjà réussi à parler 1 minute sans notes",
+            key="smart_achievable",
+            help="Quelles ressources/skills avez-vous déjà ?"
+        )
+    
+    with col_input2:
+        temps = st.selectbox(
+            "**Délai :**",
+            ["3 jours", "1 semaine", "10 jours", "1 mois", "3 mois"],
+            key="smart_time",
+            help="Quelle est votre échéance ?"
+        )
+        
+        relevant = st.text_input(
+            "**Pourquoi est-ce important ?**",
+            "Pour progresser dans ma carrière",
+            key="smart_relevant",
+            help="En quoi cela sert vos objectifs plus larges ?"
+        )
+    
+    col_btn, col_result = st.columns([1, 3])
+    with col_btn:
+        if st.button("🚀 Transformer en SMART", type="primary", use_container_width=True, key="smart_transform_btn"):
+            smart_objectif = f"Dans {temps}, je serai capable de {mesurable.lower()}."
+            get_session().smart = SmartDraft(
+                objectif=smart_objectif,
+                details={
+                    "S": objectif,
+                    "M": mesurable,
+                    "A": atteignable,
+                    "R": relevant,
+                    "T": temps
+                }
+            )
+    
+    with col_result:
+        draft = get_session().smart
+        if draft is not None:
+            details = draft.details
+            st.markdown(
+                result_card(
+                    "🎯",
+                    "Objectif SMART généré !",
+                    f'<p><strong>{draft.objectif}</strong></p>'
+                    '<h5>📋 Détails :</h5>'
+                    f'<p><strong>S</strong>pécifique : {details["S"]}</p>'
+                    f'<p><strong>M</strong>esurable : {details["M"]}</p>'
+                    f'<p><strong>A</strong>tteignable : {details["A"]}</p>'
+                    f'<p><strong>R</strong>elevant : {details["R"]}</p>'
+                    f'<p><strong>T</strong>emporel : {details["T"]}</p>'
+                ),
+                unsafe_allow_html=True
+            )
+            
+            verdict = validate(details["S"], details["M"], details["A"], details["R"], details["T"])
+            publish_score("smart_score", verdict.score)
+            st.metric("Critères SMART respectés", f"{verdict.score}/5")
+            for letter in CRITERIA:
+                criterion = verdict.criteria[letter]
+                icon = "✓" if criterion.ok else "⚠️"
+                st.markdown(f"{icon} **{CRITERIA_LABELS[letter]}** : {criterion.message}")
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    create_transition(
+        "Maintenant que ton idée est définie et ton objectif clarifié… Il faut raconter une histoire."
+    )
@@ -0,0 +1,152 @@
+"""Section 3 : Storytelling STAR"""
+
+import streamlit as st
+
+from mastertalk.components import create_readability_table, create_transition
+from mastertalk.prerender import static_block
+from mastertalk.session import StarDraft, get_session
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    card_title,
+    feature_row,
+    letter_row,
+    quote_block,
+    result_card,
+    section_header,
+    takeaway,
+)
+
+
+@static_block
+def _header() -> str:
+    """Titre principal"""
+    return section_header("📖", "3. Storytelling STAR", "Comment toucher les gens avec une histoire")
+
+
+@static_block
+def _method_card() -> str:
+    """Carte de présentation STAR"""
+    return (
+        '<div class="section-card">'
+        + card_title("⭐ La méthode STAR en détail")
+        + letter_row("S", "Situation", "Le contexte, le décor, le point de départ", "amber", plain=True)
+        + letter_row("T", "Tâche", "Le défi, l\'objectif, la mission", "blue", plain=True)
+        + letter_row("A", "Action", "Les étapes, les choix, les efforts", "green", plain=True)
+        + letter_row("R", "Résultat", "Le dénouement, les apprentissages", "violet", plain=True)
+        + takeaway(
+            "🎯 Pourquoi STAR fonctionne ?",
+            'Parce que ça crée <strong>une structure claire, émotionnelle et mémorable</strong>.'
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _tips_card() -> str:
+    """Carte de conseils storytelling"""
+    return (
+        '<div class="section-card">'
+        + card_title("✨ Les secrets du bon storytelling")
+        + quote_block('"Les gens oublient les faits, mais ils se souviennent des histoires."', "violet")
+        + feature_row("🎭", "Personnalisez :", "Parlez de vous ou d\'une expérience réelle", "amber")
+        + feature_row("🎯", "Structurez :", "Commencez fort et terminez avec une morale", "green")
+        + feature_row("💬", "Émotionnez :", "Montrez les émotions, ne les décrivez pas", "blue")
+        + '</div>'
+    )
+
+
+def star_section() -> None:
+    """Section Storytelling STAR"""
+    st.markdown(_header(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_method_card(), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_tips_card(), unsafe_allow_html=True)
+    
+    # Exercice pratique STAR
+    st.markdown("### 📝 Construire votre histoire avec STAR")
+    
+    # Conteneur pour l'exercice
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    cols = st.columns(2)
+    
+    with cols[0]:
+        # Utiliser des clés uniques pour les widgets
+        s_input = st.text_area(
+            "**Situation :**",
+            "Je tremblais à l'idée de présenter en classe.",
+            key="star_s_input",  # Clé unique pour le widget
+            height=100,
+            help="Décrivez le contexte initial"
+        )
+        
+        t_input = st.text_area(
+            "**Tâche :**",
+            "Je devais parler 5 minutes devant 40 étudiants.",
+            key="star_t_input",  # Clé unique pour le widget
+            height=100,
+            help="Quel était l'objectif ou le défi ?"
+        )
+    
+    with cols[1]:
+        a_input = st.text_area(
+            "**Action :**",
+            "J'ai préparé un plan simple et répété 3 fois.",
+            key="star_a_input",  # Clé unique pour le widget
+            height=100,
+            help="Qu'avez-vous fait concrètement ?"
+        )
+        
+        r_input = st.text_area(
+            "**Résultat :**",
+            "J'ai réussi et j'ai gagné confiance.",
+            key="star_r_input",  # Clé unique pour le widget
+            height=100,
+            help="Quel a été le résultat et l'apprentissage ?"
+        )
+    
+    col_btn, col_result = st.columns([1, 3])
+    with col_btn:
+        if st.button("📖 Générer mon histoire STAR", type="primary", use_container_width=True, key="star_generate_btn"):
+            # Copie des saisies : l'histoire reste affichée si les champs changent
+            get_session().star = StarDraft(situation=s_input, task=t_input, action=a_input, result=r_input)
+    
+    with col_result:
+        draft = get_session().star
+        if draft is not None:
+            
+            # Afficher l'histoire avec HTML complet
+            st.markdown(
+                result_card(
+                    "📖",
+                    "Votre histoire est prête !",
+                    '<h5>🌟 Votre histoire STAR complète</h5>'
+                    f'<p><strong>Situation :</strong> {draft.situation}</p>'
+                    f'<p><strong>Tâche :</strong> {draft.task}</p>'
+                    f'<p><strong>Action :</strong> {draft.action}</p>'
+                    f'<p><strong>Résultat :</strong> {draft.result}</p>',
+                    tone="blue"
+                ),
+                unsafe_allow_html=True
+            )
+            
+            # Lisibilité de chaque partie, recalculée seulement pour celles qui changent
+            st.markdown("**📏 Lisibilité de votre histoire**")
+            create_readability_table([
+                ("Situation", draft.situation),
+                ("Tâche", draft.task),
+                ("Action", draft.action),
+                ("Résultat", draft.result),
+            ], total_label="Histoire")
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    create_transition(
+        "Mais raconter une histoire ne suffit pas. Un bon communicateur doit aussi savoir écouter."
+    )
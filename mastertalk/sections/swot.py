@@ -0,0 +1,180 @@
+"""Section 5 : Analyse SWOT"""
+
+import streamlit as st
+
+from mastertalk.components import create_transition
+from mastertalk.prerender import static_block
+from mastertalk.session import SwotDraft, get_session
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    card_title,
+    feature_row,
+    info_box,
+    panel,
+    quote_block,
+    result_card,
+    section_header,
+    takeaway,
+)
+
+
+@static_block
+def _header() -> str:
+    """Titre principal"""
+    return section_header("📊", "5. Analyse SWOT", "Se connaître pour mieux communiquer")
+
+
+@static_block
+def _definition_card() -> str:
+    """Carte explicative SWOT"""
+    return (
+        '<div class="section-card">'
+        + card_title("📊 Qu\'est-ce que l\'analyse SWOT ?")
+        + quote_block('"Connais-toi toi-même et tu connaîtras l\'univers et les dieux."')
+        + feature_row("✅", "S - Forces :", "Vos atouts, compétences, ressources", "green")
+        + feature_row("⚠️", "W - Faiblesses :", "Vos lacunes, limites, axes d\'amélioration", "red")
+        + feature_row("🌟", "O - Opportunités :", "Tendances, occasions, atouts externes", "blue")
+        + feature_row("🔥", "T - Menaces :", "Risques, obstacles, compétition", "amber")
+        + takeaway(
+            "🎯 Pourquoi faire un SWOT ?",
+            'Parce que la <strong>connaissance de soi est la base de toute communication authentique</strong>.'
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _examples_card() -> str:
+    """Carte d'exemples SWOT"""
+    return (
+        '<div class="section-card">'
+        + card_title("💡 Exemples concrets")
+        + panel(
+            "✅ Forces (exemple) :",
+            "<ul><li>Voix claire et posée</li><li>Bonne préparation</li><li>Empathie naturelle</li></ul>",
+            "green"
+        )
+        + panel(
+            "⚠️ Faiblesses (exemple) :",
+            "<ul><li>Trac avant les présentations</li><li>Difficulté à improviser</li>"
+            "<li>Timidité en grands groupes</li></ul>",
+            "red"
+        )
+        + panel(
+            "🌟 Opportunités (exemple) :",
+            "<ul><li>Clubs de prise de parole</li><li>Formations en ligne gratuites</li>"
+            "<li>Projets collaboratifs au travail</li></ul>",
+            "blue"
+        )
+        + panel(
+            "🔥 Menaces (exemple) :",
+            "<ul><li>Critiques non constructives</li><li>Comparaison avec d\'autres</li>"
+            "<li>Manque de temps pour pratiquer</li></ul>",
+            "amber"
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _mission() -> str:
+    """Consigne de l'exercice"""
+    return info_box(
+        "🎯 Votre mission :",
+        "<p>Identifiez vos forces, faiblesses, opportunités et menaces pour mieux vous connaître.</p>"
+    )
+
+
+def swot_section() -> None:
+    """Section Analyse SWOT"""
+    st.markdown(_header(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_definition_card(), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_examples_card(), unsafe_allow_html=True)
+    
+    # Interface interactive SWOT améliorée
+    st.markdown("### 📝 Votre analyse SWOT personnelle")
+    
+    # Conteneur pour l'exercice
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    st.markdown(_mission(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(panel("✅ Vos Forces", "", "green"), unsafe_allow_html=True)
+        forces = st.text_area(
+            "Listez vos atouts en communication :",
+            "voix claire, idées structurées, bonne préparation, empathie naturelle",
+            key="swot_forces",
+            height=120,
+            label_visibility="collapsed"
+        )
+        
+        st.markdown(panel("⚠️ Vos Faiblesses", "", "red"), unsafe_allow_html=True)
+        faiblesses = st.text_area(
+            "Listez vos axes d'amélioration :",
+            "stress, timidité, difficulté à improviser, peur du jugement",
+            key="swot_faiblesses",
+            height=120,
+            label_visibility="collapsed"
+        )
+    
+    with col2:
+        st.markdown(panel("🌟 Vos Opportunités", "", "blue"), unsafe_allow_html=True)
+        opportunites = st.text_area(
+            "Listez les occasions autour de vous :",
+            "présentations au travail, clubs de prise de parole, concours d'éloquence, formations en ligne",
+            key="swot_opportunites",
+            height=120,
+            label_visibility="collapsed"
+        )
+        
+        st.markdown(panel("🔥 Vos Menaces", "", "amber"), unsafe_allow_html=True)
+        menaces = st.text_area(
+            "Listez les obstacles potentiels :",
+            "jugements des collègues, comparaison avec d'autres, trac paralysant, manque de temps",
+            key="swot_menaces",
+            height=120,
+            label_visibility="collapsed"
+        )
+    
+    col_btn, col_result = st.columns([1, 3])
+    with col_btn:
+        if st.button("📊 Générer mon SWOT", type="primary", use_container_width=True, key="swot_generate_btn"):
+            get_session().swot = SwotDraft(
+                forces=forces,
+                faiblesses=faiblesses,
+                opportunites=opportunites,
+                menaces=menaces
+            )
+    
+    with col_result:
+        result = get_session().swot
+        if result is not None:
+            st.markdown(
+                result_card(
+                    "📊",
+                    "Votre analyse SWOT est prête !",
+                    '<div class="mt-grid-2">'
+                    + panel("✅ Forces", f'<p>{result.forces}</p>', "green")
+                    + panel("⚠️ Faiblesses", f'<p>{result.faiblesses}</p>', "red")
+                    + panel("🌟 Opportunités", f'<p>{result.opportunites}</p>', "blue")
+                    + panel("🔥 Menaces", f'<p>{result.menaces}</p>', "amber")
+                    + '</div>'
+                ),
+                unsafe_allow_html=True
+            )
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    create_transition(
+        "La matrice TOWS organise STRATÉGIQUEMENT les éléments de SWOT pour passer à l'action."
+    )
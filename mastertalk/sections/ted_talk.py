@@ -0,0 +1,105 @@
+"""Section 1 : Qu'est-ce qu'un TED Talk ?"""
+
+import streamlit as st
+
+from mastertalk.components import create_transition
+from mastertalk.prerender import static_block
+from mastertalk.session import get_session
+from mastertalk.simplifier import simplify
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    card_title,
+    feature_row,
+    quote_block,
+    section_header,
+    success_card,
+    takeaway,
+)
+
+
+@static_block
+def _header() -> str:
+    """Titre principal"""
+    return section_header("🎤", "1. Qu&#39;est-ce qu&#39;un TED Talk ?", "La puissance des idées partagées")
+
+
+@static_block
+def _definition_card() -> str:
+    """Carte de définition TED Talk"""
+    return (
+        '<div class="section-card">'
+        + card_title("📋 Un TED Talk, c&#39;est :")
+        + feature_row("✅", "Une idée forte,", "facile à retenir")
+        + feature_row("✅", "Un discours court", "(≤ 18 minutes)")
+        + feature_row("✅", "Une histoire personnelle", "qui devient une leçon universelle")
+        + feature_row("✅", "Une connexion émotionnelle", "avec le public")
+        + takeaway(
+            "🎯 Pourquoi ça marche ?",
+            'Parce que c&#39;est <strong>simple, humain et authentique</strong>.'
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _one_idea_card() -> str:
+    """Carte The One Idea Rule"""
+    return (
+        '<div class="section-card">'
+        + card_title("⭐ The One Idea Rule")
+        + quote_block('"Un discours = Une seule idée principale."')
+        + feature_row("✔", "Clarté :", "C&#39;est ce qui rend le message clair", "green")
+        + feature_row("✔", "Simplicité :", "C&#39;est ce qui évite la confusion", "blue")
+        + feature_row("✔", "Mémorabilité :", "C&#39;est ce qui rend la présentation mémorable", "violet")
+        + '</div>'
+    )
+
+
+def ted_talk_section() -> None:
+    """Section TED Talk"""
+    st.markdown(_header(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_definition_card(), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_one_idea_card(), unsafe_allow_html=True)
+    
+    # Exercice pratique
+    st.markdown("### 💡 Exercice pratique : The One Idea Rule")
+    
+    # Conteneur pour l'exercice
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    idea = st.text_area(
+        "**Transformez cette idée complexe en une seule idée principale :**",
+        "Je veux parler de motivation, discipline, stress et leadership",
+        key="idea_simplify",
+        height=100
+    )
+    
+    col_btn, col_result = st.columns([1, 3])
+    with col_btn:
+        if st.button("✨ Simplifier", type="primary", use_container_width=True, key="simplify_btn"):
+            # Phrase extraite de la saisie : une seule idée, 7 mots au plus
+            simplified = simplify(idea)
+            if simplified is None:
+                st.warning("Écrivez d'abord votre idée.")
+            get_session().simplified_idea = simplified
+    
+    with col_result:
+        simplified_idea = get_session().simplified_idea
+        if simplified_idea is not None:
+            st.markdown(
+                success_card("Idée simplifiée :", simplified_idea, icon="✓"),
+                unsafe_allow_html=True
+            )
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    create_transition(
+        "Une fois l'idée principale définie, il faut lui donner une direction. Et pour cela, on utilise SMART."
+    )
@@ -0,0 +1,190 @@
+"""Section 6 : Matrice TOWS"""
+
+import streamlit as st
+
+from mastertalk.components import create_transition
+from mastertalk.prerender import static_block
+from mastertalk.session import TowsDraft, get_session
+from mastertalk.templates import (
+    EXERCISE_CLOSE,
+    EXERCISE_OPEN,
+    card_title,
+    feature_row,
+    info_box,
+    panel,
+    quote_block,
+    result_card,
+    section_header,
+    takeaway,
+)
+
+
+@static_block
+def _header() -> str:
+    """Titre principal"""
+    return section_header("🔄", "6. Matrice TOWS", "Transformer la théorie en actions concrètes")
+
+
+@static_block
+def _definition_card() -> str:
+    """Carte explicative TOWS"""
+    return (
+        '<div class="section-card">'
+        + card_title("🔄 Qu\'est-ce que la matrice TOWS ?")
+        + quote_block('"La connaissance n\'a de valeur que si elle est transformée en action."')
+        + feature_row("💪", "SO - Stratégies offensives :", "Utiliser les forces pour saisir les opportunités", "green")
+        + feature_row("🛡️", "ST - Stratégies défensives :", "Utiliser les forces pour contrer les menaces", "amber")
+        + feature_row("🚀", "WO - Stratégies d\'adaptation :", "Transformer les faiblesses en forces grâce aux opportunités", "blue")
+        + feature_row("⚠️", "WT - Stratégies de survie :", "Minimiser les faiblesses pour éviter les menaces", "red")
+        + takeaway(
+            "🎯 L\'avantage TOWS :",
+            'Transforme <strong>l\'analyse en stratégie, la théorie en action concrète</strong>.'
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _examples_card() -> str:
+    """Carte d'exemples TOWS"""
+    return (
+        '<div class="section-card">'
+        + card_title("📋 Exemples de stratégies TOWS")
+        + panel(
+            "💪 SO - Stratégies offensives",
+            "<p>Utiliser ma voix claire pour participer à un concours d\'éloquence</p>",
+            "green"
+        )
+        + panel(
+            "🛡️ ST - Stratégies défensives",
+            "<p>M\'appuyer sur ma bonne préparation pour diminuer le stress du jugement</p>",
+            "amber"
+        )
+        + panel(
+            "🚀 WO - Stratégies d\'adaptation",
+            "<p>Participer à un club de prise de parole pour travailler ma timidité</p>",
+            "blue"
+        )
+        + panel(
+            "⚠️ WT - Stratégies de survie",
+            "<p>Pratiquer la respiration avant chaque présentation pour gérer le trac</p>",
+            "red"
+        )
+        + '</div>'
+    )
+
+
+@static_block
+def _mission() -> str:
+    """Consigne de l'exercice"""
+    return info_box(
+        "🎯 Votre mission :",
+        "<p>Transformez votre analyse SWOT en stratégies d\'action concrètes avec la matrice TOWS.</p>"
+    )
+
+
+def tows_section() -> None:
+    """Section Matrice TOWS"""
+    st.markdown(_header(), unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(_definition_card(), unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(_examples_card(), unsafe_allow_html=True)
+    
+    # Matrice TOWS interactive améliorée
+    st.markdown("### 🎯 Votre stratégie TOWS")
+    
+    # Conteneur pour l'exercice
+    st.markdown(EXERCISE_OPEN, unsafe_allow_html=True)
+    
+    st.markdown(_mission(), unsafe_allow_html=True)
+    
+    cols = st.columns(4)
+    
+    with cols[0]:
+        st.markdown(
+            panel("💪 SO", "<p>Forces + Opportunités</p>", "green"),
+            unsafe_allow_html=True
+        )
+        so_ex = st.text_area(
+            "Exemple :",
+            "Utiliser ma voix claire pour participer à un concours d'éloquence",
+            key="tows_so",
+            height=120,
+            label_visibility="collapsed",
+            help="Comment utiliser vos forces pour saisir les opportunités ?"
+        )
+    
+    with cols[1]:
+        st.markdown(
+            panel("🛡️ ST", "<p>Forces + Menaces</p>", "amber"),
+            unsafe_allow_html=True
+        )
+        st_ex = st.text_area(
+            "Exemple :",
+            "M'appuyer sur ma bonne préparation pour diminuer le stress du jugement",
+            key="tows_st",
+            height=120,
+            label_visibility="collapsed",
+            help="Comment utiliser vos forces pour contrer les menaces ?"
+        )
+    
+    with cols[2]:
+        st.markdown(
+            panel("🚀 WO", "<p>Faiblesses + Opportunités</p>", "blue"),
+            unsafe_allow_html=True
+        )
+        wo_ex = st.text_area(
+            "Exemple :",
+            "Participer à un club de prise de parole pour travailler ma timidité",
+            key="tows_wo",
+            height=120,
+            label_visibility="collapsed",
+            help="Comment transformer vos faiblesses en forces grâce aux opportunités ?"
+        )
+    
+    with cols[3]:
+        st.markdown(
+            panel("⚠️ WT", "<p>Faiblesses + Menaces</p>", "red"),
+            unsafe_allow_html=True
+        )
+        wt_ex = st.text_area(
+            "Exemple :",
+            "Pratiquer la respiration avant chaque présentation pour gérer le trac",
+            key="tows_wt",
+            height=120,
+            label_visibility="collapsed",
+            help="Comment minimiser vos faiblesses pour éviter les menaces ?"
+        )
+    
+    col_btn, col_result = st.columns([1, 3])
+    with col_btn:
+        if st.button("📈 Générer ma matrice TOWS", type="primary", use_container_width=True, key="tows_generate_btn"):
+            get_session().tows = TowsDraft(so=so_ex, st=st_ex, wo=wo_ex, wt=wt_ex)
+    
+    with col_result:
+        matrix = get_session().tows
+        if matrix is not None:
+            st.markdown(
+                result_card(
+                    "🔄",
+                    "Votre matrice TOWS est prête !",
+                    '<div class="mt-grid-2">'
+                    + panel("💪 Forces + Opportunités (SO)", f'<p>{matrix.so}</p>', "green")
+                    + panel("🛡️ Forces + Menaces (ST)", f'<p>{matrix.st}</p>', "amber")
+                    + panel("🚀 Faiblesses + Opportunités (WO)", f'<p>{matrix.wo}</p>', "blue")
+                    + panel("⚠️ Faiblesses + Menaces (WT)", f'<p>{matrix.wt}</p>', "red")
+                    + '</div>'
+                ),
+                unsafe_allow_html=True
+            )
+    
+    st.markdown(EXERCISE_CLOSE, unsafe_allow_html=True)
+    
+    create_transition(
+        "Maintenant, place à l'action : mettons en pratique tout ce que nous avons appris !"
+    )
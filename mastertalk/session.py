@@ -0,0 +1,249 @@
+"""Modèle typé de la session d'un participant
+
+Tout l'état applicatif d'une session tient dans un seul objet SessionData,
+rangé sous une clé unique de st.session_state. Chaque section a son propre
+enregistrement, créé à la première écriture : il vaut None tant que la
+section n'a rien produit. Toutes les classes sont déclarées avec slots
+(pas de __dict__ par instance) et SessionData.nbytes() mesure la taille
+d'une session.
+
+La taille reste bornée : les champs sont fixes, les sections visitées sont
+limitées aux sections du catalogue (mastertalk.catalog), les minuteurs à
+TIMER_DURATIONS, les brouillons à DRAFT_WIDGET_KEYS et les compteurs de
+tirages de l'atelier 3 aux filtres des banques de mastertalk.challenges.
+Seules les saisies des participants ont une longueur variable.
+
+Les valeurs des widgets (paramètre key=) restent gérées par Streamlit dans
+st.session_state ; celles des brouillons (DRAFT_WIDGET_KEYS) sont copiées
+dans SessionData.drafts pour être sauvegardées avec la session (voir
+mastertalk.store).
+"""
+
+import random
+import sys
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Dict, Optional, Set
+
+import streamlit as st
+
+# Clé unique de la session dans st.session_state
+SESSION_KEY = "mastertalk_session"
+
+# Version du format produit par SessionData.to_dict
+SCHEMA_VERSION = 1
+
+# Champs de saisie libre conservés avec la session
+DRAFT_WIDGET_KEYS = (
+    "user_name",
+    "idea_simplify",
+    "smart_goal", "smart_measurable", "smart_achievable", "smart_relevant",
+    "star_s_input", "star_t_input", "star_a_input", "star_r_input",
+    "ecoute_reformulation",
+    "swot_forces", "swot_faiblesses", "swot_opportunites", "swot_menaces",
+    "tows_so", "tows_st", "tows_wo", "tows_wt",
+    "atelier1_idea",
+    "atelier2_sujet_perso", "atelier2_intro", "atelier2_corps", "atelier2_conclusion",
+    "arg1", "arg2", "arg3", "contre_arg", "reponse_contre",
+    "reformulation", "validation_emotion",
+)
+
+
+@dataclass(slots=True)
+class Progress:
+    """Parcours : sections visitées et dernière section affichée"""
+    visited_sections: Set[str] = field(default_factory=set)
+    current_progress: int = 0
+    last_section: str = "Introduction"
+
+
+@dataclass(slots=True)
+class UserProfile:
+    """Profil saisi dans l'introduction"""
+    name: str
+    level: str
+    goal: str
+
+
+@dataclass(slots=True)
+class SmartDraft:
+    """Objectif SMART généré et ses cinq critères"""
+    objectif: str
+    details: Dict[str, str]
+
+
+@dataclass(slots=True)
+class StarDraft:
+    """Histoire STAR générée"""
+    situation: str
+    task: str
+    action: str
+    result: str
+
+
+@dataclass(slots=True)
+class EcouteState:
+    """Exercice de reformulation de la section Écoute active"""
+    success: Optional[bool] = None
+    message: str = ""
+    example: Optional[str] = None
+    tips: Optional[str] = None
+
+
+@dataclass(slots=True)
+class SwotDraft:
+    """Analyse SWOT générée"""
+    forces: str
+    faiblesses: str
+    opportunites: str
+    menaces: str
+
+
+@dataclass(slots=True)
+class TowsDraft:
+    """Matrice TOWS générée"""
+    so: str
+    st: str
+    wo: str
+    wt: str
+
+
+@dataclass(slots=True)
+class DebatState:
+    """Défi et contre-argument de l'atelier 3"""
+    sujet: Optional[str] = None
+    position: str = ""
+    contre_exemple: Optional[str] = None
+    categorie: str = ""
+    niveau: int = 0
+    # Graine et compteurs des tirages sans remise (voir mastertalk.challenges)
+    seed: int = field(default_factory=lambda: random.getrandbits(32))
+    draws: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class TimerState:
+    """Minuteur d'atelier, voir mastertalk.timers"""
+    duration: int
+    running: bool = False
+    deadline: float = 0.0
+    remaining: int = 0
+    finished: bool = False
+
+
+# Enregistrements créés à la demande par SessionData.ensure
+_LAZY_RECORDS = {
+    "ecoute": EcouteState,
+    "debat": DebatState,
+}
+
+# Champs de SessionData qui contiennent un enregistrement (ou None)
+_RECORD_FIELDS = {
+    "progress": Progress,
+    "profile": UserProfile,
+    "smart": SmartDraft,
+    "star": StarDraft,
+    "ecoute": EcouteState,
+    "swot": SwotDraft,
+    "tows": TowsDraft,
+    "debat": DebatState,
+}
+
+
+@dataclass(slots=True)
+class SessionData:
+    """État complet d'une session"""
+    progress: Progress = field(default_factory=Progress)
+    profile: Optional[UserProfile] = None
+    simplified_idea: Optional[str] = None
+    smart: Optional[SmartDraft] = None
+    star: Optional[StarDraft] = None
+    ecoute: Optional[EcouteState] = None
+    swot: Optional[SwotDraft] = None
+    tows: Optional[TowsDraft] = None
+    selected_atelier: Optional[str] = None
+    show_guide_atelier2: bool = False
+    debat: Optional[DebatState] = None
+    show_final_message: bool = False
+    timers: Dict[str, TimerState] = field(default_factory=dict)
+    drafts: Dict[str, Any] = field(default_factory=dict)
+
+    def ensure(self, name: str):
+        """Retourne l'enregistrement nommé, créé vide s'il n'existe pas encore"""
+        record = getattr(self, name)
+        if record is None:
+            record = _LAZY_RECORDS[name]()
+            setattr(self, name, record)
+        return record
+
+    def nbytes(self) -> int:
+        """Taille mémoire de la session, enregistrements compris (octets)"""
+        return deep_sizeof(self)
+
+    def size_report(self) -> Dict[str, int]:
+        """Taille de chaque champ et total de la session (octets)"""
+        report = {f.name: deep_sizeof(getattr(self, f.name)) for f in fields(self)}
+        report["total"] = self.nbytes()
+        return report
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Forme sérialisable en JSON de la session"""
+        data = asdict(self)
+        data["progress"]["visited_sections"] = sorted(self.progress.visited_sections)
+        data["version"] = SCHEMA_VERSION
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SessionData":
+        """Reconstruit une session à partir de to_dict()
+
+        Lève ValueError si le format ne correspond pas à cette version.
+        """
+        if data.get("version") != SCHEMA_VERSION:
+            raise ValueError(f"format de session inconnu : {data.get('version')!r}")
+        values = {}
+        try:
+            for f in fields(cls):
+                if f.name not in data:
+                    continue
+                value = data[f.name]
+                if f.name in _RECORD_FIELDS and value is not None:
+                    value = _RECORD_FIELDS[f.name](**value)
+                elif f.name == "timers":
+                    value = {timer_id: TimerState(**timer) for timer_id, timer in value.items()}
+                values[f.name] = value
+            session = cls(**values)
+        except TypeError as exc:
+            raise ValueError(f"session invalide : {exc}") from exc
+        session.progress.visited_sections = set(session.progress.visited_sections)
+        return session
+
+    def capture_drafts(self, widget_state) -> None:
+        """Copie les brouillons saisis dans les widgets"""
+        for key in DRAFT_WIDGET_KEYS:
+            if key in widget_state:
+                self.drafts[key] = widget_state[key]
+
+
+def deep_sizeof(obj: object, seen: Optional[Set[int]] = None) -> int:
+    """Taille d'un objet et de tout ce qu'il contient, chaque objet compté une fois"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(type(obj), "__slots__"):
+        size += sum(deep_sizeof(getattr(obj, name), seen) for name in type(obj).__slots__)
+    return size
+
+
+def get_session() -> SessionData:
+    """Retourne la session courante, créée à la première réexécution"""
+    if SESSION_KEY not in st.session_state:
+        st.session_state[SESSION_KEY] = SessionData()
+    return st.session_state[SESSION_KEY]
@@ -0,0 +1,153 @@
+"""Fidélité d'une reformulation au message d'origine
+
+Deux mesures complètent la détection des marqueurs d'écoute active
+(mastertalk.keywords), qui ne dit rien du fond :
+
+* similarité : cosinus entre les vecteurs TF-IDF des n-grammes de
+  caractères (3 et 4) des mots porteurs de sens, sans accents. Les
+  n-grammes rapprochent les formes d'un même mot (« jugé », « jugement ») ;
+* couverture : part des mots porteurs de sens du message repris dans la
+  reformulation, au radical près.
+
+Les messages de référence (phrases et scénarios d'écoute du catalogue,
+voir mastertalk.catalog) forment une matrice NumPy calculée une fois par
+version du catalogue : une ligne normalisée par message, une colonne par
+n-gramme vu dans les références. Une reformulation est comparée à toutes
+les références en un seul produit matrice-vecteur ; seuls ses n-grammes
+connus de l'index entrent dans le vecteur, les autres ne comptent que dans
+sa norme.
+"""
+
+import math
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence, Tuple
+
+import numpy as np
+
+from mastertalk.catalog import Entries, get_catalog, labels
+from mastertalk.keywords import fold_text
+from mastertalk.text_analysis import analyze_text
+
+NGRAM_SIZES = (3, 4)
+
+# Deux mots sont rapprochés s'ils partagent ce préfixe (ou si l'un est le
+# début de l'autre) : « peur » / « peurs », « jugé » / « jugement »
+STEM_CHARS = 5
+
+# Seuils d'une reformulation fidèle : l'un ou l'autre suffit
+MIN_SIMILARITY = 0.2
+MIN_COVERAGE = 0.3
+
+@dataclass(frozen=True, slots=True)
+class Fidelity:
+    """Proximité d'une reformulation avec le message d'origine"""
+    similarity: float
+    coverage: float
+    missing: Tuple[str, ...]
+
+    @property
+    def faithful(self) -> bool:
+        """La reformulation reprend le fond du message"""
+        return self.similarity >= MIN_SIMILARITY or self.coverage >= MIN_COVERAGE
+
+
+def _content_words(text: str) -> Tuple[str, ...]:
+    """Mots porteurs de sens, en minuscules et sans accents"""
+    return tuple(fold_text(word)[0] for word in analyze_text(text).content_words)
+
+
+def _ngrams(words: Iterable[str]) -> Counter:
+    counts: Counter = Counter()
+    for word in words:
+        padded = f" {word} "
+        for size in NGRAM_SIZES:
+            counts.update(padded[i:i + size] for i in range(len(padded) - size + 1))
+    return counts
+
+
+def _covers(stem: str, stems: Iterable[str]) -> bool:
+    return any(other.startswith(stem) or stem.startswith(other) for other in stems)
+
+
+class SimilarityIndex:
+    """Matrice TF-IDF précalculée d'un ensemble de messages de référence"""
+
+    def __init__(self, references: Sequence[str]) -> None:
+        grams = [_ngrams(_content_words(text)) for text in references]
+        df: Counter = Counter(gram for counts in grams for gram in counts)
+        total = len(references)
+        # IDF lissé : un n-gramme absent des références garde le poids maximal
+        self._default_idf = math.log(1 + total) + 1
+        self._columns = {gram: column for column, gram in enumerate(df)}
+        self._idf = np.array([math.log((1 + total) / (1 + n)) + 1 for n in df.values()])
+        self._rows = {text: row for row, text in enumerate(references)}
+        self._matrix = np.array([self._weigh(counts) for counts in grams]).reshape(total, len(df))
+        self._stems = {text: self._key_words(text) for text in references}
+        self.scores = lru_cache(maxsize=1024)(self._scores)
+
+    def _weigh(self, counts: Counter) -> np.ndarray:
+        """Vecteur normalisé sur les colonnes de l'index"""
+        tf = np.zeros(len(self._columns))
+        unknown = 0.0
+        for gram, n in counts.items():
+            column = self._columns.get(gram)
+            if column is None:
+                unknown += ((1 + math.log(n)) * self._default_idf) ** 2
+            else:
+                tf[column] = 1 + math.log(n)
+        vector = tf * self._idf
+        norm = math.sqrt(float(vector @ vector) + unknown)
+        return vector / norm if norm else vector
+
+    def _scores(self, text: str) -> np.ndarray:
+        """Cosinus d'un texte avec chaque référence, dans l'ordre de l'index (mémoïsé par texte)"""
+        return self._matrix @ self._weigh(_ngrams(_content_words(text)))
+
+    def _similarity(self, reference: str, reformulation: str) -> float:
+        row = self._rows.get(reference)
+        if row is not None:
+            return float(self.scores(reformulation)[row])
+        # Référence hors index (ancien export) : les deux textes sont pesés sur leurs n-grammes communs
+        a, b = _ngrams(_content_words(reference)), _ngrams(_content_words(reformulation))
+        grams = list(a.keys() | b.keys())
+        idf = np.array([
+            self._idf[self._columns[gram]] if gram in self._columns else self._default_idf
+            for gram in grams
+        ])
+        va = np.array([1 + math.log(a[gram]) if a[gram] else 0.0 for gram in grams]) * idf
+        vb = np.array([1 + math.log(b[gram]) if b[gram] else 0.0 for gram in grams]) * idf
+        norm = math.sqrt(float(va @ va) * float(vb @ vb))
+        return float(va @ vb) / norm if norm else 0.0
+
+    @staticmethod
+    def _key_words(text: str) -> Dict[str, str]:
+        """Radical (sans accents) -> mot tel qu'écrit, pour les mots porteurs de sens"""
+        words = analyze_text(text).content_words
+        return {folded[:STEM_CHARS]: word for folded, word in zip(_content_words(text), words)}
+
+    def compare(self, reference: str, reformulation: str) -> Fidelity:
+        """Similarité et couverture d'une reformulation par rapport à la référence"""
+        similarity = self._similarity(reference, reformulation)
+        key_words = self._stems.get(reference) or self._key_words(reference)
+        stems = {word[:STEM_CHARS] for word in _content_words(reformulation)}
+        missing = tuple(word for stem, word in key_words.items() if not _covers(stem, stems))
+        coverage = 1 - len(missing) / len(key_words) if key_words else 0.0
+        return Fidelity(round(similarity, 3), round(coverage, 3), missing)
+
+
+@lru_cache(maxsize=1)
+def _reference_index(phrases: Entries, scenarios: Entries) -> SimilarityIndex:
+    return SimilarityIndex([*labels(phrases), *(scenario.text for scenario in scenarios)])
+
+
+def reference_index() -> SimilarityIndex:
+    """Index des messages à reformuler du catalogue, reconstruit s'ils changent"""
+    catalog = get_catalog()
+    return _reference_index(catalog.ecoute_phrases, catalog.listening_scenarios)
+
+
+def fidelity(reference: str, reformulation: str) -> Fidelity:
+    """Fidélité d'une reformulation à un message de référence"""
+    return reference_index().compare(reference, reformulation)
@@ -0,0 +1,136 @@
+"""Simplification extractive d'une idée en une phrase courte
+
+Le texte est découpé en propositions (ponctuation et conjonctions « et »,
+« mais », « car »...). Chaque mot porteur de sens reçoit un poids selon sa
+fréquence et sa longueur. Toutes les suites de mots d'une proposition,
+de MAX_IDEA_WORDS mots au plus, sont des candidates. Elles sont notées
+par la somme des poids de leurs mots, avec un bonus pour un début de
+proposition (le sujet) et une pénalité pour une phrase qui commence sur
+un mot outil ; une phrase qui finit sur un mot outil (« de », « les »,
+« quand »...) n'est pas retenue.
+
+La meilleure candidate est rendue comme une phrase, sans rien inventer.
+Tout est local et mémoïsé par texte.
+"""
+
+import math
+import re
+from collections import Counter
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from mastertalk.scoring import MAX_IDEA_WORDS
+from mastertalk.text_analysis import STOPWORDS, normalize_apostrophes
+
+# Les propositions sont séparées par la ponctuation et par ces conjonctions
+CLAUSE_BREAK = re.compile(r"[.!?;:,()…\n]+|\s(?:et|mais|ou|car|donc|or|puis)\s", re.IGNORECASE)
+WORD = re.compile(r"[^\W_]+(?:[-'][^\W_]+)*")
+
+# Mots outils qui peuvent ouvrir une phrase (déterminants, pronoms sujets)
+OPENERS = frozenset("""
+le la les l un une des du ce cet cette ces mon ma mes ton ta tes son sa ses notre nos votre vos
+leur leurs je j tu il elle on nous vous ils elles chaque tout toute tous toutes
+""".split())
+
+# Mots du discours sur le discours (« je voudrais vous parler de... ») : peu de poids
+DISCOURSE_WORDS = frozenset("""
+pense crois trouve veux voudrais vais aimerais souhaite souhaiterais parler expliquer présenter
+montrer dire partager aujourd'hui vraiment toujours jamais
+""".split())
+DISCOURSE_WEIGHT = 0.3
+
+# Bonus d'une candidate qui commence sa proposition ; pénalités d'une
+# candidate ouverte par un mot outil, et d'une candidate coupée au milieu
+# d'un groupe de mots (retenue seulement faute de mieux)
+CLAUSE_START_BONUS = 0.5
+DANGLING_PENALTY = 1.0
+MID_CLAUSE_PENALTY = 10.0
+# Léger coût par mot outil : à poids égal, la phrase la plus courte l'emporte
+FILLER_COST = 0.05
+
+# Nombre de suggestions proposées dans l'atelier 1
+SUGGESTIONS = 3
+
+
+def _head(word: str) -> str:
+    """Mot en minuscules sans l'élision (« l'écoute » -> « écoute »)"""
+    word = word.lower()
+    if "'" in word:
+        prefix, rest = word.split("'", 1)
+        if prefix in STOPWORDS or prefix in OPENERS:
+            return rest
+    return word
+
+
+def _opens(word: str) -> bool:
+    """Le mot peut ouvrir une phrase : déterminant, pronom, ou élision (« l'écoute »)"""
+    word = word.lower()
+    return word in OPENERS or word.split("'", 1)[0] in OPENERS and "'" in word
+
+
+def _is_content(head: str) -> bool:
+    return len(head) >= 3 and head not in STOPWORDS and not head.isdigit()
+
+
+@lru_cache(maxsize=1024)
+def _candidates(text: str) -> Tuple[Tuple[float, int, str], ...]:
+    """Candidates (score, position, phrase), de la meilleure à la moins bonne"""
+    clauses = [WORD.findall(part) for part in CLAUSE_BREAK.split(normalize_apostrophes(text))]
+    clauses = [words for words in clauses if words]
+    heads = [[_head(word) for word in words] for words in clauses]
+
+    frequency = Counter(head for clause in heads for head in clause if _is_content(head))
+    weights = {
+        head: n * math.log(1 + len(head)) * (DISCOURSE_WEIGHT if head in DISCOURSE_WORDS else 1.0)
+        for head, n in frequency.items()
+    }
+
+    scored = []
+    position = 0
+    for words, clause_heads in zip(clauses, heads):
+        for start in range(len(words)):
+            for end in range(start + 1, min(start + MAX_IDEA_WORDS, len(words)) + 1):
+                span = clause_heads[start:end]
+                if span[-1] not in weights:
+                    continue
+                weight = sum(weights.get(head, 0.0) for head in span)
+                score = weight - FILLER_COST * sum(head not in weights for head in span)
+                if start == 0:
+                    score += CLAUSE_START_BONUS
+                elif not _opens(words[start]):
+                    score -= MID_CLAUSE_PENALTY
+                if span[0] not in weights and not _opens(words[start]):
+                    score -= DANGLING_PENALTY
+                scored.append((round(score, 4), position + start, " ".join(words[start:end])))
+        position += len(words)
+    # Meilleur score d'abord ; à score égal, la candidate la plus proche du début
+    scored.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+    return tuple(scored)
+
+
+def _sentence(phrase: str) -> str:
+    return phrase[0].upper() + phrase[1:] + "."
+
+
+@lru_cache(maxsize=1024)
+def simplify(text: str) -> Optional[str]:
+    """Une seule idée, en MAX_IDEA_WORDS mots au plus, extraite du texte"""
+    candidates = _candidates(text)
+    return _sentence(candidates[0][2]) if candidates else None
+
+
+@lru_cache(maxsize=1024)
+def suggestions(text: str, limit: int = SUGGESTIONS) -> Tuple[str, ...]:
+    """Plusieurs reformulations courtes distinctes, de la meilleure à la moins bonne"""
+    chosen: List[str] = []
+    seen_words: List[set] = []
+    for _, _, phrase in _candidates(text):
+        words = set(_head(word) for word in WORD.findall(phrase))
+        # Une suggestion qui reprend la moitié des mots d'une autre n'apporte rien
+        if any(len(words & other) * 2 > min(len(words), len(other)) for other in seen_words):
+            continue
+        chosen.append(_sentence(phrase))
+        seen_words.append(words)
+        if len(chosen) == limit:
+            break
+    return tuple(chosen)
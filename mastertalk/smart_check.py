@@ -0,0 +1,183 @@
+"""Vérification des cinq critères d'un objectif SMART
+
+Des expressions régulières compilées à l'import repèrent dans les champs
+les quantités (« 3 minutes », « 80 % », « deux fois »), les durées et les
+échéances (« dans 1 mois », « d'ici juin », « avant le 15/03 »). Chaque
+critère reçoit un verdict (respecté ou non, avec un conseil) :
+
+* Spécifique : l'objectif nomme une action précise, pas seulement « mieux »
+  (jugé sur l'objectif seul) ;
+* Mesurable : la mesure (ou à défaut l'objectif) contient au moins une quantité ;
+* Atteignable et Relevant : une justification est donnée ;
+* Temporel : une échéance figure dans le délai ou dans un autre champ.
+
+validate() est mémoïsé sur les cinq champs et ne coûte que quelques
+dizaines de microsecondes : on peut vérifier les objectifs d'une promotion
+entière (voir mastertalk.scoring).
+"""
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from mastertalk.text_analysis import analyze_text, normalize_apostrophes
+
+CRITERIA = ("S", "M", "A", "R", "T")
+
+# Nombres écrits en lettres et unités reconnues après un nombre. « un » et
+# « une » sont le plus souvent des articles (« une présentation ») : ils ne
+# comptent comme nombre que devant une unité de temps ou « fois »
+_NUMBER_WORDS = (
+    "deux|trois|quatre|cinq|six|sept|huit|neuf|dix|onze|douze|quinze|vingt|"
+    "trente|quarante|cinquante|soixante|cent|mille"
+)
+_ONE = "une?"
+_TIME_UNITS = r"secondes?|sec|s|minutes?|min|heures?|h|jours?|semaines?|mois|ans?|années?"
+_UNITS = (
+    _TIME_UNITS + r"|fois|%|pour ?cent|personnes?|participants?|slides?|diapositives?|pages?|mots?"
+    r"|présentations?|discours|exposés?|réunions?|questions?|€|euros?|km|kg|points?"
+)
+
+_MONTHS = "janvier|février|fevrier|mars|avril|mai|juin|juillet|août|aout|septembre|octobre|novembre|décembre|decembre"
+
+# Quantité chiffrée (unité facultative) ou écrite en lettres (unité obligatoire) ;
+# les dates (« 15/03 », « 12 mars », « le 1er juin ») sont reconnues pour être écartées
+QUANTITY = re.compile(
+    r"(?P<date>\b(?:\d{1,2}/\d{1,2}(?:/\d{2,4})?|\d{1,2}[.-]\d{1,2}[.-]\d{2,4})\b"
+    rf"|\b\d{{1,2}}(?:er)?\s+(?:{_MONTHS})\b)"
+    rf"|(?P<value>\d+(?:[.,]\d+)?)\s*(?P<unit>(?:{_UNITS})\b|%)?"
+    rf"|\b(?P<word>{_NUMBER_WORDS})\s+(?P<word_unit>(?:{_UNITS})\b)"
+    rf"|\b(?P<one>{_ONE})\s+(?P<one_unit>(?:{_TIME_UNITS}|fois)\b)",
+    re.IGNORECASE,
+)
+# Année seule (« en 2025 ») : une échéance, pas une quantité
+YEAR = re.compile(r"(?:19|20)\d\d")
+DURATION = re.compile(rf"\b(?:\d+|{_ONE}|{_NUMBER_WORDS})\s*(?:{_TIME_UNITS})\b", re.IGNORECASE)
+# Échéance : « dans 3 semaines », « d'ici juin », « avant le 15/03 », « le 30 juin »,
+# « fin juin », « en 2026 »... (« en 3 minutes » est une durée de prise de parole,
+# pas une échéance)
+DEADLINE = re.compile(
+    r"\b(?:dans|d'ici|avant|pour|jusqu'(?:à|au|en))\s+(?:le\s+|la\s+|l'|fin\s+|la\s+fin\s+d[eu]\s+)?"
+    rf"(?:\d{{1,2}}/\d{{1,2}}(?:/\d{{2,4}})?|\d+\s*(?:{_TIME_UNITS})|(?:{_ONE}|{_NUMBER_WORDS})\s+(?:{_TIME_UNITS})"
+    rf"|\d{{1,2}}\s+(?:{_MONTHS})|(?:{_MONTHS})|\d{{4}}|semaine|mois|année|trimestre)\b"
+    rf"|\ben\s+(?:{_MONTHS}|\d{{4}})\b"
+    rf"|\b\d{{1,2}}(?:er)?\s+(?:{_MONTHS})\b"
+    rf"|\b(?:(?:fin|début)\s+|mi-)(?:{_MONTHS})\b"
+    r"|\b\d{1,2}[/.-]\d{1,2}[/.-]\d{2,4}\b"
+    r"|\b(?:demain|la semaine prochaine|le mois prochain|l'an prochain|cette semaine|ce mois-ci|fin (?:du mois|de l'année))\b",
+    re.IGNORECASE,
+)
+
+# Verbes et adverbes qui signalent un objectif vague
+VAGUE = re.compile(
+    r"\b(?:mieux|plus|davantage|beaucoup|bien|améliorer|progresser|un peu|être meilleur|être à l'aise)\b",
+    re.IGNORECASE,
+)
+
+# Mots porteurs de sens minimaux pour une justification (A, R) ou un objectif précis (S)
+MIN_CONTENT_WORDS = 2
+
+
+@dataclass(frozen=True, slots=True)
+class Quantity:
+    """Quantité repérée dans un champ"""
+    value: str
+    unit: Optional[str]
+    text: str
+
+
+@dataclass(frozen=True, slots=True)
+class Criterion:
+    """Verdict d'un critère SMART"""
+    ok: bool
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class SmartVerdict:
+    """Verdict complet d'un objectif"""
+    criteria: Dict[str, Criterion]
+    quantities: Tuple[Quantity, ...]
+    deadline: Optional[str]
+
+    @property
+    def score(self) -> int:
+        """Nombre de critères respectés, sur 5"""
+        return sum(criterion.ok for criterion in self.criteria.values())
+
+    @property
+    def flagged(self) -> Tuple[str, ...]:
+        """Critères non respectés"""
+        return tuple(letter for letter, criterion in self.criteria.items() if not criterion.ok)
+
+
+def extract_quantities(text: str) -> Tuple[Quantity, ...]:
+    """Quantités d'un texte, dans l'ordre"""
+    found = []
+    for match in QUANTITY.finditer(text):
+        if match.group("date"):
+            continue
+        if match.group("value"):
+            if match.group("unit") is None and YEAR.fullmatch(match.group("value")):
+                continue
+            found.append(Quantity(match.group("value"), match.group("unit"), match.group(0).strip()))
+        elif match.group("word"):
+            found.append(Quantity(match.group("word").lower(), match.group("word_unit"), match.group(0)))
+        else:
+            found.append(Quantity(match.group("one").lower(), match.group("one_unit"), match.group(0)))
+    return tuple(found)
+
+
+def extract_deadline(deadline: str, *others: str) -> Optional[str]:
+    """Première échéance trouvée dans le champ délai puis dans les autres champs, ou None
+
+    Une durée seule (« 3 mois ») n'est une échéance que dans le champ délai :
+    ailleurs, « 10 minutes » est la durée de la prise de parole.
+    """
+    match = DEADLINE.search(deadline) or DURATION.fullmatch(deadline.strip())
+    if match:
+        return match.group(0)
+    for text in others:
+        match = DEADLINE.search(text)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _content_words(text: str) -> int:
+    return len(analyze_text(text).content_words)
+
+
+@lru_cache(maxsize=4096)
+def validate(objective: str, measurable: str, achievable: str, relevant: str, deadline: str) -> SmartVerdict:
+    """Verdict des cinq critères pour les champs de la section SMART"""
+    objective, measurable, achievable, relevant, deadline = (
+        normalize_apostrophes(field.strip())
+        for field in (objective, measurable, achievable, relevant, deadline)
+    )
+    quantities = extract_quantities(measurable) or extract_quantities(objective)
+    found_deadline = extract_deadline(deadline, objective, measurable)
+
+    # Une quantité dans l'objectif lui-même précise un verbe vague (« parler 3 minutes de plus »)
+    vague = VAGUE.search(objective)
+    specific = _content_words(objective) >= MIN_CONTENT_WORDS and not (vague and not extract_quantities(objective))
+    achievable_ok = _content_words(achievable) >= MIN_CONTENT_WORDS
+    relevant_ok = _content_words(relevant) >= MIN_CONTENT_WORDS
+
+    if specific:
+        specific_message = "Objectif précis"
+    elif vague:
+        specific_message = f"« {vague.group(0)} » reste vague : dites exactement ce que vous ferez"
+    else:
+        specific_message = "Décrivez l'action visée en quelques mots"
+    criteria = {
+        "S": Criterion(specific, specific_message),
+        "M": Criterion(bool(quantities), ", ".join(q.text for q in quantities) if quantities
+                       else "Aucune quantité : ajoutez un chiffre (durée, nombre de fois, pourcentage…)"),
+        "A": Criterion(achievable_ok, "Justifié" if achievable_ok
+                       else "Expliquez sur quoi vous vous appuyez (ressources, réussites passées)"),
+        "R": Criterion(relevant_ok, "Justifié" if relevant_ok else "Dites à quoi cet objectif vous sert"),
+        "T": Criterion(found_deadline is not None, found_deadline or "Aucune échéance : fixez une date ou un délai"),
+    }
+    return SmartVerdict(criteria, quantities, found_deadline)
@@ -0,0 +1,147 @@
+"""Estimation de la durée d'un texte lu à voix haute
+
+La durée dépend moins du nombre de mots que du nombre de syllabes
+prononcées et des pauses marquées par la ponctuation. Pour un texte :
+
+    durée = syllabes / débit + somme des pauses
+
+Les syllabes sont comptées par groupes de voyelles, avec les règles
+courantes du français : « e » final muet (« idée » = 2), « é », « ï »,
+« ü » et « ë » qui ouvrent une nouvelle syllabe (« réalité » = 4), sigles
+épelés (« SMS » = 3), nombres lus en toutes lettres (environ 1,5 syllabe
+par chiffre). Les terminaisons verbales en « -ent » ne sont pas
+distinguées des noms (« moment ») : l'estimation reste une estimation.
+
+La mesure d'un texte (syllabes et pauses) ne dépend pas du débit : elle
+est mémoïsée par contenu et un changement de débit ne la refait pas.
+Pour un lot (estimate_many), chaque texte distinct est mesuré une fois et
+les durées à un ou plusieurs débits sont calculées sur des tableaux NumPy.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, Sequence, Tuple, Union
+
+import numpy as np
+
+from mastertalk.text_analysis import normalize_apostrophes
+
+# Débits de parole en syllabes par seconde
+SPEAKING_RATES: Dict[str, float] = {
+    "Posé": 3.5,
+    "Naturel": 4.5,
+    "Rapide": 5.5,
+}
+DEFAULT_RATE = "Naturel"
+
+# Durée des pauses (secondes) selon la ponctuation
+COMMA_PAUSE = 0.25
+CLAUSE_PAUSE = 0.4
+SENTENCE_PAUSE = 0.6
+ELLIPSIS_PAUSE = 0.8
+LINE_PAUSE = 0.3
+
+# Syllabes prononcées par chiffre d'un nombre (« 2024 » = 6)
+DIGIT_SYLLABLES = 1.5
+
+_TOKEN = re.compile(
+    r"""
+    (?P<number>\d+(?:[.,]\d+)*)
+    |(?P<word>[^\W\d_]+)
+    |(?P<pause>\.{2,}|…|[.!?]+|[;:]|,|\n+)
+    """,
+    re.VERBOSE,
+)
+
+# Noyau de syllabe : voyelle accentuée qui rompt la diphtongue, ou groupe de voyelles
+_NUCLEUS = re.compile(r"[éïüë]|[aeiouyàâäèêîôöûùÿœæ]+")
+
+_PAUSES = {",": COMMA_PAUSE, ";": CLAUSE_PAUSE, ":": CLAUSE_PAUSE, "…": ELLIPSIS_PAUSE}
+
+
+@dataclass(frozen=True, slots=True)
+class SpeechEstimate:
+    """Durée estimée d'un texte à un débit donné"""
+    syllables: int
+    pauses: float
+    seconds: float
+
+
+@lru_cache(maxsize=8192)
+def word_syllables(word: str) -> int:
+    """Nombre de syllabes prononcées d'un mot en minuscules"""
+    nuclei = _NUCLEUS.findall(word)
+    if not nuclei:
+        # Sigle sans voyelle, épelé lettre par lettre ; « l' », « j' » : aucune
+        return len(word) if len(word) > 1 else 0
+    count = len(nuclei)
+    # « e » final muet : idée, une, vies (mais pas « le », « ces »)
+    if count > 1 and nuclei[-1] == "e" and (word.endswith("e") or word.endswith("es")):
+        count -= 1
+    return count
+
+
+def _pause(mark: str) -> float:
+    if mark[0] == "\n":
+        return LINE_PAUSE
+    if len(mark) > 1 and mark[0] == ".":
+        return ELLIPSIS_PAUSE
+    return _PAUSES.get(mark, SENTENCE_PAUSE)
+
+
+@lru_cache(maxsize=4096)
+def measure(text: str) -> Tuple[int, float]:
+    """Syllabes et secondes de pause d'un texte (mémoïsé par contenu)"""
+    syllables = 0
+    digits = 0
+    pauses = 0.0
+    for number, word, mark in _TOKEN.findall(normalize_apostrophes(text).lower()):
+        if word:
+            syllables += word_syllables(word)
+        elif number:
+            digits += sum(char.isdigit() for char in number)
+        else:
+            pauses += _pause(mark)
+    return syllables + round(digits * DIGIT_SYLLABLES), round(pauses, 2)
+
+
+def estimate(text: str, rate: float = SPEAKING_RATES[DEFAULT_RATE]) -> SpeechEstimate:
+    """Durée de lecture d'un texte au débit donné (syllabes par seconde)"""
+    syllables, pauses = measure(text)
+    # Arrondi au dixième supérieur à partir de 0,05, calculé comme SpeechBatch.seconds
+    return SpeechEstimate(syllables, pauses, math.floor((syllables / rate + pauses) * 10 + 0.5) / 10)
+
+
+@dataclass(frozen=True, eq=False)
+class SpeechBatch:
+    """Mesures d'une série de textes, en tableaux alignés sur les textes"""
+    syllables: np.ndarray
+    pauses: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.syllables)
+
+    def seconds(self, rate: Union[float, Sequence[float]] = SPEAKING_RATES[DEFAULT_RATE]) -> np.ndarray:
+        """Durées en secondes au débit donné ; pour plusieurs débits, une colonne par débit"""
+        rates = np.asarray(rate, dtype=float)
+        if rates.ndim:
+            seconds = self.syllables[:, None] / rates + self.pauses[:, None]
+        else:
+            seconds = self.syllables / rates + self.pauses
+        # Même arrondi que estimate()
+        return np.floor(seconds * 10 + 0.5) / 10
+
+
+def estimate_many(texts: Iterable[str]) -> SpeechBatch:
+    """Mesures d'une série de textes, dans l'ordre
+
+    Chaque texte distinct n'est mesuré qu'une fois, hors du cache de
+    measure() : un gros lot n'en chasse pas les textes de l'application.
+    """
+    texts = list(texts)
+    distinct = {text: index for index, text in enumerate(dict.fromkeys(texts))}
+    measured = np.array([measure.__wrapped__(text) for text in distinct], dtype=float).reshape(-1, 2)
+    rows = np.fromiter(map(distinct.__getitem__, texts), dtype=np.intp, count=len(texts))
+    return SpeechBatch(measured[rows, 0].astype(int), measured[rows, 1])
@@ -0,0 +1,361 @@
+"""Stockages des sessions sauvegardées, partageables entre processus
+
+Un processus Streamlit n'utilise qu'un cœur : une grande promotion est
+répartie sur plusieurs processus derrière un proxy local. Pour qu'un
+participant retrouve son parcours quel que soit le processus qui le
+reçoit, les sessions (voir mastertalk.store) sont rangées dans un
+stockage commun, choisi par la variable d'environnement
+MASTERTALK_STATE_URL :
+
+* sqlite:///chemin/sessions.sqlite3 (défaut : data/sessions.sqlite3) :
+  comme avec SQLAlchemy, trois barres donnent un chemin relatif à la
+  racine du projet (sqlite:///data/sessions.sqlite3) et quatre un chemin
+  absolu (sqlite:////var/lib/mastertalk/sessions.sqlite3) ;
+* redis://hôte:port/base : tout serveur qui parle le protocole Redis
+  (RESP). Le client n'utilise que GET et SET ; pour travailler en local,
+  un serveur de remplacement en mémoire est fourni :
+
+    python -m mastertalk.state_backends serve --port 6379
+
+Exemple avec deux processus :
+
+    MASTERTALK_STATE_URL=redis://127.0.0.1:6379/0 streamlit run app.py --server.port 8501
+    MASTERTALK_STATE_URL=redis://127.0.0.1:6379/0 streamlit run app.py --server.port 8502
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from mastertalk.constants import BASE_DIR, DATA_DIR
+
+# Variable d'environnement qui choisit le stockage
+STATE_URL_ENV = "MASTERTALK_STATE_URL"
+
+SQLITE_PATH = DATA_DIR / "sessions.sqlite3"
+
+# Préfixe des clés des sessions dans un stockage Redis
+REDIS_KEY_PREFIX = "mastertalk:session:"
+REDIS_TIMEOUT = 5.0
+
+# Nouveaux essais après une erreur réseau, délai doublé à chaque essai (secondes)
+REDIS_RETRIES = 3
+REDIS_RETRY_DELAY = 0.2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    token TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class StateBackend(ABC):
+    """Stockage clé -> session sérialisée (JSON)"""
+
+    @abstractmethod
+    def get(self, token: str) -> Optional[str]:
+        """Session sérialisée de ce jeton, ou None"""
+
+    @abstractmethod
+    def put_many(self, items: Dict[str, str]) -> None:
+        """Écrit plusieurs sessions en une fois"""
+
+    def purge(self, max_age: float) -> None:
+        """Supprime les sessions inactives depuis plus de max_age secondes"""
+
+    def close(self) -> None:
+        """Libère les connexions"""
+
+
+class SQLiteBackend(StateBackend):
+    """Sessions dans une base SQLite (mode WAL, partageable entre processus)"""
+
+    def __init__(self, path: Path = SQLITE_PATH) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(SCHEMA)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, token: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT data FROM sessions WHERE token = ?", (token,)).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT INTO sessions (token, data, updated_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(token) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at",
+                [(token, payload, now) for token, payload in items.items()],
+            )
+
+    def purge(self, max_age: float) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM sessions WHERE updated_at < ?", (time.time() - max_age,))
+
+
+class RedisError(Exception):
+    """Réponse d'erreur d'un serveur Redis"""
+
+
+class RedisBackend(StateBackend):
+    """Sessions dans un serveur Redis (ou compatible), expirées par le serveur
+
+    Une seule connexion par processus, protégée par un verrou. Après une
+    erreur réseau (serveur redémarré, coupure), elle est rouverte et la
+    commande renvoyée jusqu'à REDIS_RETRIES fois ; GET et SET peuvent être
+    rejoués sans risque. Les écritures groupées partent en une seule fois
+    (pipeline).
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 6379, db: int = 0,
+                 max_age: Optional[float] = None) -> None:
+        self.address = (host, port)
+        self.db = db
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._execute([("PING",)])
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection(self.address, timeout=REDIS_TIMEOUT)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+        if self.db:
+            try:
+                self._roundtrip([("SELECT", str(self.db))])
+            except (OSError, RedisError):
+                self.close()
+                raise
+
+    def _execute(self, commands: List[Tuple[str, ...]]) -> List:
+        with self._lock:
+            for attempt in range(REDIS_RETRIES + 1):
+                try:
+                    if self._sock is None:
+                        self._connect()
+                    return self._roundtrip(commands)
+                except OSError:
+                    # Connexion perdue ou serveur en cours de redémarrage
+                    self.close()
+                    if attempt == REDIS_RETRIES:
+                        raise
+                    time.sleep(REDIS_RETRY_DELAY * 2 ** attempt)
+
+    def _roundtrip(self, commands: List[Tuple[str, ...]]) -> List:
+        self._sock.sendall(b"".join(encode_command(*command) for command in commands))
+        replies = [read_reply(self._reader) for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def get(self, token: str) -> Optional[str]:
+        payload = self._execute([("GET", REDIS_KEY_PREFIX + token)])[0]
+        return payload.decode("utf-8") if payload is not None else None
+
+    def put_many(self, items: Dict[str, str]) -> None:
+        expiry = ("EX", str(int(self.max_age))) if self.max_age else ()
+        self._execute([("SET", REDIS_KEY_PREFIX + token, payload, *expiry) for token, payload in items.items()])
+
+    def close(self) -> None:
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = self._reader = None
+
+
+def encode_command(*args: str) -> bytes:
+    """Commande au format RESP (tableau de chaînes binaires)"""
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        data = arg.encode("utf-8")
+        parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+    return b"".join(parts)
+
+
+def read_reply(reader):
+    """Lit une réponse RESP ; une erreur est renvoyée (pas levée) sous forme de RedisError"""
+    line = reader.readline()
+    if not line:
+        raise ConnectionError("connexion fermée par le serveur")
+    kind, body = line[:1], line[1:-2]
+    if kind == b"+":
+        return body.decode("utf-8")
+    if kind == b"-":
+        return RedisError(body.decode("utf-8"))
+    if kind == b":":
+        return int(body)
+    if kind == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        return data[:-2]
+    if kind == b"*":
+        length = int(body)
+        return None if length < 0 else [read_reply(reader) for _ in range(length)]
+    raise RedisError(f"réponse RESP inattendue : {line!r}")
+
+
+def sqlite_path(url_path: str) -> Path:
+    """Chemin d'une URL sqlite:// : relatif à la racine du projet, absolu avec une barre de plus"""
+    # urlsplit garde la barre qui suit l'hôte (vide) : on la retire
+    path = url_path[1:]
+    if not path:
+        return SQLITE_PATH
+    return Path(path) if Path(path).is_absolute() else BASE_DIR / path
+
+
+def open_backend(url: Optional[str] = None, max_age: Optional[float] = None) -> StateBackend:
+    """Stockage désigné par l'URL (ou MASTERTALK_STATE_URL), SQLite par défaut"""
+    url = url or os.environ.get(STATE_URL_ENV, "")
+    if not url:
+        return SQLiteBackend()
+    parts = urlsplit(url)
+    if parts.scheme == "sqlite":
+        return SQLiteBackend(sqlite_path(parts.path))
+    if parts.scheme == "redis":
+        db = int(parts.path.strip("/") or 0)
+        return RedisBackend(parts.hostname or "127.0.0.1", parts.port or 6379, db, max_age)
+    raise ValueError(f"{STATE_URL_ENV} : schéma non pris en charge ({parts.scheme!r})")
+
+
+# ============================================================================
+# SERVEUR REDIS DE REMPLACEMENT (DÉVELOPPEMENT LOCAL)
+# ============================================================================
+
+class MemoryRedis:
+    """Sous-ensemble de Redis en mémoire : PING, SELECT, GET, SET [EX], DEL, EXISTS, DBSIZE, FLUSHDB"""
+
+    def __init__(self) -> None:
+        # Clé -> (valeur, échéance ou None)
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+
+    def _live(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.time():
+            del self.data[key]
+            return None
+        return value
+
+    def execute(self, args: List[bytes]):
+        command = args[0].upper()
+        if command == b"PING":
+            return "PONG"
+        if command == b"SELECT":
+            # Une seule base : le numéro est ignoré
+            return "OK"
+        if command == b"FLUSHDB":
+            self.data.clear()
+            return "OK"
+        if command == b"GET":
+            return self._live(args[1])
+        if command == b"SET":
+            expires_at = None
+            if len(args) >= 5 and args[3].upper() == b"EX":
+                expires_at = time.time() + int(args[4])
+            self.data[args[1]] = (args[2], expires_at)
+            return "OK"
+        if command == b"DEL":
+            return sum(self.data.pop(key, None) is not None for key in args[1:])
+        if command == b"EXISTS":
+            return sum(self._live(key) is not None for key in args[1:])
+        if command == b"DBSIZE":
+            return len(self.data)
+        return RedisError(f"ERR unknown command '{args[0].decode('utf-8', 'replace')}'")
+
+
+def encode_reply(value) -> bytes:
+    """Réponse au format RESP"""
+    if value is None:
+        return b"$-1\r\n"
+    if isinstance(value, RedisError):
+        return b"-%s\r\n" % str(value).encode("utf-8")
+    if isinstance(value, str):
+        return b"+%s\r\n" % value.encode("utf-8")
+    if isinstance(value, int):
+        return b":%d\r\n" % value
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+async def _read_command(reader: asyncio.StreamReader) -> Optional[List[bytes]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # Commande en ligne (redis-cli, telnet)
+        return line.split()
+    args = []
+    for _ in range(int(line[1:-2])):
+        length = int((await reader.readline())[1:-2])
+        args.append((await reader.readexactly(length + 2))[:-2])
+    return args
+
+
+async def serve(host: str, port: int) -> None:
+    """Serveur RESP en mémoire, pour faire tourner plusieurs processus en local"""
+    store = MemoryRedis()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                args = await _read_command(reader)
+                if not args:
+                    break
+                if args[0].upper() == b"QUIT":
+                    writer.write(encode_reply("OK"))
+                    break
+                writer.write(encode_reply(store.execute(args)))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    print(f"Serveur Redis de remplacement sur {host}:{port} (Ctrl+C pour arrêter)")
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Stockage partagé des sessions MasterTalk")
+    parser.add_argument("command", choices=["serve"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
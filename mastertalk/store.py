@@ -0,0 +1,211 @@
+"""Sauvegarde des sessions
+
+Chaque participant est identifié par un jeton placé dans l'URL
+(?session=...). Rouvrir ce lien après une coupure réseau ou un redémarrage
+du serveur restaure le parcours, les résultats générés et les brouillons.
+Les sessions sont rangées dans un stockage choisi par MASTERTALK_STATE_URL
+(SQLite par défaut, ou un serveur Redis partagé par plusieurs processus,
+voir mastertalk.state_backends) : le participant retrouve son parcours
+quel que soit le processus qui le reçoit.
+
+Les écritures sont différées : save() ne fait que remplacer le dernier
+état connu du jeton dans une file en mémoire, et un thread d'écriture vide
+cette file toutes les FLUSH_INTERVAL secondes en une seule transaction.
+Taper dans un champ ne provoque donc pas une écriture par réexécution. La
+file est vidée une dernière fois à l'arrêt du processus. Si l'écriture
+échoue (stockage indisponible), l'erreur est journalisée et les sessions
+reviennent dans la file, sans écraser un état plus récent, pour le passage
+suivant. Une sauvegarde identique au dernier état que ce processus a
+écrit avec succès, il y a moins de CACHE_TTL secondes, est ignorée ; au-delà,
+elle est réécrite, car un autre processus a pu écrire entre-temps.
+
+Les lectures passent par un cache local : une session lue ou enregistrée
+par ce processus est resservie sans aller-retour vers le stockage pendant
+CACHE_TTL secondes ; au-delà, elle est relue pour voir les écritures des
+autres processus.
+"""
+
+import atexit
+import json
+import logging
+import re
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import streamlit as st
+
+from mastertalk.session import SESSION_KEY, SessionData
+from mastertalk.state_backends import StateBackend, open_backend
+
+# Paramètre d'URL portant le jeton de session
+SESSION_QUERY_PARAM = "session"
+TOKEN_KEY = "mastertalk_session_token"
+TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_-]{16,64}")
+
+# Délai maximal entre une modification et son écriture dans le stockage
+FLUSH_INTERVAL = 2.0
+
+# Les sessions inactives depuis plus longtemps sont supprimées
+SESSION_TTL = 30 * 24 * 3600
+
+# Cache de lecture : durée de validité d'une entrée et nombre d'entrées
+CACHE_TTL = 5.0
+CACHE_SIZE = 1024
+
+logger = logging.getLogger(__name__)
+
+
+class SessionStore:
+    """Sessions sauvegardées, écritures groupées en arrière-plan, lectures en cache"""
+
+    def __init__(self, backend: StateBackend, flush_interval: float = FLUSH_INTERVAL,
+                 cache_ttl: float = CACHE_TTL) -> None:
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.cache_ttl = cache_ttl
+        self._pending: Dict[str, str] = {}
+        # Jeton -> (empreinte, instant) du dernier état dont ce processus a
+        # confirmé l'écriture : une sauvegarde sans changement ne repasse
+        # pas par la file tant que cette confirmation est récente
+        self._written: Dict[str, Tuple[int, float]] = {}
+        # Jeton -> (état sérialisé, instant de lecture ou d'écriture)
+        self._cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        backend.purge(SESSION_TTL)
+        self._writer = threading.Thread(target=self._run, name="mastertalk-session-store", daemon=True)
+        self._writer.start()
+
+    def _cached(self, token: str) -> Optional[str]:
+        """État en attente d'écriture, ou lu récemment (appelé sous le verrou)"""
+        payload = self._pending.get(token)
+        if payload is not None:
+            return payload
+        entry = self._cache.get(token)
+        if entry is not None and time.monotonic() - entry[1] < self.cache_ttl:
+            self._cache.move_to_end(token)
+            return entry[0]
+        return None
+
+    def _remember(self, token: str, payload: str) -> None:
+        """Met l'état en cache (appelé sous le verrou)"""
+        self._cache[token] = (payload, time.monotonic())
+        self._cache.move_to_end(token)
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def load(self, token: str) -> Optional[SessionData]:
+        """Session sauvegardée pour ce jeton, ou None"""
+        with self._lock:
+            payload = self._cached(token)
+        if payload is None:
+            payload = self.backend.get(token)
+            if payload is None:
+                return None
+            with self._lock:
+                self._remember(token, payload)
+        try:
+            session = SessionData.from_dict(json.loads(payload))
+        except ValueError:
+            # Format d'une ancienne version : on repart d'une session vierge
+            return None
+        return session
+
+    def save(self, token: str, session: SessionData) -> None:
+        """Met la session en file ; elle sera écrite au prochain passage du thread"""
+        payload = json.dumps(session.to_dict(), ensure_ascii=False, separators=(",", ":"))
+        digest = hash(payload)
+        with self._lock:
+            written = self._written.get(token)
+            if written is not None and written[0] == digest and time.monotonic() - written[1] < self.cache_ttl:
+                return
+            self._pending[token] = payload
+            self._remember(token, payload)
+
+    def flush(self) -> int:
+        """Écrit les sessions en attente en une fois ; retourne leur nombre"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+        try:
+            self.backend.put_many(pending)
+        except Exception:
+            with self._lock:
+                # Un état mis en file pendant l'écriture est plus récent : il est gardé
+                self._pending = {**pending, **self._pending}
+            raise
+        now = time.monotonic()
+        with self._lock:
+            self._written = {
+                token: written for token, written in self._written.items() if now - written[1] < self.cache_ttl
+            }
+            for token, payload in pending.items():
+                # Un état remis en file pendant l'écriture n'est pas encore confirmé
+                if token not in self._pending:
+                    self._written[token] = (hash(payload), now)
+        return len(pending)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception as exc:
+                logger.error("écriture des sessions impossible, nouvel essai dans %g s : %s", self.flush_interval, exc)
+
+    def close(self) -> None:
+        """Arrête le thread d'écriture après un dernier flush"""
+        self._stop.set()
+        self._writer.join()
+        try:
+            self.flush()
+        except Exception as exc:
+            logger.error("%d sessions non écrites à l'arrêt : %s", len(self._pending), exc)
+        self.backend.close()
+
+
+@st.cache_resource
+def get_store() -> SessionStore:
+    """Magasin de sessions partagé par toutes les sessions du processus"""
+    store = SessionStore(open_backend(max_age=SESSION_TTL))
+    atexit.register(store.close)
+    return store
+
+
+def session_token() -> str:
+    """Jeton de la session, lu dans l'URL ou créé et ajouté à l'URL"""
+    if TOKEN_KEY not in st.session_state:
+        token = st.query_params.get(SESSION_QUERY_PARAM)
+        if token is None or not TOKEN_PATTERN.fullmatch(token):
+            token = secrets.token_urlsafe(16)
+            st.query_params[SESSION_QUERY_PARAM] = token
+        st.session_state[TOKEN_KEY] = token
+    return st.session_state[TOKEN_KEY]
+
+
+def restore_session() -> SessionData:
+    """Retourne la session courante, restaurée depuis le stockage à la première exécution"""
+    if SESSION_KEY not in st.session_state:
+        st.session_state[SESSION_KEY] = get_store().load(session_token()) or SessionData()
+    session = st.session_state[SESSION_KEY]
+
+    # Brouillons réinjectés avant la création des widgets : après une
+    # reconnexion, et quand Streamlit a oublié la valeur d'un widget d'une
+    # autre section
+    for key, value in session.drafts.items():
+        if key not in st.session_state:
+            st.session_state[key] = value
+    return session
+
+
+def persist_session() -> None:
+    """Enregistre l'état courant (brouillons compris) pour écriture différée"""
+    session = st.session_state.get(SESSION_KEY)
+    if session is None:
+        return
+    session.capture_drafts(st.session_state)
+    get_store().save(session_token(), session)
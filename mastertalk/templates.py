@@ -0,0 +1,238 @@
+"""Gabarits HTML précompilés des composants d'affichage
+
+Chaque composant est un string.Template compilé une seule fois à l'import.
+Le rendu est mémoïsé par arguments : un bloc statique n'est construit
+qu'une fois par processus, et les réexécutions Streamlit ne font plus
+qu'une recherche dans le cache. La mise en forme vient des classes mt-*
+de styles/theme.css, chargées une fois avec la feuille de style.
+
+Les valeurs sont insérées telles quelles (HTML de confiance) : les
+appelants échappent eux-mêmes les saisies utilisateur si nécessaire.
+"""
+
+from functools import lru_cache
+from string import Template
+from typing import Dict, Iterable, Tuple
+
+# Tons disponibles, voir les classes .mt-tone-* de la feuille de style
+TONES = ("sky", "blue", "green", "amber", "red", "violet", "pink", "plain")
+
+TEMPLATES: Dict[str, Template] = {
+    "section_header": Template(
+        '<div class="section-card mt-section-header">'
+        '<div class="mt-icon">$icon</div>'
+        '<div><h2>$title</h2><p>$subtitle</p></div></div>'
+    ),
+    "card_title": Template('<h4 class="mt-card-title">$title</h4>'),
+    "subtitle": Template('<h5 class="mt-subtitle">$title</h5>'),
+    "quote_block": Template('<div class="mt-quote mt-tone-$tone">$text</div>'),
+    "feature_row": Template(
+        '<div class="mt-feature mt-tone-$tone">'
+        '<div class="mt-icon">$icon</div>'
+        '<div><strong>$label</strong> $text</div></div>'
+    ),
+    "bullet_row": Template(
+        '<div class="mt-bullet mt-tone-$tone">'
+        '<div class="mt-icon">$icon</div><span>$text</span></div>'
+    ),
+    "takeaway": Template(
+        '<h4 class="mt-card-title">$title</h4>'
+        '<div class="mt-takeaway"><p>$text</p></div>'
+    ),
+    "letter_row": Template(
+        '<div class="mt-letter mt-tone-$tone">'
+        '<div class="mt-icon">$letter</div>'
+        '<div><strong>$label</strong><br><span>$text</span></div></div>'
+    ),
+    "panel": Template('<div class="mt-panel mt-tone-$tone"><h5>$title</h5>$body</div>'),
+    "metric_tile": Template(
+        '<div class="mt-metric-tile mt-tone-$tone">'
+        '<div><h2>$value</h2><p>$label</p></div>'
+        '<div class="mt-icon">$icon</div></div>'
+    ),
+    "info_box": Template('<div class="mt-info-box mt-tone-$tone"><h5>$title</h5>$body</div>'),
+    "alert_card": Template(
+        '<div class="mt-alert mt-tone-$tone">'
+        '<div class="mt-alert-head"><div class="mt-icon">$icon</div><h5>$title</h5></div>'
+        '<p>$message</p></div>'
+    ),
+    "result_card": Template(
+        '<div class="mt-result mt-tone-$tone">'
+        '<div class="mt-result-head"><div class="mt-icon">$icon</div><h4>$title</h4></div>'
+        '<div class="mt-result-body">$body</div></div>'
+    ),
+    "atelier_header": Template(
+        '<div class="mt-atelier-header mt-tone-$tone">'
+        '<div class="mt-section-header"><div class="mt-icon">$icon</div>'
+        '<div><h3>$title</h3><p>$subtitle</p></div></div>'
+        '<div class="mt-objective"><strong>🎯 Objectif :</strong> $objective</div></div>'
+    ),
+    "tile": Template(
+        '<div class="mt-tile mt-tone-$tone"><div class="mt-icon">$icon</div>'
+        '<h5>$title</h5><p>$text</p></div>'
+    ),
+    "highlighted_text": Template('<div class="mt-highlighted">$text</div>'),
+    "rating": Template(
+        '<div class="mt-rating"><div class="mt-rating-label">$label</div>'
+        '<div>$stars</div><div class="mt-rating-value">$rating/$scale</div></div>'
+    ),
+    "progress_badge": Template(
+        '<div class="mt-progress-badge">📊 Progression : $percent% ($visited/$total)</div>'
+    ),
+    "objectives": Template('<div class="mt-objectives">$items</div>'),
+    "main_header": Template(
+        '<div class="main-header"><h1>$title</h1><h3>$subtitle</h3><p>$text</p></div>'
+    ),
+    "footer": Template(
+        '<div class="mt-footer"><div class="mt-footer-title">$title</div>'
+        '<div>$tagline</div><div class="mt-footer-legal">$legal</div></div>'
+    ),
+}
+
+# Étoiles pleine et vide de la notation
+STAR_ON = '<span class="mt-star mt-star-on">⭐</span>'
+STAR_OFF = '<span class="mt-star">☆</span>'
+
+
+# Ouverture d'un conteneur d'exercice (fermé par EXERCISE_CLOSE)
+EXERCISE_OPEN = '<div class="mt-exercise">'
+EXERCISE_CLOSE = '</div>'
+
+
+@lru_cache(maxsize=1024)
+def render_template(name: str, **fields: str) -> str:
+    """Rend le gabarit nommé avec les champs donnés (mémoïsé)"""
+    return TEMPLATES[name].substitute(fields)
+
+
+def template_cache_info() -> Tuple[int, int, int]:
+    """Retourne (succès, échecs, taille) du cache de rendu"""
+    info = render_template.cache_info()
+    return info.hits, info.misses, info.currsize
+
+
+# ============================================================================
+# COMPOSANTS NOMMÉS
+# ============================================================================
+
+def section_header(icon: str, title: str, subtitle: str) -> str:
+    """En-tête de section : icône, titre et sous-titre"""
+    return render_template("section_header", icon=icon, title=title, subtitle=subtitle)
+
+
+def card_title(title: str) -> str:
+    """Titre principal d'une carte"""
+    return render_template("card_title", title=title)
+
+
+def subtitle(title: str) -> str:
+    """Intertitre à l'intérieur d'une carte"""
+    return render_template("subtitle", title=title)
+
+
+def quote_block(text: str, tone: str = "sky") -> str:
+    """Encadré de citation centré"""
+    return render_template("quote_block", text=text, tone=tone)
+
+
+def feature_row(icon: str, label: str, text: str, tone: str = "sky") -> str:
+    """Ligne icône + libellé en gras + texte"""
+    return render_template("feature_row", icon=icon, label=label, text=text, tone=tone)
+
+
+def bullet_row(icon: str, text: str, tone: str = "sky") -> str:
+    """Puce compacte icône + texte"""
+    return render_template("bullet_row", icon=icon, text=text, tone=tone)
+
+
+def bullet_list(items: Iterable[Tuple[str, str]], tone: str = "sky") -> str:
+    """Suite de puces à partir de couples (icône, texte)"""
+    return "".join(bullet_row(icon, text, tone) for icon, text in items)
+
+
+def takeaway(title: str, text: str) -> str:
+    """Conclusion d'une carte : titre et encadré"""
+    return render_template("takeaway", title=title, text=text)
+
+
+def letter_row(letter: str, label: str, text: str, tone: str, plain: bool = False) -> str:
+    """Ligne d'acronyme (SMART, STAR) : lettre, libellé et explication"""
+    if plain:
+        # Fond neutre, seule la bordure et la lettre portent le ton
+        tone = f"{tone} mt-tone-plain"
+    return render_template("letter_row", letter=letter, label=label, text=text, tone=tone)
+
+
+def panel(title: str, body: str, tone: str) -> str:
+    """Panneau coloré avec titre et contenu HTML"""
+    return render_template("panel", title=title, body=body, tone=tone)
+
+
+def metric_tile(value: str, label: str, icon: str, tone: str = "sky") -> str:
+    """Tuile de métrique : valeur, libellé et icône"""
+    return render_template("metric_tile", value=value, label=label, icon=icon, tone=tone)
+
+
+def info_box(title: str, body: str, tone: str = "sky") -> str:
+    """Encadré d'instructions ou de mission"""
+    return render_template("info_box", title=title, body=body, tone=tone)
+
+
+def success_card(title: str, message: str, icon: str = "✅") -> str:
+    """Carte de réussite"""
+    return render_template("alert_card", title=title, message=message, icon=icon, tone="green")
+
+
+def warning_card(title: str, message: str, icon: str = "💡") -> str:
+    """Carte d'avertissement ou de conseil"""
+    return render_template("alert_card", title=title, message=message, icon=icon, tone="amber")
+
+
+def result_card(icon: str, title: str, body: str, tone: str = "sky") -> str:
+    """Carte de résultat généré"""
+    return render_template("result_card", icon=icon, title=title, body=body, tone=tone)
+
+
+def atelier_header(icon: str, title: str, subtitle: str, objective: str, tone: str) -> str:
+    """En-tête d'atelier avec objectif"""
+    return render_template(
+        "atelier_header", icon=icon, title=title, subtitle=subtitle, objective=objective, tone=tone
+    )
+
+
+def tile(icon: str, title: str, text: str, tone: str) -> str:
+    """Tuile centrée icône + titre + texte"""
+    return render_template("tile", icon=icon, title=title, text=text, tone=tone)
+
+
+def highlighted_text(text: str) -> str:
+    """Saisie relue avec les expressions repérées surlignées (HTML déjà échappé)"""
+    return render_template("highlighted_text", text=text)
+
+
+def rating_stars(rating: int, scale: int = 5, label: str = "Votre note") -> str:
+    """Note en étoiles avec libellé et valeur n/scale"""
+    stars = STAR_ON * rating + STAR_OFF * (scale - rating)
+    return render_template("rating", label=label, stars=stars, rating=str(rating), scale=str(scale))
+
+
+def progress_badge(percent: int, visited: int, total: int) -> str:
+    """Pastille de progression affichée dans l'en-tête"""
+    return render_template(
+        "progress_badge", percent=str(percent), visited=str(visited), total=str(total)
+    )
+
+
+def objectives(items: Iterable[str]) -> str:
+    """Encadré d'objectifs de la sidebar, une puce par ligne"""
+    return render_template("objectives", items="<br>".join(f"• {item}" for item in items))
+
+
+def main_header(title: str, subtitle: str, text: str) -> str:
+    """En-tête principal de l'application"""
+    return render_template("main_header", title=title, subtitle=subtitle, text=text)
+
+
+def footer(title: str, tagline: str, legal: str) -> str:
+    """Pied de page : titre, accroche et mentions"""
+    return render_template("footer", title=title, tagline=tagline, legal=legal)
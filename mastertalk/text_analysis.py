@@ -0,0 +1,105 @@
+"""Analyse de texte française partagée par les retours d'exercice
+
+Un seul passage d'expression régulière découpe le texte en mots, repère
+les élisions (l', d', qu'...), garde les mots composés (peut-être,
+aujourd'hui) et compte les phrases. La ponctuation isolée (« Bonjour ! »)
+n'est pas comptée comme un mot, contrairement à str.split().
+
+analyze_text() est mémoïsé sur le contenu : un champ inchangé ne coûte
+plus qu'une recherche dans le cache à la réexécution suivante.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Tuple
+
+# Nombre de mots-clés retenus par texte
+KEYWORDS = 5
+
+# Un mot-clé fait au moins MIN_KEYWORD_CHARS caractères et n'est pas un mot outil
+MIN_KEYWORD_CHARS = 3
+
+STOPWORDS = frozenset("""
+a à afin ai aie aient ainsi alors as au aucun aussi autre aux avec avez avoir avons ayant
+bien c ça car ce ceci cela celle celles celui ces cet cette ceux chaque ci comme comment
+d dans de des donc dont du elle elles en encore es est et été étaient était être eu eux
+fait faire fois font hors ici il ils j je jusqu l la là le les leur leurs lors lorsqu lui
+m ma mais me même mes moi mon n ne ni nos notre nous on ont ou où par parce pas peu peut
+plus pour pourquoi puis puisqu qu quand que quel quelle quelles quels qui quoi s sa sans se
+ses si sien son sont sous suis sur t ta te tes toi ton tous tout toute toutes très tu un
+une vos votre vous y
+""".split())
+
+_TOKEN = re.compile(
+    r"""
+    (?P<elision>\b(?:jusqu|lorsqu|puisqu|quoiqu|qu|[cdjlmnst])'(?=\w))
+    |(?P<word>\w+(?:[-']\w+)*)
+    |(?P<end>[.!?…]+)
+    """,
+    re.VERBOSE,
+)
+
+_APOSTROPHES = ("’", "ʼ", "‘")
+
+
+@dataclass(frozen=True, slots=True)
+class TextStats:
+    """Résultat de l'analyse d'un texte"""
+    words: int
+    chars: int
+    sentences: int
+    tokens: Tuple[str, ...]
+    content_words: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+
+
+def normalize_apostrophes(text: str) -> str:
+    """Remplace les apostrophes typographiques par l'apostrophe droite"""
+    for apostrophe in _APOSTROPHES:
+        if apostrophe in text:
+            text = text.replace(apostrophe, "'")
+    return text
+
+
+def compute_stats(text: str) -> TextStats:
+    """Analyse un texte en un passage (sans cache)"""
+    tokens: List[str] = []
+    content: List[str] = []
+    words = sentences = 0
+    open_sentence = False
+    # findall renvoie un triplet par jeton : un seul des groupes est non vide
+    for elision, word, end in _TOKEN.findall(normalize_apostrophes(text).lower()):
+        if end:
+            if open_sentence:
+                sentences += 1
+                open_sentence = False
+            continue
+        open_sentence = True
+        if elision:
+            tokens.append(elision)
+            continue
+        # « l'écoute » compte pour un mot, comme à l'écrit
+        tokens.append(word)
+        words += 1
+        # Mot porteur de sens : ni mot outil, ni nombre
+        if len(word) >= MIN_KEYWORD_CHARS and word not in STOPWORDS and not word.isdigit():
+            content.append(word)
+    if open_sentence:
+        sentences += 1
+
+    # À fréquence égale, l'ordre d'apparition départage (Counter le conserve)
+    keywords = tuple(word for word, _ in Counter(content).most_common(KEYWORDS))
+    return TextStats(words, len(text), sentences, tuple(tokens), tuple(content), keywords)
+
+
+@lru_cache(maxsize=4096)
+def analyze_text(text: str) -> TextStats:
+    """Analyse mémoïsée par contenu, pour les champs relus à chaque réexécution"""
+    return compute_stats(text)
+
+
+def word_count(text: str) -> int:
+    """Nombre de mots d'un texte (élisions rattachées au mot suivant)"""
+    return analyze_text(text).words if text else 0
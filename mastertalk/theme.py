@@ -0,0 +1,64 @@
+"""Configuration de la page et thème visuel"""
+
+import re
+from typing import Tuple
+
+import streamlit as st
+
+from mastertalk.assets import font_face_css, get_assets, publish_static
+from mastertalk.constants import BASE_DIR
+
+# ============================================================================
+# CONFIGURATION ET STYLE - THÈME PROFESSIONNEL CLAIR
+# ============================================================================
+
+def setup_page_config():
+    """Configure les paramètres de la page Streamlit"""
+    st.set_page_config(
+        page_title="MasterTalk : L'Art de Communiquer",
+        page_icon="🎤",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+THEME_SOURCE = BASE_DIR / "styles" / "theme.css"
+
+# Le thème est servi par le service de fichiers statiques de Streamlit
+# (server.enableStaticServing, voir .streamlit/config.toml) sous un nom
+# dérivé de son contenu : chaque réexécution n'envoie qu'une balise <link>,
+# que le navigateur résout depuis son cache.
+THEME_LINK = '<link rel="stylesheet" href="{href}" data-mastertalk-theme="{digest}">'
+
+def minify_css(css: str) -> str:
+    """Retire commentaires et espaces superflus d'une feuille de style"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+@st.cache_resource
+def compile_theme(font_css: str = "") -> str:
+    """Lit et minifie la feuille de style du thème, précédée des @font-face (une fois par processus)"""
+    return font_css + minify_css(THEME_SOURCE.read_text(encoding="utf-8"))
+
+@st.cache_resource
+def build_theme_asset() -> Tuple[str, str]:
+    """Écrit le thème compilé dans un fichier statique nommé d'après son contenu
+
+    Appelé à chaque réexécution, mais calculé une fois par processus.
+    Retourne le chemin servi (relatif à l'application) et l'empreinte du contenu.
+    """
+    css = compile_theme(font_face_css(get_assets().fonts))
+    return publish_static(css.encode("utf-8"), "theme", ".css")
+
+def load_custom_css():
+    """Charge le CSS personnalisé avec thème clair apaisant"""
+    if not st.get_option("server.enableStaticServing"):
+        # Sans service statique, on retombe sur l'injection directe (les
+        # polices locales ne peuvent pas être servies : import de Google Fonts)
+        st.markdown(f"<style>{compile_theme(font_face_css({}))}</style>", unsafe_allow_html=True)
+        return
+
+    href, digest = build_theme_asset()
+    st.markdown(THEME_LINK.format(href=href, digest=digest), unsafe_allow_html=True)
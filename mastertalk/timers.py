@@ -0,0 +1,127 @@
+"""Minuteurs partagés des ateliers"""
+
+import time
+from typing import List, Tuple
+
+import streamlit as st
+
+from mastertalk.session import TimerState, get_session
+
+# ============================================================================
+# MINUTEURS DES ATELIERS
+# ============================================================================
+
+# Paliers d'affichage d'un minuteur : (secondes restantes maximum, couleur, message)
+TimerPhases = List[Tuple[int, str, str]]
+
+TIMER_DURATIONS = {
+    "atelier2": 60,
+    "atelier3": 120,
+    "atelier4": 30
+}
+
+def _timer_state(timer_id: str) -> TimerState:
+    """Retourne (et crée si besoin) l'état du minuteur dans la session"""
+    timers = get_session().timers
+    if timer_id not in timers:
+        duration = TIMER_DURATIONS[timer_id]
+        timers[timer_id] = TimerState(duration=duration, remaining=duration)
+    return timers[timer_id]
+
+def timer_remaining(timer_id: str) -> int:
+    """Calcule le nombre de secondes restantes à partir de l'échéance"""
+    state = _timer_state(timer_id)
+    if not state.running:
+        return state.remaining
+    return max(0, int(state.deadline - time.time() + 0.999))
+
+def timer_is_running(timer_id: str) -> bool:
+    """Indique si le minuteur est en cours"""
+    return _timer_state(timer_id).running
+
+def start_timer(timer_id: str) -> None:
+    """Démarre (ou redémarre) le minuteur pour toute sa durée"""
+    state = _timer_state(timer_id)
+    state.running = True
+    state.deadline = time.time() + state.duration
+    state.remaining = state.duration
+    state.finished = False
+
+def stop_timer(timer_id: str) -> None:
+    """Met le minuteur en pause en conservant le temps restant"""
+    state = _timer_state(timer_id)
+    if state.running:
+        state.remaining = timer_remaining(timer_id)
+        state.running = False
+
+def reset_timer(timer_id: str) -> None:
+    """Arrête le minuteur et remet le temps à la durée initiale"""
+    state = _timer_state(timer_id)
+    state.running = False
+    state.remaining = state.duration
+    state.finished = False
+
+def _render_countdown(timer_id: str, label: str, phases: TimerPhases, default_phase: Tuple[str, str]) -> None:
+    """Affiche le chrono en cours ; exécuté dans un fragment rafraîchi chaque seconde"""
+    remaining = timer_remaining(timer_id)
+    state = _timer_state(timer_id)
+    duration = state.duration
+
+    if remaining <= 0:
+        # Timer terminé : une seule réexécution complète pour arrêter le fragment
+        state.running = False
+        state.remaining = 0
+        state.finished = True
+        st.rerun()
+
+    timer_color, timer_message = default_phase
+    for threshold, color, message in phases:
+        if remaining <= threshold:
+            timer_color, timer_message = color, message
+            break
+
+    minutes = remaining // 60
+    seconds = remaining % 60
+    st.markdown(
+        f'<div style="text-align: center; padding: 1.5rem; background: #f8fafc; border-radius: 12px; border: 3px solid {timer_color};">'
+        f'<div style="font-size: 3.5rem; color: {timer_color}; font-weight: bold; margin-bottom: 0.5rem;">'
+        f'{minutes:02d}:{seconds:02d}'
+        f'</div>'
+        f'<div style="color: #64748b; font-size: 1rem;">{label}</div>'
+        f'</div>',
+        unsafe_allow_html=True
+    )
+    st.progress(1 - (remaining / duration))
+    st.info(timer_message)
+
+def render_timer(
+    timer_id: str,
+    label: str,
+    phases: TimerPhases,
+    default_phase: Tuple[str, str],
+    done_message: str,
+    celebrate: bool = False,
+    show_paused: bool = True
+) -> None:
+    """Affiche un minuteur d'atelier : chrono en cours, pause ou fin"""
+    state = _timer_state(timer_id)
+
+    if state.running:
+        st.fragment(_render_countdown, run_every=1)(timer_id, label, phases, default_phase)
+    elif state.finished:
+        state.finished = False
+        st.success(done_message)
+        if celebrate:
+            st.balloons()
+    elif show_paused and state.remaining < state.duration:
+        minutes = state.remaining // 60
+        seconds = state.remaining % 60
+        st.markdown(
+            f'<div style="text-align: center; padding: 1.5rem; background: #f8fafc; border-radius: 12px; border: 2px solid #94a3b8;">'
+            f'<div style="font-size: 3rem; color: #64748b; font-weight: bold; margin-bottom: 0.5rem;">'
+            f'{minutes:02d}:{seconds:02d}'
+            f'</div>'
+            f'<div style="color: #94a3b8; font-size: 0.9rem;">Timer en pause</div>'
+            f'</div>',
+            unsafe_allow_html=True
+        )
@@ -0,0 +1,68 @@
+"""Cas de référence de mastertalk.smart_check (python -m pytest tests)"""
+
+import pytest
+
+from mastertalk.smart_check import extract_deadline, extract_quantities, validate
+
+JUSTIFICATION = "J'ai déjà présenté deux projets devant mon service"
+UTILITE = "Ma prochaine évaluation repose sur mes présentations"
+
+
+@pytest.mark.parametrize("text", [
+    "avant le 12 mars",
+    "le 30 juin",
+    "le 1er juin",
+    "12 mars 2026",
+    "15/03",
+    "en 2025",
+    "Réussir une présentation devant mon équipe",
+])
+def test_dates_et_articles_ne_sont_pas_des_quantites(text):
+    assert extract_quantities(text) == ()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("3 minutes", "3 minutes"),
+    ("deux fois par semaine", "deux fois"),
+    ("une fois par mois", "une fois"),
+    ("80 %", "80 %"),
+])
+def test_quantites(text, expected):
+    assert [q.text for q in extract_quantities(text)] == [expected]
+
+
+@pytest.mark.parametrize("deadline, expected", [
+    ("dans 3 semaines", "dans 3 semaines"),
+    ("avant le 12 mars", "avant le 12 mars"),
+    ("le 30 juin", "30 juin"),
+    ("fin juin", "fin juin"),
+    ("d'ici juin", "d'ici juin"),
+    ("3 mois", "3 mois"),
+])
+def test_echeances(deadline, expected):
+    assert extract_deadline(deadline) == expected
+
+
+def test_une_duree_hors_du_champ_delai_n_est_pas_une_echeance():
+    assert extract_deadline("", "Présenter mon projet", "10 minutes") is None
+    verdict = validate("Présenter mon projet au comité", "10 minutes", JUSTIFICATION, UTILITE, "")
+    assert "T" in verdict.flagged
+
+
+def test_une_date_ne_rend_pas_l_objectif_mesurable():
+    verdict = validate("Présenter le projet devant l'équipe", "avant le 12 mars", JUSTIFICATION, UTILITE, "")
+    assert "M" in verdict.flagged
+    assert "T" not in verdict.flagged
+
+
+def test_objectif_vague_non_rattrape_par_la_mesure():
+    verdict = validate("Je veux parler mieux en public", "3 minutes", JUSTIFICATION, UTILITE, "dans 3 mois")
+    assert verdict.flagged == ("S",)
+
+
+def test_objectif_complet():
+    verdict = validate(
+        "Présenter mon projet au comité de direction", "10 minutes, 3 questions",
+        JUSTIFICATION, UTILITE, "le 30 juin",
+    )
+    assert verdict.score == 5